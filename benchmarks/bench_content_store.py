@@ -0,0 +1,137 @@
+"""
+Compares store size and query latency of ChromaArticlesRepo with the full article content kept
+in the Chroma metadata against the content kept zstd-compressed in the SQLite content store,
+for synthetic articles. Vectors are random and inserted directly, so only storage is measured.
+
+- metadata:      content stored in every document's metadata and returned by every search.
+- content-store: only the small fields in Chroma; contents read from the content store by id.
+
+Query latency is measured for a search alone (the default response, without content) and for
+a search followed by loading the contents of the hits (fields=content).
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_content_store.py --articles 100000
+    PYTHONPATH=src python benchmarks/bench_content_store.py --articles 10000 --words 400
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+import numpy as np
+
+from domain.article_query import ArticleQuery
+
+TOPICS = np.array("government election market climate war peace economy court minister protest energy health".split())
+LAYOUTS = ("metadata", "content-store")
+
+
+def percentile(samples: list[float], percent: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, round(percent / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+def directory_mb(directory: str) -> float:
+    return sum(
+        os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(directory) for name in names
+    ) / 1024 / 1024
+
+
+def vocabulary(rng: np.random.Generator, size: int = 20_000) -> tuple[np.ndarray, np.ndarray]:
+    """Random words with Zipf-like frequencies, so the text compresses roughly like prose."""
+    letters = np.array(list("etaoinshrdlcumwfgypbvkjxqz"))
+    words = np.array(["".join(rng.choice(letters, size=rng.integers(2, 10))) for _ in range(size)])
+    weights = 1 / np.arange(1, size + 1)
+    return words, weights / weights.sum()
+
+
+def synthetic_articles(rng: np.random.Generator, words: tuple[np.ndarray, np.ndarray], start: int, count: int, length: int) -> list[ArticleQuery]:
+    vocabulary_words, weights = words
+    indices = rng.choice(len(vocabulary_words), size=(count, length), p=weights)
+    return [
+        ArticleQuery(
+            headline=f"Headline {start + i}",
+            summary=" ".join(vocabulary_words[row[:40]]),
+            content=f"Article {start + i}. " + " ".join(vocabulary_words[row]),
+            topics=list(TOPICS[row[:2] % len(TOPICS)]),
+            political_bias="None",
+        )
+        for i, row in enumerate(indices)
+    ]
+
+
+def build_store(layout: str, directory: str, args: argparse.Namespace):
+    import chromadb
+    from langchain_chroma import Chroma
+    from repositories.chroma_articles_repo import ChromaArticlesRepo
+    from repositories.sqlite_content_store import SqliteContentStore
+
+    client = chromadb.PersistentClient(path=directory)
+    content_store = SqliteContentStore(os.path.join(directory, "contents.sqlite3")) if layout == "content-store" else None
+    repo = ChromaArticlesRepo(Chroma(collection_name="bench", client=client), content_store=content_store)
+
+    rng = np.random.default_rng(42)
+    words = vocabulary(rng)
+    batch_size = min(args.batch_size, client.get_max_batch_size())
+    for start in range(0, args.articles, batch_size):
+        articles = synthetic_articles(rng, words, start, min(batch_size, args.articles - start), args.words)
+        documents = repo._articles_to_documents(articles)
+        if content_store is not None:
+            content_store.put_many({document.id: article.content for document, article in zip(documents, articles)})
+        repo._upsert_batch(documents, rng.standard_normal((len(documents), args.dimension), dtype=np.float32))
+
+    return repo
+
+
+def measure(layout: str, args: argparse.Namespace) -> tuple[float, float, list[float], list[float]]:
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        repo = build_store(layout, directory, args)
+        build_seconds = time.perf_counter() - start
+        size = directory_mb(directory)
+
+        collection = repo.vector_store._collection
+        queries = np.random.default_rng(7).standard_normal((args.queries, args.dimension), dtype=np.float32)
+
+        search_samples, content_samples = [], []
+        for query in queries:
+            start = time.perf_counter()
+            hits = collection.query(query_embeddings=[query], n_results=args.k, include=["documents", "metadatas", "distances"])
+            search_samples.append(time.perf_counter() - start)
+
+            if repo.content_store is not None:
+                repo.content_store.get_many(hits["ids"][0])
+            content_samples.append(time.perf_counter() - start)
+
+        if repo.content_store is not None:
+            repo.content_store.close()
+
+    return build_seconds, size, search_samples, content_samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=100_000)
+    parser.add_argument("--words", type=int, default=800, help="Words per article content")
+    parser.add_argument("--dimension", type=int, default=384)
+    parser.add_argument("--batch-size", type=int, default=1_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("-k", type=int, default=10, help="Results per query")
+    parser.add_argument("--layouts", nargs="+", choices=LAYOUTS, default=list(LAYOUTS))
+    args = parser.parse_args()
+
+    print(f"{args.articles} articles of {args.words} words, k={args.k}")
+    print(f"{'layout':<14} {'build s':>8} {'size MB':>9} {'search p50':>11} {'p95':>7} {'+content p50':>13} {'p95':>7}")
+    for layout in args.layouts:
+        build_seconds, size, search_samples, content_samples = measure(layout, args)
+        print(
+            f"{layout:<14} {build_seconds:>8.1f} {size:>9.1f} "
+            f"{statistics.median(search_samples) * 1000:>9.2f}ms {percentile(search_samples, 95) * 1000:>5.2f}ms "
+            f"{statistics.median(content_samples) * 1000:>11.2f}ms {percentile(content_samples, 95) * 1000:>5.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Compares the embedding backends on CPU: the PyTorch model behind HuggingFaceEmbeddings (the
+reference) against ONNX exports of the same model run by OnnxEmbeddings on onnxruntime, e.g. the
+full-precision export and an int8-quantized one, at several intra-op thread counts.
+
+For every backend it reports:
+- query: latency of embedding one short query string at a time (the GET /articles/query path);
+- batch: throughput of embedding article semantic texts in batches (the save path);
+- the lowest cosine similarity of its vectors to the reference ones, over the benchmark texts.
+
+The ONNX files are downloaded from the model repository on first use (or read from --model when it
+is a local directory). Results are written as JSON; pass an earlier file to --compare.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_embedding_backends.py
+    PYTHONPATH=src python benchmarks/bench_embedding_backends.py --onnx-file onnx/model.onnx --onnx-file onnx/model_quint8_avx2.onnx --threads 1 --threads 4
+"""
+import argparse
+import json
+import os
+import random
+import time
+
+from harness import WORDS, print_stages, stage_stats, synthetic_corpus, write_results
+
+DEFAULT_ONNX_FILES = ["onnx/model.onnx", "onnx/model_qint8_avx512_vnni.onnx"]
+
+
+def build_texts(args: argparse.Namespace) -> tuple[list[str], list[str]]:
+    rng = random.Random(7)
+    queries = [" ".join(rng.choices(WORDS, k=rng.randint(2, 6))) for _ in range(args.queries)]
+    documents = [
+        f"Headline: {article['headline']}\nSummary: {' '.join(article['paragraphs'])[:600]}\nTopics: {', '.join(rng.sample(WORDS, 3))}"
+        for article in synthetic_corpus(args.documents, words=120)
+    ]
+    return queries, documents
+
+
+def measure(embeddings, queries: list[str], documents: list[str], batch_size: int) -> tuple[dict, dict]:
+    for query in queries[:10]:
+        embeddings.embed_query(query)
+
+    latencies = []
+    start = time.perf_counter()
+    for query in queries:
+        query_start = time.perf_counter()
+        embeddings.embed_query(query)
+        latencies.append(time.perf_counter() - query_start)
+    query = stage_stats(latencies, len(queries), time.perf_counter() - start)
+
+    latencies = []
+    start = time.perf_counter()
+    for batch_start in range(0, len(documents), batch_size):
+        batch_begin = time.perf_counter()
+        embeddings.embed_documents(documents[batch_start:batch_start + batch_size])
+        latencies.append(time.perf_counter() - batch_begin)
+    batch = stage_stats(latencies, len(documents), time.perf_counter() - start)
+
+    return query, batch
+
+
+def label(file_name: str, threads: int) -> str:
+    kind = "int8" if "int8" in file_name else "onnx"
+    return f"{kind}-t{threads or os.cpu_count()}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default="sentence-transformers/all-MiniLM-L6-v2", help="Hugging Face model name or local directory")
+    parser.add_argument("--onnx-file", action="append", help=f"ONNX file of the model repository (default: {', '.join(DEFAULT_ONNX_FILES)})")
+    parser.add_argument("--threads", type=int, action="append", help="onnxruntime intra-op threads (default: 1 and all cores; 0: onnxruntime default)")
+    parser.add_argument("--queries", type=int, default=300)
+    parser.add_argument("--documents", type=int, default=512)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--output", help="JSON results path (default benchmarks/results/embedding-backends-<time>.json)")
+    parser.add_argument("--compare", help="JSON results of an earlier run to compare with")
+    args = parser.parse_args()
+
+    from langchain_huggingface import HuggingFaceEmbeddings
+    from application.services.onnx_embeddings import OnnxEmbeddings, embedding_agreement
+
+    queries, documents = build_texts(args)
+    probe_texts = queries[:50] + documents[:50]
+
+    reference = HuggingFaceEmbeddings(model_name=args.model)
+    stages, agreements = {}, {}
+    stages["torch/query"], stages["torch/batch"] = measure(reference, queries, documents, args.batch_size)
+
+    for file_name in args.onnx_file or DEFAULT_ONNX_FILES:
+        for threads in args.threads or sorted({1, os.cpu_count()}):
+            try:
+                embeddings = OnnxEmbeddings(args.model, file_name=file_name, intra_op_threads=threads, batch_size=args.batch_size)
+            except Exception as exc:
+                print(f"Skipping {file_name}: {type(exc).__name__}: {exc}")
+                break
+
+            name = label(file_name, threads)
+            stages[f"{name}/query"], stages[f"{name}/batch"] = measure(embeddings, queries, documents, args.batch_size)
+            agreements[name] = round(embedding_agreement(embeddings, reference, probe_texts), 5)
+            stages[f"{name}/query"]["min_cosine"] = agreements[name]
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)["stages"]
+
+    print(f"{args.model}: {args.queries} queries, {args.documents} documents in batches of {args.batch_size}, {os.cpu_count()} CPUs")
+    print_stages(stages, baseline)
+    for name, agreement in agreements.items():
+        print(f"{name}: lowest cosine similarity to PyTorch {agreement}")
+
+    output = args.output or os.path.join(os.path.dirname(__file__), "results", f"embedding-backends-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    parameters = {key: value for key, value in vars(args).items() if key not in ("output", "compare")}
+    print(f"Results written to {write_results(output, 'embedding-backends', parameters, stages)}")
+
+
+if __name__ == "__main__":
+    main()
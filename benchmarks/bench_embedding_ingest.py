@@ -0,0 +1,95 @@
+"""
+Measures ingestion throughput (docs/sec) of ChromaArticlesRepo.save_async for a batch of
+synthetic articles, comparing the previous aadd_documents path with the batched embedding
+stage at several batch sizes. Each run writes into a fresh temporary Chroma collection.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_embedding_ingest.py --articles 10000
+    PYTHONPATH=src python benchmarks/bench_embedding_ingest.py --fake-embeddings   # offline
+"""
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from langchain_chroma import Chroma
+from langchain_core.embeddings import DeterministicFakeEmbedding, Embeddings
+
+from application.services.batch_embedder import BatchEmbedder
+from domain.article_enriched import ArticleEnriched
+from repositories.chroma_articles_repo import ChromaArticlesRepo
+
+WORDS = "government election market climate war peace economy court minister protest energy health".split()
+
+
+def synthetic_articles(count: int) -> list[ArticleEnriched]:
+    rng = random.Random(42)
+    return [
+        ArticleEnriched(
+            headline=" ".join(rng.choices(WORDS, k=8)).capitalize(),
+            content=f"Article {i}. " + " ".join(rng.choices(WORDS, k=400)),
+            summary=" ".join(rng.choices(WORDS, k=60)),
+            topics=rng.sample(WORDS, k=3),
+            political_bias="None",
+        )
+        for i in range(count)
+    ]
+
+
+def build_embeddings(fake: bool, model_name: str) -> Embeddings:
+    if fake:
+        return DeterministicFakeEmbedding(size=384)
+
+    from langchain_huggingface import HuggingFaceEmbeddings
+    return HuggingFaceEmbeddings(model_name=model_name)
+
+
+async def measure(articles: list[ArticleEnriched], embeddings: Embeddings, batch_size: int) -> float:
+    with tempfile.TemporaryDirectory() as directory:
+        store = Chroma(collection_name="bench", embedding_function=embeddings, persist_directory=directory)
+
+        embedder = None
+        executor = None
+        if batch_size:
+            executor = ThreadPoolExecutor(max_workers=1)
+            embedder = BatchEmbedder(embeddings, batch_size=batch_size, executor=executor)
+
+        repo = ChromaArticlesRepo(store, embedder)
+
+        start = time.perf_counter()
+        await repo.save_async(articles)
+        elapsed = time.perf_counter() - start
+
+        if executor:
+            executor.shutdown()
+
+    return len(articles) / elapsed
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    articles = synthetic_articles(args.articles)
+    embeddings = build_embeddings(args.fake_embeddings, args.model)
+
+    print(f"{len(articles)} articles")
+    if not args.skip_baseline:
+        print(f"{'aadd_documents':<20} {await measure(articles, embeddings, 0):9.1f} docs/s")
+    for batch_size in args.batch_sizes:
+        print(f"{f'batched ({batch_size})':<20} {await measure(articles, embeddings, batch_size):9.1f} docs/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=10_000)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[64, 256, 1024])
+    parser.add_argument("--model", default="sentence-transformers/all-MiniLM-L6-v2")
+    parser.add_argument("--fake-embeddings", action="store_true", help="Use deterministic fake embeddings (no model download)")
+    parser.add_argument("--skip-baseline", action="store_true")
+    args = parser.parse_args()
+
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmarks the article extractor backends over a corpus of saved HTML pages, parsing
+either on the event loop or in a process pool. Reports pages/sec and event-loop stall
+time (the total and worst delay observed by a 1 ms heartbeat task while parsing).
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_extractors.py --corpus path/to/html_dir
+    PYTHONPATH=src python benchmarks/bench_extractors.py --pages 200   # synthetic corpus
+"""
+import argparse
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from application.services.article_extractors import build_article_extractor
+
+BACKENDS = ["html.parser", "lxml", "selectolax"]
+HEARTBEAT_INTERVAL = 0.001
+
+
+def load_corpus(corpus: Optional[str], pages: int) -> list[str]:
+    if corpus:
+        return [path.read_text(encoding="utf-8", errors="ignore") for path in sorted(Path(corpus).glob("*.html"))]
+
+    paragraph = "<p>The minister announced <b>new measures</b> today, <a href='#'>critics</a> disagreed.</p>"
+    page = (
+        "<html><head><title>Synthetic article</title></head><body>"
+        + "<nav>" + "<a href='#'>Section</a>" * 200 + "</nav>"
+        + "<article>" + paragraph * 600 + "</article>"
+        + "<footer>" + "<div><span>Footer link</span></div>" * 300 + "</footer>"
+        + "</body></html>"
+    )
+    return [page] * pages
+
+
+async def heartbeat(stalls: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(HEARTBEAT_INTERVAL)
+        stalls.append(max(0.0, time.perf_counter() - start - HEARTBEAT_INTERVAL))
+
+
+async def run(backend: str, pages: list[str], executor: Optional[ProcessPoolExecutor]) -> tuple[float, float, float]:
+    extractor = build_article_extractor(backend)
+    loop = asyncio.get_running_loop()
+
+    stalls: list[float] = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(heartbeat(stalls, stop))
+
+    start = time.perf_counter()
+    if executor is None:
+        for page in pages:
+            extractor.extract(page)
+            await asyncio.sleep(0)
+    else:
+        await asyncio.gather(*[loop.run_in_executor(executor, extractor.extract, page) for page in pages])
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await ticker
+
+    return len(pages) / elapsed, sum(stalls), max(stalls, default=0.0)
+
+
+async def main_async(pages: list[str], workers: int) -> None:
+    print(f"{len(pages)} pages, {workers} parse workers")
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for backend in BACKENDS:
+            for mode, pool in (("event loop", None), ("process pool", executor)):
+                pages_per_sec, total_stall, worst_stall = await run(backend, pages, pool)
+                print(
+                    f"{backend:<12} {mode:<13} {pages_per_sec:8.1f} pages/s   "
+                    f"stall total={total_stall * 1000:9.1f} ms   worst={worst_stall * 1000:7.1f} ms"
+                )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", help="Directory with saved *.html pages")
+    parser.add_argument("--pages", type=int, default=200, help="Synthetic pages to generate when no corpus is given")
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+
+    asyncio.run(main_async(load_corpus(args.corpus, args.pages), args.workers))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Compares query latency and resident memory of the FAISS index types (flat, hnsw, ivf)
+used by FaissArticlesRepo against a Chroma collection, for random vectors at several
+corpus sizes. Vectors are inserted directly so only the vector store is measured.
+Each backend runs in its own process so RSS deltas are not polluted by earlier runs.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_faiss_vs_chroma.py --sizes 10000 100000 1000000
+    PYTHONPATH=src python benchmarks/bench_faiss_vs_chroma.py --sizes 10000 --backends flat chroma
+"""
+import argparse
+import multiprocessing
+import statistics
+import tempfile
+import time
+
+import numpy as np
+
+BACKENDS = ("flat", "hnsw", "ivf", "chroma")
+
+
+def rss_mb() -> float:
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def percentile(samples: list[float], percent: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, round(percent / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+def build_faiss(backend: str, vectors: np.ndarray, nprobe: int):
+    import faiss
+
+    dimension = vectors.shape[1]
+    ids = np.arange(len(vectors), dtype=np.int64)
+
+    if backend == "hnsw":
+        index = faiss.index_factory(dimension, "IDMap2,HNSW32")
+    elif backend == "ivf":
+        nlist = max(1, int(4 * np.sqrt(len(vectors))))
+        index = faiss.index_factory(dimension, f"IDMap2,IVF{nlist},Flat")
+        index.train(vectors)
+        faiss.downcast_index(index.index).nprobe = nprobe
+    else:
+        index = faiss.index_factory(dimension, "IDMap2,Flat")
+
+    index.add_with_ids(vectors, ids)
+
+    return lambda query: index.search(query.reshape(1, -1), 4)
+
+
+def build_chroma(vectors: np.ndarray, directory: str):
+    import chromadb
+
+    client = chromadb.PersistentClient(path=directory)
+    collection = client.create_collection("bench")
+    batch_size = client.get_max_batch_size()
+    for start in range(0, len(vectors), batch_size):
+        batch = vectors[start:start + batch_size]
+        collection.add(
+            ids=[str(i) for i in range(start, start + len(batch))],
+            embeddings=batch,
+            documents=[""] * len(batch),
+        )
+
+    return lambda query: collection.query(query_embeddings=[query], n_results=4)
+
+
+def run_backend(backend: str, size: int, args: argparse.Namespace, results) -> None:
+    rng = np.random.default_rng(42)
+    vectors = rng.standard_normal((size, args.dimension), dtype=np.float32)
+    queries = rng.standard_normal((args.queries, args.dimension), dtype=np.float32)
+
+    baseline = rss_mb()
+    start = time.perf_counter()
+
+    with tempfile.TemporaryDirectory() as directory:
+        if backend == "chroma":
+            search = build_chroma(vectors, directory)
+        else:
+            search = build_faiss(backend, vectors, args.nprobe)
+
+        build_seconds = time.perf_counter() - start
+        memory = rss_mb() - baseline
+
+        samples = []
+        for query in queries:
+            start = time.perf_counter()
+            search(query)
+            samples.append(time.perf_counter() - start)
+
+    results.put((build_seconds, memory, samples))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS, default=list(BACKENDS))
+    parser.add_argument("--dimension", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--nprobe", type=int, default=16)
+    args = parser.parse_args()
+
+    print(f"{'backend':<8} {'size':>9} {'build s':>9} {'rss MB':>9} {'p50 ms':>9} {'p95 ms':>9}")
+    for size in args.sizes:
+        for backend in args.backends:
+            results = multiprocessing.Queue()
+            process = multiprocessing.Process(target=run_backend, args=(backend, size, args, results))
+            process.start()
+            build_seconds, memory, samples = results.get()
+            process.join()
+
+            print(
+                f"{backend:<8} {size:>9} {build_seconds:>9.1f} {memory:>9.1f} "
+                f"{statistics.median(samples) * 1000:>9.2f} {percentile(samples, 95) * 1000:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
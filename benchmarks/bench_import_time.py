@@ -0,0 +1,89 @@
+"""
+Measures the cold import time of the REST entrypoint with `python -X importtime`, in a fresh
+interpreter per run, and lists the slowest modules and the heavy libraries that were loaded.
+Importing the entrypoint should only pay for FastAPI and the application modules: langchain,
+langgraph, chromadb, transformers, openai and tiktoken are imported when the resources are built.
+
+For comparison, --eager also imports what AppResources.build and the dependency providers load,
+which is roughly what importing the entrypoint cost before the imports were made lazy.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_import_time.py
+    PYTHONPATH=src python benchmarks/bench_import_time.py --runs 10 --top 20 --budget-ms 1500
+    PYTHONPATH=src python benchmarks/bench_import_time.py --eager
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+MODULE = "entrypoints.rest.main"
+
+HEAVY_MODULES = (
+    "langchain", "langchain_core", "langgraph", "langsmith", "langchain_chroma", "chromadb",
+    "langchain_huggingface", "transformers", "torch", "langchain_openai", "openai", "tiktoken", "faiss",
+)
+
+EAGER_MODULES = (
+    "langchain_chroma", "langchain_huggingface", "langchain_openai", "application.services.azure_ai_summarizer",
+    "application.services.query_enhancer", "repositories.faiss_articles_repo", "repositories.chroma_articles_repo",
+    "application.utils.tokenizer",
+)
+
+
+def run_once(eager: bool) -> tuple[float, float, dict[str, tuple[int, int]], list[str]]:
+    """
+    Imports the entrypoint in a fresh interpreter.
+    Returns the wall time (ms), the total import time (ms), the self and cumulative import time (us)
+    per module and the heavy modules loaded.
+    """
+    imports = [MODULE, *EAGER_MODULES] if eager else [MODULE]
+    code = f"import sys; import {', '.join(imports)}; print(' '.join(sys.modules))"
+
+    start = time.perf_counter()
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True)
+    wall_ms = (time.perf_counter() - start) * 1000
+
+    timings, total_us = {}, 0
+    for line in process.stderr.splitlines():
+        fields = line.split("|")
+        if line.startswith("import time:") and len(fields) == 3 and fields[0][12:].strip().isdigit():
+            timings[fields[2].strip()] = (int(fields[0][12:]), int(fields[1]))
+            if not fields[2][1:].startswith(" "):  # top-level import, its cumulative time includes the nested ones
+                total_us += int(fields[1])
+
+    loaded = set(process.stdout.split())
+    return wall_ms, total_us / 1000, timings, [module for module in HEAVY_MODULES if module in loaded]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="Slowest modules to list, by self time")
+    parser.add_argument("--budget-ms", type=float, default=None, help="Exit with an error above this median import time")
+    parser.add_argument("--eager", action="store_true", help="Also import the modules loaded when the resources are built")
+    args = parser.parse_args()
+
+    runs = [run_once(args.eager) for _ in range(args.runs)]
+    wall = [wall_ms for wall_ms, _, _, _ in runs]
+    totals = [total_ms for _, total_ms, _, _ in runs]
+    entrypoint = [timings[MODULE][1] / 1000 for _, _, timings, _ in runs]
+    _, _, timings, heavy = runs[-1]
+
+    print(f"{MODULE}{' (eager)' if args.eager else ''}, {args.runs} runs")
+    print(f"entrypoint import  median {statistics.median(entrypoint):8.1f} ms  min {min(entrypoint):8.1f} ms")
+    print(f"interpreter wall   median {statistics.median(wall):8.1f} ms  min {min(wall):8.1f} ms")
+    print(f"all imports        median {statistics.median(totals):8.1f} ms  ({len(timings)} modules)")
+    print(f"heavy modules      {', '.join(heavy) or 'none'}")
+
+    print(f"\n{'self ms':>9} {'cumul ms':>9}  module")
+    for module, (self_us, cumulative_us) in sorted(timings.items(), key=lambda item: -item[1][0])[:args.top]:
+        print(f"{self_us / 1000:9.1f} {cumulative_us / 1000:9.1f}  {module}")
+
+    if args.budget_ms is not None and statistics.median(entrypoint) > args.budget_ms:
+        sys.exit(f"\nImport time {statistics.median(entrypoint):.1f} ms exceeds the budget of {args.budget_ms:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
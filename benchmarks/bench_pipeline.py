@@ -0,0 +1,224 @@
+"""
+End-to-end offline benchmark of the summarize and query paths. Runs the real
+SummarizeArticlesUseCase (WebScrapingArticlesProvider, AzureAISummarizer, ChromaArticlesRepo with
+BM25 and the content store) and QueryArticleUseCase, with three stand-ins so nothing leaves the
+machine:
+
+- a local HTTP server serving recorded news pages (--corpus) or a synthetic corpus of N articles;
+- a fake chat model answering after a configurable latency (--llm-latency, --llm-jitter), with
+  no quota unless --llm-requests-per-minute / --llm-tokens-per-minute set the scheduler budget;
+- deterministic fake embeddings, unless --embeddings-model names a Hugging Face model.
+
+Reports throughput, p50/p95/p99 latency and peak RSS for the scrape, summarize and save stages
+(timed per call inside the pipelined run), the pipeline end to end (per URL, from the start of
+the batch) and queries. Results are written as JSON; pass an earlier file to --compare to print
+the change per stage. Settings are read from the environment as for the service (e.g. the .env
+copied from .env.example), but no Azure endpoint is called.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_pipeline.py --articles 200
+    PYTHONPATH=src python benchmarks/bench_pipeline.py --articles 500 --llm-latency 1.5 --compare benchmarks/results/pipeline-20260101-120000.json
+    PYTHONPATH=src python benchmarks/bench_pipeline.py --corpus path/to/html_dir --articles 100
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import tiktoken
+
+from harness import WORDS, FakeChatModel, FixtureServer, byte_encoding, load_pages, print_stages, stage_stats, write_results
+
+UNLIMITED = 1e12
+
+
+class CallRecorder():
+    """Records the duration and time span of every call of the wrapped async methods."""
+    def __init__(self) -> None:
+        self.samples: list[float] = []
+        self.items = 0
+        self.first_start = None
+        self.last_end = None
+
+    def wrap(self, target: object, method: str, count_items=lambda args, result: 1) -> None:
+        original = getattr(target, method)
+
+        async def timed(*args, **kwargs):
+            start = time.perf_counter()
+            self.first_start = start if self.first_start is None else min(self.first_start, start)
+            result = await original(*args, **kwargs)
+            end = time.perf_counter()
+            self.samples.append(end - start)
+            self.items += count_items(args, result)
+            self.last_end = end if self.last_end is None else max(self.last_end, end)
+            return result
+
+        setattr(target, method, timed)
+
+    def stats(self) -> dict[str, float]:
+        elapsed = (self.last_end - self.first_start) if self.samples else 0.0
+        return stage_stats(self.samples, self.items, elapsed)
+
+
+def build_tokenizer(model: str):
+    from application.utils.tokenizer import Tokenizer
+
+    try:
+        return Tokenizer(model, encoding=tiktoken.encoding_for_model(model))
+    except Exception as exc:
+        # The BPE ranks are downloaded on first use; offline, count bytes instead
+        print(f"Using a byte-level tokenizer, {model} encoding unavailable: {type(exc).__name__}")
+        return Tokenizer(model, encoding=byte_encoding())
+
+
+def build_use_cases(directory: str, args: argparse.Namespace):
+    import chromadb
+    from langchain_chroma import Chroma
+    from langchain_core.embeddings import DeterministicFakeEmbedding
+    from application.services.azure_ai_summarizer import AzureAISummarizer
+    from application.services.batch_embedder import BatchEmbedder
+    from application.services.llm_scheduler import LlmScheduler
+    from application.services.query_enhancer import QueryEnhancer
+    from application.services.web_scraping_articles_provider import WebScrapingArticlesProvider
+    from application.use_cases.query_articles_use_case import QueryArticleUseCase
+    from application.use_cases.summarize_articles_use_case import SummarizeArticlesUseCase
+    from application.utils.token_limit_validator import TokenLimitValidator
+    from application.utils.tokenizer import TokenizerTextSplitter
+    from config.prompts import build_chunk_summary_prompt, build_query_enhancement_prompt, build_summary_prompt
+    from config.settings import settings
+    from repositories.bm25_index import Bm25Index
+    from repositories.chroma_articles_repo import ChromaArticlesRepo
+    from repositories.sqlite_content_store import SqliteContentStore
+
+    settings.USE_DETERMINISTIC_QUERY = not args.enhance_queries
+
+    if args.embeddings_model:
+        from langchain_huggingface import HuggingFaceEmbeddings
+        embeddings = HuggingFaceEmbeddings(model_name=args.embeddings_model)
+    else:
+        embeddings = DeterministicFakeEmbedding(size=384)
+
+    tokenizer = build_tokenizer(settings.AZURE_OPENAI_DEPLOYMENT_NAME)
+    llm = FakeChatModel(latency=args.llm_latency, jitter=args.llm_jitter)
+    scheduler = LlmScheduler(
+        requests_per_minute=args.llm_requests_per_minute or UNLIMITED,
+        tokens_per_minute=args.llm_tokens_per_minute or UNLIMITED,
+        max_concurrency=settings.LLM_MAX_CONCURRENCY,
+        completion_tokens=settings.LLM_COMPLETION_TOKENS_ESTIMATE,
+    )
+    summarizer = AzureAISummarizer(
+        llm,
+        build_summary_prompt(),
+        build_chunk_summary_prompt(),
+        TokenizerTextSplitter(tokenizer, chunk_size=settings.CHUNK_TOKEN_LIMIT, chunk_overlap=50),
+        TokenLimitValidator(max_tokens=settings.MAX_TOKEN_LIMIT, model_name=settings.AZURE_OPENAI_DEPLOYMENT_NAME, tokenizer=tokenizer),
+        scheduler,
+        tokenizer=tokenizer,
+        collapse_token_limit=settings.SUMMARY_COLLAPSE_TOKEN_LIMIT,
+        short_article_tokens=settings.SUMMARY_SHORT_ARTICLE_TOKENS,
+    )
+
+    repo = ChromaArticlesRepo(
+        Chroma(collection_name="benchmark", client=chromadb.PersistentClient(path=directory), embedding_function=embeddings),
+        BatchEmbedder(embeddings, batch_size=settings.EMBEDDING_BATCH_SIZE, executor=ThreadPoolExecutor(max_workers=settings.EMBEDDING_WORKERS)),
+        lexical_index=Bm25Index(os.path.join(directory, "bm25_index.sqlite3")),
+        candidates=settings.HYBRID_SEARCH_CANDIDATES,
+        rrf_k=settings.HYBRID_SEARCH_RRF_K,
+        content_store=SqliteContentStore(os.path.join(directory, "contents.sqlite3"), level=settings.CONTENT_STORE_ZSTD_LEVEL),
+    )
+    provider = WebScrapingArticlesProvider(http2=False, max_concurrency=settings.SCRAPER_MAX_CONCURRENCY)
+
+    summarize_use_case = SummarizeArticlesUseCase(
+        repo,
+        summarizer,
+        provider,
+        scrape_workers=settings.PIPELINE_SCRAPE_WORKERS,
+        summarize_workers=settings.PIPELINE_SUMMARIZE_WORKERS,
+        save_batch_size=settings.PIPELINE_SAVE_BATCH_SIZE,
+        queue_size=settings.PIPELINE_QUEUE_SIZE,
+    )
+    query_enhancer = QueryEnhancer(
+        llm,
+        build_query_enhancement_prompt(),
+        TokenLimitValidator(max_tokens=settings.QUERY_TOKEN_LIMIT, model_name=settings.AZURE_OPENAI_DEPLOYMENT_NAME, tokenizer=tokenizer),
+        scheduler=scheduler,
+    )
+
+    return summarize_use_case, QueryArticleUseCase(repo, query_enhancer, os.urandom(32), max_offset=settings.QUERY_MAX_OFFSET), provider, repo
+
+
+async def run_async(args: argparse.Namespace) -> dict[str, dict[str, float]]:
+    pages = load_pages(args.corpus, args.articles, args.words)
+
+    with tempfile.TemporaryDirectory() as directory, FixtureServer(pages, latency=args.server_latency) as server:
+        summarize_use_case, query_use_case, provider, repo = build_use_cases(directory, args)
+
+        scrape, summarize, save = CallRecorder(), CallRecorder(), CallRecorder()
+        scrape.wrap(provider, "get_async", lambda args, result: len(result))
+        summarize.wrap(summarize_use_case.summarizer, "summarize_async", lambda args, result: len(result))
+        save.wrap(repo, "save_async", lambda args, result: len(args[0]))
+
+        latencies, failures = [], 0
+        start = time.perf_counter()
+        async for result in summarize_use_case.stream(server.urls):
+            latencies.append(time.perf_counter() - start)
+            failures += result.status == "error"
+        pipeline = stage_stats(latencies, len(latencies), time.perf_counter() - start)
+        pipeline["failed"] = failures
+
+        rng = random.Random(7)
+        queries = [" ".join(rng.choices(WORDS, k=3)) for _ in range(args.queries)]
+        query_latencies = []
+        start = time.perf_counter()
+        for query in queries:
+            query_start = time.perf_counter()
+            await query_use_case(query, k=args.k)
+            query_latencies.append(time.perf_counter() - query_start)
+        query = stage_stats(query_latencies, len(queries), time.perf_counter() - start)
+
+        await provider.close_async()
+        repo.content_store.close()
+        repo.lexical_index.close()
+
+    return {"scrape": scrape.stats(), "summarize": summarize.stats(), "save": save.stats(), "pipeline": pipeline, "query": query}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=200)
+    parser.add_argument("--words", type=int, default=800, help="Words per synthetic article")
+    parser.add_argument("--corpus", help="Directory of recorded .html pages to serve instead of synthetic ones")
+    parser.add_argument("--server-latency", type=float, default=0.05, help="Seconds before the fixture server answers")
+    parser.add_argument("--llm-latency", type=float, default=0.5, help="Mean seconds per fake LLM call")
+    parser.add_argument("--llm-jitter", type=float, default=0.2, help="Standard deviation, as a fraction of the mean")
+    parser.add_argument("--llm-requests-per-minute", type=float, default=0, help="LLM scheduler request budget (0: unlimited)")
+    parser.add_argument("--llm-tokens-per-minute", type=float, default=0, help="LLM scheduler token budget (0: unlimited)")
+    parser.add_argument("--embeddings-model", help="Hugging Face model to embed with instead of fake embeddings")
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("-k", type=int, default=10, help="Results per query")
+    parser.add_argument("--enhance-queries", action="store_true", help="Rewrite queries with the fake LLM first")
+    parser.add_argument("--output", help="JSON results path (default benchmarks/results/pipeline-<time>.json)")
+    parser.add_argument("--compare", help="JSON results of an earlier run to compare with")
+    args = parser.parse_args()
+
+    stages = asyncio.run(run_async(args))
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)["stages"]
+
+    print(f"{args.articles} articles, LLM latency {args.llm_latency}s, {args.queries} queries")
+    print_stages(stages, baseline)
+
+    output = args.output or os.path.join(os.path.dirname(__file__), "results", f"pipeline-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    parameters = {key: value for key, value in vars(args).items() if key not in ("output", "compare")}
+    print(f"Results written to {write_results(output, 'pipeline', parameters, stages)}")
+
+
+if __name__ == "__main__":
+    main()
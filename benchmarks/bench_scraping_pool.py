@@ -0,0 +1,95 @@
+"""
+Measures scraping throughput (URLs/sec) of WebScrapingArticlesProvider against local
+HTTP servers, comparing a fresh httpx.AsyncClient per URL (previous behaviour) with the
+shared pooled client. Runs a same-host batch and a mixed-host batch (one server per port).
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_scraping_pool.py --urls 200 --hosts 5
+"""
+import argparse
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+import httpx
+
+from application.services.web_scraping_articles_provider import WebScrapingArticlesProvider
+
+ARTICLE_HTML = (
+    "<html><head><title>Benchmark article</title></head><body><article>"
+    + "<p>The minister announced new measures today. Critics disagreed. Markets moved.</p>" * 40
+    + "</article></body></html>"
+).encode()
+
+
+class ArticleHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(ARTICLE_HTML)))
+        self.end_headers()
+        self.wfile.write(ARTICLE_HTML)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_servers(count: int) -> list[ThreadingHTTPServer]:
+    servers = []
+    for _ in range(count):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), ArticleHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+    return servers
+
+
+class PerUrlClientProvider(WebScrapingArticlesProvider):
+    """Reproduces the previous behaviour: one client (and TCP handshake) per URL."""
+    async def _fetch_async(self, url: str, headers: Optional[dict[str, str]] = None) -> httpx.Response:
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            response = await client.get(url, headers=headers)
+            response.raise_for_status()
+        return response
+
+
+async def measure(provider: WebScrapingArticlesProvider, urls: list[str]) -> float:
+    start = time.perf_counter()
+    await provider.get_async(urls)
+    elapsed = time.perf_counter() - start
+    await provider.close_async()
+    return len(urls) / elapsed
+
+
+async def main_async(url_count: int, host_count: int) -> None:
+    servers = start_servers(host_count)
+    ports = [server.server_address[1] for server in servers]
+
+    batches = {
+        "same-host": [f"http://127.0.0.1:{ports[0]}/article/{i}" for i in range(url_count)],
+        "mixed-host": [f"http://127.0.0.1:{ports[i % host_count]}/article/{i}" for i in range(url_count)],
+    }
+
+    for batch_name, urls in batches.items():
+        per_url = await measure(PerUrlClientProvider(http2=False), urls)
+        pooled = await measure(WebScrapingArticlesProvider(http2=False), urls)
+        print(f"{batch_name:<11} per-url client: {per_url:8.1f} URLs/s   pooled client: {pooled:8.1f} URLs/s")
+
+    for server in servers:
+        server.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--urls", type=int, default=200)
+    parser.add_argument("--hosts", type=int, default=5)
+    args = parser.parse_args()
+
+    asyncio.run(main_async(args.urls, args.hosts))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Compares the latency of the /articles/query vector path when the embedding model,
+Chroma client and LLM are built per request (previous behaviour) versus shared
+through AppResources (current behaviour).
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_shared_resources.py --requests 20
+"""
+import argparse
+import statistics
+import time
+
+from abstractions.resources import AppResources
+
+
+def percentile(samples: list[float], percent: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, round(percent / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+def run_request(resources: AppResources, query: str) -> None:
+    resources.chroma.similarity_search_with_score(query)
+
+
+def bench_per_request(requests: int, query: str) -> list[float]:
+    samples = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        run_request(AppResources.build(), query)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def bench_shared(requests: int, query: str) -> list[float]:
+    resources = AppResources.build()
+    resources.embeddings.embed_query("warm up")
+
+    samples = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        run_request(resources, query)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def report(name: str, samples: list[float]) -> None:
+    print(
+        f"{name:<12} p50={percentile(samples, 50) * 1000:9.1f} ms  "
+        f"p99={percentile(samples, 99) * 1000:9.1f} ms  "
+        f"mean={statistics.mean(samples) * 1000:9.1f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--query", default="war in ukraine")
+    args = parser.parse_args()
+
+    report("per-request", bench_per_request(args.requests, args.query))
+    report("shared", bench_shared(args.requests, args.query))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Measures tokenization throughput (article tokens/sec) of the summarization prompt path for
+long synthetic articles: splitting an article into chunks, then counting the tokens of each
+chunk prompt once for the token limit validator and once for the LLM scheduler.
+
+- before: TokenTextSplitter-style split (encode, decode chunk by chunk) and a full encode of the
+  joined prompt messages for every count.
+- after:  the shared Tokenizer (one encode per article, batch decode, batch encode of the chunk
+  prompts, cached system prompt and chunk counts).
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_tokenization.py --articles 100
+    PYTHONPATH=src python benchmarks/bench_tokenization.py --offline   # byte-level encoding, no download
+"""
+import argparse
+import random
+import time
+
+import tiktoken
+from langchain_core.prompts.chat import ChatPromptValue
+
+from application.utils.tokenizer import Tokenizer
+from application.utils.token_limit_validator import TokenLimitValidator
+from config.prompts import build_chunk_summary_prompt
+from harness import byte_encoding
+
+WORDS = "government election market climate war peace economy court minister protest energy health".split()
+
+
+def synthetic_articles(count: int, words: int) -> list[str]:
+    rng = random.Random(42)
+    return [f"Article {i}. " + " ".join(rng.choices(WORDS, k=words)) + "." for i in range(count)]
+
+
+def build_encoding(offline: bool, model: str) -> tiktoken.Encoding:
+    if offline:
+        return byte_encoding()
+    return tiktoken.encoding_for_model(model)
+
+
+def chunk_prompts(chunks: list[str]) -> list[ChatPromptValue]:
+    prompt = build_chunk_summary_prompt()
+    return [prompt.invoke({"headline": "Headline", "content": chunk}) for chunk in chunks]
+
+
+def run_before(articles: list[str], encoding: tiktoken.Encoding, chunk_size: int, overlap: int) -> None:
+    for article in articles:
+        tokens = encoding.encode(article)
+        chunks = []
+        for start in range(0, len(tokens), chunk_size - overlap):
+            chunks.append(encoding.decode(tokens[start:start + chunk_size]))
+            if start + chunk_size >= len(tokens):
+                break
+
+        for prompt in chunk_prompts(chunks):
+            for _ in range(2):  # validator, then scheduler estimate
+                len(encoding.encode(" ".join(f"{message.content}" for message in prompt.messages)))
+
+
+def run_after(articles: list[str], encoding: tiktoken.Encoding, chunk_size: int, overlap: int) -> None:
+    tokenizer = Tokenizer("unused", encoding=encoding)
+    validator = TokenLimitValidator(max_tokens=10**9, model_name="unused", tokenizer=tokenizer)
+
+    for article in articles:
+        prompts = chunk_prompts(tokenizer.split_text(article, chunk_size, overlap))
+
+        validator._count_batch(prompts)
+        for prompt in prompts:
+            for _ in range(2):
+                validator.count_tokens(prompt)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=100)
+    parser.add_argument("--words", type=int, default=8_000, help="Words per article")
+    parser.add_argument("--chunk-size", type=int, default=1_000)
+    parser.add_argument("--chunk-overlap", type=int, default=50)
+    parser.add_argument("--model", default="gpt-4o-mini")
+    parser.add_argument("--offline", action="store_true", help="Use a byte-level encoding (no BPE download)")
+    args = parser.parse_args()
+
+    encoding = build_encoding(args.offline, args.model)
+    articles = synthetic_articles(args.articles, args.words)
+    total_tokens = sum(map(len, encoding.encode_ordinary_batch(articles)))
+
+    print(f"{len(articles)} articles, {total_tokens} tokens ({encoding.name})")
+    for name, run in (("before", run_before), ("after", run_after)):
+        start = time.perf_counter()
+        run(articles, encoding, args.chunk_size, args.chunk_overlap)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<8} {total_tokens / elapsed:12.0f} tokens/s  ({elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+"""
+Shared pieces of the offline benchmarks: a latency-configurable fake chat model, a local HTTP
+server serving news article pages, a synthetic article corpus, a byte-level tokenizer encoding,
+latency statistics and JSON results that can be compared between runs. Nothing here calls Azure or the internet.
+"""
+import asyncio
+import json
+import os
+import platform
+import random
+import resource
+import statistics
+import subprocess
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Optional
+
+import tiktoken
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+WORDS = (
+    "government election market climate war peace economy court minister protest energy health "
+    "parliament budget inflation storm flood vaccine strike border treaty reform investigation "
+    "company shares bank interest rates police court ruling president senate coalition summit"
+).split()
+TOPICS = ["Politics", "Economy", "Climate", "Health", "Justice", "World"]
+BIASES = ["Right", "Lean Right", "None", "Lean Left", "Left"]
+# The pre-tokenization pattern of cl100k_base
+PATTERN = r"""'s|'t|'re|'ve|'m|'ll|'d| ?\p{L}+| ?\p{N}+| ?[^\s\p{L}\p{N}]+|\s+(?!\S)|\s+"""
+
+
+def byte_encoding() -> tiktoken.Encoding:
+    """Returns an encoding with one token per byte, for when the BPE ranks cannot be downloaded."""
+    return tiktoken.Encoding(name="bytes", pat_str=PATTERN, mergeable_ranks={bytes([i]): i for i in range(256)}, special_tokens={})
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    Chat model answering the summarization and query prompts of the service after a simulated
+    latency: chunk prompts get a short summary, final prompts a JSON enriched article and query
+    prompts a rewritten query. Reports token usage like the OpenAI models, so the LLM metrics work.
+    """
+    latency: float = 0.5
+    jitter: float = 0.2
+    summary_words: int = 60
+    seed: int = 42
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-benchmark"
+
+    def _answer(self, messages: list[BaseMessage]) -> tuple[str, float]:
+        prompt = "\n".join(str(message.content) for message in messages)
+        rng = random.Random(self.seed + zlib.crc32(prompt.encode()))
+        delay = max(0.0, rng.gauss(self.latency, self.jitter * self.latency))
+
+        if "structured data" in prompt:
+            content = json.dumps({
+                "summary": " ".join(rng.choices(WORDS, k=self.summary_words)),
+                "topics": rng.sample(TOPICS, 2),
+                "political_bias": rng.choice(BIASES),
+            })
+        elif "Rewrite this query" in prompt:
+            content = prompt.rsplit("Query:", 1)[-1].strip() + " " + " ".join(rng.choices(WORDS, k=5))
+        else:
+            content = " ".join(rng.choices(WORDS, k=self.summary_words))
+        return content, delay
+
+    def _result(self, messages: list[BaseMessage], content: str) -> ChatResult:
+        prompt_tokens = sum(len(str(message.content).split()) for message in messages)
+        usage = {"prompt_tokens": prompt_tokens, "completion_tokens": len(content.split())}
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=content))], llm_output={"token_usage": usage})
+
+    def _generate(self, messages: list[BaseMessage], stop: Optional[list[str]] = None, run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        content, delay = self._answer(messages)
+        time.sleep(delay)
+        return self._result(messages, content)
+
+    async def _agenerate(self, messages: list[BaseMessage], stop: Optional[list[str]] = None, run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        content, delay = self._answer(messages)
+        await asyncio.sleep(delay)
+        return self._result(messages, content)
+
+    def with_structured_output(self, schema, **kwargs):
+        return self | PydanticOutputParser(pydantic_object=schema)
+
+
+def synthetic_corpus(count: int, words: int, seed: int = 42) -> list[dict[str, str]]:
+    """Generates articles with a headline and paragraphs of news-like words."""
+    rng = random.Random(seed)
+    articles = []
+    for i in range(count):
+        sentences = [
+            " ".join(rng.choices(WORDS, k=rng.randint(8, 20))).capitalize() + "." for _ in range(max(1, words // 14))
+        ]
+        paragraphs = [" ".join(sentences[start:start + 4]) for start in range(0, len(sentences), 4)]
+        articles.append({"headline": f"Article {i}: {' '.join(rng.choices(WORDS, k=5)).title()}", "paragraphs": paragraphs})
+    return articles
+
+
+def render_page(article: dict[str, Any]) -> bytes:
+    """Renders an article as a news page with navigation, related links and footer boilerplate."""
+    paragraphs = "".join(f"<p>{paragraph}</p>" for paragraph in article["paragraphs"])
+    return (
+        f"<html><head><title>{article['headline']}</title><meta charset='utf-8'></head><body>"
+        + "<nav>" + "".join(f"<a href='/section/{topic}'>{topic}</a>" for topic in TOPICS * 10) + "</nav>"
+        + f"<main><article><h1>{article['headline']}</h1>{paragraphs}</article></main>"
+        + "<aside>" + "<a href='/related'>Related story</a>" * 30 + "</aside>"
+        + "<footer>" + "<p>Copyright News Corp. All rights reserved.</p>" * 3 + "</footer></body></html>"
+    ).encode()
+
+
+def load_pages(corpus: Optional[str], count: int, words: int) -> list[bytes]:
+    """Loads recorded .html pages from a directory (cycled up to count), or renders synthetic ones."""
+    if corpus:
+        recorded = [path.read_bytes() for path in sorted(Path(corpus).glob("*.html"))]
+        if not recorded:
+            raise SystemExit(f"No .html pages found in {corpus}")
+        return [recorded[i % len(recorded)] for i in range(count)]
+
+    return [render_page(article) for article in synthetic_corpus(count, words)]
+
+
+class FixtureServer():
+    """
+    Local HTTP server serving the pages at /article/<n>, with an optional simulated response latency.
+    A numbered paragraph is added to each article body, so recorded pages served more than once
+    still have distinct contents and are summarized as new articles.
+    """
+    def __init__(self, pages: list[bytes], latency: float = 0.0) -> None:
+        self.pages = [number_page(page, i) for i, page in enumerate(pages)]
+        self.latency = latency
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def __enter__(self) -> "FixtureServer":
+        pages, latency = self.pages, self.latency
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                try:
+                    page = pages[int(self.path.rsplit("/", 1)[-1])]
+                except (ValueError, IndexError):
+                    self.send_error(404)
+                    return
+                if latency:
+                    time.sleep(latency)
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(page)))
+                self.end_headers()
+                self.wfile.write(page)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    @property
+    def urls(self) -> list[str]:
+        port = self._server.server_address[1]
+        return [f"http://127.0.0.1:{port}/article/{i}" for i in range(len(self.pages))]
+
+
+def number_page(page: bytes, number: int) -> bytes:
+    paragraph = f"<p>Edition {number}.</p>".encode()
+    for closing_tag in (b"</article>", b"</main>", b"</body>"):
+        position = page.rfind(closing_tag)
+        if position != -1:
+            return page[:position] + paragraph + page[position:]
+    return page + paragraph
+
+
+def percentile(samples: list[float], percent: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, round(percent / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+def peak_rss_mb() -> float:
+    """Peak resident memory of the process so far (ru_maxrss is in KiB on Linux, bytes on macOS)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 / 1024 if platform.system() == "Darwin" else peak / 1024
+
+
+def stage_stats(samples: list[float], items: int, elapsed: float) -> dict[str, float]:
+    """Throughput and latency percentiles (ms) of a stage, with the peak RSS when it finished."""
+    return {
+        "items": items,
+        "calls": len(samples),
+        "elapsed_s": round(elapsed, 3),
+        "throughput_per_s": round(items / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(percentile(samples, 50) * 1000, 2) if samples else 0.0,
+        "p95_ms": round(percentile(samples, 95) * 1000, 2) if samples else 0.0,
+        "p99_ms": round(percentile(samples, 99) * 1000, 2) if samples else 0.0,
+        "mean_ms": round(statistics.fmean(samples) * 1000, 2) if samples else 0.0,
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def write_results(path: str, benchmark: str, parameters: dict[str, Any], stages: dict[str, dict[str, float]]) -> str:
+    """Writes the results with the run parameters, git revision and host, returning the path."""
+    results = {
+        "benchmark": benchmark,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "machine": f"{platform.system()} {platform.machine()}, {os.cpu_count()} CPUs",
+        "parameters": parameters,
+        "stages": stages,
+    }
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as file:
+        json.dump(results, file, indent=2)
+    return path
+
+
+def print_stages(stages: dict[str, dict[str, float]], baseline: Optional[dict[str, dict[str, float]]] = None) -> None:
+    """Prints the stage table, with the change against a baseline run if one is given."""
+    columns = ("throughput_per_s", "p50_ms", "p95_ms", "p99_ms", "peak_rss_mb")
+    width = max([10, *map(len, stages)])
+    print(f"{'stage':<{width}} {'items':>6} {'items/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'peak RSS MB':>12}")
+    for name, stats in stages.items():
+        print(f"{name:<{width}} {stats['items']:>6} " + " ".join(
+            f"{stats[column]:>{12 if column == 'peak_rss_mb' else 9}.1f}" for column in columns
+        ))
+        if baseline and name in baseline:
+            print(f"{'  vs base':<{width}} {'':>6} " + " ".join(
+                f"{change(stats[column], baseline[name][column]):>{12 if column == 'peak_rss_mb' else 9}}" for column in columns
+            ))
+
+
+def change(value: float, base: float) -> str:
+    if not base:
+        return "n/a"
+    return f"{(value - base) / base * 100:+.1f}%"
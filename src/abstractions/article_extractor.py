@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+
+class ArticleExtractor(ABC):
+    """
+    Abstract base class for article extractors.
+    This class defines the interface for extracting the headline and content from raw HTML.
+    Implementations must be picklable so extraction can run in a process pool.
+    """
+    @abstractmethod
+    def extract(self, html: str) -> dict[str, str]:
+        pass
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Union
 
 class ArticlesProvider(ABC):
     """
@@ -8,5 +8,13 @@ class ArticlesProvider(ABC):
     It should be implemented by any concrete provider class.
     """
     @abstractmethod
-    def get_async(self, paths: list[str]) -> tuple[Optional[str], str]:
+    async def get_async(self, paths: list[str]) -> list[Union[dict[str, str], Exception]]:
+        """
+        Fetches the articles at the given paths. A path that fails must not abort the others:
+        the error raised for it is returned in its place.
+        """
+        pass
+
+    async def close_async(self) -> None:
+        """Releases any resources (e.g. pooled connections) held by the provider."""
         pass
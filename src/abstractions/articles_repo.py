@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 from domain.article_enriched import ArticleEnriched
+from domain.article_filters import ArticleFilters
 
 class ArticlesRepo(ABC):
     """
@@ -12,5 +14,13 @@ class ArticlesRepo(ABC):
         pass
 
     @abstractmethod
-    def query_async(self, query: str) -> str:
+    def query_async(self, query: str, k: int = 4, offset: int = 0, filters: Optional[ArticleFilters] = None) -> list:
+        pass
+
+    @abstractmethod
+    def get_by_fingerprints_async(self, fingerprints: list[str]) -> dict[str, ArticleEnriched]:
+        pass
+
+    @abstractmethod
+    def get_contents_async(self, ids: list[str]) -> dict[str, str]:
         pass
@@ -0,0 +1,43 @@
+from abc import ABC, abstractmethod
+from typing import Any, Iterator, Optional
+from domain.embedding_signature import EmbeddingSignature
+
+class CollectionMigrator(ABC):
+    """
+    Abstract base class for moving a vector collection to new embeddings.
+    The stored documents are copied with new vectors into a shadow collection, which is then swapped
+    in for the live one; the live collection is retired and dropped once nothing uses it.
+    Sources are "live" (copied to the shadow) and "retired" (copied to the live collection after a swap).
+    It should be implemented by any concrete vector store supporting migrations.
+    """
+    @abstractmethod
+    def signature(self) -> Optional[EmbeddingSignature]:
+        pass
+
+    @abstractmethod
+    def prepare_shadow(self, signature: EmbeddingSignature) -> None:
+        pass
+
+    @abstractmethod
+    def iter_id_pages(self, source: str, batch_size: int) -> Iterator[list[str]]:
+        pass
+
+    @abstractmethod
+    def missing(self, source: str, ids: list[str]) -> tuple[list[str], list[str], list[dict[str, Any]]]:
+        pass
+
+    @abstractmethod
+    def write(self, source: str, ids: list[str], embeddings: Any, documents: list[str], metadatas: list[dict[str, Any]]) -> None:
+        pass
+
+    @abstractmethod
+    def swap(self) -> None:
+        pass
+
+    @abstractmethod
+    def has_retired(self) -> bool:
+        pass
+
+    @abstractmethod
+    def drop_retired(self) -> None:
+        pass
@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+
+class ContentStore(ABC):
+    """
+    Abstract base class for article content stores.
+    This class defines the interface for storing the full text of articles apart from the vector index, keyed by article id.
+    It should be implemented by any concrete content store class.
+    """
+    @abstractmethod
+    def put_many(self, contents: dict[str, str]) -> None:
+        pass
+
+    @abstractmethod
+    def get_many(self, ids: list[str]) -> dict[str, str]:
+        pass
+
+    @abstractmethod
+    def stats(self) -> dict[str, int]:
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        pass
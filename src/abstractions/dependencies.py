@@ -1,97 +1,195 @@
-from langchain_chroma import Chroma
-from langchain_huggingface import HuggingFaceEmbeddings
-from langchain_openai import AzureChatOpenAI
-from langchain.text_splitter import TokenTextSplitter
-from langchain_core.language_models.chat_models import BaseChatModel
-from typing import Annotated
-from fastapi import Depends
-from langchain_core.rate_limiters import InMemoryRateLimiter
+from typing import TYPE_CHECKING, Annotated, Optional
+from fastapi import Depends, Request
 
 from abstractions.articles_repo import ArticlesRepo
+from abstractions.resources import AppResources, ArticleStore
 from abstractions.summarizer import Summarizer
 from abstractions.articles_provider import ArticlesProvider
-from application.services.azure_ai_summarizer import AzureAISummarizer
+from abstractions.summary_job_store import SummaryJobStore
+from application.exceptions.service_not_ready_error import ServiceNotReadyError
 from application.use_cases.summarize_articles_use_case import SummarizeArticlesUseCase
 from application.use_cases.query_articles_use_case import QueryArticleUseCase
-from application.services.query_enhancer import QueryEnhancer
-from application.services.web_scraping_articles_provider import WebScrapingArticlesProvider
-from config.prompts import build_summary_prompt, build_chunk_summary_prompt, build_query_enhancement_prompt
+from application.use_cases.submit_summary_job_use_case import SubmitSummaryJobUseCase
+from application.use_cases.get_summary_job_use_case import GetSummaryJobUseCase
+from application.use_cases.ingest_articles_use_case import IngestArticlesUseCase
+from application.services.summary_job_runner import SummaryJobRunner
 from config.settings import settings
-from repositories.chroma_articles_repo import ChromaArticlesRepo
-from application.utils.token_limit_validator import TokenLimitValidator
+
+# langchain, langgraph, chromadb, transformers, openai and tiktoken are imported by the providers
+# that build objects from them, so importing the REST entrypoint stays fast
+if TYPE_CHECKING:
+    from langchain_chroma import Chroma
+    from langchain_huggingface import HuggingFaceEmbeddings
+    from langchain_openai import AzureChatOpenAI
+    from langchain.text_splitter import TextSplitter
+    from langchain_core.language_models.chat_models import BaseChatModel
+    from application.services.query_enhancer import QueryEnhancer
+    from application.services.semantic_query_cache import SemanticQueryCache
+    from application.services.batch_embedder import BatchEmbedder
+    from application.services.llm_scheduler import LlmScheduler
+    from application.utils.token_limit_validator import TokenLimitValidator
+    from application.utils.tokenizer import Tokenizer
+
+### Shared resources
+def get_resources(request: Request) -> AppResources:
+    resources = request.app.state.resources
+    if resources is None:
+        raise ServiceNotReadyError()
+
+    return resources
 
 ### Vectore Stores
-def get_embeddings():
-    return HuggingFaceEmbeddings(model_name=settings.HUGGINGFACE_MODEL_NAME)
-
-def get_chroma(embeddings: Annotated[HuggingFaceEmbeddings, Depends(get_embeddings)]) -> Chroma: 
-    return Chroma(
-        collection_name=settings.ARTICLES_COLLECTION_NAME,
-        embedding_function=embeddings,
-        persist_directory=settings.CHROMA_PERSIST_DIRECTORY,
-        
-    )
+def get_embeddings(resources: Annotated[AppResources, Depends(get_resources)]) -> "HuggingFaceEmbeddings":
+    return resources.embeddings
 
-def get_articles_repo(
-    chroma_vectore_store: Annotated[Chroma, Depends(get_chroma)],
-) -> ArticlesRepo:
-    return ChromaArticlesRepo(chroma_vectore_store)
+def get_article_store(resources: Annotated[AppResources, Depends(get_resources)]) -> ArticleStore:
+    return resources.store
+
+def get_chroma(store: Annotated[ArticleStore, Depends(get_article_store)]) -> "Chroma": 
+    return store.chroma
+
+def get_embedder(store: Annotated[ArticleStore, Depends(get_article_store)]) -> "BatchEmbedder":
+    return store.embedder
+
+def get_articles_repo(store: Annotated[ArticleStore, Depends(get_article_store)]) -> ArticlesRepo:
+    return store.articles_repo
 
 ### LLM
-def get_llm() -> BaseChatModel:
-    rate_limiter = InMemoryRateLimiter(
-        requests_per_second=10, # 10 per second
-        check_every_n_seconds=0.1,  # Wake up every 100 ms to check whether allowed to make a request
-        max_bucket_size=10,  # Controls the maximum burst size
-    )
-    return AzureChatOpenAI(
-        azure_endpoint=settings.AZURE_OPENAI_ENDPOINT,
-        azure_deployment=settings.AZURE_OPENAI_DEPLOYMENT_NAME,
-        openai_api_version=settings.AZURE_OPENAI_API_VERSION,
-        temperature=0.3,
-        rate_limiter=rate_limiter
-    )
+def get_llm(resources: Annotated[AppResources, Depends(get_resources)]) -> "BaseChatModel":
+    return resources.llm
+
+def get_llm_scheduler(resources: Annotated[AppResources, Depends(get_resources)]) -> Optional["LlmScheduler"]:
+    return resources.llm_scheduler
+
+def get_tokenizer(resources: Annotated[AppResources, Depends(get_resources)]) -> "Tokenizer":
+    return resources.tokenizer
+
+def get_query_token_validator(tokenizer: Annotated["Tokenizer", Depends(get_tokenizer)]) -> "TokenLimitValidator":
+    from application.utils.token_limit_validator import TokenLimitValidator
 
-def get_query_token_validator() -> TokenLimitValidator:
-    return TokenLimitValidator(max_tokens=settings.QUERY_TOKEN_LIMIT,model_name=settings.AZURE_OPENAI_DEPLOYMENT_NAME)
+    return TokenLimitValidator(max_tokens=settings.QUERY_TOKEN_LIMIT,model_name=settings.AZURE_OPENAI_DEPLOYMENT_NAME, tokenizer=tokenizer)
+
+def get_semantic_query_cache(resources: Annotated[AppResources, Depends(get_resources)]) -> Optional["SemanticQueryCache"]:
+    return resources.semantic_query_cache
 
 def get_query_enhancer(
-    llm: Annotated[AzureChatOpenAI, Depends(get_llm)],
-    token_limit_validator: Annotated[TokenLimitValidator, Depends(get_query_token_validator)]
+    llm: Annotated["AzureChatOpenAI", Depends(get_llm)],
+    token_limit_validator: Annotated["TokenLimitValidator", Depends(get_query_token_validator)],
+    semantic_cache: Annotated[Optional["SemanticQueryCache"], Depends(get_semantic_query_cache)],
+    scheduler: Annotated[Optional["LlmScheduler"], Depends(get_llm_scheduler)],
 ):    
+    from application.services.query_enhancer import QueryEnhancer
+    from config.prompts import build_query_enhancement_prompt
+
     prompt = build_query_enhancement_prompt()
     
-    return QueryEnhancer(llm, prompt, token_limit_validator)
+    return QueryEnhancer(llm, prompt, token_limit_validator, semantic_cache, scheduler)
+
+def get_summary_token_validator(tokenizer: Annotated["Tokenizer", Depends(get_tokenizer)]) -> "TokenLimitValidator":
+    from application.utils.token_limit_validator import TokenLimitValidator
+
+    return TokenLimitValidator(max_tokens=settings.MAX_TOKEN_LIMIT,model_name=settings.AZURE_OPENAI_DEPLOYMENT_NAME, tokenizer=tokenizer)
 
-def get_summary_token_validator() -> TokenLimitValidator:
-    return TokenLimitValidator(max_tokens=settings.MAX_TOKEN_LIMIT,model_name=settings.AZURE_OPENAI_DEPLOYMENT_NAME)
+def get_token_text_splitter(tokenizer: Annotated["Tokenizer", Depends(get_tokenizer)]) -> "TextSplitter":
+    from application.utils.tokenizer import TokenizerTextSplitter
 
-def get_token_text_splitter() -> TokenTextSplitter:
-    return TokenTextSplitter(model_name=settings.AZURE_OPENAI_DEPLOYMENT_NAME, chunk_size=settings.CHUNK_TOKEN_LIMIT, chunk_overlap=50)
+    return TokenizerTextSplitter(tokenizer, chunk_size=settings.CHUNK_TOKEN_LIMIT, chunk_overlap=50)
 
 def get_summarizer(
-    llm: Annotated[BaseChatModel, Depends(get_llm)],
-    token_text_splitter: Annotated[TokenTextSplitter, Depends(get_token_text_splitter)],
-    token_limit_validator: Annotated[TokenLimitValidator, Depends(get_summary_token_validator)]
+    llm: Annotated["BaseChatModel", Depends(get_llm)],
+    token_text_splitter: Annotated["TextSplitter", Depends(get_token_text_splitter)],
+    token_limit_validator: Annotated["TokenLimitValidator", Depends(get_summary_token_validator)],
+    scheduler: Annotated[Optional["LlmScheduler"], Depends(get_llm_scheduler)],
+    tokenizer: Annotated["Tokenizer", Depends(get_tokenizer)],
     ) -> Summarizer:
+    from application.services.azure_ai_summarizer import AzureAISummarizer
+    from config.prompts import build_summary_prompt, build_chunk_summary_prompt
+
     summary_prompt = build_summary_prompt()
     chunk_summary_prompt = build_chunk_summary_prompt()
     
-    return AzureAISummarizer(llm, summary_prompt, chunk_summary_prompt, token_text_splitter, token_limit_validator)
+    return AzureAISummarizer(
+        llm,
+        summary_prompt,
+        chunk_summary_prompt,
+        token_text_splitter,
+        token_limit_validator,
+        scheduler,
+        tokenizer=tokenizer,
+        collapse_token_limit=settings.SUMMARY_COLLAPSE_TOKEN_LIMIT,
+        short_article_tokens=settings.SUMMARY_SHORT_ARTICLE_TOKENS,
+    )
 
 ### Services    
-def get_articles_provider() -> ArticlesProvider:
-    return WebScrapingArticlesProvider()
+def get_articles_provider(resources: Annotated[AppResources, Depends(get_resources)]) -> ArticlesProvider:
+    return resources.articles_provider
 
 def get_query_articles_user_case(
         articles_repo: Annotated[ArticlesRepo, Depends(get_articles_repo)],
-        query_enhancer: Annotated[QueryEnhancer, Depends(get_query_enhancer)]
+        query_enhancer: Annotated["QueryEnhancer", Depends(get_query_enhancer)],
+        resources: Annotated[AppResources, Depends(get_resources)],
 ) -> QueryArticleUseCase:
-    return QueryArticleUseCase(articles_repo, query_enhancer)
+    return QueryArticleUseCase(articles_repo, query_enhancer, resources.cursor_secret, max_offset=settings.QUERY_MAX_OFFSET)
 
 def get_summarize_articles_user_case(
         articles_repo: Annotated[ArticlesRepo, Depends(get_articles_repo)],
         summarizer: Annotated[Summarizer, Depends(get_summarizer)],
         articles_provider: Annotated[ArticlesProvider, Depends(get_articles_provider)],
 ) -> SummarizeArticlesUseCase:
-    return SummarizeArticlesUseCase(articles_repo, summarizer, articles_provider)
+    return build_pipelined_use_case(articles_repo, summarizer, articles_provider)
+
+def build_summarize_articles_use_case(resources: AppResources) -> SummarizeArticlesUseCase:
+    """Builds the summarize use case outside of a request, for the background job workers."""
+    summarizer = get_summarizer(
+        resources.llm,
+        get_token_text_splitter(resources.tokenizer),
+        get_summary_token_validator(resources.tokenizer),
+        resources.llm_scheduler,
+        resources.tokenizer,
+    )
+    articles_repo = resources.store.articles_repo
+
+    return build_pipelined_use_case(articles_repo, summarizer, resources.articles_provider)
+
+def build_ingest_articles_use_case(resources: AppResources, summarize: bool = True, parallel: int = 4) -> IngestArticlesUseCase:
+    """Builds the bulk ingestion use case outside of a request, for the ingestion CLI."""
+    summarizer = get_summarizer(
+        resources.llm,
+        get_token_text_splitter(resources.tokenizer),
+        get_summary_token_validator(resources.tokenizer),
+        resources.llm_scheduler,
+        resources.tokenizer,
+    )
+    articles_repo = resources.store.articles_repo
+
+    return IngestArticlesUseCase(articles_repo, summarizer, summarize=summarize, parallel=parallel)
+
+def build_pipelined_use_case(
+        articles_repo: ArticlesRepo, summarizer: Summarizer, articles_provider: ArticlesProvider
+) -> SummarizeArticlesUseCase:
+    """Builds the summarize use case with the pipeline stage limits of the settings."""
+    return SummarizeArticlesUseCase(
+        articles_repo,
+        summarizer,
+        articles_provider,
+        scrape_workers=settings.PIPELINE_SCRAPE_WORKERS,
+        summarize_workers=settings.PIPELINE_SUMMARIZE_WORKERS,
+        save_batch_size=settings.PIPELINE_SAVE_BATCH_SIZE,
+        queue_size=settings.PIPELINE_QUEUE_SIZE,
+    )
+
+### Background jobs
+def get_summary_job_store(resources: Annotated[AppResources, Depends(get_resources)]) -> SummaryJobStore:
+    return resources.summary_job_store
+
+def get_summary_job_runner(request: Request) -> SummaryJobRunner:
+    return request.app.state.summary_job_runner
+
+def get_submit_summary_job_use_case(
+        store: Annotated[SummaryJobStore, Depends(get_summary_job_store)],
+        runner: Annotated[SummaryJobRunner, Depends(get_summary_job_runner)],
+) -> SubmitSummaryJobUseCase:
+    return SubmitSummaryJobUseCase(store, runner)
+
+def get_summary_job_use_case(store: Annotated[SummaryJobStore, Depends(get_summary_job_store)]) -> GetSummaryJobUseCase:
+    return GetSummaryJobUseCase(store)
@@ -0,0 +1,513 @@
+import asyncio
+import logging
+import os
+import secrets
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Optional
+
+from abstractions.articles_provider import ArticlesProvider
+from abstractions.articles_repo import ArticlesRepo
+from config.settings import settings
+from repositories.sqlite_scrape_cache import SqliteScrapeCache
+from repositories.sqlite_summary_job_store import SqliteSummaryJobStore
+from repositories.store_directory_lock import StoreDirectoryLock
+
+if TYPE_CHECKING:
+    from langchain_core.embeddings import Embeddings
+    from langchain_chroma import Chroma
+    from langchain_huggingface import HuggingFaceEmbeddings
+    from langchain_core.language_models.chat_models import BaseChatModel
+    from application.services.semantic_query_cache import SemanticQueryCache
+    from application.services.batch_embedder import BatchEmbedder
+    from application.services.llm_scheduler import LlmScheduler
+    from application.utils.tokenizer import Tokenizer
+    from repositories.sqlite_llm_cache import SqliteLLMCache
+    from repositories.faiss_articles_repo import FaissArticlesRepo
+    from repositories.bm25_index import Bm25Index
+    from repositories.sqlite_content_store import SqliteContentStore
+    from repositories.chroma_collection_migrator import ChromaCollectionMigrator
+    from application.services.reembedding_job import ReembeddingJob
+    from domain.embedding_signature import EmbeddingSignature
+
+@dataclass(frozen=True)
+class ArticleStore():
+    """
+    The vector store together with the embedder saving into it and the articles repository over both.
+    It is replaced as a whole when the collection is migrated to another embedding model, so a
+    request reading it once never mixes the store of one model with the embedder of the other.
+    """
+    chroma: "Chroma"
+    embedder: Optional["BatchEmbedder"]
+    articles_repo: ArticlesRepo
+
+class AppResources():
+    """
+    Container for the heavy, process-wide resources shared by every request, built once at
+    application startup and released on shutdown: the embedding model and its batch embedder, the
+    article store (Chroma or FAISS, with the BM25 index and the content store), the LLM with its
+    scheduler and response cache, the tokenizer, the semantic query cache, the summary job store,
+    the pooled scraping client and the HTML parsing process pool.
+    The Chroma collection records the embedding model its vectors were computed with. When the configured
+    model differs, the stored articles keep being queried with their own model while a background job
+    re-embeds them, and the store and embedder are swapped for the re-embedded ones when it is done.
+    The libraries behind them (langchain, chromadb, transformers, openai, tiktoken, faiss) are imported
+    when the resources are built rather than when this module is imported, so the web server starts fast.
+    """
+    def __init__(
+        self,
+        embeddings: "HuggingFaceEmbeddings",
+        chroma: "Chroma",
+        llm: "BaseChatModel",
+        articles_provider: ArticlesProvider,
+        parse_executor: Optional[ProcessPoolExecutor] = None,
+        llm_cache: Optional["SqliteLLMCache"] = None,
+        semantic_query_cache: Optional["SemanticQueryCache"] = None,
+        embedder: Optional["BatchEmbedder"] = None,
+        faiss_articles_repo: Optional["FaissArticlesRepo"] = None,
+        summary_job_store: Optional[SqliteSummaryJobStore] = None,
+        llm_scheduler: Optional["LlmScheduler"] = None,
+        tokenizer: Optional["Tokenizer"] = None,
+        lexical_index: Optional["Bm25Index"] = None,
+        content_store: Optional["SqliteContentStore"] = None,
+    ) -> None:
+        self.embeddings = embeddings
+        self.llm = llm
+        self.articles_provider = articles_provider
+        self.parse_executor = parse_executor
+        self.llm_cache = llm_cache
+        self.semantic_query_cache = semantic_query_cache
+        self.faiss_articles_repo = faiss_articles_repo
+        self.summary_job_store = summary_job_store
+        self.llm_scheduler = llm_scheduler
+        self.tokenizer = tokenizer
+        self.lexical_index = lexical_index
+        self.content_store = content_store
+        self.store = self._build_store(chroma, embedder)
+
+        self.store_lock: Optional[StoreDirectoryLock] = None
+        self.cursor_secret = secrets.token_bytes(32)
+        self.reembedding_job: Optional["ReembeddingJob"] = None
+        self.on_swap: list[Callable[[], None]] = []
+
+    @property
+    def chroma(self) -> "Chroma":
+        return self.store.chroma
+
+    @property
+    def embedder(self) -> Optional["BatchEmbedder"]:
+        return self.store.embedder
+
+    @classmethod
+    def build(cls, exclusive_store: bool = False) -> 'AppResources':
+        """
+        Builds all shared resources from the application settings, after locking the store directory.
+        Args:
+            exclusive_store (bool): Whether to lock the store directory exclusively, as the bulk
+                ingestion does, instead of sharing it with the other API server workers.
+        Returns:
+            AppResources: The container with the embedding model, vector store, LLM and articles provider.
+        Raises:
+            StoreLockedError: If another process holds the store directory in a conflicting mode.
+        """
+        import chromadb
+        from langchain_chroma import Chroma
+        from langchain_openai import AzureChatOpenAI
+        from application.services.web_scraping_articles_provider import WebScrapingArticlesProvider
+        from application.services.article_extractors import build_article_extractor
+        from application.services.semantic_query_cache import SemanticQueryCache
+        from application.services.batch_embedder import BatchEmbedder
+        from application.services.llm_scheduler import LlmScheduler
+        from application.services.llm_metrics_handler import LlmMetricsHandler
+        from application.services.reembedding_job import ReembeddingJob
+        from application.utils.tokenizer import Tokenizer
+        from repositories.sqlite_llm_cache import SqliteLLMCache
+        from repositories.faiss_articles_repo import FaissArticlesRepo
+        from repositories.bm25_index import Bm25Index
+        from repositories.sqlite_content_store import SqliteContentStore
+        from repositories.chroma_collection_migrator import ChromaCollectionMigrator
+
+        store_directory = settings.CHROMA_PERSIST_DIRECTORY if settings.USE_CHROMA_DB else settings.FAISS_PERSIST_DIRECTORY
+        store_lock = StoreDirectoryLock(store_directory)
+        store_lock.acquire(exclusive=exclusive_store)
+
+        try:
+            logging.info("Loading embedding model: %s", settings.HUGGINGFACE_MODEL_NAME)
+
+            embeddings = cls._build_embeddings(settings.HUGGINGFACE_MODEL_NAME)
+
+            migrator = None
+            live_embeddings, live_normalize = embeddings, settings.EMBEDDING_NORMALIZE
+            if settings.USE_CHROMA_DB:
+                migrator = ChromaCollectionMigrator(chromadb.PersistentClient(path=settings.CHROMA_PERSIST_DIRECTORY), settings.ARTICLES_COLLECTION_NAME)
+                live_embeddings = cls._open_collection(migrator, embeddings)
+                # Until the collection is migrated, queries and saves are normalized like its vectors
+                stored = migrator.signature()
+                if stored is not None:
+                    live_normalize = stored.normalized
+
+            chroma = Chroma(
+                collection_name=settings.ARTICLES_COLLECTION_NAME,
+                embedding_function=live_embeddings,
+                persist_directory=settings.CHROMA_PERSIST_DIRECTORY,
+            )
+
+            llm_scheduler = LlmScheduler(
+                requests_per_minute=settings.LLM_REQUESTS_PER_MINUTE,
+                tokens_per_minute=settings.LLM_TOKENS_PER_MINUTE,
+                max_concurrency=settings.LLM_MAX_CONCURRENCY,
+                completion_tokens=settings.LLM_COMPLETION_TOKENS_ESTIMATE,
+            )
+            llm_cache = SqliteLLMCache(
+                path=settings.LLM_CACHE_PATH,
+                ttl_seconds=settings.LLM_CACHE_TTL_SECONDS,
+                max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+            )
+            llm = AzureChatOpenAI(
+                azure_endpoint=settings.AZURE_OPENAI_ENDPOINT,
+                azure_deployment=settings.AZURE_OPENAI_DEPLOYMENT_NAME,
+                openai_api_version=settings.AZURE_OPENAI_API_VERSION,
+                temperature=0.3,
+                max_retries=0,  # Retried by the LLM scheduler, which honours Retry-After and frees the slot between attempts
+                cache=llm_cache,
+                callbacks=[LlmMetricsHandler()],
+            )
+
+            parse_executor = None
+            if settings.SCRAPER_PARSE_WORKERS > 0:
+                parse_executor = ProcessPoolExecutor(max_workers=settings.SCRAPER_PARSE_WORKERS)
+
+            scrape_cache = None
+            if settings.SCRAPE_CACHE_ENABLED:
+                scrape_cache = SqliteScrapeCache(
+                    path=settings.SCRAPE_CACHE_PATH,
+                    ttl_seconds=settings.SCRAPE_CACHE_TTL_SECONDS,
+                    max_bytes=settings.SCRAPE_CACHE_MAX_BYTES,
+                )
+
+            articles_provider = WebScrapingArticlesProvider(
+                timeout=settings.SCRAPER_TIMEOUT,
+                max_connections=settings.SCRAPER_MAX_CONNECTIONS,
+                max_connections_per_host=settings.SCRAPER_MAX_CONNECTIONS_PER_HOST,
+                max_concurrency=settings.SCRAPER_MAX_CONCURRENCY,
+                http2=settings.SCRAPER_HTTP2,
+                extractor=build_article_extractor(settings.SCRAPER_PARSER_BACKEND),
+                parse_executor=parse_executor,
+                scrape_cache=scrape_cache,
+            )
+
+            semantic_query_cache = None
+            if settings.SEMANTIC_CACHE_ENABLED:
+                semantic_query_cache = SemanticQueryCache(
+                    embeddings=embeddings,
+                    threshold=settings.SEMANTIC_CACHE_THRESHOLD,
+                    max_entries=settings.SEMANTIC_CACHE_MAX_ENTRIES,
+                )
+
+            embedder = BatchEmbedder(
+                embeddings=live_embeddings,
+                batch_size=settings.EMBEDDING_BATCH_SIZE,
+                executor=ThreadPoolExecutor(max_workers=settings.EMBEDDING_WORKERS, thread_name_prefix="embedding"),
+                normalize=live_normalize,
+            )
+
+            lexical_index = None
+            if settings.HYBRID_SEARCH_ENABLED:
+                lexical_index = Bm25Index(os.path.join(store_directory, "bm25_index.sqlite3"))
+
+            content_store = None
+            if settings.CONTENT_STORE_ENABLED:
+                content_store = SqliteContentStore(os.path.join(store_directory, "contents.sqlite3"), level=settings.CONTENT_STORE_ZSTD_LEVEL)
+
+            faiss_articles_repo = None
+            if not settings.USE_CHROMA_DB:
+                faiss_articles_repo = FaissArticlesRepo(
+                    persist_directory=settings.FAISS_PERSIST_DIRECTORY,
+                    embedder=embedder,
+                    index_type=settings.FAISS_INDEX_TYPE,
+                    ivf_threshold=settings.FAISS_IVF_THRESHOLD,
+                    nprobe=settings.FAISS_NPROBE,
+                    lexical_index=lexical_index,
+                    candidates=settings.HYBRID_SEARCH_CANDIDATES,
+                    rrf_k=settings.HYBRID_SEARCH_RRF_K,
+                    content_store=content_store,
+                )
+
+            tokenizer = Tokenizer(settings.AZURE_OPENAI_DEPLOYMENT_NAME, cache_size=settings.TOKENIZER_CACHE_SIZE)
+
+            summary_job_store = SqliteSummaryJobStore(
+                path=settings.SUMMARY_JOBS_PATH,
+                lease_seconds=settings.SUMMARY_JOB_LEASE_SECONDS,
+                retention_seconds=settings.SUMMARY_JOB_RETENTION_SECONDS,
+                max_attempts=settings.SUMMARY_JOB_MAX_ATTEMPTS,
+            )
+
+            resources = cls(
+                embeddings, chroma, llm, articles_provider, parse_executor, llm_cache, semantic_query_cache, embedder,
+                faiss_articles_repo, summary_job_store, llm_scheduler, tokenizer, lexical_index, content_store,
+            )
+            resources.store_lock = store_lock
+            resources.cursor_secret = settings.QUERY_CURSOR_SECRET.encode() or cls._load_cursor_secret(store_directory)
+
+            if migrator is not None:
+                migrate = live_embeddings is not embeddings or stored != cls._configured_signature()
+                if migrate or migrator.has_retired():
+                    resources.reembedding_job = ReembeddingJob(
+                        migrator,
+                        BatchEmbedder(
+                            embeddings=embeddings,
+                            executor=ThreadPoolExecutor(max_workers=1, thread_name_prefix="reembedding"),
+                            normalize=settings.EMBEDDING_NORMALIZE,
+                        ),
+                        cls._configured_signature(),
+                        on_swap=resources._swap_to_migrated_collection,
+                        migrate=migrate,
+                        batch_size=settings.EMBEDDING_MIGRATION_BATCH_SIZE,
+                        pause_seconds=settings.EMBEDDING_MIGRATION_PAUSE_SECONDS,
+                        lock=StoreDirectoryLock(settings.CHROMA_PERSIST_DIRECTORY, ".migration.lock"),
+                    )
+
+            return resources
+        except BaseException:
+            # The lock and its file descriptor are only handed over to the resources on success
+            store_lock.release()
+            raise
+
+    @staticmethod
+    def _load_cursor_secret(directory: str) -> bytes:
+        """
+        Reads the secret signing query cursors from the store directory, creating it on first start,
+        so every worker accepts the cursors issued by the others.
+        Args:
+            directory (str): The store directory.
+        Returns:
+            bytes: The secret.
+        """
+        path = os.path.join(directory, ".cursor_secret")
+        if not os.path.exists(path):
+            temporary_path = f"{path}.{os.getpid()}.tmp"
+            with open(os.open(temporary_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "wb") as file:
+                file.write(secrets.token_bytes(32))
+            try:
+                os.link(temporary_path, path)  # Fails if another worker created it first
+            except FileExistsError:
+                pass
+            finally:
+                os.remove(temporary_path)
+
+        with open(path, "rb") as file:
+            return file.read()
+
+    @staticmethod
+    def _configured_signature() -> "EmbeddingSignature":
+        from domain.embedding_signature import EmbeddingSignature
+
+        return EmbeddingSignature(
+            model=settings.HUGGINGFACE_MODEL_NAME, version=settings.EMBEDDING_VERSION, normalized=settings.EMBEDDING_NORMALIZE,
+        )
+
+    @classmethod
+    def _open_collection(cls, migrator: "ChromaCollectionMigrator", embeddings: "Embeddings") -> "Embeddings":
+        """
+        Checks the embedding signature of the articles collection against the configured model.
+        A collection without a signature is stamped with the configured one if its vectors have the
+        dimension of the configured model (or it is empty), and as unknown otherwise, so it is migrated.
+        Args:
+            migrator (ChromaCollectionMigrator): The migrator of the articles collection.
+            embeddings (Embeddings): The configured embedding model.
+        Returns:
+            Embeddings: The model to embed queries and saves with until the collection is migrated:
+                the one the stored vectors were computed with, if it is known.
+        """
+        from domain.embedding_signature import UNKNOWN_MODEL, EmbeddingSignature
+
+        migrator.recover()
+        configured = cls._configured_signature()
+
+        stored = migrator.signature()
+        if stored is None:
+            dimension = migrator.stored_dimension()
+            if dimension is None or dimension == len(embeddings.embed_query("dimension")):
+                stored = configured
+            else:
+                logging.error(
+                    "The stored articles have %d-dimensional vectors from an unrecorded model, not %s; queries fail until they are re-embedded",
+                    dimension, configured.model,
+                )
+                stored = EmbeddingSignature(model=UNKNOWN_MODEL, version=0)
+            migrator.stamp(stored)
+
+        if stored.model in (configured.model, UNKNOWN_MODEL):
+            return embeddings
+
+        logging.info("The stored articles were embedded with %s; loading it to serve queries until they are re-embedded", stored.model)
+        return cls._build_embeddings(stored.model)
+
+    @staticmethod
+    def _build_embeddings(model_name: str) -> "Embeddings":
+        """
+        Loads the embedding model with the configured backend: PyTorch, or onnxruntime running an ONNX
+        (optionally int8-quantized) export of the model. An ONNX model is checked against the PyTorch
+        one on probe texts; if it cannot be loaded or its vectors deviate beyond the configured cosine
+        similarity, the PyTorch model is used instead, so stored vectors stay comparable with queries.
+        Args:
+            model_name (str): The Hugging Face model name.
+        Returns:
+            Embeddings: The embedding model.
+        """
+        from langchain_huggingface import HuggingFaceEmbeddings
+
+        if settings.EMBEDDING_BACKEND != "onnx":
+            return HuggingFaceEmbeddings(model_name=model_name)
+
+        from application.services.onnx_embeddings import OnnxEmbeddings, embedding_agreement
+
+        try:
+            embeddings = OnnxEmbeddings(
+                model_name,
+                file_name=settings.EMBEDDING_ONNX_FILE,
+                intra_op_threads=settings.EMBEDDING_ONNX_THREADS,
+                batch_size=settings.EMBEDDING_BATCH_SIZE,
+            )
+        except Exception as exc:
+            logging.error("Failed to load %s of %s, using the PyTorch model: %s", settings.EMBEDDING_ONNX_FILE, model_name, exc, exc_info=True)
+            return HuggingFaceEmbeddings(model_name=model_name)
+
+        if settings.EMBEDDING_ONNX_MIN_COSINE <= 0:
+            return embeddings
+
+        reference = HuggingFaceEmbeddings(model_name=model_name)
+        agreement = embedding_agreement(embeddings, reference)
+        if agreement < settings.EMBEDDING_ONNX_MIN_COSINE:
+            logging.error(
+                "%s of %s deviates from the PyTorch model (cosine similarity %.4f < %.4f), using the PyTorch model",
+                settings.EMBEDDING_ONNX_FILE, model_name, agreement, settings.EMBEDDING_ONNX_MIN_COSINE,
+            )
+            return reference
+
+        logging.info("Using %s of %s on onnxruntime (cosine similarity to PyTorch %.4f)", settings.EMBEDDING_ONNX_FILE, model_name, agreement)
+        return embeddings
+
+    def _build_store(self, chroma: "Chroma", embedder: Optional["BatchEmbedder"]) -> ArticleStore:
+        """
+        Builds the articles repository over the vector store and embedder: the FAISS repository, or a
+        Chroma one sharing the lexical index and the content store.
+        """
+        if self.faiss_articles_repo is not None:
+            return ArticleStore(chroma, embedder, self.faiss_articles_repo)
+
+        from repositories.chroma_articles_repo import ChromaArticlesRepo
+
+        articles_repo = ChromaArticlesRepo(
+            chroma,
+            embedder,
+            lexical_index=self.lexical_index,
+            candidates=settings.HYBRID_SEARCH_CANDIDATES,
+            rrf_k=settings.HYBRID_SEARCH_RRF_K,
+            content_store=self.content_store,
+        )
+        return ArticleStore(chroma, embedder, articles_repo)
+
+    def _swap_to_migrated_collection(self) -> None:
+        """
+        Switches to the collection re-embedded with the configured model. The Chroma store, the
+        embedder and the articles repository are published in one assignment, so a request uses
+        either the old or the new store; the callbacks in `on_swap` then rebuild long-lived objects
+        holding the old one.
+        """
+        from langchain_chroma import Chroma
+        from application.services.batch_embedder import BatchEmbedder
+
+        chroma = Chroma(client=self.chroma._client, collection_name=settings.ARTICLES_COLLECTION_NAME, embedding_function=self.embeddings)
+        embedder = BatchEmbedder(
+            embeddings=self.embeddings,
+            batch_size=settings.EMBEDDING_BATCH_SIZE,
+            executor=self.embedder.executor if self.embedder is not None else None,
+            normalize=settings.EMBEDDING_NORMALIZE,
+        )
+        self.store = self._build_store(chroma, embedder)
+
+        for callback in self.on_swap:
+            callback()
+
+    async def warm_up_async(self) -> None:
+        """
+        Embeds a dummy query so the model weights (of the configured model and, until the stored articles
+        are re-embedded, of the model they were embedded with) are loaded before the first request is served,
+        indexes the stored articles lexically if the BM25 index does not exist yet, makes the topics
+        of Chroma articles stored before topic filtering existed filterable, and moves contents still
+        stored in the vector store metadata to the content store.
+        """
+        await asyncio.to_thread(self.embeddings.embed_query, "warm up")
+        if self.chroma.embeddings is not self.embeddings:
+            await asyncio.to_thread(self.chroma.embeddings.embed_query, "warm up")
+
+        logging.info("Embedding model warmed up")
+
+        articles_repo = self.store.articles_repo
+        if self.faiss_articles_repo is None:
+            await asyncio.to_thread(articles_repo.backfill_topic_flags)
+        await asyncio.to_thread(articles_repo.move_contents_to_store)
+
+        if self.lexical_index is not None and len(self.lexical_index) == 0:
+            await asyncio.to_thread(self._build_lexical_index)
+
+    def _build_lexical_index(self) -> None:
+        """Indexes the articles already in the vector store, when the lexical index was just created."""
+        for page in self.store.articles_repo.iter_page_contents():
+            self.lexical_index.add(page)
+
+        if len(self.lexical_index):
+            logging.info("Built BM25 index over %d stored articles", len(self.lexical_index))
+
+    async def close_async(self) -> None:
+        """
+        Stops the re-embedding job, releases the HTTP connections of the LLM and scraping clients, shuts down
+        the parsing and embedding pools, closes the LLM cache, the summary job store, the content store, the
+        BM25 index and the FAISS metadata store and stops the Chroma client before unlocking the store directory.
+        """
+        if self.reembedding_job is not None:
+            await self.reembedding_job.stop_async()
+            if self.reembedding_job.embedder.executor is not None:
+                self.reembedding_job.embedder.executor.shutdown(wait=True)
+
+        await self.articles_provider.close_async()
+
+        if self.parse_executor is not None:
+            self.parse_executor.shutdown(wait=False, cancel_futures=True)
+
+        if self.embedder is not None and self.embedder.executor is not None:
+            self.embedder.executor.shutdown(wait=True)
+
+        async_client = getattr(self.llm, "root_async_client", None)
+        if async_client is not None:
+            await async_client.close()
+
+        if self.llm_scheduler is not None:
+            logging.info("LLM scheduler stats: %s", self.llm_scheduler.stats())
+
+        if self.llm_cache is not None:
+            logging.info("LLM cache stats: %s", self.llm_cache.stats())
+            self.llm_cache.close()
+
+        if self.summary_job_store is not None:
+            self.summary_job_store.close()
+
+        if self.content_store is not None:
+            logging.info("Content store stats: %s", self.content_store.stats())
+            self.content_store.close()
+
+        if self.lexical_index is not None:
+            self.lexical_index.close()
+
+        if self.faiss_articles_repo is not None:
+            self.faiss_articles_repo.close()
+
+        client = getattr(self.chroma, "_client", None)
+        if client is not None:
+            client.clear_system_cache()
+
+        if self.store_lock is not None:
+            self.store_lock.release()
+
+        logging.info("Shared resources released")
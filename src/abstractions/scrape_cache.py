@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from application.models.cached_scrape import CachedScrape
+
+class ScrapeCache(ABC):
+    """
+    Abstract base class for scrape caches.
+    This class defines the interface for storing scraped articles and their HTTP validators.
+    It should be implemented by any concrete cache class.
+    """
+    @abstractmethod
+    def get(self, url: str) -> Optional[CachedScrape]:
+        pass
+
+    @abstractmethod
+    def put(self, url: str, article: dict[str, str], etag: Optional[str], last_modified: Optional[str]) -> None:
+        pass
+
+    @abstractmethod
+    def touch(self, url: str) -> None:
+        pass
+
+    @abstractmethod
+    def stats(self) -> dict[str, int]:
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        pass
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Union
 from domain.article_query import ArticleQuery
 
 class Summarizer(ABC):
@@ -8,5 +9,9 @@ class Summarizer(ABC):
     It should be implemented by any concrete summarizer class.
     """
     @abstractmethod
-    async def summarize_async(self, headline: str, content: str) -> list[ArticleQuery]:
+    async def summarize_async(self, articles: list[dict[str, str]]) -> list[Union[ArticleQuery, Exception]]:
+        """
+        Summarizes the given articles. An article that fails must not abort the others:
+        the error raised for it is returned in its place.
+        """
         pass
@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from application.models.article_summary_result_dto import ArticleSummaryResultDTO
+from application.models.summary_job_dto import SummaryJobDTO
+
+class SummaryJobStore(ABC):
+    """
+    Abstract base class for summary job stores.
+    This class defines the interface for persisting background summarization jobs and handing
+    their URLs out to workers. It should be implemented by any concrete store class.
+    """
+    @abstractmethod
+    def create(self, urls: list[str]) -> SummaryJobDTO:
+        pass
+
+    @abstractmethod
+    def claim(self, limit: int, worker_id: str) -> list[tuple[str, int, str]]:
+        pass
+
+    @abstractmethod
+    def renew(self, items: list[tuple[str, int, str]], worker_id: str) -> None:
+        pass
+
+    @abstractmethod
+    def complete(self, job_id: str, results: list[tuple[int, ArticleSummaryResultDTO]], worker_id: str) -> int:
+        pass
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[SummaryJobDTO]:
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        pass
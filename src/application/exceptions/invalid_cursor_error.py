@@ -0,0 +1,7 @@
+class InvalidCursorError(Exception):
+    """
+    Exception raised when a pagination cursor is malformed, forged, was issued for another query or
+    filters, or goes beyond the deepest page served.
+    """
+    def __init__(self):
+        super().__init__("The cursor is invalid or does not belong to this query.")
@@ -0,0 +1,10 @@
+class JobNotFoundError(Exception):
+    """
+    Exception raised when a summary job does not exist or has already been pruned.
+    Attributes:
+        job_id (str): The id of the missing job.
+    """
+    def __init__(self, job_id: str):
+        message = f"Summary job not found: {job_id}"
+        super().__init__(message)
+        self.job_id = job_id
@@ -0,0 +1,10 @@
+class ServiceNotReadyError(Exception):
+    """
+    Exception raised when a request needs the shared resources before they finished loading.
+    Attributes:
+        retry_after (int): Seconds the client should wait before retrying.
+    """
+    def __init__(self, retry_after: int = 5):
+        message = "The service is starting up, please retry shortly."
+        super().__init__(message)
+        self.retry_after = retry_after
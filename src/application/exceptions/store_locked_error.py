@@ -0,0 +1,11 @@
+class StoreLockedError(Exception):
+    """
+    Exception raised when the article store directory is locked by another process.
+    Attributes:
+        directory (str): The locked store directory.
+    """
+    def __init__(self, directory: str, exclusive: bool):
+        holder = "the API server or another bulk ingestion" if exclusive else "a bulk ingestion"
+        message = f"The article store {directory} is in use by {holder}; stop it first."
+        super().__init__(message)
+        self.directory = directory
@@ -0,0 +1,39 @@
+from typing import Literal, Optional
+from pydantic import BaseModel
+
+from application.models.article_summary_dto import ArticleSummaryDTO
+from application.utils.error_details import describe_error
+
+class ArticleSummaryResultDTO(BaseModel):
+    """
+    Represents the outcome of summarizing a single URL: either the summarized
+    article or the error that prevented it from being summarized.
+    """
+    url: str
+    status: Literal["ok", "error"]
+    article: Optional[ArticleSummaryDTO] = None
+    error: Optional[str] = None
+
+    @classmethod
+    def from_article(cls, url: str, article) -> 'ArticleSummaryResultDTO':
+        """
+        Builds a successful result for the URL.
+        Args:
+            url (str): The summarized URL.
+            article (ArticleEnriched): The summarized article.
+        Returns:
+            ArticleSummaryResultDTO: The successful result.
+        """
+        return cls(url=url, status="ok", article=ArticleSummaryDTO.from_article(article))
+
+    @classmethod
+    def from_error(cls, url: str, exc: BaseException) -> 'ArticleSummaryResultDTO':
+        """
+        Builds a failed result for the URL.
+        Args:
+            url (str): The URL that failed.
+            exc (BaseException): The error raised while scraping, summarizing or saving it.
+        Returns:
+            ArticleSummaryResultDTO: The failed result.
+        """
+        return cls(url=url, status="error", error=describe_error(exc))
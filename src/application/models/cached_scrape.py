@@ -0,0 +1,34 @@
+from typing import Optional
+from pydantic import BaseModel
+
+class CachedScrape(BaseModel):
+    """
+    Represents a previously scraped article stored in the scrape cache, together
+    with the HTTP validators needed to revalidate it.
+    """
+    headline: str
+    content: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    is_fresh: bool = False
+
+    def to_article(self) -> dict[str, str]:
+        """
+        Returns the cached article in the format produced by the articles provider.
+        Returns:
+            dict[str, str]: Dictionary with 'headline' and 'content' keys.
+        """
+        return {"headline": self.headline, "content": self.content}
+
+    def conditional_headers(self) -> dict[str, str]:
+        """
+        Builds the conditional request headers used to revalidate the cached article.
+        Returns:
+            dict[str, str]: The If-None-Match / If-Modified-Since headers.
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
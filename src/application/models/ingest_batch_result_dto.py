@@ -0,0 +1,21 @@
+from pydantic import BaseModel
+
+class IngestBatchResultDTO(BaseModel):
+    """
+    Represents the outcome of ingesting a batch of dump records: the articles saved, the ones
+    skipped because their content is already stored, and the records that failed.
+    """
+    ingested: int = 0
+    skipped: int = 0
+    failed: int = 0
+
+    def __add__(self, other: 'IngestBatchResultDTO') -> 'IngestBatchResultDTO':
+        return IngestBatchResultDTO(
+            ingested=self.ingested + other.ingested,
+            skipped=self.skipped + other.skipped,
+            failed=self.failed + other.failed,
+        )
+
+    @property
+    def total(self) -> int:
+        return self.ingested + self.skipped + self.failed
@@ -1,28 +1,40 @@
-from typing import Optional
+from typing import Iterable, Literal, Optional
 from pydantic import BaseModel
 
+RelatedArticleField = Literal["headline", "content", "summary", "topics", "political_bias", "score"]
+ALL_FIELDS: frozenset[str] = frozenset(RelatedArticleField.__args__)
+DEFAULT_FIELDS: frozenset[str] = ALL_FIELDS - {"content"}
+
 class RelatedArticleDTO(BaseModel):
     """
     Represents the data structure for an article, including its title, content,
     summary, topics, political bias, score.
+    Only the projected fields are set, so unset fields can be left out of responses.
     """
     headline: Optional[str] = None
-    content: str
-    summary: str
+    content: Optional[str] = None
+    summary: Optional[str] = None
     topics: Optional[list[str]] = None
     political_bias: Optional[str] = None
     score: Optional[float] = None
         
     @classmethod
-    def from_document(cls, document, score) -> 'RelatedArticleDTO':
+    def from_document(
+        cls, document, score, fields: Optional[Iterable[str]] = None, content: Optional[str] = None
+    ) -> 'RelatedArticleDTO':
         """
-        Converts an Article object to an ArticleSummaryDTO.
+        Converts a stored Document and its score to a RelatedArticleDTO.
+        When the repository keeps contents in a content store, the document metadata has no content;
+        it is passed in instead, loaded only when the content field is requested.
         
         Args:
-            article (Article): The Article object to convert.
+            document (Document): The Document to convert.
+            score (float): The score of the document for the query.
+            fields (Optional[Iterable[str]]): The fields to set; all of them by default.
+            content (Optional[str]): The content of the article; read from the metadata if omitted.
         
         Returns:
-            ArticleSummaryDTO: The converted DTO.
+            RelatedArticleDTO: The converted DTO.
         """
         
         metadata = getattr(document, "metadata", {})
@@ -33,12 +45,14 @@ class RelatedArticleDTO(BaseModel):
         if isinstance(topics, str):
             topics = [t.strip() for t in topics.split(",") if t.strip()]
 
-        return cls(
-            headline=metadata.get("headline"),
-            summary=metadata.get("summary", ""),
-            content=metadata.get("content", ""),
-            topics=topics,
-            political_bias=metadata.get("political_bias"),
-            score=score
-        )
-    
\ No newline at end of file
+        values = {
+            "headline": metadata.get("headline"),
+            "summary": metadata.get("summary", ""),
+            "content": content if content is not None else metadata.get("content", ""),
+            "topics": topics,
+            "political_bias": metadata.get("political_bias"),
+            "score": score,
+        }
+        selected = ALL_FIELDS if fields is None else set(fields)
+
+        return cls(**{field: value for field, value in values.items() if field in selected})
@@ -0,0 +1,12 @@
+from typing import Optional
+from pydantic import BaseModel
+
+from application.models.related_article_dto import RelatedArticleDTO
+
+class RelatedArticlesPageDTO(BaseModel):
+    """
+    Represents a page of articles related to a query and the cursor of the next page,
+    if there may be one.
+    """
+    items: list[RelatedArticleDTO]
+    next_cursor: Optional[str] = None
@@ -0,0 +1,19 @@
+from datetime import datetime
+from typing import Literal
+from pydantic import BaseModel
+
+from application.models.article_summary_result_dto import ArticleSummaryResultDTO
+
+class SummaryJobDTO(BaseModel):
+    """
+    Represents a background summarization job: its progress over the submitted URLs
+    and the results of the URLs finished so far, in submission order.
+    """
+    id: str
+    status: Literal["pending", "running", "completed"]
+    total: int
+    succeeded: int = 0
+    failed: int = 0
+    created_at: datetime
+    updated_at: datetime
+    results: list[ArticleSummaryResultDTO] = []
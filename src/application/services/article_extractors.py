@@ -0,0 +1,89 @@
+from bs4 import BeautifulSoup
+
+from abstractions.article_extractor import ArticleExtractor
+
+NO_TITLE = "No title found"
+NO_CONTENT = "No article content found"
+
+class BeautifulSoupExtractor(ArticleExtractor):
+    """
+    Extracts articles with BeautifulSoup using the given parser backend
+    ('html.parser' is pure Python, 'lxml' is a faster C implementation).
+    """
+    def __init__(self, parser: str = "html.parser") -> None:
+        self.parser = parser
+
+    def extract(self, html: str) -> dict[str, str]:
+        """
+        Extracts the headline and content from the HTML page.
+        Args:
+            html (str): The raw HTML of the article page.
+        Returns:
+            dict[str, str]: Dictionary with 'headline' and 'content' keys.
+        """
+        soup = BeautifulSoup(html, self.parser)
+
+        title = (soup.title.string if soup.title else None) or \
+                (soup.find('h1').get_text(strip=True) if soup.find('h1') else NO_TITLE)
+
+        article_body = soup.find('article') or soup.find('main')
+        if article_body:
+            content = article_body.get_text(separator="\n", strip=True)
+        else:
+            paragraphs = soup.find_all('p')            
+            content = "\n".join(p.get_text(strip=True) for p in paragraphs) if paragraphs else NO_CONTENT
+
+        return {
+            "headline": title.strip(),
+            "content": content.strip()
+        }
+
+class SelectolaxExtractor(ArticleExtractor):
+    """
+    Extracts articles with the selectolax Lexbor parser, which is considerably
+    faster than BeautifulSoup for large pages.
+    """
+    def extract(self, html: str) -> dict[str, str]:
+        """
+        Extracts the headline and content from the HTML page.
+        Args:
+            html (str): The raw HTML of the article page.
+        Returns:
+            dict[str, str]: Dictionary with 'headline' and 'content' keys.
+        """
+        from selectolax.lexbor import LexborHTMLParser
+
+        tree = LexborHTMLParser(html)
+
+        title_node = tree.css_first('title')
+        h1_node = tree.css_first('h1')
+        title = (title_node.text() if title_node else None) or \
+                (h1_node.text(strip=True) if h1_node else NO_TITLE)
+
+        article_body = tree.css_first('article') or tree.css_first('main')
+        if article_body:
+            text = article_body.text(separator="\n", strip=True)
+            content = "\n".join(line for line in text.split("\n") if line)
+        else:
+            paragraphs = tree.css('p')
+            content = "\n".join(p.text(strip=True) for p in paragraphs) if paragraphs else NO_CONTENT
+
+        return {
+            "headline": title.strip(),
+            "content": content.strip()
+        }
+
+def build_article_extractor(backend: str) -> ArticleExtractor:
+    """
+    Creates the article extractor for the given backend name.
+    Args:
+        backend (str): One of 'html.parser', 'lxml' or 'selectolax'.
+    Returns:
+        ArticleExtractor: The extractor for the backend.
+    """
+    if backend == "selectolax":
+        return SelectolaxExtractor()
+    if backend in ("html.parser", "lxml"):
+        return BeautifulSoupExtractor(parser=backend)
+    
+    raise ValueError(f"Unknown article extractor backend: {backend}")
@@ -1,18 +1,23 @@
 import asyncio
 import logging
-from typing import TypedDict
+from typing import Optional, TypedDict, Union
 from langchain_core.output_parsers import StrOutputParser
-from langchain.text_splitter import TokenTextSplitter
+from langchain.text_splitter import TextSplitter
 from langchain.prompts import ChatPromptTemplate
 from langchain_core.language_models.chat_models import BaseChatModel
-from langgraph.graph import StateGraph, END
+from langgraph.graph import StateGraph, START, END
 from langsmith import traceable
-from tenacity import retry, wait_exponential, stop_after_attempt, retry_if_not_exception_type
+from tenacity import RetryCallState, retry, wait_exponential, stop_after_attempt, retry_if_not_exception_type
 
 from domain.article_enriched import ArticleEnriched
 from abstractions.summarizer import Summarizer
 from application.utils.token_limit_validator import TokenLimitValidator
+from application.utils.tokenizer import Tokenizer
 from application.exceptions.token_limit_exceeded_error import TokenLimitExceededError
+from application.services.llm_scheduler import LlmScheduler, LlmPriority, ScheduledRunnable
+from application.utils.metrics import LLM_RETRIES_TOTAL, SUMMARY_CHUNKS, SUMMARY_NODE_SECONDS, timed
+
+CHARS_PER_TOKEN = 4
 
 class GraphState(TypedDict):
     """State for the summarization graph."""
@@ -20,8 +25,33 @@ class GraphState(TypedDict):
     content: str
     chunks: list[str]
     chunk_summaries: list[str]
+    collapse_depth: int
     article_enriched: str
 
+def count_node_retry(retry_state: RetryCallState) -> None:
+    """Counts a graph node retried after an error, as a tenacity before_sleep hook."""
+    LLM_RETRIES_TOTAL.inc(reason="node_error")
+
+def timed_node(name: str, node):
+    """
+    Wraps a graph node so its duration, retries included, is observed per node and added to
+    the stage timings of the current request.
+    Args:
+        name (str): The node name.
+        node: The sync or async node function.
+    Returns:
+        The wrapped node function.
+    """
+    if asyncio.iscoroutinefunction(node):
+        async def async_wrapper(state: GraphState) -> GraphState:
+            with timed(SUMMARY_NODE_SECONDS, stage=f"summary_{name}", node=name):
+                return await node(state)
+        return async_wrapper
+
+    def wrapper(state: GraphState) -> GraphState:
+        with timed(SUMMARY_NODE_SECONDS, stage=f"summary_{name}", node=name):
+            return node(state)
+    return wrapper
 
 @traceable
 class AzureAISummarizer(Summarizer):
@@ -30,41 +60,77 @@ class AzureAISummarizer(Summarizer):
     This class provides methods to summarize articles by splitting them into chunks,
     summarizing each chunk, and then combining the summaries into a final enriched article.
     Aslo knowsn as Map-Reduce summarization pattern.
+    With an LLM scheduler, final summaries are prioritized over chunk summaries so articles
+    that are almost done finish first, and both yield to interactive calls.
+    With a tokenizer, articles of at most short_article_tokens skip splitting and go straight to
+    the final summary; articles longer than CHARS_PER_TOKEN characters per short token are
+    routed to the splitter without being encoded, so only short candidates are counted, and chunk summaries longer than collapse_token_limit are collapsed
+    level by level (token-bounded groups reduced concurrently) until they fit, instead of
+    overflowing the final prompt.
     """
     def __init__(
         self, 
         llm: BaseChatModel,
         summary_prompt: ChatPromptTemplate,
         chunk_summary_prompt: ChatPromptTemplate,
-        token_text_splitter: TokenTextSplitter,
+        token_text_splitter: TextSplitter,
         token_limit_validator: TokenLimitValidator,
+        scheduler: Optional[LlmScheduler] = None,
+        tokenizer: Optional[Tokenizer] = None,
+        collapse_token_limit: Optional[int] = None,
+        short_article_tokens: int = 0,
+        max_collapse_depth: int = 5,
     ):        
         self.text_splitter = token_text_splitter
+        self.scheduler = scheduler
+        self.tokenizer = tokenizer
+        self.collapse_token_limit = collapse_token_limit
+        self.short_article_tokens = short_article_tokens
+        self.max_collapse_depth = max_collapse_depth
         
-        self.summary_chain = self._build_chain(summary_prompt, token_limit_validator, llm.with_structured_output(schema=ArticleEnriched))
-        self.chunk_chain = self._build_chain(chunk_summary_prompt, token_limit_validator, llm)
+        self.summary_chain = self._build_chain(
+            summary_prompt, token_limit_validator, llm.with_structured_output(schema=ArticleEnriched), LlmPriority.SUMMARY
+        )
+        self.chunk_chain = self._build_chain(chunk_summary_prompt, token_limit_validator, llm, LlmPriority.CHUNK_SUMMARY)
         
         self.graph = self._build_graph()
 
-    def _build_chain(self, prompt, token_limit_validator, llm):
+    def _build_chain(self, prompt, token_limit_validator, llm, priority: LlmPriority):
         """
         Builds a chain for summarization using the provided prompt, token limit validator, and LLM.
         Args:
             prompt (ChatPromptTemplate): The prompt template for summarization.
             token_limit_validator (TokenLimitValidator): Validator to check token limits.
             llm (BaseChatModel): The language model to use for summarization.
+            priority (LlmPriority): The scheduling priority of the LLM calls of the chain.
         Returns:
             Chain: A chain that processes the summarization task.
         """
+        if self.scheduler is not None:
+            llm = ScheduledRunnable(llm, self.scheduler, token_limit_validator.count_tokens, priority)
+
         return prompt | token_limit_validator | llm | StrOutputParser()
     
     def _build_graph(self):
         """Builds the state graph for summarization."""
         graph = StateGraph(GraphState)
 
+        def route_article(state: GraphState) -> str:
+            """Sends short articles straight to the final summary."""
+            content = state["content"]
+            if (
+                self.tokenizer is not None
+                and len(content) <= self.short_article_tokens * CHARS_PER_TOKEN
+                and self.tokenizer.count(content) <= self.short_article_tokens
+            ):
+                logging.debug("Short article, skipping split.")
+                return "summarize_final"
+            return "split"
+
         def splitter_node(state: GraphState) -> GraphState:
             """Splits the content into chunks using the text splitter."""
             chunks = self.text_splitter.split_text(state["content"])
+            SUMMARY_CHUNKS.observe(len(chunks))
             
             logging.debug(f"Split content into {len(chunks)} chunks.")
             
@@ -73,19 +139,50 @@ class AzureAISummarizer(Summarizer):
         @retry(
             wait=wait_exponential(multiplier=1, min=1, max=5), 
             stop=stop_after_attempt(2),
-            retry=retry_if_not_exception_type(TokenLimitExceededError)
+            retry=retry_if_not_exception_type(TokenLimitExceededError),
+            before_sleep=count_node_retry,
         )
         async def summarize_chunks_node(state: GraphState) -> GraphState:
             """Summarizes chunks of the article in batch."""
             summaries = await self.chunk_chain.abatch(
                 [{"headline": state["headline"], "content": contet_chunk} for contet_chunk in state["chunks"]]
             )
-            return {**state, "chunk_summaries": summaries}
+            return {**state, "chunk_summaries": summaries, "collapse_depth": 0}
+
+        def route_summaries(state: GraphState) -> str:
+            """Collapses the chunk summaries again while they do not fit in the final prompt."""
+            if (
+                self.tokenizer is None
+                or self.collapse_token_limit is None
+                or state["collapse_depth"] >= self.max_collapse_depth
+                or len(state["chunk_summaries"]) < 2
+                or sum(self.tokenizer.count_batch(state["chunk_summaries"])) <= self.collapse_token_limit
+            ):
+                return "summarize_final"
+            return "collapse"
+
+        @retry(
+            wait=wait_exponential(multiplier=1, min=1, max=5), 
+            stop=stop_after_attempt(2),
+            retry=retry_if_not_exception_type(TokenLimitExceededError),
+            before_sleep=count_node_retry,
+        )
+        async def collapse_node(state: GraphState) -> GraphState:
+            """Reduces token-bounded groups of chunk summaries concurrently, one tree level per call."""
+            groups = self._group_summaries(state["chunk_summaries"])
+            summaries = await self.chunk_chain.abatch(
+                [{"headline": state["headline"], "content": "\n".join(group)} for group in groups]
+            )
+
+            logging.debug(f"Collapsed {len(state['chunk_summaries'])} summaries into {len(summaries)}.")
+
+            return {**state, "chunk_summaries": summaries, "collapse_depth": state["collapse_depth"] + 1}
         
         @retry(
             wait=wait_exponential(multiplier=1, min=1, max=5), 
             stop=stop_after_attempt(2),
-            retry=retry_if_not_exception_type(TokenLimitExceededError)
+            retry=retry_if_not_exception_type(TokenLimitExceededError),
+            before_sleep=count_node_retry,
         )
         async def summarize_all_node(state: GraphState) -> GraphState:
             """Combines chunk summaries into a final enriched article."""            
@@ -100,36 +197,61 @@ class AzureAISummarizer(Summarizer):
             
             return {**state, "article_enriched": enriched_article}
 
-        graph.add_node("split", splitter_node)
-        graph.add_node("summarize_chunks", summarize_chunks_node)
-        graph.add_node("summarize_final", summarize_all_node)
+        graph.add_node("split", timed_node("split", splitter_node))
+        graph.add_node("summarize_chunks", timed_node("summarize_chunks", summarize_chunks_node))
+        graph.add_node("collapse", timed_node("collapse", collapse_node))
+        graph.add_node("summarize_final", timed_node("summarize_final", summarize_all_node))
 
-        graph.set_entry_point("split")
+        graph.add_conditional_edges(START, route_article)
         graph.add_conditional_edges(
             "split",
             lambda state: "summarize_chunks" if len(state["chunks"]) > 1 else "summarize_final"
         )
-        graph.add_edge("summarize_chunks", "summarize_final")
+        graph.add_conditional_edges("summarize_chunks", route_summaries)
+        graph.add_conditional_edges("collapse", route_summaries)
         graph.add_edge("summarize_final", END)
 
         return graph.compile()
 
-    async def summarize_async(self, articles: list[dict[str, str]]) -> list[dict[str, str]]:
+    def _group_summaries(self, summaries: list[str]) -> list[list[str]]:
+        """
+        Groups consecutive summaries so each group fits in collapse_token_limit tokens.
+        Every group holds at least two summaries when possible, so each level shrinks the tree.
+        Args:
+            summaries (list[str]): The summaries of the current level.
+        Returns:
+            list[list[str]]: The groups to reduce.
+        """
+        groups: list[list[str]] = []
+        group_tokens = 0
+
+        for summary, tokens in zip(summaries, self.tokenizer.count_batch(summaries)):
+            if groups and (len(groups[-1]) < 2 or group_tokens + tokens <= self.collapse_token_limit):
+                groups[-1].append(summary)
+                group_tokens += tokens
+            else:
+                groups.append([summary])
+                group_tokens = tokens
+
+        return groups
+
+    async def summarize_async(self, articles: list[dict[str, str]]) -> list[Union[ArticleEnriched, Exception]]:
         """
         Asynchronously summarizes a list of articles.
+        An article that fails does not cancel the others; its error is returned in its place.
         Args:
             articles (List[Dict[str, str]]): List of articles with 'headline' and 'content'.
         Returns:
-            List[Dict[str, str]]: List of enriched articles with summaries.
+            List[Union[ArticleEnriched, Exception]]: The enriched article, or the error raised for it, per input article.
         """
         tasks = [
             self.graph.ainvoke(article)
             for article in articles
         ]
-        results = await asyncio.gather(*tasks)
+        results = await asyncio.gather(*tasks, return_exceptions=True)
         
         # Extract the enriched articles from the results
         return [
-            result["article_enriched"]
+            result if isinstance(result, Exception) else result["article_enriched"]
             for result in results
         ]
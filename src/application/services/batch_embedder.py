@@ -0,0 +1,79 @@
+import asyncio
+from concurrent.futures import Executor
+from typing import AsyncIterator, Optional, Union
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from application.utils.metrics import EMBEDDED_DOCUMENTS_TOTAL, EMBEDDING_SECONDS, timed
+
+class BatchEmbedder():
+    """
+    Embedding stage that encodes documents in fixed-size batches on an executor,
+    so the (synchronous) embedding model never runs on the event loop.
+    Optionally returns L2-normalized float32 NumPy arrays instead of Python lists, for documents
+    and queries alike, so queries stay comparable with the stored vectors.
+    """
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        batch_size: int = 64,
+        executor: Optional[Executor] = None,
+        normalize: bool = False,
+    ) -> None:
+        self.embeddings = embeddings
+        self.batch_size = batch_size
+        self.executor = executor
+        self.normalize = normalize
+
+    async def embed_batch_async(self, texts: list[str]) -> Union[list[list[float]], np.ndarray]:
+        """
+        Embeds a single batch of texts on the executor.
+        Args:
+            texts (list[str]): The texts to embed.
+        Returns:
+            Union[list[list[float]], np.ndarray]: The embeddings, as a normalized float32 array if enabled.
+        """
+        loop = asyncio.get_running_loop()
+        with timed(EMBEDDING_SECONDS, stage="embedding"):
+            vectors = await loop.run_in_executor(self.executor, self.embeddings.embed_documents, texts)
+        EMBEDDED_DOCUMENTS_TOTAL.inc(len(texts))
+
+        if not self.normalize:
+            return vectors
+
+        return self._normalize(np.asarray(vectors, dtype=np.float32))
+
+    async def embed_query_async(self, text: str) -> Union[list[float], np.ndarray]:
+        """
+        Embeds a query on the executor, normalized like the documents.
+        Args:
+            text (str): The query.
+        Returns:
+            Union[list[float], np.ndarray]: The embedding, as a normalized float32 array if enabled.
+        """
+        loop = asyncio.get_running_loop()
+        with timed(EMBEDDING_SECONDS, stage="query_embedding"):
+            vector = await loop.run_in_executor(self.executor, self.embeddings.embed_query, text)
+
+        if not self.normalize:
+            return vector
+
+        return self._normalize(np.asarray([vector], dtype=np.float32))[0]
+
+    @staticmethod
+    def _normalize(matrix: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+
+        return matrix / norms
+
+    async def iter_batches_async(self, texts: list[str]) -> AsyncIterator[tuple[int, Union[list[list[float]], np.ndarray]]]:
+        """
+        Embeds the texts batch by batch.
+        Args:
+            texts (list[str]): The texts to embed.
+        Yields:
+            tuple[int, Union[list[list[float]], np.ndarray]]: The offset of the batch and its embeddings.
+        """
+        for start in range(0, len(texts), self.batch_size):
+            yield start, await self.embed_batch_async(texts[start:start + self.batch_size])
@@ -0,0 +1,42 @@
+import time
+from typing import Any, Optional
+from uuid import UUID
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+from application.utils.metrics import LLM_REQUEST_SECONDS, LLM_TOKENS_TOTAL
+from application.utils.request_context import record_stage
+
+class LlmMetricsHandler(BaseCallbackHandler):
+    """
+    Callback handler recording the latency of every LLM call and the tokens reported by the service.
+    Calls answered by the LLM cache carry no token usage and are counted with outcome 'cached'.
+    """
+    def __init__(self) -> None:
+        self._started: dict[UUID, float] = {}
+
+    def on_chat_model_start(self, serialized: dict[str, Any], messages: list, *, run_id: UUID, **kwargs: Any) -> None:
+        self._started[run_id] = time.perf_counter()
+
+    def on_llm_start(self, serialized: dict[str, Any], prompts: list[str], *, run_id: UUID, **kwargs: Any) -> None:
+        self._started[run_id] = time.perf_counter()
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        token_usage = (response.llm_output or {}).get("token_usage") or {}
+        for kind in ("prompt_tokens", "completion_tokens"):
+            if token_usage.get(kind):
+                LLM_TOKENS_TOTAL.inc(token_usage[kind], kind=kind.removesuffix("_tokens"))
+
+        self._observe(run_id, "ok" if response.llm_output is not None else "cached")
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._observe(run_id, "error")
+
+    def _observe(self, run_id: UUID, outcome: str) -> None:
+        start: Optional[float] = self._started.pop(run_id, None)
+        if start is None:
+            return
+
+        elapsed = time.perf_counter() - start
+        LLM_REQUEST_SECONDS.observe(elapsed, outcome=outcome)
+        record_stage("llm", elapsed)
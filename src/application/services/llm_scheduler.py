@@ -0,0 +1,353 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from typing import Any, AsyncIterator, Callable, Optional
+from langchain_core.caches import BaseCache
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.load import dumps
+from langchain_core.runnables import Runnable, RunnableBinding, RunnableSequence
+from langchain_core.runnables.config import RunnableConfig
+from openai import APIConnectionError, InternalServerError, RateLimitError
+
+from application.utils.metrics import LLM_RETRIES_TOTAL
+
+class LlmPriority(IntEnum):
+    """Scheduling priority of an LLM call; lower values are served first."""
+    INTERACTIVE = 0
+    SUMMARY = 1
+    CHUNK_SUMMARY = 2
+
+class TokenBucket():
+    """
+    Token bucket refilled continuously at a per-minute rate, holding at most burst_seconds of budget.
+    """
+    def __init__(self, per_minute: float, burst_seconds: float = 10, clock: Callable[[], float] = time.monotonic) -> None:
+        self.rate = per_minute / 60
+        self.capacity = max(1.0, self.rate * burst_seconds)
+        self.level = self.capacity
+        self._clock = clock
+        self._updated_at = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self.level = min(self.capacity, self.level + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def delay(self, amount: float) -> float:
+        """
+        Returns how long to wait until amount is available (0 if it is available now).
+        Amounts above the capacity only wait for a full bucket, so they cannot block forever.
+        """
+        self._refill()
+        missing = min(amount, self.capacity) - self.level
+        return missing / self.rate if missing > 0 else 0.0
+
+    def consume(self, amount: float) -> None:
+        self._refill()
+        self.level -= amount
+
+class LlmScheduler():
+    """
+    Shared scheduler for LLM calls that budgets both requests and estimated tokens per minute,
+    matching how Azure OpenAI quotas are enforced. Waiting calls are served strictly by priority
+    (then arrival), so interactive query enhancement overtakes queued bulk chunk summaries.
+    Concurrency adapts AIMD-style: it grows by one slot per window of successful calls and is
+    halved on a 429, and all calls pause for the Retry-After interval the service asks for.
+    """
+    def __init__(
+        self,
+        requests_per_minute: float,
+        tokens_per_minute: float,
+        max_concurrency: int,
+        min_concurrency: int = 1,
+        completion_tokens: int = 256,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.completion_tokens = completion_tokens
+        self.concurrency_limit = float(max_concurrency)
+
+        self.rate_limited = 0
+        self.in_flight = 0
+
+        self._requests = TokenBucket(requests_per_minute, clock=clock)
+        self._tokens = TokenBucket(tokens_per_minute, clock=clock)
+        self._clock = clock
+        self._paused_until = 0.0
+        self._last_decrease = float("-inf")
+
+        self._waiters: list[list] = []
+        self._sequence = itertools.count()
+        self._condition: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_condition(self) -> asyncio.Condition:
+        # Created lazily so the scheduler can be built outside of the event loop, and again
+        # once that loop is closed, as no call can still be waiting on it
+        if self._condition is None or self._loop.is_closed():
+            self._condition = asyncio.Condition()
+            self._loop = asyncio.get_running_loop()
+        return self._condition
+
+    def run_sync(self, coroutine_factory: Callable[[], Any]) -> Any:
+        """
+        Runs a scheduled call from synchronous code.
+        The call is submitted to the event loop the scheduler runs on, so it shares the budgets
+        and the queue of the async calls; without a running loop it gets a loop of its own.
+        Args:
+            coroutine_factory (Callable[[], Any]): Builds the coroutine making the call.
+        Returns:
+            Any: The result of the coroutine.
+        Raises:
+            RuntimeError: If called from the thread running the scheduler's event loop, which
+                would block the loop the call waits on.
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed() or not loop.is_running():
+            return asyncio.run(coroutine_factory())
+
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            raise RuntimeError("Scheduled LLM calls made on the scheduler's event loop must use ainvoke.")
+
+        return asyncio.run_coroutine_threadsafe(coroutine_factory(), loop).result()
+
+    def _delay(self, tokens: int) -> Optional[float]:
+        """
+        Returns how long the head of the queue must wait: 0 to run now, a number of seconds
+        for the budgets to refill or a pause to end, or None to wait for a running call to finish.
+        """
+        now = self._clock()
+        if now < self._paused_until:
+            return self._paused_until - now
+
+        if self.in_flight >= int(self.concurrency_limit):
+            return None
+
+        return max(self._requests.delay(1), self._tokens.delay(tokens))
+
+    async def acquire(self, tokens: int, priority: LlmPriority) -> None:
+        """
+        Waits until a call of the given size and priority may be sent.
+        Args:
+            tokens (int): The estimated prompt and completion tokens of the call.
+            priority (LlmPriority): The priority of the call.
+        """
+        condition = self._get_condition()
+        entry = [int(priority), next(self._sequence), tokens]
+
+        async with condition:
+            heapq.heappush(self._waiters, entry)
+            try:
+                while True:
+                    delay = self._delay(tokens) if self._waiters[0] is entry else None
+                    if delay == 0:
+                        break
+                    try:
+                        await asyncio.wait_for(condition.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+
+                heapq.heappop(self._waiters)
+                self._requests.consume(1)
+                self._tokens.consume(tokens)
+                self.in_flight += 1
+            except BaseException:
+                if entry in self._waiters:
+                    self._waiters.remove(entry)
+                    heapq.heapify(self._waiters)
+                raise
+            finally:
+                condition.notify_all()
+
+    async def release(self, retry_after: Optional[float] = None, rate_limited: bool = False) -> None:
+        """
+        Frees the slot of a finished call and adapts the concurrency limit.
+        Args:
+            retry_after (Optional[float]): Seconds the service asked to wait, if any.
+            rate_limited (bool): Whether the call was rejected with a 429.
+        """
+        condition = self._get_condition()
+
+        async with condition:
+            self.in_flight -= 1
+            now = self._clock()
+
+            if rate_limited:
+                self.rate_limited += 1
+                pause = retry_after if retry_after is not None else 1.0
+                self._paused_until = max(self._paused_until, now + pause)
+
+                # Concurrent calls often fail together; decrease once per pause window
+                if now - self._last_decrease >= pause:
+                    self.concurrency_limit = max(float(self.min_concurrency), self.concurrency_limit / 2)
+                    self._last_decrease = now
+                    logging.warning(
+                        "LLM rate limited, pausing %.1fs and reducing concurrency to %d", pause, int(self.concurrency_limit)
+                    )
+            else:
+                self.concurrency_limit = min(float(self.max_concurrency), self.concurrency_limit + 1 / self.concurrency_limit)
+
+            condition.notify_all()
+
+    @asynccontextmanager
+    async def slot(self, tokens: int, priority: LlmPriority) -> AsyncIterator[None]:
+        """
+        Holds a scheduling slot for the duration of one LLM call, reporting 429s back to the scheduler.
+        Args:
+            tokens (int): The estimated prompt and completion tokens of the call.
+            priority (LlmPriority): The priority of the call.
+        """
+        await self.acquire(tokens, priority)
+
+        retry_after, rate_limited = None, False
+        try:
+            yield
+        except RateLimitError as exc:
+            retry_after, rate_limited = retry_after_seconds(exc), True
+            raise
+        finally:
+            await asyncio.shield(self.release(retry_after, rate_limited))
+
+    def stats(self) -> dict[str, float]:
+        """
+        Returns the current state of the scheduler.
+        Returns:
+            dict[str, float]: Concurrency limit, running and waiting calls and the number of 429s seen.
+        """
+        return {
+            "concurrency_limit": int(self.concurrency_limit),
+            "in_flight": self.in_flight,
+            "waiting": len(self._waiters),
+            "rate_limited": self.rate_limited,
+        }
+
+class ScheduledRunnable(Runnable):
+    """
+    Runs the wrapped LLM runnable through an LlmScheduler with a fixed priority.
+    The call size is estimated from the prompt with the token counter plus the scheduler's
+    completion estimate. Prompts already in the model's cache are answered without a slot; the
+    model is found behind bindings and structured-output parsers.
+    429s are retried after the pause the scheduler imposes; connection errors, timeouts and
+    5xx responses are retried with exponential backoff, the slot released while waiting.
+    """
+    def __init__(
+        self,
+        runnable: Runnable,
+        scheduler: LlmScheduler,
+        token_counter: Callable[[Any], int],
+        priority: LlmPriority,
+        max_rate_limit_retries: int = 5,
+        max_transient_retries: int = 2,
+        backoff_seconds: float = 0.5,
+        max_backoff_seconds: float = 8.0,
+    ) -> None:
+        self.runnable = runnable
+        self.scheduler = scheduler
+        self.token_counter = token_counter
+        self.priority = priority
+        self.max_rate_limit_retries = max_rate_limit_retries
+        self.max_transient_retries = max_transient_retries
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+
+    def invoke(self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any) -> Any:
+        """
+        Invokes the wrapped runnable from synchronous code through the scheduler's event loop.
+        Args:
+            input (Any): The prompt value.
+            config (Optional[RunnableConfig]): Configuration for the runnable.
+        Returns:
+            Any: The output of the wrapped runnable.
+        """
+        return self.scheduler.run_sync(lambda: self.ainvoke(input, config, **kwargs))
+
+    async def ainvoke(self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any) -> Any:
+        """
+        Invokes the wrapped runnable once the scheduler grants a slot, or right away on a cache hit.
+        Args:
+            input (Any): The prompt value.
+            config (Optional[RunnableConfig]): Configuration for the runnable.
+        Returns:
+            Any: The output of the wrapped runnable.
+        """
+        if await self._is_cached(input, **kwargs):
+            return await self.runnable.ainvoke(input, config, **kwargs)
+
+        tokens = self.token_counter(input) + self.scheduler.completion_tokens
+        rate_limited = transient = 0
+
+        while True:
+            try:
+                async with self.scheduler.slot(tokens, self.priority):
+                    return await self.runnable.ainvoke(input, config, **kwargs)
+            except RateLimitError:
+                if rate_limited >= self.max_rate_limit_retries:
+                    raise
+                rate_limited += 1
+                LLM_RETRIES_TOTAL.inc(reason="rate_limited")
+            except (APIConnectionError, InternalServerError) as exc:
+                if transient >= self.max_transient_retries:
+                    raise
+                delay = min(self.max_backoff_seconds, self.backoff_seconds * 2 ** transient)
+                transient += 1
+                LLM_RETRIES_TOTAL.inc(reason="transient")
+                logging.warning("LLM call failed (%s), retrying in %.1fs", type(exc).__name__, delay)
+                await asyncio.sleep(delay)
+
+    async def _is_cached(self, input: Any, **kwargs: Any) -> bool:
+        """
+        Checks whether the wrapped model's cache holds an answer for the prompt.
+        Only caches exposing contains() are checked, so hit/miss counters are not touched twice.
+        Args:
+            input (Any): The prompt value.
+        Returns:
+            bool: True if the call will be answered from the cache.
+        """
+        model, bound_kwargs = self.runnable, {}
+        while True:
+            if isinstance(model, RunnableSequence):
+                model = model.first
+            elif isinstance(model, RunnableBinding):
+                # Outer bindings override the arguments of the ones they wrap
+                bound_kwargs = {**model.kwargs, **bound_kwargs}
+                model = model.bound
+            else:
+                break
+
+        cache = getattr(model, "cache", None)
+        if not isinstance(model, BaseChatModel) or not isinstance(cache, BaseCache) or not hasattr(cache, "contains"):
+            return False
+
+        call_kwargs = {**bound_kwargs, **kwargs}
+        call_kwargs.pop("ls_structured_output_format", None)
+
+        messages = model._convert_input(input).to_messages()
+        llm_string = model._get_llm_string(**call_kwargs)
+        return await asyncio.to_thread(cache.contains, dumps(messages), llm_string)
+
+def retry_after_seconds(exc: RateLimitError) -> Optional[float]:
+    """
+    Reads the wait time requested by a 429 response.
+    Args:
+        exc (RateLimitError): The rate limit error.
+    Returns:
+        Optional[float]: The seconds to wait, or None if the response does not say.
+    """
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+
+    for header, scale in (("retry-after-ms", 1000), ("retry-after", 1)):
+        try:
+            return float(headers[header]) / scale
+        except (KeyError, TypeError, ValueError):
+            continue
+
+    return None
@@ -1,4 +1,5 @@
 import logging
+from typing import Optional
 from langchain_openai import AzureChatOpenAI
 from langsmith import traceable
 from langchain_core.output_parsers import StrOutputParser
@@ -7,22 +8,32 @@ from tenacity import retry, wait_exponential, stop_after_attempt, retry_if_not_e
 from config.settings import settings
 from application.exceptions.token_limit_exceeded_error import TokenLimitExceededError
 from application.utils.token_limit_validator import TokenLimitValidator
+from application.services.semantic_query_cache import SemanticQueryCache
+from application.services.llm_scheduler import LlmScheduler, LlmPriority, ScheduledRunnable
 
 @traceable
 class QueryEnhancer():
     """
     Enhances user queries to be more semantically rich and specific for searching documents.
     Uses an LLM to rewrite the query based on a predefined prompt.
+    An optional semantic cache reuses rewrites of near-identical queries, and an optional
+    LLM scheduler runs the rewrite ahead of queued bulk summarization calls.
     """
     def __init__(
         self,
         llm: AzureChatOpenAI,
         prompt: str,        
-        token_limit_validator: TokenLimitValidator
+        token_limit_validator: TokenLimitValidator,
+        semantic_cache: Optional[SemanticQueryCache] = None,
+        scheduler: Optional[LlmScheduler] = None,
     ):
+        if scheduler is not None:
+            llm = ScheduledRunnable(llm, scheduler, token_limit_validator.count_tokens, LlmPriority.INTERACTIVE)
+
         self.llm = llm
         self.prompt = prompt
         self.token_limit_validator = token_limit_validator
+        self.semantic_cache = semantic_cache
 
     @retry(
         wait=wait_exponential(multiplier=1, min=1, max=5), 
@@ -40,6 +51,11 @@ class QueryEnhancer():
         if settings.USE_DETERMINISTIC_QUERY:
             return query    
         
+        if self.semantic_cache:
+            cached, vector = await self.semantic_cache.lookup_async(query)
+            if cached is not None:
+                return cached
+        
         logging.info("Enhancing query: %s", query)
                 
         chain = self.prompt | self.token_limit_validator | self.llm | StrOutputParser()
@@ -47,4 +63,7 @@ class QueryEnhancer():
         
         logging.info("Enhanced query: %s", result)
 
+        if self.semantic_cache:
+            self.semantic_cache.store(query, vector, result)
+
         return result
\ No newline at end of file
@@ -0,0 +1,154 @@
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Callable, Optional
+
+from abstractions.collection_migrator import CollectionMigrator
+from application.exceptions.store_locked_error import StoreLockedError
+from application.services.batch_embedder import BatchEmbedder
+from application.utils.metrics import REEMBEDDED_DOCUMENTS_TOTAL
+from domain.embedding_signature import EmbeddingSignature
+
+if TYPE_CHECKING:
+    from repositories.store_directory_lock import StoreDirectoryLock
+
+class ReembeddingJob():
+    """
+    Background job moving the stored articles to the configured embedding model.
+    It reads the semantic text stored with each article in batches, embeds it with the new model and
+    writes it, with the article metadata and id, to a shadow collection, so no article is scraped or
+    summarized again. The live collection keeps serving queries (embedded with its own model) and
+    saves meanwhile. A second pass copies the articles saved during the first one, then the shadow is
+    swapped in and `on_swap` switches the service to the new collection and model. Articles saved to
+    the retired collection by requests still in flight during the swap are copied over after a grace
+    period, and the retired collection is dropped.
+    Every pass skips the articles already copied at their latest version, so an interrupted migration
+    resumes where it stopped and articles saved again meanwhile are copied again.
+    With a lock, exactly one process (the one holding it) migrates; the others poll the signature of
+    the live collection and call `on_swap` once it is swapped, well within the grace period, and
+    take over the migration if its process stops. The job is throttled: it embeds one batch at a time, on the executor of its own embedder, and
+    pauses between batches so live requests keep the embedding model most of the time.
+    """
+    def __init__(
+        self,
+        migrator: CollectionMigrator,
+        embedder: BatchEmbedder,
+        signature: EmbeddingSignature,
+        on_swap: Callable[[], None],
+        migrate: bool = True,
+        batch_size: int = 128,
+        pause_seconds: float = 0.5,
+        retire_grace_seconds: float = 60,
+        lock: Optional["StoreDirectoryLock"] = None,
+        poll_seconds: float = 5,
+    ) -> None:
+        self.migrator = migrator
+        self.embedder = embedder
+        self.signature = signature
+        self.on_swap = on_swap
+        self.migrate = migrate
+        self.batch_size = batch_size
+        self.pause_seconds = pause_seconds
+        self.retire_grace_seconds = retire_grace_seconds
+        self.lock = lock
+        self.poll_seconds = poll_seconds
+
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Starts the job on the running event loop."""
+        self._task = asyncio.create_task(self.run_async(), name="reembedding-job")
+
+    async def stop_async(self) -> None:
+        """Cancels the job; a migration in progress resumes on the next start."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def run_async(self) -> None:
+        """
+        Migrates the collection if needed, then catches up from and drops the retired collection, if any,
+        once it holds the lock; until then, follows the swap of the process holding it.
+        """
+        try:
+            while not await asyncio.to_thread(self._try_lock):
+                if not self.migrate:
+                    return  # The process holding the lock catches up from the retired collection
+
+                if await asyncio.to_thread(self.migrator.signature) == self.signature:
+                    self.on_swap()
+                    logging.info("Switched to the articles re-embedded with %s by another worker", self.signature)
+                    return
+                await asyncio.sleep(self.poll_seconds)
+
+            try:
+                await self._migrate_async()
+            finally:
+                if self.lock is not None:
+                    self.lock.release()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logging.error("Re-embedding the stored articles failed: %s", exc, exc_info=True)
+
+    def _try_lock(self) -> bool:
+        """Takes the lock without waiting, if there is one. Returns whether this process may migrate."""
+        if self.lock is None:
+            return True
+        try:
+            self.lock.acquire(exclusive=True)
+        except StoreLockedError:
+            return False
+        return True
+
+    async def _migrate_async(self) -> None:
+        grace_seconds = 0.0
+        if self.migrate and await asyncio.to_thread(self.migrator.signature) == self.signature:
+            # Swapped by the process that held the lock before this one
+            self.on_swap()
+            grace_seconds = self.retire_grace_seconds
+        elif self.migrate:
+            logging.info("Re-embedding the stored articles with %s", self.signature)
+            await asyncio.to_thread(self.migrator.prepare_shadow, self.signature)
+
+            copied = await self._copy_async("live")
+            copied += await self._copy_async("live")
+
+            await asyncio.to_thread(self.migrator.swap)
+            self.on_swap()
+            grace_seconds = self.retire_grace_seconds
+
+            logging.info("Swapped in the articles re-embedded with %s (%d copied by this run)", self.signature, copied)
+
+        if await asyncio.to_thread(self.migrator.has_retired):
+            await asyncio.sleep(grace_seconds)
+            caught_up = await self._copy_async("retired")
+            await asyncio.to_thread(self.migrator.drop_retired)
+
+            logging.info("Dropped the retired articles collection, after copying %d articles saved to it", caught_up)
+
+    async def _copy_async(self, source: str) -> int:
+        """
+        Copies the documents of a source collection missing from its target, with new embeddings.
+        Args:
+            source (str): "live" (copied to the shadow) or "retired" (copied to the live collection).
+        Returns:
+            int: The number of documents copied.
+        """
+        pages = self.migrator.iter_id_pages(source, self.batch_size)
+        copied = 0
+        while True:
+            ids = await asyncio.to_thread(next, pages, None)
+            if ids is None:
+                return copied
+
+            ids, documents, metadatas = await asyncio.to_thread(self.migrator.missing, source, ids)
+            if not ids:
+                continue
+
+            vectors = await self.embedder.embed_batch_async(documents)
+            await asyncio.to_thread(self.migrator.write, source, ids, vectors, documents, metadatas)
+
+            copied += len(ids)
+            REEMBEDDED_DOCUMENTS_TOTAL.inc(len(ids))
+            await asyncio.sleep(self.pause_seconds)
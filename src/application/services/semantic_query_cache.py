@@ -0,0 +1,99 @@
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Optional
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+class SemanticQueryCache():
+    """
+    Caches enhanced queries by the embedding of the original query.
+    A new query reuses a cached rewrite when its cosine similarity to a cached query is
+    at least the threshold, so near-identical queries ("ukraine war", "war in ukraine")
+    skip the LLM. The cache is bounded and evicts the least recently used entries.
+    """
+    def __init__(self, embeddings: Embeddings, threshold: float, max_entries: int) -> None:
+        self.embeddings = embeddings
+        self.threshold = threshold
+        self.max_entries = max_entries
+
+        self.hits = 0
+        self.misses = 0
+
+        self._vectors: Optional[np.ndarray] = None
+        self._entries: OrderedDict[int, tuple[str, str]] = OrderedDict()
+
+    async def _embed_async(self, query: str) -> np.ndarray:
+        """
+        Embeds the query off the event loop and normalizes it to unit length.
+        Args:
+            query (str): The query to embed.
+        Returns:
+            np.ndarray: The normalized float32 embedding.
+        """
+        vector = np.asarray(await asyncio.to_thread(self.embeddings.embed_query, query), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+
+        return vector / norm if norm else vector
+
+    async def lookup_async(self, query: str) -> tuple[Optional[str], np.ndarray]:
+        """
+        Looks up a cached rewrite for a semantically similar query.
+        Args:
+            query (str): The original user query.
+        Returns:
+            tuple[Optional[str], np.ndarray]: The cached enhanced query (or None on a miss)
+            and the query embedding, which can be passed back to store_async.
+        """
+        vector = await self._embed_async(query)
+
+        if self._entries:
+            size = max(self._entries) + 1
+            similarities = self._vectors[:size] @ vector
+            best = int(np.argmax(similarities))
+
+            if best in self._entries and similarities[best] >= self.threshold:
+                self.hits += 1
+                self._entries.move_to_end(best)
+                cached_query, enhanced_query = self._entries[best]
+
+                logging.info("Semantic cache hit for query '%s' (matched '%s', similarity %.3f)", query, cached_query, similarities[best])
+
+                return enhanced_query, vector
+
+        self.misses += 1
+        return None, vector
+
+    def store(self, query: str, vector: np.ndarray, enhanced_query: str) -> None:
+        """
+        Stores the enhanced query under the embedding of the original query.
+        Args:
+            query (str): The original user query.
+            vector (np.ndarray): The normalized embedding returned by lookup_async.
+            enhanced_query (str): The LLM rewrite of the query.
+        """
+        if self._vectors is None:
+            self._vectors = np.zeros((self.max_entries, vector.shape[0]), dtype=np.float32)
+
+        if len(self._entries) < self.max_entries:
+            slot = len(self._entries)
+        else:
+            slot, _ = self._entries.popitem(last=False)
+
+        self._vectors[slot] = vector
+        self._entries[slot] = (query, enhanced_query)
+
+    def stats(self) -> dict[str, float]:
+        """
+        Returns the hit/miss counters of the cache.
+        Returns:
+            dict[str, float]: Hits, misses, hit rate and number of entries.
+        """
+        lookups = self.hits + self.misses
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+        }
@@ -0,0 +1,140 @@
+import asyncio
+import logging
+import time
+import uuid
+from itertools import groupby
+from typing import Optional
+
+from abstractions.summary_job_store import SummaryJobStore
+from application.models.article_summary_result_dto import ArticleSummaryResultDTO
+from application.use_cases.summarize_articles_use_case import SummarizeArticlesUseCase
+from application.utils.request_context import format_stage_timings, new_request_id, request_context
+
+class SummaryJobRunner():
+    """
+    Runs background summary jobs on a bounded pool of worker tasks.
+    Each worker claims a batch of queued URLs from the job store, summarizes them with the
+    summarize articles use case and records the per-URL results. Workers wake up when a job
+    is submitted and otherwise poll the store, which also picks up URLs queued by other
+    processes or left unfinished by a previous run. The leases of a batch are renewed every
+    lease_renewal_seconds while it runs, so a slow batch is not claimed again by another worker.
+    Each worker holds its leases under its own id, so results of a batch whose lease expired
+    are dropped instead of overwriting those of the worker that claimed it again.
+    """
+    def __init__(
+        self,
+        store: SummaryJobStore,
+        use_case: SummarizeArticlesUseCase,
+        workers: int = 2,
+        batch_size: int = 10,
+        poll_seconds: float = 2,
+        lease_renewal_seconds: Optional[float] = None,
+    ) -> None:
+        self.store = store
+        self.use_case = use_case
+        self.workers = workers
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        self.lease_renewal_seconds = lease_renewal_seconds
+
+        self._wake_up: Optional[asyncio.Event] = None
+        self._tasks: list[asyncio.Task] = []
+
+    def start(self) -> None:
+        """Starts the worker tasks on the running event loop."""
+        self._wake_up = asyncio.Event()
+        self._tasks = [
+            asyncio.create_task(self._work_async(uuid.uuid4().hex), name=f"summary-job-worker-{i}") for i in range(self.workers)
+        ]
+
+        logging.info("Started %d summary job workers", self.workers)
+
+    def notify(self) -> None:
+        """Wakes up idle workers after a job was submitted."""
+        if self._wake_up is not None:
+            self._wake_up.set()
+
+    async def stop_async(self) -> None:
+        """
+        Cancels the workers. URLs they were processing stay claimed and are
+        picked up again once their lease expires.
+        """
+        for task in self._tasks:
+            task.cancel()
+
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        logging.info("Stopped summary job workers")
+
+    async def _work_async(self, worker_id: str) -> None:
+        while True:
+            try:
+                items = await asyncio.to_thread(self.store.claim, self.batch_size, worker_id)
+            except Exception as exc:
+                logging.error("Failed to claim summary job items: %s", exc, exc_info=True)
+                items = []
+
+            if items:
+                await self._process_async(items, worker_id)
+                continue
+
+            self._wake_up.clear()
+            try:
+                await asyncio.wait_for(self._wake_up.wait(), self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _process_async(self, items: list[tuple[str, int, str]], worker_id: str) -> None:
+        """
+        Summarizes a batch of claimed URLs and records their results per job.
+        The batch runs under its own request id, logged with its stage timing breakdown.
+        Args:
+            items (list[tuple[str, int, str]]): The job id, position and URL of each claimed item.
+            worker_id (str): The id of the worker holding the leases.
+        """
+        renewal = None
+        if self.lease_renewal_seconds:
+            renewal = asyncio.create_task(self._renew_leases_async(items, worker_id))
+
+        with request_context(new_request_id()) as timings:
+            start = time.perf_counter()
+            try:
+                await self._process_batch_async(items, worker_id)
+            finally:
+                if renewal is not None:
+                    renewal.cancel()
+                    await asyncio.gather(renewal, return_exceptions=True)
+            logging.info(
+                "Processed %d queued URLs in %.1fms: %s",
+                len(items), (time.perf_counter() - start) * 1000, format_stage_timings(timings)
+            )
+
+    async def _renew_leases_async(self, items: list[tuple[str, int, str]], worker_id: str) -> None:
+        """Renews the leases of a batch until cancelled."""
+        while True:
+            await asyncio.sleep(self.lease_renewal_seconds)
+            try:
+                await asyncio.to_thread(self.store.renew, items, worker_id)
+            except Exception as exc:
+                logging.error("Failed to renew the leases of %d queued URLs: %s", len(items), exc, exc_info=True)
+
+    async def _process_batch_async(self, items: list[tuple[str, int, str]], worker_id: str) -> None:
+        urls = [url for _, _, url in items]
+
+        logging.info("Processing %d queued URLs", len(urls))
+
+        try:
+            results = await self.use_case(urls)
+        except Exception as exc:
+            logging.error("Summary job batch failed: %s", exc, exc_info=True)
+            results = [ArticleSummaryResultDTO.from_error(url, exc) for url in urls]
+
+        outcomes = sorted(zip(items, results), key=lambda outcome: outcome[0][0])
+        for job_id, job_outcomes in groupby(outcomes, key=lambda outcome: outcome[0][0]):
+            try:
+                await asyncio.to_thread(
+                    self.store.complete, job_id, [(position, result) for (_, position, _), result in job_outcomes], worker_id
+                )
+            except Exception as exc:
+                logging.error("Failed to record results of summary job %s: %s", job_id, exc, exc_info=True)
@@ -1,28 +1,142 @@
 import asyncio
 import httpx
 import logging
-from bs4 import BeautifulSoup
-from typing import Optional
+import time
+from concurrent.futures import Executor
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional, Union
+from urllib.parse import urlsplit
 
 from abstractions.articles_provider import ArticlesProvider
+from abstractions.article_extractor import ArticleExtractor
+from abstractions.scrape_cache import ScrapeCache
 from application.exceptions.no_content_error import NoContentError
+from application.services.article_extractors import BeautifulSoupExtractor
+from application.utils.metrics import SCRAPE_CACHE_TOTAL, SCRAPE_FETCH_SECONDS, SCRAPE_PARSE_SECONDS, timed
+from application.utils.request_context import record_stage
 
 class WebScrapingArticlesProvider(ArticlesProvider):
     """
     Implements ArticlesProvider to scrape articles from the web using HTTP requests.
+    A single pooled HTTP client is shared by all scrapes, so connections (and HTTP/2 streams)
+    to the same news site are reused. Concurrency is bounded globally and per host.
+    HTML extraction is delegated to a pluggable extractor, optionally running in an executor
+    (e.g. a process pool) so heavy pages do not block the event loop. With a scrape cache,
+    fresh articles are served without a request and stale ones are revalidated conditionally.
     """
+    def __init__(
+        self,
+        timeout: float = 30,
+        max_connections: int = 100,
+        max_connections_per_host: int = 6,
+        max_concurrency: int = 20,
+        http2: bool = True,
+        extractor: Optional[ArticleExtractor] = None,
+        parse_executor: Optional[Executor] = None,
+        scrape_cache: Optional[ScrapeCache] = None,
+    ) -> None:
+        self.extractor = extractor or BeautifulSoupExtractor()
+        self.parse_executor = parse_executor
+        self.scrape_cache = scrape_cache
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.http2 = http2
+        
+        self._client: Optional[httpx.AsyncClient] = None
+        self._concurrency = asyncio.Semaphore(max_concurrency)
+        self._host_limits: dict[str, tuple[asyncio.Semaphore, int]] = {}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Returns the shared HTTP client, creating it on first use.
+        Returns:
+            httpx.AsyncClient: The pooled HTTP client.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                http2=self.http2,
+                follow_redirects=True,
+            )
+        return self._client
 
-    async def get_async(self, paths: list[str]) -> list[tuple[Optional[str], str]]:
+    @asynccontextmanager
+    async def _host_limit(self, url: str) -> AsyncIterator[None]:
+        """
+        Holds a slot of the semaphore limiting concurrent requests to the host of the given URL.
+        The semaphore is dropped once no request holds or waits for it, so hosts seen once do not
+        accumulate for the lifetime of the provider.
+        Args:
+            url (str): The URL to be requested.
+        """
+        host = urlsplit(url).netloc.lower()
+        semaphore, users = self._host_limits.get(host, (None, 0))
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_connections_per_host)
+        self._host_limits[host] = (semaphore, users + 1)
+        try:
+            async with semaphore:
+                yield
+        finally:
+            semaphore, users = self._host_limits[host]
+            if users == 1:
+                del self._host_limits[host]
+            else:
+                self._host_limits[host] = (semaphore, users - 1)
+
+    async def close_async(self) -> None:
+        """
+        Closes the shared HTTP client and its pooled connections, and the scrape cache.
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+        if self.scrape_cache is not None:
+            self.scrape_cache.close()
+
+    async def get_async(self, paths: list[str]) -> list[Union[dict[str, str], Exception]]:
         """
         Scrapes articles from the provided URLs asynchronously.
+        A URL that fails does not cancel the others; its error is returned in its place.
         Args:
             paths (list[str]): List of URLs to scrape articles from.
         Returns:
-            list[tuple[Optional[str], str]]: List of tuples containing the article title and content.
+            list[Union[dict[str, str], Exception]]: The 'headline' and 'content' of each article,
+            or the error raised for it, in the order of the URLs.
         """
         tasks = [self._scrap_article_async(url) for url in paths]
         
-        return await asyncio.gather(*tasks)
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _fetch_async(self, url: str, headers: Optional[dict[str, str]] = None) -> httpx.Response:
+        """
+        Fetches the given URL with the shared client, respecting the global and per-host limits.
+        Args:
+            url (str): The URL to fetch.
+            headers (Optional[dict[str, str]]): Extra request headers, e.g. conditional validators.
+        Returns:
+            httpx.Response: The successful (or 304 Not Modified) HTTP response.
+        """
+        start = time.perf_counter()
+        outcome = "error"
+        try:
+            async with self._concurrency, self._host_limit(url):
+                response = await self._get_client().get(url, headers=headers)
+                if response.status_code != httpx.codes.NOT_MODIFIED:
+                    response.raise_for_status()
+            outcome = "not_modified" if response.status_code == httpx.codes.NOT_MODIFIED else "ok"
+        finally:
+            elapsed = time.perf_counter() - start
+            SCRAPE_FETCH_SECONDS.observe(elapsed, outcome=outcome)
+            record_stage("scrape_fetch", elapsed)
+        
+        return response
 
     async def _scrap_article_async(self, url: str) -> tuple[Optional[str], str]:
         """
@@ -32,31 +146,50 @@ class WebScrapingArticlesProvider(ArticlesProvider):
         Returns:
             tuple[Optional[str], str]: A tuple containing the article title and content.
         """
-        logging.info("Scraping article from URL: %s", url)
+        cached = await asyncio.to_thread(self.scrape_cache.get, url) if self.scrape_cache else None
+        if cached and cached.is_fresh:
+            SCRAPE_CACHE_TOTAL.inc(result="fresh")
+            logging.info("Serving cached article for URL: %s", url)
+            return cached.to_article()
+
+        if self.scrape_cache:
+            SCRAPE_CACHE_TOTAL.inc(result="stale" if cached else "miss")
 
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.get(url)
-            response.raise_for_status()
+        logging.info("Scraping article from URL: %s", url)
 
-        soup = BeautifulSoup(response.text, 'html.parser')
+        response = await self._fetch_async(url, cached.conditional_headers() if cached else None)
 
-        title = (soup.title.string if soup.title else None) or \
-                (soup.find('h1').get_text(strip=True) if soup.find('h1') else "No title found")
+        if cached and response.status_code == httpx.codes.NOT_MODIFIED:
+            logging.info("Article not modified, serving cached version for URL: %s", url)
+            await asyncio.to_thread(self.scrape_cache.touch, url)
+            return cached.to_article()
 
-        article_body = soup.find('article') or soup.find('main')
-        if article_body:
-            content = article_body.get_text(separator="\n", strip=True)
-        else:
-            paragraphs = soup.find_all('p')            
-            content = "\n".join(p.get_text(strip=True) for p in paragraphs) if paragraphs else "No article content found"
+        with timed(SCRAPE_PARSE_SECONDS, stage="scrape_parse"):
+            article = await self._extract_async(response.text)
             
-        if(not is_valid_article(content)):
+        if(not is_valid_article(article["content"])):
             raise NoContentError(url)
         
-        return {
-            "headline": title.strip(),
-            "content": content.strip()
-        }
+        if self.scrape_cache:
+            await asyncio.to_thread(
+                self.scrape_cache.put, url, article, response.headers.get("ETag"), response.headers.get("Last-Modified")
+            )
+
+        return article
+
+    async def _extract_async(self, html: str) -> dict[str, str]:
+        """
+        Extracts the headline and content from the HTML, in the parse executor if one is configured.
+        Args:
+            html (str): The raw HTML of the article page.
+        Returns:
+            dict[str, str]: Dictionary with 'headline' and 'content' keys.
+        """
+        if self.parse_executor is None:
+            return self.extractor.extract(html)
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.parse_executor, self.extractor.extract, html)
         
 def is_valid_article(text) -> bool:
     """
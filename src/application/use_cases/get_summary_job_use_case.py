@@ -0,0 +1,28 @@
+import asyncio
+
+from abstractions.summary_job_store import SummaryJobStore
+from application.exceptions.job_not_found_error import JobNotFoundError
+from application.models.summary_job_dto import SummaryJobDTO
+
+class GetSummaryJobUseCase():
+    """
+    Use case for reporting the progress and results of a background summary job.
+    """
+    def __init__(self, store: SummaryJobStore) -> None:
+        self.store = store
+
+    async def __call__(self, job_id: str) -> SummaryJobDTO:
+        """
+        Loads the job with the results of its finished URLs.
+        Args:
+            job_id (str): The job id.
+        Returns:
+            SummaryJobDTO: The job.
+        Raises:
+            JobNotFoundError: If the job does not exist.
+        """
+        job = await asyncio.to_thread(self.store.get, job_id)
+        if job is None:
+            raise JobNotFoundError(job_id)
+
+        return job
@@ -0,0 +1,167 @@
+import asyncio
+import logging
+from collections import deque
+from typing import Any, AsyncIterator, Iterable, Optional
+
+from abstractions.articles_repo import ArticlesRepo
+from abstractions.summarizer import Summarizer
+from domain.article_query import ArticleQuery
+from application.models.ingest_batch_result_dto import IngestBatchResultDTO
+from application.utils.content_fingerprint import fingerprint_content
+
+
+class IngestArticlesUseCase():
+    """
+    Use case for ingesting pre-scraped articles, e.g. from a bulk dump, without scraping them.
+    Each batch of records is summarized and saved to the vector database, skipping the articles
+    whose content is already stored. With summarization disabled, the articles are saved with the
+    summary, topics and political bias of their records, if any, and embedded from their headline
+    and content. Batches run concurrently, while progress is reported in input order, so the
+    position reported is a safe point to resume an interrupted ingestion from.
+    """
+    def __init__(self, repo: ArticlesRepo, summarizer: Summarizer, summarize: bool = True, parallel: int = 4) -> None:
+        self.repo = repo
+        self.summarizer = summarizer
+        self.summarize = summarize
+        self.parallel = parallel
+
+    async def __call__(self, records: list[dict[str, Any]], in_flight: Optional[set[str]] = None) -> IngestBatchResultDTO:
+        """
+        Ingests a batch of records. A record without content, or whose summarization fails,
+        is counted as failed without aborting the batch.
+        Args:
+            records (list[dict[str, Any]]): The records, with a content and optionally a headline,
+                summary, topics and political bias.
+            in_flight (Optional[set[str]]): The fingerprints being ingested by concurrent batches,
+                which are skipped; the batch adds its own while it runs.
+        Returns:
+            IngestBatchResultDTO: The counts of ingested, skipped and failed records.
+        Raises:
+            Exception: If saving the batch fails.
+        """
+        result = IngestBatchResultDTO()
+
+        articles: dict[str, dict[str, Any]] = {}
+        for record in records:
+            content = record.get("content")
+            if not isinstance(content, str) or not content.strip():
+                result.failed += 1
+                continue
+
+            fingerprint = fingerprint_content(content)
+            if fingerprint in articles or (in_flight is not None and fingerprint in in_flight):
+                result.skipped += 1
+            else:
+                articles[fingerprint] = record
+
+        if in_flight is None:
+            return await self._ingest(articles, result)
+
+        # Claimed before the first await, so a concurrent batch holding the same article skips it
+        in_flight.update(articles)
+        try:
+            return await self._ingest(articles, result)
+        finally:
+            in_flight.difference_update(articles)
+
+    async def _ingest(self, articles: dict[str, dict[str, Any]], result: IngestBatchResultDTO) -> IngestBatchResultDTO:
+        """
+        Summarizes and saves the deduplicated records of a batch that are not stored yet.
+        Args:
+            articles (dict[str, dict[str, Any]]): The records by content fingerprint.
+            result (IngestBatchResultDTO): The counts of the batch so far, updated in place.
+        Returns:
+            IngestBatchResultDTO: The counts of ingested, skipped and failed records.
+        """
+        known_articles = await self.repo.get_by_fingerprints_async(list(articles))
+        result.skipped += len(known_articles)
+        new_records = [record for fingerprint, record in articles.items() if fingerprint not in known_articles]
+        if not new_records:
+            return result
+
+        if self.summarize:
+            summaries = await self.summarizer.summarize_async(
+                [{"headline": record.get("headline"), "content": record["content"]} for record in new_records]
+            )
+        else:
+            summaries = [self._to_article(record) for record in new_records]
+
+        new_articles = []
+        for record, summary in zip(new_records, summaries):
+            if isinstance(summary, Exception):
+                logging.warning("Failed to summarize dump article %r: %s", record.get("headline"), summary)
+                result.failed += 1
+            else:
+                new_articles.append(summary)
+
+        if new_articles:
+            await self.repo.save_async(new_articles)
+        result.ingested += len(new_articles)
+
+        return result
+
+    @staticmethod
+    def _to_article(record: dict[str, Any]) -> ArticleQuery:
+        """
+        Builds an article from a record as is, for ingestion without summarization.
+        Args:
+            record (dict[str, Any]): The dump record.
+        Returns:
+            ArticleQuery: The article, with an empty summary if the record has none.
+        """
+        return ArticleQuery(
+            headline=record.get("headline"),
+            content=record["content"],
+            summary=record.get("summary") or "",
+            topics=record.get("topics") or None,
+            political_bias=record.get("political_bias"),
+        )
+
+    async def stream(self, batches: Iterable[list[dict[str, Any]]], start: int = 0) -> AsyncIterator[tuple[int, IngestBatchResultDTO]]:
+        """
+        Ingests batches of records with up to `parallel` batches in flight. Batches are read from
+        the iterable only when a slot is free, so memory stays bounded however large the input is.
+        An article in several batches in flight at once is ingested by the first one and skipped by the others.
+        Args:
+            batches (Iterable[list[dict[str, Any]]]): The batches of records, read lazily.
+            start (int): The position of the first record, when resuming.
+        Yields:
+            tuple[int, IngestBatchResultDTO]: For each batch, in input order, the position after its
+                last record and its result. Every record before that position has been ingested.
+        Raises:
+            Exception: If a batch fails to save; the batches in flight are cancelled.
+        """
+        batch_iterator = iter(batches)
+        in_flight: set[str] = set()
+        pending: deque[tuple[int, asyncio.Task]] = deque()
+        position = start
+        exhausted = False
+
+        try:
+            while pending or not exhausted:
+                # A batch finished ahead of an earlier, slower one frees its slot, but at most
+                # 4 x parallel batches wait to be reported, so unreported results stay bounded
+                running = sum(not task.done() for _, task in pending)
+                while not exhausted and running < self.parallel and len(pending) < 4 * self.parallel:
+                    records = await asyncio.to_thread(next, batch_iterator, None)
+                    if records is None:
+                        exhausted = True
+                        break
+
+                    position += len(records)
+                    pending.append((position, asyncio.create_task(self(records, in_flight))))
+                    running += 1
+
+                if not pending:
+                    break
+
+                if not pending[0][1].done():
+                    await asyncio.wait([task for _, task in pending if not task.done()], return_when=asyncio.FIRST_COMPLETED)
+                    continue
+
+                end, task = pending.popleft()
+                yield end, task.result()
+        finally:
+            for _, task in pending:
+                task.cancel()
+            await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
@@ -1,31 +1,78 @@
 import logging
+from typing import TYPE_CHECKING, Iterable, Optional
 
 from abstractions.articles_repo import ArticlesRepo
-from application.services.query_enhancer import QueryEnhancer
-from application.models.related_article_dto import RelatedArticleDTO
+from application.models.related_article_dto import RelatedArticleDTO, DEFAULT_FIELDS
+from application.models.related_articles_page_dto import RelatedArticlesPageDTO
+from application.utils.query_cursor import cursor_key, decode_cursor, encode_cursor
+from domain.article_filters import ArticleFilters
+
+if TYPE_CHECKING:
+    from application.services.query_enhancer import QueryEnhancer
 
 class QueryArticleUseCase():
     """
     Use case for querying articles based on a search query.
+    Results are paginated with opaque cursors that carry the enhanced query, so only the
+    first page pays for query enhancement, and filters are applied by the repository.
+    Cursors are signed with a server secret and reach at most max_offset results deep, which bounds
+    the candidates fetched from the vector store and the lexical index per page.
+    Article contents are loaded from the repository only when the content field is requested.
     """
-    def __init__(self, repo: ArticlesRepo, query_enhancer: QueryEnhancer) -> None:
+    def __init__(self, repo: ArticlesRepo, query_enhancer: "QueryEnhancer", cursor_secret: bytes, max_offset: int = 100) -> None:
         self.repo = repo
         self.query_enhancer = query_enhancer
+        self.cursor_secret = cursor_secret
+        self.max_offset = max_offset
 
-    async def __call__(self, query: str) -> list[RelatedArticleDTO]:
+    async def __call__(
+        self,
+        query: str,
+        k: int = 4,
+        cursor: Optional[str] = None,
+        filters: Optional[ArticleFilters] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> RelatedArticlesPageDTO:
         """
         Process the input to query related articles based on the provided search query.
         Args:
             query (str): The search query to find related articles.
+            k (int): The number of articles per page.
+            cursor (Optional[str]): The cursor of the page to return; the first page if omitted.
+            filters (Optional[ArticleFilters]): Metadata filters the articles must match.
+            fields (Optional[Iterable[str]]): The fields to return per article; all but content if omitted.
         Returns:
-            list[RelatedArticleDTO]: List of related articles matching the query.
+            RelatedArticlesPageDTO: The page of related articles matching the query and the cursor of the next page.
+        Raises:
+            InvalidCursorError: If the cursor is malformed, forged, was issued for another query or filters,
+                or goes beyond max_offset.
         """
         logging.info("Exectuing query articles use case with query: %s", query)
-        
-        query = await self.query_enhancer.enhance_async(query)
-        results = await self.repo.query_async(query)
+
+        filters = filters or ArticleFilters()
+        key = cursor_key(query, filters)
+
+        if cursor is None:
+            search_query, offset = await self.query_enhancer.enhance_async(query), 0
+        else:
+            search_query, offset = decode_cursor(cursor, key, self.cursor_secret, self.max_offset)
+
+        results = await self.repo.query_async(search_query, k=k, offset=offset, filters=filters)
 
         logging.info("Query articles use case completed with %d results", len(results))
-        
-        return [RelatedArticleDTO.from_document(document=document, score=score) for (document, score) in results]
-    
\ No newline at end of file
+
+        fields = DEFAULT_FIELDS if fields is None else set(fields)
+        contents = {}
+        if "content" in fields and results:
+            contents = await self.repo.get_contents_async([document.id for document, _ in results])
+
+        return RelatedArticlesPageDTO(
+            items=[
+                RelatedArticleDTO.from_document(document=document, score=score, fields=fields, content=contents.get(document.id))
+                for (document, score) in results
+            ],
+            next_cursor=(
+                encode_cursor(search_query, offset + k, key, self.cursor_secret)
+                if len(results) == k and offset + k <= self.max_offset else None
+            ),
+        )
@@ -0,0 +1,32 @@
+import asyncio
+import logging
+
+from abstractions.summary_job_store import SummaryJobStore
+from application.models.summary_job_dto import SummaryJobDTO
+from application.services.summary_job_runner import SummaryJobRunner
+from application.utils.url_validator import validate_urls
+
+class SubmitSummaryJobUseCase():
+    """
+    Use case for queueing a batch of URLs to be summarized in the background.
+    """
+    def __init__(self, store: SummaryJobStore, runner: SummaryJobRunner) -> None:
+        self.store = store
+        self.runner = runner
+
+    async def __call__(self, urls: list[str]) -> SummaryJobDTO:
+        """
+        Validates the URLs and persists a job for them.
+        Args:
+            urls (list[str]): List of URLs to scrape and summarize articles from.
+        Returns:
+            SummaryJobDTO: The queued job.
+        """
+        validate_urls(urls)
+
+        job = await asyncio.to_thread(self.store.create, urls)
+        self.runner.notify()
+
+        logging.info("Queued summary job %s with %d URLs", job.id, job.total)
+
+        return job
@@ -1,42 +1,194 @@
 import logging
+from typing import AsyncIterator, Union
 
 from abstractions.articles_repo import ArticlesRepo
 from abstractions.summarizer import Summarizer
 from abstractions.articles_provider import ArticlesProvider
 from domain.article_enriched import ArticleEnriched
-from application.models.article_summary_dto import ArticleSummaryDTO
+from application.models.article_summary_result_dto import ArticleSummaryResultDTO
 from application.utils.url_validator import validate_urls
+from application.utils.content_fingerprint import fingerprint_content
+from application.utils.stage_pipeline import Finished, PipelineStage, StagePipeline
+
+# Outcome of a URL whose content is already being summarized for an earlier URL of the batch
+DUPLICATE = object()
 
 
 class SummarizeArticlesUseCase():
     """
     Use case for summarizing articles from given URLs.
     It scrapes the articles, summarizes them, and saves the results to a vector database.
+    The three steps run as a pipeline of stages connected by bounded queues, each with its own
+    concurrency, so an article is summarized as soon as it is scraped and saved as soon as it is
+    summarized, instead of every step waiting for the slowest article of the previous one.
+    Articles whose content was already summarized are returned from the repository
+    without running the summarizer again, and URLs with the same content share one summarization.
+    A URL that fails to scrape or summarize is reported in its result without aborting the others.
+    Results can also be streamed one URL at a time.
     """
-    def __init__(self, repo: ArticlesRepo, summarizer: Summarizer, articles_provider: ArticlesProvider) -> None:
+    def __init__(
+        self,
+        repo: ArticlesRepo,
+        summarizer: Summarizer,
+        articles_provider: ArticlesProvider,
+        scrape_workers: int = 20,
+        summarize_workers: int = 16,
+        save_batch_size: int = 32,
+        queue_size: int = 16,
+    ) -> None:
         self.repo = repo
         self.summarizer = summarizer
         self.articles_provider = articles_provider
+        self.scrape_workers = scrape_workers
+        self.summarize_workers = summarize_workers
+        self.save_batch_size = save_batch_size
+        self.queue_size = queue_size
 
-    async def __call__(self, urls: list[str]) -> list[ArticleSummaryDTO]:
+    async def __call__(self, urls: list[str]) -> list[ArticleSummaryResultDTO]:
         """
         Process the input to summarize articles from the provided URLs.
         Args:
             urls (list[str]): List of URLs to scrape and summarize articles from.
         Returns:
-            list[ArticleSummaryDTO]: List of summarized articles.
+            list[ArticleSummaryResultDTO]: The summarized article or the error of each URL, in URL order.
         """
         validate_urls(urls)
         
         logging.info("Executing summarize articles use case")
-        
-        scrapped_articles = await self.articles_provider.get_async(urls)
-        
-        articles: list[ArticleEnriched] = await self.summarizer.summarize_async(scrapped_articles)
 
-        await self.repo.save_async(articles)
+        outcomes: list[Union[ArticleEnriched, Exception, None]] = [None] * len(urls)
+        async for position, outcome in self._process_async(urls):
+            outcomes[position] = outcome
+
+        results = [self._to_result(url, outcome) for url, outcome in zip(urls, outcomes)]
         
-        logging.info("Summarize articles use case completed with %d articles", len(articles))
+        logging.info(
+            "Summarize articles use case completed with %d articles, %d failed URLs",
+            sum(result.status == "ok" for result in results), sum(result.status == "error" for result in results),
+        )
         
-        return [ArticleSummaryDTO.from_article(article=article) for article in articles]
-    
\ No newline at end of file
+        return results
+
+    async def _process_async(self, urls: list[str]) -> AsyncIterator[tuple[int, Union[ArticleEnriched, Exception]]]:
+        """
+        Runs the URLs through the scrape, summarize and save stages.
+        The first URL of each content fingerprint goes through the summarize and save stages; the
+        other URLs with the same content leave the pipeline after scraping and get its outcome.
+        Args:
+            urls (list[str]): The URLs to summarize.
+        Yields:
+            tuple[int, Union[ArticleEnriched, Exception]]: The position of each URL and its article or error,
+            in completion order.
+        """
+        leaders: dict[str, int] = {}
+        fingerprints: dict[int, str] = {}
+
+        async def scrape(items: list[tuple[int, str]]) -> list:
+            scrapped_articles = await self.articles_provider.get_async([url for _, url in items])
+
+            outcomes = []
+            for (position, _), article in zip(items, scrapped_articles):
+                if isinstance(article, Exception):
+                    outcomes.append(article)
+                    continue
+
+                fingerprint = fingerprints[position] = fingerprint_content(article["content"])
+                if leaders.setdefault(fingerprint, position) != position:
+                    outcomes.append(Finished(DUPLICATE))
+                else:
+                    outcomes.append((fingerprint, article))
+            return outcomes
+
+        async def summarize(items: list[tuple[str, dict[str, str]]]) -> list:
+            known_articles = await self.repo.get_by_fingerprints_async([fingerprint for fingerprint, _ in items])
+            new_articles = [(fingerprint, article) for fingerprint, article in items if fingerprint not in known_articles]
+
+            summaries = await self.summarizer.summarize_async([article for _, article in new_articles]) if new_articles else []
+            summarized = dict(zip([fingerprint for fingerprint, _ in new_articles], summaries))
+
+            return [
+                Finished(known_articles[fingerprint]) if fingerprint in known_articles else summarized[fingerprint]
+                for fingerprint, _ in items
+            ]
+
+        async def save(articles: list[ArticleEnriched]) -> list[ArticleEnriched]:
+            await self.repo.save_async(articles)
+            return articles
+
+        pipeline = StagePipeline(
+            [
+                PipelineStage("scrape", scrape, workers=self.scrape_workers),
+                PipelineStage("summarize", summarize, workers=self.summarize_workers),
+                PipelineStage("save", save, batch_size=self.save_batch_size),
+            ],
+            queue_size=self.queue_size,
+        )
+
+        finished: dict[str, Union[ArticleEnriched, Exception]] = {}
+        duplicates: dict[str, list[int]] = {}
+
+        outcomes = pipeline.run(list(enumerate(urls)))
+        try:
+            async for position, outcome in outcomes:
+                fingerprint = fingerprints.get(position)
+
+                if outcome is DUPLICATE:
+                    if fingerprint in finished:
+                        yield position, finished[fingerprint]
+                    else:
+                        duplicates.setdefault(fingerprint, []).append(position)
+                    continue
+
+                yield position, outcome
+
+                if fingerprint is not None:
+                    finished[fingerprint] = outcome
+                    for duplicate in duplicates.pop(fingerprint, []):
+                        yield duplicate, outcome
+        finally:
+            await outcomes.aclose()
+
+    @staticmethod
+    def _to_result(url: str, outcome) -> ArticleSummaryResultDTO:
+        """
+        Builds the result of a URL from its summarized article or the error raised for it.
+        Args:
+            url (str): The summarized URL.
+            outcome (Union[ArticleEnriched, Exception]): The article or the error.
+        Returns:
+            ArticleSummaryResultDTO: The per-URL result.
+        """
+        if isinstance(outcome, Exception):
+            logging.warning("Failed to summarize URL %s: %s", url, outcome)
+            return ArticleSummaryResultDTO.from_error(url, outcome)
+
+        return ArticleSummaryResultDTO.from_article(url, outcome)
+
+    def stream(self, urls: list[str]) -> AsyncIterator[ArticleSummaryResultDTO]:
+        """
+        Summarizes the articles from the provided URLs, yielding each result as soon as its
+        article is scraped, summarized and saved, in completion order. A failing URL yields
+        an error result instead of aborting the other URLs.
+        Args:
+            urls (list[str]): List of URLs to scrape and summarize articles from.
+        Returns:
+            AsyncIterator[ArticleSummaryResultDTO]: The per-URL results.
+        Raises:
+            UrlValidationError: If any URL is invalid (raised before anything is streamed).
+        """
+        validate_urls(urls)
+
+        return self._stream_async(urls)
+
+    async def _stream_async(self, urls: list[str]) -> AsyncIterator[ArticleSummaryResultDTO]:
+        logging.info("Executing streaming summarize articles use case for %d URLs", len(urls))
+
+        # The client may disconnect mid-stream; closing the pipeline stops the work nobody will read
+        results = self._process_async(urls)
+        try:
+            async for position, outcome in results:
+                yield self._to_result(urls[position], outcome)
+        finally:
+            await results.aclose()
+
+        logging.info("Streaming summarize articles use case completed for %d URLs", len(urls))
@@ -0,0 +1,20 @@
+import hashlib
+import re
+import unicodedata
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+def fingerprint_content(content: str) -> str:
+    """
+    Computes a stable fingerprint of the article content, used as the article id.
+    The content is Unicode-normalized, case-folded and has its whitespace collapsed,
+    so the same article scraped twice maps to the same fingerprint.
+    Args:
+        content (str): The article content.
+    Returns:
+        str: The hex SHA-256 digest of the normalized content.
+    """
+    normalized = unicodedata.normalize("NFKC", content).casefold()
+    normalized = WHITESPACE_PATTERN.sub(" ", normalized).strip()
+
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
@@ -0,0 +1,42 @@
+import logging
+import sys
+from httpx import HTTPStatusError
+from tenacity import RetryError
+
+from application.exceptions.no_content_error import NoContentError
+from application.exceptions.token_limit_exceeded_error import TokenLimitExceededError
+
+def is_content_filter_error(exc: BaseException) -> bool:
+    """
+    Checks whether an error is an Azure OpenAI content filter rejection.
+    openai is only loaded once an LLM client is built, so it is not imported here: if it is not
+    loaded yet, the error cannot have been raised by it.
+    Args:
+        exc (BaseException): The error to check.
+    Returns:
+        bool: Whether the error is a ContentFilterFinishReasonError.
+    """
+    openai = sys.modules.get("openai")
+    return openai is not None and isinstance(exc, openai.ContentFilterFinishReasonError)
+
+def describe_error(exc: BaseException) -> str:
+    """
+    Builds the client-facing message for an error raised while processing a single article,
+    using the same wording as the REST exception handlers.
+    Args:
+        exc (BaseException): The error raised for the article.
+    Returns:
+        str: The error message to report for the article.
+    """
+    if isinstance(exc, HTTPStatusError):
+        return f"HTTP error occurred: {exc.response.status_code} - {exc.response.reason_phrase}"
+
+    if isinstance(exc, (NoContentError, TokenLimitExceededError)):
+        return str(exc)
+
+    if isinstance(exc, RetryError) and is_content_filter_error(exc.last_attempt.exception()):
+        return "The content was blocked due to violating safety filters."
+
+    logging.error("Unexpected error while processing article: %s", exc, exc_info=exc)
+
+    return "An unexpected error occurred."
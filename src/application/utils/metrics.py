@@ -0,0 +1,236 @@
+import bisect
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from application.utils.request_context import record_stage
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+def _format_labels(label_names: tuple[str, ...], label_values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(label_names, label_values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+class Metric():
+    """
+    Base class of the metrics: a name, a help text and label names, with one series per label values.
+    """
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+
+        self._lock = threading.Lock()
+
+    def _label_values(self, labels: dict[str, str]) -> tuple[str, ...]:
+        if set(labels) != set(self.label_names):
+            raise ValueError(f"Metric {self.name} expects labels {self.label_names}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def render(self) -> list[str]:
+        """
+        Renders the metric in the Prometheus text exposition format.
+        Returns:
+            list[str]: The HELP and TYPE lines followed by one line per sample.
+        """
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}", *self._samples()]
+
+    def _samples(self) -> list[str]:
+        raise NotImplementedError
+
+class Counter(Metric):
+    """Monotonically increasing count, e.g. of tokens or retries."""
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> None:
+        super().__init__(name, documentation, label_names)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        """
+        Increases the counter of the given labels.
+        Args:
+            amount (float): The non-negative amount to add.
+            **labels (str): The label values.
+        """
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        """
+        Returns:
+            float: The current count of the given labels.
+        """
+        with self._lock:
+            return self._values.get(self._label_values(labels), 0.0)
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}" for key, value in values]
+
+class Histogram(Metric):
+    """Distribution of observed values, e.g. latencies, counted in cumulative buckets."""
+    kind = "histogram"
+
+    def __init__(
+        self, name: str, documentation: str, label_names: tuple[str, ...] = (), buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> None:
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._series: dict[tuple[str, ...], list] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """
+        Records an observation.
+        Args:
+            value (float): The observed value.
+            **labels (str): The label values.
+        """
+        key = self._label_values(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * len(self.buckets), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def count(self, **labels: str) -> int:
+        """
+        Returns:
+            int: The number of observations of the given labels.
+        """
+        with self._lock:
+            series = self._series.get(self._label_values(labels))
+            return series[2] if series else 0
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            series = sorted((key, (list(counts), total, count)) for key, (counts, total, count) in self._series.items())
+
+        lines = []
+        for key, (counts, total, count) in series:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                bound_label = 'le="' + _format_value(bound) + '"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.label_names, key, bound_label)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.label_names, key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.label_names, key)} {count}")
+        return lines
+
+class MetricsRegistry():
+    """
+    Process-wide collection of metrics, rendered in the Prometheus text exposition format.
+    Built in, so the service exposes its metrics without a client library or an external collector.
+    """
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: Metric) -> Metric:
+        """
+        Adds a metric, returning the one already registered under its name if any.
+        Args:
+            metric (Metric): The metric.
+        Returns:
+            Metric: The registered metric.
+        """
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> Counter:
+        return self.register(Counter(name, documentation, label_names))
+
+    def histogram(
+        self, name: str, documentation: str, label_names: tuple[str, ...] = (), buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, label_names, buckets))
+
+    def render(self) -> str:
+        """
+        Renders every metric.
+        Returns:
+            str: The metrics in the Prometheus text exposition format.
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "\n".join(line for metric in metrics for line in metric.render()) + "\n"
+
+@contextmanager
+def timed(histogram: Histogram, stage: Optional[str] = None, **labels: str) -> Iterator[None]:
+    """
+    Observes the duration of the block in the histogram and, if a stage is given, adds it to the
+    stage timings of the current request.
+    Args:
+        histogram (Histogram): The latency histogram, in seconds.
+        stage (Optional[str]): The name of the stage in the request breakdown.
+        **labels (str): The label values of the histogram.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        histogram.observe(elapsed, **labels)
+        if stage is not None:
+            record_stage(stage, elapsed)
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    "http_request_duration_seconds", "Duration of HTTP requests, until the response headers are sent.", ("method", "route", "status")
+)
+SCRAPE_FETCH_SECONDS = REGISTRY.histogram(
+    "scrape_fetch_duration_seconds", "Duration of article page downloads, including connection and host limit waits.", ("outcome",)
+)
+SCRAPE_PARSE_SECONDS = REGISTRY.histogram(
+    "scrape_parse_duration_seconds", "Duration of article HTML extraction, including the parse pool queue."
+)
+SCRAPE_CACHE_TOTAL = REGISTRY.counter(
+    "scrape_cache_lookups_total", "Scrape cache lookups by result.", ("result",)
+)
+SUMMARY_CHUNKS = REGISTRY.histogram(
+    "summary_chunks", "Number of chunks articles are split into.", buckets=(1, 2, 4, 8, 16, 32, 64, 128)
+)
+SUMMARY_NODE_SECONDS = REGISTRY.histogram(
+    "summary_node_duration_seconds", "Duration of the summarization graph nodes, per article.", ("node",)
+)
+LLM_REQUEST_SECONDS = REGISTRY.histogram(
+    "llm_request_duration_seconds", "Duration of LLM calls.", ("outcome",)
+)
+LLM_TOKENS_TOTAL = REGISTRY.counter(
+    "llm_tokens_total", "Tokens used by LLM calls, as reported by the service.", ("kind",)
+)
+LLM_RETRIES_TOTAL = REGISTRY.counter(
+    "llm_retries_total", "Retried LLM calls, by reason.", ("reason",)
+)
+EMBEDDING_SECONDS = REGISTRY.histogram(
+    "embedding_batch_duration_seconds", "Duration of embedding batches of documents."
+)
+EMBEDDED_DOCUMENTS_TOTAL = REGISTRY.counter(
+    "embedded_documents_total", "Documents embedded."
+)
+VECTOR_STORE_SECONDS = REGISTRY.histogram(
+    "vector_store_duration_seconds", "Duration of vector store writes (per batch) and queries.", ("store", "operation")
+)
+REEMBEDDED_DOCUMENTS_TOTAL = REGISTRY.counter(
+    "reembedded_documents_total", "Stored documents re-embedded by embedding model migrations."
+)
@@ -0,0 +1,74 @@
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+
+from application.exceptions.invalid_cursor_error import InvalidCursorError
+from domain.article_filters import ArticleFilters
+
+def cursor_key(query: str, filters: ArticleFilters) -> str:
+    """
+    Derives the key binding a cursor to the query and filters it was issued for.
+    Args:
+        query (str): The query as sent by the client.
+        filters (ArticleFilters): The filters of the query.
+    Returns:
+        str: A short hash of the query and filters.
+    """
+    payload = json.dumps([query, filters.model_dump()], sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+def _b64decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+def _sign(payload: bytes, secret: bytes) -> bytes:
+    return hmac.new(secret, payload, hashlib.sha256).digest()
+
+def encode_cursor(search_query: str, offset: int, key: str, secret: bytes) -> str:
+    """
+    Encodes the position of the next page as an opaque URL-safe cursor, signed with a server secret.
+    The enhanced search query is carried along, so later pages skip query enhancement; the signature
+    keeps clients from substituting a query that was not enhanced and validated, or another offset.
+    Args:
+        search_query (str): The enhanced query the first page was searched with.
+        offset (int): The number of results already returned.
+        key (str): The cursor key of the original query and filters.
+        secret (bytes): The secret signing the cursors.
+    Returns:
+        str: The cursor.
+    """
+    payload = json.dumps({"q": search_query, "o": offset, "k": key}, separators=(",", ":")).encode()
+    return f"{_b64encode(payload)}.{_b64encode(_sign(payload, secret))}"
+
+def decode_cursor(cursor: str, key: str, secret: bytes, max_offset: int) -> tuple[str, int]:
+    """
+    Decodes a cursor issued by encode_cursor.
+    Args:
+        cursor (str): The cursor.
+        key (str): The cursor key of the current query and filters.
+        secret (bytes): The secret the cursors are signed with.
+        max_offset (int): The largest offset a cursor may point to.
+    Returns:
+        tuple[str, int]: The enhanced search query and the offset of the next page.
+    Raises:
+        InvalidCursorError: If the cursor is malformed, was not signed with the secret, was issued for
+            another query or filters, or points beyond max_offset.
+    """
+    try:
+        encoded_payload, encoded_signature = cursor.split(".")
+        payload = _b64decode(encoded_payload)
+        if not hmac.compare_digest(_b64decode(encoded_signature), _sign(payload, secret)):
+            raise InvalidCursorError()
+        payload = json.loads(payload)
+        search_query, offset, issued_key = payload["q"], payload["o"], payload["k"]
+    except (binascii.Error, ValueError, TypeError, KeyError) as exc:
+        raise InvalidCursorError() from exc
+
+    if issued_key != key or not isinstance(search_query, str) or not isinstance(offset, int) or not 0 <= offset <= max_offset:
+        raise InvalidCursorError()
+
+    return search_query, offset
@@ -0,0 +1,17 @@
+def reciprocal_rank_fusion(rankings: list[list[str]], k: int = 60) -> list[tuple[str, float]]:
+    """
+    Fuses ranked lists of ids with reciprocal rank fusion: each id scores the sum of
+    1 / (k + rank) over the lists it appears in, so only ranks matter, not the raw
+    scores, which are not comparable between BM25 and vector distances.
+    Args:
+        rankings (list[list[str]]): Ids ordered best first, one list per retriever.
+        k (int): Damping constant; larger values flatten the weight of the top ranks.
+    Returns:
+        list[tuple[str, float]]: Every id with its fused score, best first.
+    """
+    scores: dict[str, float] = {}
+    for ranking in rankings:
+        for rank, item in enumerate(ranking, start=1):
+            scores[item] = scores.get(item, 0.0) + 1 / (k + rank)
+
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
@@ -0,0 +1,91 @@
+import logging
+import re
+import threading
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+REQUEST_ID_PATTERN = re.compile(r"^[A-Za-z0-9._:-]{1,128}$")
+
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+stage_timings_var: ContextVar[Optional[dict[str, float]]] = ContextVar("stage_timings", default=None)
+
+# Stages are recorded from worker threads as well as the event loop, so the breakdowns are
+# read and updated under a lock
+_stage_timings_lock = threading.Lock()
+
+def new_request_id(candidate: Optional[str] = None) -> str:
+    """
+    Returns the request id to use: the one supplied by the caller if it is well formed, a new one otherwise.
+    Args:
+        candidate (Optional[str]): The request id supplied by the caller, e.g. in an X-Request-ID header.
+    Returns:
+        str: The request id.
+    """
+    if candidate and REQUEST_ID_PATTERN.match(candidate):
+        return candidate
+    return uuid.uuid4().hex
+
+@contextmanager
+def request_context(request_id: str) -> Iterator[dict[str, float]]:
+    """
+    Binds a request id and an empty stage timing breakdown to the current context.
+    Tasks and threads started inside the block inherit them, so every stage of the
+    request logs the request id and adds its duration to the same breakdown.
+    Args:
+        request_id (str): The request id.
+    Yields:
+        dict[str, float]: The cumulative seconds spent per stage, filled as the request runs.
+    """
+    timings: dict[str, float] = {}
+    request_id_token = request_id_var.set(request_id)
+    timings_token = stage_timings_var.set(timings)
+    try:
+        yield timings
+    finally:
+        stage_timings_var.reset(timings_token)
+        request_id_var.reset(request_id_token)
+
+def record_stage(stage: str, seconds: float) -> None:
+    """
+    Adds the duration of a stage to the breakdown of the current request, if there is one.
+    Stages of concurrent articles add up, so a stage can total more than the request wall time.
+    Args:
+        stage (str): The stage name.
+        seconds (float): The duration of the stage.
+    """
+    timings = stage_timings_var.get()
+    if timings is not None:
+        with _stage_timings_lock:
+            timings[stage] = timings.get(stage, 0.0) + seconds
+
+def snapshot_stage_timings(timings: dict[str, float]) -> dict[str, float]:
+    """
+    Returns a copy of a stage timing breakdown that stages may still be adding to.
+    Args:
+        timings (dict[str, float]): The seconds spent per stage.
+    Returns:
+        dict[str, float]: A copy of the breakdown.
+    """
+    with _stage_timings_lock:
+        return dict(timings)
+
+def format_stage_timings(timings: dict[str, float]) -> str:
+    """
+    Formats a stage timing breakdown for logs, slowest stage first.
+    Args:
+        timings (dict[str, float]): The seconds spent per stage.
+    Returns:
+        str: The stages and their durations in milliseconds, e.g. 'scrape_fetch=120.4ms embedding=35.0ms'.
+    """
+    return " ".join(
+        f"{stage}={seconds * 1000:.1f}ms"
+        for stage, seconds in sorted(snapshot_stage_timings(timings).items(), key=lambda item: -item[1])
+    )
+
+class RequestIdLogFilter(logging.Filter):
+    """Adds the request id of the current context (or '-') to log records as request_id."""
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get() or "-"
+        return True
@@ -0,0 +1,16 @@
+from domain.article_query import ArticleQuery
+
+def build_semantic_text(article: ArticleQuery) -> str:
+    """
+    Builds the text embedded and indexed for an article: its headline, summary and topics,
+    or its headline and content when it was stored without a summary (bulk ingestion
+    without summarization).
+    Args:
+        article (ArticleQuery): The article to store.
+    Returns:
+        str: The semantic text of the article.
+    """
+    if not article.summary:
+        return f"Headline: {article.headline}\nContent: {article.content}"
+
+    return f"Headline: {article.headline}\nSummary: {article.summary}\nTopics: {', '.join(article.topics or [])}"
@@ -0,0 +1,87 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Sequence
+
+@dataclass(frozen=True)
+class Finished():
+    """Outcome of a stage handler that completes an item early, skipping the remaining stages."""
+    value: Any
+
+@dataclass(frozen=True)
+class PipelineStage():
+    """
+    A stage of a StagePipeline.
+    Args:
+        name (str): The stage name, for task names.
+        handler (Callable[[list[Any]], Awaitable[list[Any]]]): Processes a batch of items, returning one
+            outcome per item: the input of the next stage, a Finished value or an exception.
+        workers (int): The number of batches processed concurrently.
+        batch_size (int): The maximum number of queued items handled together. Workers take what is
+            already queued, up to this size, and never wait for a batch to fill.
+    """
+    name: str
+    handler: Callable[[list[Any]], Awaitable[list[Any]]]
+    workers: int = 1
+    batch_size: int = 1
+
+class StagePipeline():
+    """
+    Runs items through a sequence of async stages connected by bounded queues.
+    Every stage has its own workers, so an item moves to the next stage as soon as it is done
+    instead of waiting for the slowest item of the previous stage, and a full queue holds the
+    upstream stage back (backpressure). An exception outcome, or an exception raised by a
+    handler for its whole batch, completes the item with that exception.
+    """
+    def __init__(self, stages: Sequence[PipelineStage], queue_size: int = 16) -> None:
+        self.stages = list(stages)
+        self.queue_size = queue_size
+
+    async def run(self, items: Sequence[Any]) -> AsyncIterator[tuple[int, Any]]:
+        """
+        Runs the items through the stages. Closing the iterator early cancels the remaining work.
+        Args:
+            items (Sequence[Any]): The inputs of the first stage.
+        Yields:
+            tuple[int, Any]: The position of each item and its final outcome, in completion order.
+        """
+        queues = [asyncio.Queue(maxsize=self.queue_size) for _ in self.stages]
+        output: asyncio.Queue = asyncio.Queue()
+        last = len(self.stages) - 1
+
+        async def feed() -> None:
+            for position, item in enumerate(items):
+                await queues[0].put((position, item))
+
+        async def work(number: int, stage: PipelineStage) -> None:
+            queue = queues[number]
+            while True:
+                batch = [await queue.get()]
+                while len(batch) < stage.batch_size and not queue.empty():
+                    batch.append(queue.get_nowait())
+
+                try:
+                    outcomes = await stage.handler([item for _, item in batch])
+                except Exception as exc:
+                    outcomes = [exc] * len(batch)
+
+                for (position, _), outcome in zip(batch, outcomes):
+                    if isinstance(outcome, Finished):
+                        output.put_nowait((position, outcome.value))
+                    elif isinstance(outcome, Exception) or number == last:
+                        output.put_nowait((position, outcome))
+                    else:
+                        await queues[number + 1].put((position, outcome))
+
+        tasks = [asyncio.create_task(feed(), name="pipeline-feed")] + [
+            asyncio.create_task(work(number, stage), name=f"pipeline-{stage.name}-{worker}")
+            for number, stage in enumerate(self.stages)
+            for worker in range(stage.workers)
+        ]
+
+        try:
+            for _ in range(len(items)):
+                yield await output.get()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
@@ -1,20 +1,33 @@
-import tiktoken
+from typing import Any, Optional
 from langchain_core.runnables import Runnable
 from langchain_core.runnables.config import RunnableConfig
 from langchain_core.prompts.chat import ChatPromptValue
-from langchain_core.messages import BaseMessage
 
 from config.settings import settings
 from application.exceptions.token_limit_exceeded_error import TokenLimitExceededError
+from application.utils.tokenizer import Tokenizer
 
 class TokenLimitValidator(Runnable):
     """
     Validates that the token count of a chat prompt does not exceed a specified limit.
     This is useful for ensuring that the input to an LLM does not exceed the model's token limit.
+    Counting goes through the shared Tokenizer, so repeated system prompts are not encoded again
+    and a batch of prompts is encoded in one call.
     """
-    def __init__(self, max_tokens: int, model_name: str):
+    def __init__(self, max_tokens: int, model_name: str, tokenizer: Optional[Tokenizer] = None):
         self.max_tokens = max_tokens
-        self.encoding = tiktoken.encoding_for_model(model_name)
+        self.tokenizer = tokenizer or Tokenizer(model_name)
+        self.encoding = self.tokenizer.encoding
+
+    def count_tokens(self, input: ChatPromptValue) -> int:
+        """
+        Counts the tokens of the messages of a chat prompt.
+        Args:
+            input (ChatPromptValue): The chat prompt containing messages to count.
+        Returns:
+            int: The token count.
+        """
+        return self.tokenizer.count_messages(input.messages)
 
     def invoke(self, input: ChatPromptValue, config: RunnableConfig = None) -> str:
         """
@@ -24,13 +37,24 @@ class TokenLimitValidator(Runnable):
             config (RunnableConfig, optional): Configuration for the runnable. Defaults to None.
         Raises:
             TokenLimitExceededError: If the token count exceeds the maximum allowed."""
-        messages: list[BaseMessage] = input.messages
-        
-        combined = " ".join([f"{msg.content}" for msg in messages])
-
-        token_count = len(self.encoding.encode(combined))
+        token_count = self.count_tokens(input)
         
         if token_count > self.max_tokens:
             raise TokenLimitExceededError(token_count, self.max_tokens)
         
-        return input
\ No newline at end of file
+        return input
+
+    def batch(self, inputs: list[ChatPromptValue], config: Optional[RunnableConfig] = None, **kwargs: Any) -> list:
+        """Validates a batch of prompts, encoding all of their messages in a single batch first."""
+        self._count_batch(inputs)
+
+        return super().batch(inputs, config, **kwargs)
+
+    async def abatch(self, inputs: list[ChatPromptValue], config: Optional[RunnableConfig] = None, **kwargs: Any) -> list:
+        """Validates a batch of prompts, encoding all of their messages in a single batch first."""
+        self._count_batch(inputs)
+
+        return await super().abatch(inputs, config, **kwargs)
+
+    def _count_batch(self, inputs: list[ChatPromptValue]) -> None:
+        self.tokenizer.count_batch([f"{message.content}" for input in inputs for message in input.messages])
@@ -0,0 +1,125 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+import tiktoken
+from langchain.text_splitter import TextSplitter
+from langchain_core.messages import BaseMessage
+
+class Tokenizer():
+    """
+    Shared tiktoken tokenization service.
+    Token counts are cached by text (bounded, least recently used first), so the fixed system
+    prompts of each template are encoded once per process and a message counted by the token
+    limit validator is not encoded again by the LLM scheduler. Articles are encoded once to be
+    split, the chunk counts are remembered from the token windows, and cache misses are
+    encoded together with tiktoken's multi-threaded batch encoder.
+    """
+    def __init__(self, model_name: str, cache_size: int = 4096, encoding: Optional[tiktoken.Encoding] = None) -> None:
+        self.encoding = encoding or tiktoken.encoding_for_model(model_name)
+        self.cache_size = cache_size
+
+        self._counts: OrderedDict[str, int] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def encode(self, text: str) -> list[int]:
+        """
+        Encodes the text, treating special tokens as plain text.
+        Args:
+            text (str): The text to encode.
+        Returns:
+            list[int]: The token ids.
+        """
+        return self.encoding.encode_ordinary(text)
+
+    def count(self, text: str) -> int:
+        """
+        Counts the tokens of a text.
+        Args:
+            text (str): The text to count.
+        Returns:
+            int: The token count.
+        """
+        return self.count_batch([text])[0]
+
+    def count_batch(self, texts: list[str]) -> list[int]:
+        """
+        Counts the tokens of several texts, encoding the ones not cached in a single batch.
+        Args:
+            texts (list[str]): The texts to count.
+        Returns:
+            list[int]: The token count of each text.
+        """
+        with self._lock:
+            counts = {text: self._counts.get(text) for text in texts}
+            for text, count in counts.items():
+                if count is not None:
+                    self._counts.move_to_end(text)
+
+        missing = [text for text, count in counts.items() if count is None]
+        if len(missing) == 1:
+            counts[missing[0]] = len(self.encode(missing[0]))
+        elif missing:
+            counts.update(zip(missing, map(len, self.encoding.encode_ordinary_batch(missing))))
+
+        if missing:
+            self._remember({text: counts[text] for text in missing})
+
+        return [counts[text] for text in texts]
+
+    def count_messages(self, messages: list[BaseMessage]) -> int:
+        """
+        Counts the tokens of the contents of chat messages.
+        Args:
+            messages (list[BaseMessage]): The messages to count.
+        Returns:
+            int: The total token count.
+        """
+        return sum(self.count_batch([f"{message.content}" for message in messages]))
+
+    def split_text(self, text: str, chunk_size: int, chunk_overlap: int) -> list[str]:
+        """
+        Splits a text into windows of at most chunk_size tokens overlapping by chunk_overlap tokens.
+        The text is encoded once and the windows are decoded in a batch.
+        Args:
+            text (str): The text to split.
+            chunk_size (int): The maximum number of tokens per chunk.
+            chunk_overlap (int): The number of tokens shared by consecutive chunks.
+        Returns:
+            list[str]: The chunks.
+        """
+        tokens = self.encode(text)
+        if not tokens:
+            return []
+
+        step = chunk_size - chunk_overlap
+
+        windows = []
+        for start in range(0, len(tokens), step):
+            windows.append(tokens[start:start + chunk_size])
+            if start + chunk_size >= len(tokens):
+                break
+
+        chunks = self.encoding.decode_batch(windows)
+        self._remember(dict(zip(chunks, map(len, windows))))
+
+        return chunks
+
+    def _remember(self, counts: dict[str, int]) -> None:
+        with self._lock:
+            self._counts.update(counts)
+            for text in counts:
+                self._counts.move_to_end(text)
+            while len(self._counts) > self.cache_size:
+                self._counts.popitem(last=False)
+
+class TokenizerTextSplitter(TextSplitter):
+    """
+    Token text splitter backed by the shared Tokenizer, a drop-in replacement for
+    langchain's TokenTextSplitter that shares its encoding and token count cache.
+    """
+    def __init__(self, tokenizer: Tokenizer, chunk_size: int, chunk_overlap: int = 50, **kwargs: Any) -> None:
+        super().__init__(chunk_size=chunk_size, chunk_overlap=chunk_overlap, **kwargs)
+        self.tokenizer = tokenizer
+
+    def split_text(self, text: str) -> list[str]:
+        return self.tokenizer.split_text(text, self._chunk_size, self._chunk_overlap)
@@ -3,7 +3,12 @@ LOGGING_CONFIG = {
     "disable_existing_loggers": False, 
     "formatters": {
         "standard": {  
-            "format": "%(asctime)s - %(levelname)s - %(message)s"
+            "format": "%(asctime)s - %(levelname)s - [%(request_id)s] %(message)s"
+        }
+    },
+    "filters": {
+        "request_id": {
+            "()": "application.utils.request_context.RequestIdLogFilter"
         }
     },
     "handlers": {
@@ -11,6 +16,7 @@ LOGGING_CONFIG = {
             "class": "logging.StreamHandler", 
             "level": "INFO",
             "formatter": "standard",
+            "filters": ["request_id"],
             "stream": "ext://sys.stdout"
         }
     },
@@ -29,6 +29,81 @@ class Settings(BaseSettings):
     CHUNK_TOKEN_LIMIT: int
     MAX_TOKEN_LIMIT: int
 
+    FAST_START: bool = False
+
+    SCRAPER_TIMEOUT: float = 30
+    SCRAPER_MAX_CONNECTIONS: int = 100
+    SCRAPER_MAX_CONNECTIONS_PER_HOST: int = 6
+    SCRAPER_MAX_CONCURRENCY: int = 20
+    SCRAPER_HTTP2: bool = True
+    SCRAPER_PARSER_BACKEND: str = "selectolax"
+    SCRAPER_PARSE_WORKERS: int = 2
+
+    SCRAPE_CACHE_ENABLED: bool = True
+    SCRAPE_CACHE_PATH: str = "./cache/scrape_cache.sqlite3"
+    SCRAPE_CACHE_TTL_SECONDS: float = 3600
+    SCRAPE_CACHE_MAX_BYTES: int = 512 * 1024 * 1024
+
+    LLM_REQUESTS_PER_MINUTE: float = 600
+    LLM_TOKENS_PER_MINUTE: float = 200_000
+    LLM_MAX_CONCURRENCY: int = 16
+    LLM_COMPLETION_TOKENS_ESTIMATE: int = 256
+
+    TOKENIZER_CACHE_SIZE: int = 4096
+
+    SUMMARY_COLLAPSE_TOKEN_LIMIT: int = 12_000
+    SUMMARY_SHORT_ARTICLE_TOKENS: int = 200
+
+    LLM_CACHE_PATH: str = "./cache/llm_cache.sqlite3"
+    LLM_CACHE_TTL_SECONDS: float = 7 * 24 * 3600
+    LLM_CACHE_MAX_ENTRIES: int = 100_000
+
+    SEMANTIC_CACHE_ENABLED: bool = True
+    SEMANTIC_CACHE_THRESHOLD: float = 0.92
+    SEMANTIC_CACHE_MAX_ENTRIES: int = 10_000
+
+    EMBEDDING_BATCH_SIZE: int = 256
+    EMBEDDING_WORKERS: int = 1
+    EMBEDDING_NORMALIZE: bool = False
+    EMBEDDING_BACKEND: str = "torch"
+    EMBEDDING_ONNX_FILE: str = "onnx/model.onnx"
+    EMBEDDING_ONNX_THREADS: int = 0
+    EMBEDDING_ONNX_MIN_COSINE: float = 0.99
+    EMBEDDING_VERSION: int = 1
+    EMBEDDING_MIGRATION_BATCH_SIZE: int = 128
+    EMBEDDING_MIGRATION_PAUSE_SECONDS: float = 0.5
+
+    FAISS_PERSIST_DIRECTORY: str = "./faiss_db"
+    FAISS_INDEX_TYPE: str = "flat"
+    FAISS_IVF_THRESHOLD: int = 50_000
+    FAISS_NPROBE: int = 16
+
+    HYBRID_SEARCH_ENABLED: bool = True
+    HYBRID_SEARCH_CANDIDATES: int = 20
+    HYBRID_SEARCH_RRF_K: int = 60
+
+    QUERY_CURSOR_SECRET: str = ""
+    QUERY_MAX_OFFSET: int = 100
+
+    CONTENT_STORE_ENABLED: bool = True
+    CONTENT_STORE_ZSTD_LEVEL: int = 3
+
+    PIPELINE_SCRAPE_WORKERS: int = 20
+    PIPELINE_SUMMARIZE_WORKERS: int = 16
+    PIPELINE_SAVE_BATCH_SIZE: int = 32
+    PIPELINE_QUEUE_SIZE: int = 16
+
+    INGEST_BATCH_SIZE: int = 32
+    INGEST_PARALLEL: int = 4
+
+    SUMMARY_JOBS_PATH: str = "./cache/summary_jobs.sqlite3"
+    SUMMARY_JOB_WORKERS: int = 2
+    SUMMARY_JOB_BATCH_SIZE: int = 10
+    SUMMARY_JOB_LEASE_SECONDS: float = 15 * 60
+    SUMMARY_JOB_MAX_ATTEMPTS: int = 3
+    SUMMARY_JOB_POLL_SECONDS: float = 2
+    SUMMARY_JOB_RETENTION_SECONDS: float = 7 * 24 * 3600
+
     model_config = ConfigDict(extra="ignore")
 
 settings = Settings()
\ No newline at end of file
@@ -0,0 +1,41 @@
+from typing import Literal, Optional
+from pydantic import BaseModel, Field, field_validator
+
+PoliticalBias = Literal["Right", "Lean Right", "None", "Lean Left", "Left"]
+
+def normalize_topic(topic: str) -> str:
+    """
+    Normalizes a topic for filtering, so 'World News' and ' world news' match.
+    Args:
+        topic (str): The topic.
+    Returns:
+        str: The stripped, case-folded topic.
+    """
+    return topic.strip().casefold()
+
+class ArticleFilters(BaseModel):
+    """
+    Represents the metadata filters of an article query.
+    Values of a field are alternatives (any of them matches); fields are all required to match.
+    """
+    political_bias: Optional[list[PoliticalBias]] = Field(
+        default=None, description="Political biases the articles may have.",
+    )
+    topics: Optional[list[str]] = Field(
+        default=None, description="Topics of which the articles must mention at least one.",
+    )
+
+    @field_validator("topics")
+    @classmethod
+    def _normalize_topics(cls, topics: Optional[list[str]]) -> Optional[list[str]]:
+        if topics is None:
+            return None
+        return sorted({normalize_topic(topic) for topic in topics if topic.strip()}) or None
+
+    def is_empty(self) -> bool:
+        """
+        Tells whether the filters match every article.
+        Returns:
+            bool: True if no filter is set.
+        """
+        return not self.political_bias and not self.topics
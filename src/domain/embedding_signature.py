@@ -0,0 +1,41 @@
+from typing import Any, Optional
+from pydantic import BaseModel, ConfigDict
+
+EMBEDDING_MODEL_KEY = "embedding_model"
+EMBEDDING_VERSION_KEY = "embedding_version"
+EMBEDDING_NORMALIZED_KEY = "embedding_normalized"
+
+# Model of a collection stored before signatures were recorded, whose vectors do not match the configured model
+UNKNOWN_MODEL = "unknown"
+
+class EmbeddingSignature(BaseModel):
+    """
+    Represents the embedding model, the version of the embeddings computed with it and whether they
+    were L2-normalized, that the vectors of a collection were computed with. Queries embedded with
+    another signature are not comparable with the stored vectors.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    model: str
+    version: int = 1
+    normalized: bool = False
+
+    def to_metadata(self) -> dict[str, Any]:
+        return {EMBEDDING_MODEL_KEY: self.model, EMBEDDING_VERSION_KEY: self.version, EMBEDDING_NORMALIZED_KEY: self.normalized}
+
+    @classmethod
+    def from_metadata(cls, metadata: Optional[dict[str, Any]]) -> Optional['EmbeddingSignature']:
+        """
+        Reads the signature recorded in collection metadata.
+        Args:
+            metadata (Optional[dict[str, Any]]): The collection metadata.
+        Returns:
+            Optional[EmbeddingSignature]: The signature, or None if none was recorded.
+        """
+        if not metadata or EMBEDDING_MODEL_KEY not in metadata:
+            return None
+        return cls(
+            model=metadata[EMBEDDING_MODEL_KEY],
+            version=int(metadata.get(EMBEDDING_VERSION_KEY, 1)),
+            normalized=bool(metadata.get(EMBEDDING_NORMALIZED_KEY, False)),
+        )
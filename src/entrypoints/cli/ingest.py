@@ -0,0 +1,170 @@
+"""
+Bulk ingestion of pre-scraped article dumps into the vector database.
+
+Streams a JSON Lines (.jsonl, .jsonl.gz) or Parquet (.parquet, requires pyarrow) dump whose
+records have a "content" and usually a "headline", summarizes the articles with the configured
+LLM and saves them with the configured articles repository, a batch at a time with several
+batches in flight. Articles whose content is already stored are skipped. With
+--skip-summarization the articles are saved without calling the LLM, embedded from their
+headline and content (records may carry their own "summary", "topics" and "political_bias").
+
+Progress is checkpointed next to the dump after every batch, so an interrupted run resumes
+where it stopped when started again with the same arguments.
+
+The ingestion locks the store directory exclusively and refuses to start while the API server
+is running on it (and the API server refuses to start during an ingestion), so the two never
+compete for the write locks of the store, the embedding model and the LLM rate limits.
+
+Usage:
+    PYTHONPATH=src python -m entrypoints.cli.ingest articles.jsonl
+    PYTHONPATH=src python -m entrypoints.cli.ingest articles.parquet --skip-summarization --parallel 8
+"""
+import argparse
+import asyncio
+import logging
+import logging.config
+import time
+from typing import Optional
+
+from application.exceptions.store_locked_error import StoreLockedError
+from application.models.ingest_batch_result_dto import IngestBatchResultDTO
+from application.use_cases.ingest_articles_use_case import IngestArticlesUseCase
+from config.logging import LOGGING_CONFIG
+from config.settings import settings
+from repositories.article_dump_reader import ArticleDumpReader
+from repositories.json_ingest_checkpoint import JsonIngestCheckpoint
+
+
+def format_duration(seconds: float) -> str:
+    seconds = int(seconds)
+    return f"{seconds // 3600}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+
+
+class ProgressReporter():
+    """Logs the ingestion progress with the rate of this run and the estimated time left, at most once per interval."""
+    def __init__(self, start: int, total: Optional[int], interval: float = 5) -> None:
+        self.start = start
+        self.total = total
+        self.interval = interval
+
+        self._started_at = time.monotonic()
+        self._reported_at = 0.0
+
+    def report(self, position: int, totals: IngestBatchResultDTO, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and now - self._reported_at < self.interval:
+            return
+        self._reported_at = now
+
+        elapsed = now - self._started_at
+        rate = (position - self.start) / elapsed if elapsed > 0 else 0.0
+
+        if self.total:
+            eta = format_duration((self.total - position) / rate) if rate > 0 else "unknown"
+            progress = f"{position}/{self.total} articles ({position / self.total:.1%}), ETA {eta}"
+        else:
+            progress = f"{position} articles"
+
+        logging.info(
+            "Ingested %s at %.1f articles/s: %d saved, %d already stored, %d failed",
+            progress, rate, totals.ingested, totals.skipped, totals.failed,
+        )
+
+
+async def ingest_async(
+    use_case: IngestArticlesUseCase,
+    reader: ArticleDumpReader,
+    checkpoint: JsonIngestCheckpoint,
+    batch_size: int,
+    progress_seconds: float = 5,
+    count: bool = True,
+) -> IngestBatchResultDTO:
+    """
+    Ingests the dump from the checkpointed position, saving the checkpoint after every batch.
+    Args:
+        use_case (IngestArticlesUseCase): The ingestion use case.
+        reader (ArticleDumpReader): The dump reader.
+        checkpoint (JsonIngestCheckpoint): The checkpoint of the dump.
+        batch_size (int): The number of records per batch.
+        progress_seconds (float): The minimum interval between progress logs.
+        count (bool): Whether to count the records first, for the ETA.
+    Returns:
+        IngestBatchResultDTO: The totals over every run of the dump.
+    Raises:
+        SystemExit: If the checkpoint belongs to another dump.
+    """
+    dump = reader.describe()
+    state = checkpoint.load() or {"dump": dump, "position": 0, "completed": False}
+    if state["dump"] != dump:
+        raise SystemExit(
+            f"Checkpoint {checkpoint.path} belongs to {state['dump']['path']} ({state['dump']['size']} bytes); "
+            "pass --restart to ingest this dump from the start"
+        )
+
+    totals = IngestBatchResultDTO(**{key: state.get(key, 0) for key in ("ingested", "skipped", "failed")})
+    if state["completed"]:
+        logging.info("Dump %s was already ingested: %s", dump["path"], totals)
+        return totals
+
+    start = state["position"]
+    total = await asyncio.to_thread(reader.count) if count else None
+    if start:
+        logging.info("Resuming ingestion of %s after %d articles", dump["path"], start)
+
+    reporter = ProgressReporter(start, total, progress_seconds)
+    position = start
+    async for position, result in use_case.stream(reader.iter_batches(batch_size, skip=start), start=start):
+        totals += result
+        await asyncio.to_thread(checkpoint.save, {"dump": dump, "position": position, "completed": False, **totals.model_dump()})
+        reporter.report(position, totals)
+
+    await asyncio.to_thread(checkpoint.save, {"dump": dump, "position": position, "completed": True, **totals.model_dump()})
+    reporter.report(position, totals, force=True)
+
+    return totals
+
+
+async def main_async(args: argparse.Namespace) -> IngestBatchResultDTO:
+    from abstractions.resources import AppResources
+    from abstractions.dependencies import build_ingest_articles_use_case
+
+    reader = ArticleDumpReader(args.dump, format=args.format)
+    checkpoint = JsonIngestCheckpoint(args.checkpoint or f"{args.dump}.checkpoint.json")
+    if args.restart:
+        checkpoint.clear()
+
+    try:
+        resources = await asyncio.to_thread(AppResources.build, exclusive_store=True)
+    except StoreLockedError as exc:
+        raise SystemExit(str(exc)) from None
+
+    try:
+        await resources.warm_up_async()
+        use_case = build_ingest_articles_use_case(resources, summarize=not args.skip_summarization, parallel=args.parallel)
+
+        return await ingest_async(use_case, reader, checkpoint, args.batch_size, args.progress_seconds, count=not args.no_count)
+    finally:
+        await resources.close_async()
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("dump", help="The JSON Lines or Parquet article dump")
+    parser.add_argument("--format", choices=("jsonl", "parquet"), help="The dump format (default: from the file extension)")
+    parser.add_argument("--batch-size", type=int, default=settings.INGEST_BATCH_SIZE, help="Records per batch")
+    parser.add_argument("--parallel", type=int, default=settings.INGEST_PARALLEL, help="Batches in flight")
+    parser.add_argument("--skip-summarization", action="store_true", help="Save and embed headline and content without calling the LLM")
+    parser.add_argument("--checkpoint", help="The checkpoint file (default: <dump>.checkpoint.json)")
+    parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint and ingest the dump from the start")
+    parser.add_argument("--no-count", action="store_true", help="Do not count the records first (no ETA)")
+    parser.add_argument("--progress-seconds", type=float, default=5, help="Minimum interval between progress logs")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    logging.config.dictConfig(LOGGING_CONFIG)
+    asyncio.run(main_async(parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
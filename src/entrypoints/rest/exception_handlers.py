@@ -1,6 +1,5 @@
 from fastapi import FastAPI, Request, status
 from fastapi.responses import JSONResponse
-from openai import ContentFilterFinishReasonError 
 from tenacity import RetryError
 import logging
 
@@ -9,6 +8,10 @@ from httpx import HTTPStatusError
 from application.exceptions.token_limit_exceeded_error import TokenLimitExceededError
 from application.exceptions.url_validation_error import UrlValidationError
 from application.exceptions.no_content_error import NoContentError
+from application.exceptions.job_not_found_error import JobNotFoundError
+from application.exceptions.invalid_cursor_error import InvalidCursorError
+from application.exceptions.service_not_ready_error import ServiceNotReadyError
+from application.utils.error_details import is_content_filter_error
 
 def exception_container(app: FastAPI) -> None:
         
@@ -72,6 +75,55 @@ def exception_container(app: FastAPI) -> None:
             },
         )
         
+    @app.exception_handler(JobNotFoundError)
+    async def job_not_found_exception_handler(request: Request, exc: JobNotFoundError):
+        """
+        Exception handler for JobNotFoundError exceptions.
+        Args:
+            request (Request): The request object.
+            exc (JobNotFoundError): The exception that was raised.
+        Returns:
+            JSONResponse: A JSON response with a 404 Not Found status code and an error message.
+        """
+        logging.warning(f"Summary job not found: {exc.job_id}")
+        return JSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={"detail": str(exc)},
+        )
+        
+    @app.exception_handler(InvalidCursorError)
+    async def invalid_cursor_exception_handler(request: Request, exc: InvalidCursorError):
+        """
+        Exception handler for InvalidCursorError exceptions.
+        Args:
+            request (Request): The request object.
+            exc (InvalidCursorError): The exception that was raised.
+        Returns:
+            JSONResponse: A JSON response with a 400 Bad Request status code and an error message.
+        """
+        logging.warning("Invalid pagination cursor provided")
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content={"detail": str(exc)},
+        )
+        
+    @app.exception_handler(ServiceNotReadyError)
+    async def service_not_ready_exception_handler(request: Request, exc: ServiceNotReadyError):
+        """
+        Exception handler for ServiceNotReadyError exceptions.
+        Args:
+            request (Request): The request object.
+            exc (ServiceNotReadyError): The exception that was raised.
+        Returns:
+            JSONResponse: A JSON response with a 503 Service Unavailable status code, asking the client to retry later.
+        """
+        logging.info(f"Request received before startup finished: {request.url.path}")
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"detail": str(exc)},
+            headers={"Retry-After": str(exc.retry_after)},
+        )
+        
     @app.exception_handler(TokenLimitExceededError)
     async def token_limit_exception_handler(request: Request, exc: TokenLimitExceededError):
         """
@@ -101,7 +153,7 @@ def exception_container(app: FastAPI) -> None:
         """
         inner_exc = exc.last_attempt.exception()
 
-        if isinstance(inner_exc, ContentFilterFinishReasonError):
+        if is_content_filter_error(inner_exc):
             logging.warning(f"Content blocked by filter: {inner_exc}")
             return JSONResponse(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -1,25 +1,105 @@
+import asyncio
+import logging
 import logging.config
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
+from abstractions.resources import AppResources
+from abstractions.dependencies import build_summarize_articles_use_case
+from application.services.summary_job_runner import SummaryJobRunner
+from config.settings import settings
 from entrypoints.rest.exception_handlers import exception_container
-from entrypoints.rest.routers import articles
+from entrypoints.rest.request_metrics import request_metrics_middleware
+from entrypoints.rest.routers import articles, health, metrics
 from config.logging import LOGGING_CONFIG
-from langchain_core.globals import set_llm_cache
-from langchain_core.caches import InMemoryCache
 
 logging.config.dictConfig(LOGGING_CONFIG)
 
-set_llm_cache(InMemoryCache())
+async def start_async(app: FastAPI) -> None:
+    """
+    Builds and warms up the shared resources off the event loop, then starts the background
+    summary job workers. The resources are published last, so the app is ready once they are set.
+    """
+    resources = await asyncio.to_thread(AppResources.build)
+    try:
+        await resources.warm_up_async()
+        use_case = await asyncio.to_thread(build_summarize_articles_use_case, resources)
+    except BaseException:
+        await resources.close_async()
+        raise
+
+    summary_job_runner = SummaryJobRunner(
+        store=resources.summary_job_store,
+        use_case=use_case,
+        workers=settings.SUMMARY_JOB_WORKERS,
+        batch_size=settings.SUMMARY_JOB_BATCH_SIZE,
+        poll_seconds=settings.SUMMARY_JOB_POLL_SECONDS,
+        lease_renewal_seconds=settings.SUMMARY_JOB_LEASE_SECONDS / 3,
+    )
+    summary_job_runner.start()
+
+    # Background jobs save with the articles repository of their use case, which must follow the embedding migration
+    resources.on_swap.append(lambda: setattr(summary_job_runner, "use_case", build_summarize_articles_use_case(resources)))
+    if resources.reembedding_job is not None:
+        resources.reembedding_job.start()
+
+    app.state.summary_job_runner = summary_job_runner
+    app.state.resources = resources
+
+    logging.info("Application ready")
+
+async def start_in_background_async(app: FastAPI) -> None:
+    """Runs the startup after the server is accepting connections, recording a failure for the readiness probe."""
+    try:
+        await start_async(app)
+    except Exception as exc:
+        logging.error("Application startup failed: %s", exc, exc_info=True)
+        app.state.startup_error = exc
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Builds the shared resources once per process, warms them up, starts the background
+    summary job workers and releases everything on shutdown.
+    By default this happens before the first request is accepted. With FAST_START the server
+    accepts connections right away and the resources load in the background: until they are
+    ready, GET /health/ready and the endpoints that need them answer 503.
+    """
+    app.state.resources = None
+    app.state.summary_job_runner = None
+    app.state.startup_error = None
+
+    startup = None
+    if settings.FAST_START:
+        startup = asyncio.create_task(start_in_background_async(app))
+    else:
+        await start_async(app)
+
+    yield
+
+    if startup is not None and not startup.done():
+        startup.cancel()
+        await asyncio.gather(startup, return_exceptions=True)
+
+    if app.state.summary_job_runner is not None:
+        await app.state.summary_job_runner.stop_async()
+
+    if app.state.resources is not None:
+        await app.state.resources.close_async()
 
 app = FastAPI(
     title="News Scraper",
     description="This API allows you summarize articles and query to find related ones.",
-    version="1.0.0")
+    version="1.0.0",
+    lifespan=lifespan)
 
 app.include_router(articles.router)
+app.include_router(health.router)
+app.include_router(metrics.router)
 
 exception_container(app)
+request_metrics_middleware(app)
 
 # Dev only
 #if __name__ == "__main__":
@@ -0,0 +1,94 @@
+import logging
+import time
+from typing import AsyncIterator
+
+from fastapi import FastAPI, Request
+from starlette.routing import Match
+
+from application.utils.metrics import HTTP_REQUEST_SECONDS
+from application.utils.request_context import (
+    format_stage_timings, new_request_id, request_context, snapshot_stage_timings
+)
+
+REQUEST_ID_HEADER = "X-Request-ID"
+
+def request_metrics_middleware(app: FastAPI) -> None:
+
+    @app.middleware("http")
+    async def request_metrics(request: Request, call_next):
+        """
+        Runs the request under a request id, taken from the X-Request-ID header or generated,
+        so every log line and stage timing of the request is tied to it.
+        Observes the request duration per route and returns the request id and the stage
+        breakdown (Server-Timing) in the response headers. The headers are sent before the body,
+        so for streamed responses (e.g. NDJSON) Server-Timing misses the stages that run while the
+        body is streamed; the full breakdown is logged once the body has been sent.
+        Args:
+            request (Request): The request object.
+            call_next: The next handler of the middleware chain.
+        Returns:
+            Response: The response, with the X-Request-ID and Server-Timing headers.
+        """
+        request_id = new_request_id(request.headers.get(REQUEST_ID_HEADER))
+
+        with request_context(request_id) as timings:
+            start = time.perf_counter()
+            status_code = 500
+            try:
+                response = await call_next(request)
+                status_code = response.status_code
+            finally:
+                elapsed = time.perf_counter() - start
+                HTTP_REQUEST_SECONDS.observe(elapsed, method=request.method, route=route_path(request), status=str(status_code))
+
+        response.headers[REQUEST_ID_HEADER] = request_id
+        response.headers["Server-Timing"] = ", ".join(
+            [f"{stage};dur={seconds * 1000:.1f}" for stage, seconds in snapshot_stage_timings(timings).items()]
+            + [f"total;dur={elapsed * 1000:.1f}"]
+        )
+        response.body_iterator = log_stage_timings_after_body(response.body_iterator, request, request_id, start, timings)
+        return response
+
+async def log_stage_timings_after_body(
+    body_iterator: AsyncIterator[bytes], request: Request, request_id: str, start: float, timings: dict[str, float]
+) -> AsyncIterator[bytes]:
+    """
+    Passes the response body through and then logs the stage breakdown of the request,
+    so the stages that run while a streamed body is produced are included.
+    Args:
+        body_iterator (AsyncIterator[bytes]): The response body.
+        request (Request): The request object.
+        request_id (str): The request id, to tie the log line to the request.
+        start (float): The perf_counter value when the request started.
+        timings (dict[str, float]): The stage breakdown of the request.
+    Yields:
+        bytes: The chunks of the response body.
+    """
+    try:
+        async for chunk in body_iterator:
+            yield chunk
+    finally:
+        if timings:
+            with request_context(request_id):
+                logging.info(
+                    "%s %s took %.1fms: %s",
+                    request.method, request.url.path, (time.perf_counter() - start) * 1000, format_stage_timings(timings)
+                )
+
+def route_path(request: Request) -> str:
+    """
+    Returns the path template of the route that handled the request, e.g. '/articles/summary/jobs/{job_id}',
+    so the metric labels stay bounded whatever the URLs requested.
+    Args:
+        request (Request): The request object.
+    Returns:
+        str: The route path, or 'unmatched' if no route matched.
+    """
+    route = request.scope.get("route")
+    if route is not None:
+        return route.path
+
+    for route in request.app.router.routes:
+        if route.matches(request.scope)[0] == Match.FULL:
+            return route.path
+    return "unmatched"
@@ -1,12 +1,20 @@
-from typing import Annotated
+from typing import Annotated, Optional
 
 from fastapi import APIRouter, Depends, status, Query
+from fastapi.responses import StreamingResponse
 
 from application.use_cases.summarize_articles_use_case import SummarizeArticlesUseCase
 from application.use_cases.query_articles_use_case import QueryArticleUseCase
-from abstractions.dependencies import get_summarize_articles_user_case, get_query_articles_user_case
-from application.models.related_article_dto import RelatedArticleDTO
-from application.models.article_summary_dto import ArticleSummaryDTO
+from application.use_cases.submit_summary_job_use_case import SubmitSummaryJobUseCase
+from application.use_cases.get_summary_job_use_case import GetSummaryJobUseCase
+from abstractions.dependencies import (
+    get_summarize_articles_user_case, get_query_articles_user_case, get_submit_summary_job_use_case, get_summary_job_use_case
+)
+from application.models.related_article_dto import RelatedArticleField
+from application.models.related_articles_page_dto import RelatedArticlesPageDTO
+from application.models.article_summary_result_dto import ArticleSummaryResultDTO
+from application.models.summary_job_dto import SummaryJobDTO
+from domain.article_filters import ArticleFilters, PoliticalBias
 
 router = APIRouter(prefix="/articles")
 
@@ -14,10 +22,13 @@ router = APIRouter(prefix="/articles")
     "/summary",
     status_code=status.HTTP_200_OK,
     summary="Summarize a list of article URLs",
-    description="Accepts a list of URLs and returns summarized content for each article.",
-    response_model=list[ArticleSummaryDTO],
+    description=(
+        "Accepts a list of URLs and returns a result per URL, in request order: the summarized article, "
+        "or the error (e.g. HTTP or content extraction failure) that prevented it. "
+        "A failing URL does not fail the others."
+    ),
+    response_model=list[ArticleSummaryResultDTO],
     responses={
-        422: {"description": "Validation or content extraction failed"},
         400: {"description": "Invalid URLs"},
         500: {"description": "Unexpected server error"}
     },
@@ -26,19 +37,97 @@ router = APIRouter(prefix="/articles")
 async def summarize_articles(
     urls: list[str],
     use_case: Annotated[SummarizeArticlesUseCase, Depends(get_summarize_articles_user_case)],
-) -> list[ArticleSummaryDTO]:
+) -> list[ArticleSummaryResultDTO]:
+    return await use_case(urls)
+
+@router.post(
+    "/summary/stream",
+    status_code=status.HTTP_200_OK,
+    summary="Summarize a list of article URLs, streaming each result",
+    description=(
+        "Accepts a list of URLs and streams one JSON line (NDJSON) per URL as soon as its article "
+        "is summarized and saved, in completion order. Failed URLs are reported as error lines."
+    ),
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"application/x-ndjson": {}}, "description": "One ArticleSummaryResultDTO per line"},
+        400: {"description": "Invalid URLs"},
+    },
+    tags=["Articles"]
+)
+async def summarize_articles_stream(
+    urls: list[str],
+    use_case: Annotated[SummarizeArticlesUseCase, Depends(get_summarize_articles_user_case)],
+) -> StreamingResponse:
+    results = use_case.stream(urls)
+
+    return StreamingResponse(
+        (result.model_dump_json() + "\n" async for result in results),
+        media_type="application/x-ndjson",
+    )
+
+@router.post(
+    "/summary/jobs",
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Queue a list of article URLs to be summarized in the background",
+    description=(
+        "Accepts a list of URLs and returns a job immediately. The articles are summarized by background "
+        "workers; poll GET /articles/summary/jobs/{job_id} for progress and results."
+    ),
+    response_model=SummaryJobDTO,
+    responses={
+        400: {"description": "Invalid URLs"},
+    },
+    tags=["Articles"]
+)
+async def submit_summary_job(
+    urls: list[str],
+    use_case: Annotated[SubmitSummaryJobUseCase, Depends(get_submit_summary_job_use_case)],
+) -> SummaryJobDTO:
     return await use_case(urls)
 
+@router.get(
+    "/summary/jobs/{job_id}",
+    status_code=status.HTTP_200_OK,
+    summary="Get the progress and results of a summary job",
+    description="Returns the status of the job, its progress counters and the results of the URLs finished so far.",
+    response_model=SummaryJobDTO,
+    responses={
+        404: {"description": "Job not found"},
+    },
+    tags=["Articles"]
+)
+async def get_summary_job(
+    job_id: str,
+    use_case: Annotated[GetSummaryJobUseCase, Depends(get_summary_job_use_case)],
+) -> SummaryJobDTO:
+    return await use_case(job_id)
+
 @router.get(
     "/query",
     status_code=status.HTTP_200_OK,
     summary="Find articles related to a query",
-    description="Searches and returns articles related to the provided query string.",
-    response_model=list[RelatedArticleDTO],
+    description=(
+        "Searches and returns a page of articles related to the provided query string, best first. "
+        "Pass the returned next_cursor to get the next page; it is null when there are no more results. "
+        "Filters are applied by the vector store, and only the requested fields are returned "
+        "(all but content by default)."
+    ),
+    response_model=RelatedArticlesPageDTO,
+    response_model_exclude_unset=True,
+    responses={
+        400: {"description": "Invalid cursor"},
+    },
     tags=["Articles"]
 )
 async def query_related(
     use_case: Annotated[QueryArticleUseCase, Depends(get_query_articles_user_case)],
     query: str = Query(..., description="Search query string", min_length=3),
-) -> list[RelatedArticleDTO]:
-    return await use_case(query)
\ No newline at end of file
+    k: int = Query(4, description="Number of articles per page", ge=1, le=50),
+    cursor: Optional[str] = Query(None, description="Cursor of the page to return, from a previous response"),
+    fields: Optional[list[RelatedArticleField]] = Query(None, description="Fields to return per article"),
+    political_bias: Optional[list[PoliticalBias]] = Query(None, description="Only articles with one of these political biases"),
+    topics: Optional[list[str]] = Query(None, description="Only articles about at least one of these topics"),
+) -> RelatedArticlesPageDTO:
+    filters = ArticleFilters(political_bias=political_bias, topics=topics)
+    return await use_case(query, k=k, cursor=cursor, filters=filters, fields=fields)
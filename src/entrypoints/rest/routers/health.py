@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Request, status
+from fastapi.responses import JSONResponse
+
+router = APIRouter(prefix="/health")
+
+@router.get(
+    "/ready",
+    status_code=status.HTTP_200_OK,
+    summary="Report whether the service is ready to serve requests",
+    description=(
+        "Returns 200 once the embedding model, vector store and LLM clients are loaded and warmed up. "
+        "Returns 503 with status 'starting' while they are still loading (FAST_START), "
+        "or 'failed' if loading them failed."
+    ),
+    responses={
+        200: {"description": "Ready", "content": {"application/json": {"example": {"status": "ready"}}}},
+        503: {"description": "Starting or failed", "content": {"application/json": {"example": {"status": "starting"}}}},
+    },
+    tags=["Health"]
+)
+async def ready(request: Request) -> JSONResponse:
+    if request.app.state.resources is not None:
+        return JSONResponse(status_code=status.HTTP_200_OK, content={"status": "ready"})
+
+    if request.app.state.startup_error is not None:
+        return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content={"status": "failed"})
+
+    return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content={"status": "starting"})
@@ -0,0 +1,23 @@
+from fastapi import APIRouter, status
+from fastapi.responses import PlainTextResponse
+
+from application.utils.metrics import REGISTRY
+
+router = APIRouter()
+
+@router.get(
+    "/metrics",
+    status_code=status.HTTP_200_OK,
+    summary="Expose the service metrics in the Prometheus text format",
+    description=(
+        "Histograms of request, scrape fetch and parse, summarization node, LLM, embedding and vector store "
+        "latencies, the chunk count per article, and counters of LLM tokens, LLM retries and scrape cache lookups."
+    ),
+    response_class=PlainTextResponse,
+    responses={
+        200: {"content": {"text/plain": {}}, "description": "The metrics, one sample per line"},
+    },
+    tags=["Metrics"]
+)
+async def metrics() -> PlainTextResponse:
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -0,0 +1,114 @@
+import gzip
+import json
+import logging
+import os
+from typing import IO, Any, Iterator, Optional
+
+ARTICLE_FIELDS = ("headline", "content", "summary", "topics", "political_bias")
+
+class ArticleDumpReader():
+    """
+    Streams the records of a pre-scraped article dump in batches, so a dump of any size is read
+    with memory bounded to a batch. Dumps are JSON Lines files (one JSON object per line,
+    optionally gzip-compressed) or Parquet files, read row group by row group with pyarrow.
+    Records have a content and usually a headline; a summary, topics and political bias are
+    kept when articles are ingested without summarization.
+    """
+    def __init__(self, path: str, format: Optional[str] = None) -> None:
+        self.path = path
+        self.format = format or ("parquet" if path.endswith(".parquet") else "jsonl")
+
+        if self.format not in ("jsonl", "parquet"):
+            raise ValueError(f"Unsupported article dump format: {self.format}")
+
+    def count(self) -> int:
+        """
+        Counts the records of the dump, for progress reporting: from the Parquet metadata,
+        or by scanning the JSON Lines file for non-blank lines.
+        Returns:
+            int: The number of records.
+        """
+        if self.format == "parquet":
+            return self._parquet_file().metadata.num_rows
+
+        with self._open_jsonl() as file:
+            return sum(1 for line in file if line.strip())
+
+    def iter_batches(self, batch_size: int, skip: int = 0) -> Iterator[list[dict[str, Any]]]:
+        """
+        Reads the records in batches.
+        Args:
+            batch_size (int): The maximum number of records per batch.
+            skip (int): The number of leading records to skip, e.g. the ones already ingested.
+        Yields:
+            list[dict[str, Any]]: The records of each batch. A malformed JSON line is yielded as an
+                empty record, so record positions stay aligned with the file.
+        """
+        records = self._iter_parquet(skip) if self.format == "parquet" else self._iter_jsonl(skip)
+
+        batch = []
+        for record in records:
+            batch.append(record)
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def describe(self) -> dict[str, Any]:
+        """
+        Returns:
+            dict[str, Any]: The path and size of the dump, recorded in checkpoints to detect a changed dump.
+        """
+        return {"path": os.path.abspath(self.path), "size": os.path.getsize(self.path)}
+
+    def _open_jsonl(self) -> IO[str]:
+        if self.path.endswith(".gz"):
+            return gzip.open(self.path, "rt", encoding="utf-8")
+        return open(self.path, encoding="utf-8")
+
+    def _iter_jsonl(self, skip: int) -> Iterator[dict[str, Any]]:
+        position = 0
+        with self._open_jsonl() as file:
+            for number, line in enumerate(file, start=1):
+                if not line.strip():
+                    continue
+
+                position += 1
+                if position <= skip:
+                    continue
+
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as exc:
+                    logging.warning("Skipping malformed line %d of %s: %s", number, self.path, exc)
+                    record = {}
+
+                yield record if isinstance(record, dict) else {}
+
+    def _parquet_file(self):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise RuntimeError("Reading Parquet article dumps requires pyarrow (pip install pyarrow)") from exc
+
+        return pq.ParquetFile(self.path)
+
+    def _iter_parquet(self, skip: int) -> Iterator[dict[str, Any]]:
+        parquet_file = self._parquet_file()
+        columns = [name for name in ARTICLE_FIELDS if name in parquet_file.schema_arrow.names]
+
+        # Whole row groups before the resume position are skipped without being read
+        row_groups = []
+        for index in range(parquet_file.num_row_groups):
+            rows = parquet_file.metadata.row_group(index).num_rows
+            if skip >= rows:
+                skip -= rows
+            else:
+                row_groups.append(index)
+
+        for record_batch in parquet_file.iter_batches(batch_size=1024, row_groups=row_groups, columns=columns):
+            records = record_batch.to_pylist()
+            if skip:
+                records, skip = records[skip:], max(0, skip - len(records))
+            yield from records
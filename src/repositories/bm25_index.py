@@ -0,0 +1,230 @@
+import json
+import logging
+import math
+import re
+import sqlite3
+import threading
+from array import array
+from collections import Counter
+from typing import Iterable, Optional
+import numpy as np
+
+from repositories.sqlite_connection import connect_sqlite
+
+TERM_PATTERN = re.compile(r"\w+")
+STOP_WORDS = frozenset(
+    "a an and are as at be but by for from has have in is it its of on or that the this to was were will with".split()
+)
+MAX_TERM_FREQUENCY = np.iinfo(np.uint16).max
+
+def tokenize_terms(text: str) -> list[str]:
+    """
+    Splits a text into lowercase word terms, dropping common English stop words.
+    Args:
+        text (str): The text to tokenize.
+    Returns:
+        list[str]: The terms, in order.
+    """
+    return [term for term in TERM_PATTERN.findall(text.lower()) if term not in STOP_WORDS]
+
+class Bm25Index():
+    """
+    Okapi BM25 inverted index over document texts, updated incrementally.
+    Each term maps to two growable arrays (document numbers and term frequencies) instead of Python
+    objects per posting, and queries score the postings with numpy. Re-adding a document tombstones
+    its previous version; tombstoned postings are dropped when they reach a quarter of the index.
+    With a path, the term frequencies of every document are appended to a SQLite log shared by all
+    worker processes: an addition writes only its own documents, and each process replays the log
+    entries it has not seen yet before searching, so no process overwrites another's documents.
+    """
+    def __init__(self, path: Optional[str] = None, k1: float = 1.2, b: float = 0.75) -> None:
+        self.path = path
+        self.k1 = k1
+        self.b = b
+
+        self._ids: list[str] = []
+        self._numbers: dict[str, int] = {}
+        self._lengths = array("I")
+        self._deleted = bytearray()
+        self._postings: dict[str, tuple[array, array]] = {}
+        self._total_length = 0
+        self._lock = threading.Lock()
+
+        self._writer: Optional[sqlite3.Connection] = None
+        self._reader: Optional[sqlite3.Connection] = None
+        self._write_lock = threading.Lock()
+        self._sequence = 0
+
+        if path is not None:
+            self._writer = connect_sqlite(path)
+            # AUTOINCREMENT so the sequence of a replaced document is never reused and replays miss nothing
+            self._writer.execute(
+                """
+                CREATE TABLE IF NOT EXISTS bm25_documents (
+                    sequence INTEGER PRIMARY KEY AUTOINCREMENT,
+                    id TEXT NOT NULL UNIQUE,
+                    terms TEXT NOT NULL
+                )
+                """
+            )
+            self._reader = connect_sqlite(path)
+            with self._lock:
+                self._replay()
+            logging.info("Loaded BM25 index with %d documents and %d terms from %s", len(self), len(self._postings), path)
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._replay()
+            return len(self._numbers)
+
+    def add(self, documents: Iterable[tuple[str, str]]) -> None:
+        """
+        Indexes documents, replacing the previous version of documents already indexed.
+        Args:
+            documents (Iterable[tuple[str, str]]): The id and text of each document.
+        """
+        documents = [(document_id, Counter(tokenize_terms(text))) for document_id, text in documents]
+
+        if self._writer is None:
+            with self._lock:
+                for document_id, terms in documents:
+                    self._index(document_id, terms)
+                self._compact_if_needed()
+            return
+
+        rows = [(document_id, json.dumps(terms, separators=(",", ":"))) for document_id, terms in documents]
+        with self._write_lock:
+            self._writer.execute("BEGIN IMMEDIATE")
+            try:
+                self._writer.executemany("DELETE FROM bm25_documents WHERE id = ?", [(document_id,) for document_id, _ in rows])
+                self._writer.executemany("INSERT INTO bm25_documents (id, terms) VALUES (?, ?)", rows)
+                self._writer.execute("COMMIT")
+            except BaseException:
+                self._writer.execute("ROLLBACK")
+                raise
+
+        with self._lock:
+            self._replay()
+
+    def _replay(self) -> None:
+        """
+        Indexes the log entries written since the last replay, by this or another process.
+        Must be called under the lock.
+        """
+        if self._reader is None:
+            return
+
+        rows = self._reader.execute(
+            "SELECT sequence, id, terms FROM bm25_documents WHERE sequence > ? ORDER BY sequence", (self._sequence,)
+        )
+        for sequence, document_id, terms in rows:
+            self._index(document_id, json.loads(terms))
+            self._sequence = sequence
+        self._compact_if_needed()
+
+    def _index(self, document_id: str, terms: dict[str, int]) -> None:
+        """Indexes a document from its term frequencies. Must be called under the lock."""
+        self._remove(document_id)
+
+        number = len(self._ids)
+        for term, frequency in terms.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = (array("I"), array("H"))
+            postings[0].append(number)
+            postings[1].append(frequency if frequency < MAX_TERM_FREQUENCY else MAX_TERM_FREQUENCY)
+
+        length = sum(terms.values())
+        self._ids.append(document_id)
+        self._numbers[document_id] = number
+        self._lengths.append(length)
+        self._deleted.append(0)
+        self._total_length += length
+
+    def _remove(self, document_id: str) -> None:
+        number = self._numbers.pop(document_id, None)
+        if number is not None:
+            self._deleted[number] = 1
+            self._total_length -= self._lengths[number]
+
+    def _compact_if_needed(self) -> None:
+        if len(self._ids) - len(self._numbers) > len(self._ids) // 4:
+            self._compact()
+
+    def search(self, query: str, k: int) -> list[tuple[str, float]]:
+        """
+        Ranks the indexed documents against a query with BM25.
+        Args:
+            query (str): The query text.
+            k (int): The maximum number of documents to return.
+        Returns:
+            list[tuple[str, float]]: The ids and scores of the best matching documents, best first.
+        """
+        terms = set(tokenize_terms(query))
+
+        with self._lock:
+            self._replay()
+            count = len(self._numbers)
+            if not count or not terms:
+                return []
+
+            deleted = np.frombuffer(self._deleted, dtype=np.uint8).astype(bool)
+            lengths = np.frombuffer(self._lengths, dtype=np.uint32)
+            average_length = max(self._total_length / count, 1.0)
+            scores = np.zeros(len(self._ids), dtype=np.float32)
+
+            for term in terms:
+                postings = self._postings.get(term)
+                if postings is None:
+                    continue
+
+                numbers = np.frombuffer(postings[0], dtype=np.uint32)
+                frequencies = np.frombuffer(postings[1], dtype=np.uint16).astype(np.float32)
+                live = ~deleted[numbers]
+                numbers, frequencies = numbers[live], frequencies[live]
+                if not len(numbers):
+                    continue
+
+                idf = math.log(1 + (count - len(numbers) + 0.5) / (len(numbers) + 0.5))
+                norms = self.k1 * (1 - self.b + self.b * lengths[numbers] / average_length)
+                scores[numbers] += idf * frequencies * (self.k1 + 1) / (frequencies + norms)
+
+            matches = np.flatnonzero(scores)
+            if len(matches) > k:
+                matches = matches[np.argpartition(-scores[matches], k - 1)[:k]]
+            matches = matches[np.argsort(-scores[matches], kind="stable")]
+
+            return [(self._ids[number], float(scores[number])) for number in matches]
+
+    def close(self) -> None:
+        """Closes the log connections, if any."""
+        with self._write_lock, self._lock:
+            for connection in (self._writer, self._reader):
+                if connection is not None:
+                    connection.close()
+            self._writer = self._reader = None
+
+    def _compact(self) -> None:
+        """
+        Drops the postings of tombstoned documents and renumbers the live ones.
+        Must be called under the lock.
+        """
+        live = np.flatnonzero(np.frombuffer(self._deleted, dtype=np.uint8) == 0)
+        renumbered = np.full(len(self._ids), -1, dtype=np.int64)
+        renumbered[live] = np.arange(len(live))
+
+        postings = {}
+        for term, (numbers, frequencies) in self._postings.items():
+            numbers = np.frombuffer(numbers, dtype=np.uint32)
+            kept = renumbered[numbers] >= 0
+            if kept.any():
+                postings[term] = (
+                    array("I", renumbered[numbers[kept]].astype(np.uint32).tobytes()),
+                    array("H", np.frombuffer(frequencies, dtype=np.uint16)[kept].tobytes()),
+                )
+
+        self._postings = postings
+        self._ids = [self._ids[number] for number in live]
+        self._numbers = {document_id: number for number, document_id in enumerate(self._ids)}
+        self._lengths = array("I", np.frombuffer(self._lengths, dtype=np.uint32)[live].tobytes())
+        self._deleted = bytearray(len(self._ids))
@@ -1,27 +1,208 @@
+import asyncio
+import logging
+import time
+from typing import Callable, Iterable, Iterator, Optional, Union
+import numpy as np
 from langchain_core.documents import Document
 from langchain_chroma import Chroma
 from abstractions.articles_repo import ArticlesRepo
+from abstractions.content_store import ContentStore
+from application.services.batch_embedder import BatchEmbedder
 from domain.article_query import ArticleQuery
+from domain.article_enriched import ArticleEnriched
+from domain.article_filters import ArticleFilters, normalize_topic
+from application.utils.content_fingerprint import fingerprint_content
+from application.utils.metrics import VECTOR_STORE_SECONDS, timed
+from application.utils.rank_fusion import reciprocal_rank_fusion
+from application.utils.semantic_text import build_semantic_text
+from repositories.bm25_index import Bm25Index
+
+TOPIC_KEY_PREFIX = "topic:"
+TOPIC_FLAGS_KEY = "topic_flags"
+CONTENT_STORED_KEY = "content_stored"
+SAVED_AT_KEY = "saved_at"
+
+def topic_flags(topics: Iterable[str]) -> dict[str, bool]:
+    """
+    Builds the metadata flags that make topics filterable, one boolean key per normalized topic,
+    since Chroma metadata values cannot be lists and its local engine has no substring operator.
+    Args:
+        topics (Iterable[str]): The topics of the article.
+    Returns:
+        dict[str, bool]: The flags, plus the marker telling the document has them.
+    """
+    flags = {f"{TOPIC_KEY_PREFIX}{normalize_topic(topic)}": True for topic in topics if topic.strip()}
+    flags[TOPIC_FLAGS_KEY] = True
+    return flags
+
+def build_where(filters: Optional[ArticleFilters]) -> Optional[dict]:
+    """
+    Translates article filters to a Chroma metadata where clause.
+    Args:
+        filters (Optional[ArticleFilters]): The filters.
+    Returns:
+        Optional[dict]: The where clause, or None if nothing is filtered.
+    """
+    if filters is None:
+        return None
+
+    clauses = []
+    if filters.political_bias:
+        clauses.append({"political_bias": {"$in": list(filters.political_bias)}})
+    if filters.topics:
+        topics = [{f"{TOPIC_KEY_PREFIX}{topic}": True} for topic in filters.topics]
+        clauses.append(topics[0] if len(topics) == 1 else {"$or": topics})
+
+    if not clauses:
+        return None
+    return clauses[0] if len(clauses) == 1 else {"$and": clauses}
 
 class ChromaArticlesRepo(ArticlesRepo):
     """
     Repository for storing and querying articles using Chroma vector store.
     This class implements the ArticlesRepo interface and provides methods
     to save articles and perform similarity searches.
+    With a batch embedder, saves are embedded off the event loop and streamed into
+    Chroma in fixed-size batches, writing one batch while the next one is being embedded.
+    With a BM25 lexical index, saved articles are also indexed lexically and queries fuse the
+    BM25 and vector rankings with reciprocal rank fusion, so exact names, tickers and places
+    rank well; scores are then fused scores (higher is better) instead of distances.
+    Filters are translated to where clauses evaluated by Chroma; topics are stored as one boolean
+    metadata flag per topic so they can be matched exactly.
+    With a content store, the full article content is kept there instead of in the Chroma metadata,
+    so searches only load and return the small fields; content is read on demand by id.
     """
 
-    def __init__(self, vector_store: Chroma) -> None:
+    def __init__(
+        self,
+        vector_store: Chroma,
+        embedder: Optional[BatchEmbedder] = None,
+        lexical_index: Optional[Bm25Index] = None,
+        k: int = 4,
+        candidates: int = 20,
+        rrf_k: int = 60,
+        content_store: Optional[ContentStore] = None,
+    ) -> None:
         self.vector_store = vector_store
+        self.embedder = embedder
+        self.lexical_index = lexical_index
+        self.content_store = content_store
+        self.k = k
+        self.candidates = candidates
+        self.rrf_k = rrf_k
 
     async def save_async(self, articles: list[ArticleQuery]) -> None:
         """
-        Saves a list of ArticleData objects to the vector store.
+        Upserts a list of ArticleData objects into the vector store.
+        Documents are keyed by the content fingerprint, so saving the same article twice
+        replaces it instead of adding a duplicate vector.
         Args:
             articles (List[ArticleData]): List of ArticleData objects to save.
         """        
         documents = self._articles_to_documents(articles)
+        if not documents:
+            return
 
-        await self.vector_store.aadd_documents(documents)
+        if self.content_store is not None:
+            contents = {fingerprint_content(article.content): article.content for article in articles}
+            await asyncio.to_thread(self.content_store.put_many, contents)
+
+        if self.embedder is None:
+            await self.vector_store.aadd_documents(documents, ids=[document.id for document in documents])
+        else:
+            await self._save_batched_async(documents)
+
+        if self.lexical_index is not None:
+            await asyncio.to_thread(self._index_lexically, documents)
+
+    def _index_lexically(self, documents: list[Document]) -> None:
+        """
+        Adds the documents to the lexical index.
+        Args:
+            documents (list[Document]): The saved documents.
+        """
+        self.lexical_index.add((document.id, document.page_content) for document in documents)
+
+    async def _save_batched_async(self, documents: list[Document]) -> None:
+        """
+        Embeds the documents in batches and upserts each batch into Chroma.
+        At most one write is in flight, so memory stays bounded to two batches.
+        Args:
+            documents (list[Document]): The documents to save.
+        """
+        pending_write: Optional[asyncio.Future] = None
+        try:
+            async for start, vectors in self.embedder.iter_batches_async([document.page_content for document in documents]):
+                if pending_write is not None:
+                    await pending_write
+                
+                batch = documents[start:start + len(vectors)]
+                pending_write = asyncio.ensure_future(asyncio.to_thread(self._upsert_batch, batch, vectors))
+        finally:
+            if pending_write is not None:
+                await pending_write
+
+    def _upsert_batch(self, documents: list[Document], vectors: Union[list[list[float]], np.ndarray]) -> None:
+        """
+        Upserts a batch of documents with precomputed embeddings into the Chroma collection.
+        Args:
+            documents (list[Document]): The documents of the batch.
+            vectors (Union[list[list[float]], np.ndarray]): Their embeddings.
+        """
+        with timed(VECTOR_STORE_SECONDS, stage="vector_store_write", store="chroma", operation="write"):
+            self.vector_store._collection.upsert(
+                ids=[document.id for document in documents],
+                embeddings=vectors,
+                metadatas=[document.metadata for document in documents],
+                documents=[document.page_content for document in documents],
+            )
+
+    async def get_by_fingerprints_async(self, fingerprints: list[str]) -> dict[str, ArticleEnriched]:
+        """
+        Loads already stored articles by their content fingerprints.
+        Args:
+            fingerprints (list[str]): Content fingerprints of the articles to look up.
+        Returns:
+            dict[str, ArticleEnriched]: Stored articles keyed by fingerprint; unknown fingerprints are omitted.
+        """
+        if not fingerprints:
+            return {}
+        
+        documents = await self.vector_store.aget_by_ids(fingerprints)
+        contents = await self._load_contents([document.id for document in documents])
+
+        return {document.id: self._document_to_article(document, contents.get(document.id)) for document in documents}
+
+    async def get_contents_async(self, ids: list[str]) -> dict[str, str]:
+        """
+        Loads the full content of articles by id.
+        Args:
+            ids (list[str]): The article ids (content fingerprints).
+        Returns:
+            dict[str, str]: The contents keyed by id; unknown ids are omitted.
+        """
+        if not ids:
+            return {}
+
+        contents = await self._load_contents(ids)
+        missing = [article_id for article_id in ids if article_id not in contents]
+        if missing:
+            documents = await self.vector_store.aget_by_ids(missing)
+            contents.update({document.id: document.metadata["content"] for document in documents if "content" in document.metadata})
+
+        return contents
+
+    async def _load_contents(self, ids: list[str]) -> dict[str, str]:
+        """
+        Loads contents from the content store, if there is one.
+        Args:
+            ids (list[str]): The article ids.
+        Returns:
+            dict[str, str]: The stored contents keyed by id.
+        """
+        if self.content_store is None or not ids:
+            return {}
+        return await asyncio.to_thread(self.content_store.get_many, ids)
 
     def _articles_to_documents(self, articles: list[ArticleQuery]) -> list[Document]:
         """
@@ -34,27 +215,184 @@ class ChromaArticlesRepo(ArticlesRepo):
         """
         documents = []
         for article in articles:
-            semantic_text = f"Headline: {article.headline}\nSummary: {article.summary}\nTopics: {', '.join(article.topics)}"
-            doc = Document(
-                page_content=semantic_text,
-                metadata={
-                    "headline": article.headline,
-                    "summary": article.summary,
-                    "topics": ','.join(article.topics),
-                    "content": article.content,
-                    "political_bias": article.political_bias,
-                },
-            )
+            metadata = {
+                "headline": article.headline,
+                "summary": article.summary,
+                "topics": ','.join(article.topics or []),
+                "political_bias": article.political_bias,
+                SAVED_AT_KEY: time.time(),
+                **topic_flags(article.topics or []),
+            }
+            if self.content_store is None:
+                metadata["content"] = article.content
+            else:
+                metadata.update({"content": None, CONTENT_STORED_KEY: True})  # None drops content stored before
+
+            doc = Document(id=fingerprint_content(article.content), page_content=build_semantic_text(article), metadata=metadata)
             documents.append(doc)
         return documents
+
+    def _document_to_article(self, document: Document, content: Optional[str] = None) -> ArticleEnriched:
+        """
+        Converts a stored Document back to an ArticleEnriched object.
+        Args:
+            document (Document): The Document loaded from the vector store.
+            content (Optional[str]): The content from the content store; read from the metadata if omitted.
+        Returns:
+            ArticleEnriched: The stored article.
+        """
+        metadata = document.metadata or {}
+        topics = metadata.get("topics")
+
+        return ArticleEnriched(
+            headline=metadata.get("headline"),
+            content=content if content is not None else metadata.get("content", ""),
+            summary=metadata.get("summary", ""),
+            topics=[t.strip() for t in topics.split(",") if t.strip()] if topics else None,
+            political_bias=metadata.get("political_bias"),
+        )
     
-    async def query_async(self, query: str) -> list[tuple[Document, float]] :
+    async def query_async(
+        self, query: str, k: Optional[int] = None, offset: int = 0, filters: Optional[ArticleFilters] = None
+    ) -> list[tuple[Document, float]]:
         """
         Queries the vector store for documents similar to the given query.
+        With a lexical index, the vector and BM25 candidates are fused with reciprocal rank fusion.
+        Filters are passed to Chroma as a where clause, for both the vector search and the BM25 candidates.
         Args:
             query (str): The search query to find similar articles.
+            k (Optional[int]): The number of results to return; the repository default if omitted.
+            offset (int): The number of best results to skip, for pagination.
+            filters (Optional[ArticleFilters]): Metadata filters the documents must match.
         Returns:
-            List[Tuple[Document, float]]: List of tuples containing Document and similarity score.
-        """                
-        return await self.vector_store.asimilarity_search_with_score(query)
+            List[Tuple[Document, float]]: List of tuples containing Document and similarity (or fused) score.
+        """
+        with timed(VECTOR_STORE_SECONDS, stage="vector_store_query", store="chroma", operation="query"):
+            k = self.k if k is None else k
+            where = build_where(filters)
+
+            if self.lexical_index is None:
+                results = await self._similarity_search_async(query, offset + k, where)
+                return results[offset:]
+
+            candidates = max(self.candidates, offset + k)
+            dense, lexical = await asyncio.gather(
+                self._similarity_search_async(query, candidates, where),
+                asyncio.to_thread(self.lexical_index.search, query, candidates),
+            )
+            lexical_ids = [document_id for document_id, _ in lexical]
+            if where is not None and lexical_ids:
+                lexical_ids = await asyncio.to_thread(self._filter_ids, lexical_ids, where)
+
+            fused = reciprocal_rank_fusion([[document.id for document, _ in dense], lexical_ids], self.rrf_k)[offset:offset + k]
+
+            documents = {document.id: document for document, _ in dense}
+            missing = [document_id for document_id, _ in fused if document_id not in documents]
+            if missing:
+                documents.update({document.id: document for document in await self.vector_store.aget_by_ids(missing)})
+
+            return [(documents[document_id], score) for document_id, score in fused if document_id in documents]
+
+    async def _similarity_search_async(self, query: str, k: int, where: Optional[dict]) -> list[tuple[Document, float]]:
+        """
+        Searches the vector store, embedding the query with the batch embedder if there is one, so
+        it is normalized like the stored documents.
+        """
+        if self.embedder is None:
+            return await self.vector_store.asimilarity_search_with_score(query, k=k, filter=where)
+
+        vector = await self.embedder.embed_query_async(query)
+        return await asyncio.to_thread(
+            self.vector_store.similarity_search_by_vector_with_relevance_scores, [float(x) for x in vector], k=k, filter=where
+        )
+
+    def _filter_ids(self, ids: list[str], where: dict) -> list[str]:
+        """
+        Keeps the ids of the documents matching a where clause, evaluated by Chroma.
+        Args:
+            ids (list[str]): The candidate ids, best first.
+            where (dict): The where clause.
+        Returns:
+            list[str]: The matching ids, in their original order.
+        """
+        matching = set(self.vector_store._collection.get(ids=ids, where=where, include=[])["ids"])
+        return [document_id for document_id in ids if document_id in matching]
+
+    def backfill_topic_flags(self, batch_size: int = 1000) -> int:
+        """
+        Adds the topic flags to documents stored before topics were filterable.
+        Args:
+            batch_size (int): The number of documents updated at a time.
+        Returns:
+            int: The number of documents updated.
+        """
+        updated = self._backfill(
+            TOPIC_FLAGS_KEY,
+            lambda ids, metadatas: [topic_flags((metadata.get("topics") or "").split(",")) for metadata in metadatas],
+            batch_size,
+        )
+        if updated:
+            logging.info("Added topic flags to %d stored articles", updated)
+        return updated
+
+    def move_contents_to_store(self, batch_size: int = 1000) -> int:
+        """
+        Moves the content of documents stored before the content store was used out of their metadata.
+        Args:
+            batch_size (int): The number of documents moved at a time.
+        Returns:
+            int: The number of documents moved.
+        """
+        if self.content_store is None:
+            return 0
+
+        def move(ids: list[str], metadatas: list[dict]) -> list[dict]:
+            self.content_store.put_many({
+                article_id: metadata["content"] for article_id, metadata in zip(ids, metadatas) if "content" in metadata
+            })
+            return [{"content": None, CONTENT_STORED_KEY: True} for _ in ids]
+
+        moved = self._backfill(CONTENT_STORED_KEY, move, batch_size)
+        if moved:
+            logging.info("Moved the content of %d stored articles to the content store", moved)
+        return moved
+
+    def _backfill(self, marker: str, updates: Callable[[list[str], list[dict]], list[dict]], batch_size: int) -> int:
+        """
+        Updates the metadata of the documents not having a marker key yet, page by page.
+        Updates are merged into the stored metadata, and None values remove keys.
+        Args:
+            marker (str): The key the updates set to True.
+            updates (Callable[[list[str], list[dict]], list[dict]]): Builds the metadata updates of a page of ids and metadatas.
+            batch_size (int): The number of documents updated at a time.
+        Returns:
+            int: The number of documents updated.
+        """
+        collection = self.vector_store._collection
+        updated = 0
+        while True:
+            page = collection.get(where={marker: {"$ne": True}}, include=["metadatas"], limit=batch_size)
+            if not page["ids"]:
+                return updated
+
+            metadatas = [{**update, marker: True} for update in updates(page["ids"], page["metadatas"])]
+            collection.update(ids=page["ids"], metadatas=metadatas)
+            updated += len(page["ids"])
+
+    def iter_page_contents(self, batch_size: int = 1000) -> Iterator[list[tuple[str, str]]]:
+        """
+        Reads the stored documents page by page, to (re)build the lexical index.
+        Args:
+            batch_size (int): The number of documents per page.
+        Returns:
+            Iterator[list[tuple[str, str]]]: Pages of document ids and texts.
+        """
+        offset = 0
+        while True:
+            page = self.vector_store._collection.get(include=["documents"], limit=batch_size, offset=offset)
+            if not page["ids"]:
+                return
+
+            yield list(zip(page["ids"], page["documents"]))
+            offset += len(page["ids"])
     
@@ -0,0 +1,170 @@
+import logging
+from typing import Any, Iterator, Optional
+
+from chromadb.api import ClientAPI
+from chromadb.api.models.Collection import Collection
+from chromadb.errors import NotFoundError
+from abstractions.collection_migrator import CollectionMigrator
+from domain.embedding_signature import EmbeddingSignature
+from repositories.chroma_articles_repo import SAVED_AT_KEY
+
+SHADOW_SUFFIX = "__shadow"
+RETIRED_SUFFIX = "__retired"
+
+def saved_at(metadata: Optional[dict[str, Any]]) -> float:
+    """Returns when a document was saved, from its metadata; 0 for documents saved before it was recorded."""
+    return (metadata or {}).get(SAVED_AT_KEY, 0.0)
+
+class ChromaCollectionMigrator(CollectionMigrator):
+    """
+    Chroma side of moving the articles collection to another embedding model.
+    Collections are stamped with the signature of their embeddings in their metadata. A migration
+    copies the stored documents (the semantic text), metadata and ids into a shadow collection with
+    new vectors, then swaps it in by renaming: the live collection becomes the retired one and the
+    shadow takes the live name. Handles opened before the swap keep working on the retired
+    collection, which is dropped once it is no longer used. A swap interrupted between the two
+    renames is completed by recover().
+    """
+    def __init__(self, client: ClientAPI, name: str) -> None:
+        self.client = client
+        self.name = name
+        self.shadow_name = f"{name}{SHADOW_SUFFIX}"
+        self.retired_name = f"{name}{RETIRED_SUFFIX}"
+
+    def _get(self, name: str) -> Optional[Collection]:
+        try:
+            return self.client.get_collection(name)
+        except (NotFoundError, ValueError):
+            return None
+
+    def recover(self) -> None:
+        """Completes a swap interrupted after the live collection was retired, before the shadow was renamed."""
+        if self._get(self.name) is None and self._get(self.shadow_name) is not None:
+            self.client.get_collection(self.shadow_name).modify(name=self.name)
+            logging.warning("Completed the interrupted swap of collection %s", self.name)
+
+    def signature(self) -> Optional[EmbeddingSignature]:
+        """
+        Returns:
+            Optional[EmbeddingSignature]: The signature of the live collection, or None if it has none (or does not exist).
+        """
+        collection = self._get(self.name)
+        return EmbeddingSignature.from_metadata(collection.metadata) if collection is not None else None
+
+    def stamp(self, signature: EmbeddingSignature) -> None:
+        """
+        Records the signature in the metadata of the live collection, creating it if needed.
+        Args:
+            signature (EmbeddingSignature): The signature of the stored vectors.
+        """
+        collection = self.client.get_or_create_collection(self.name)
+        collection.modify(metadata={**self._settable_metadata(collection), **signature.to_metadata()})
+
+    @staticmethod
+    def _settable_metadata(collection: Collection) -> dict[str, Any]:
+        # The distance function (hnsw:*) is fixed at creation and cannot be passed to modify
+        return {key: value for key, value in (collection.metadata or {}).items() if not key.startswith("hnsw:")}
+
+    def stored_dimension(self) -> Optional[int]:
+        """
+        Returns:
+            Optional[int]: The dimension of the vectors of the live collection, or None if it is empty.
+        """
+        collection = self._get(self.name)
+        if collection is None:
+            return None
+
+        embeddings = collection.get(limit=1, include=["embeddings"])["embeddings"]
+        return len(embeddings[0]) if embeddings is not None and len(embeddings) else None
+
+    def has_retired(self) -> bool:
+        """
+        Returns:
+            bool: Whether a retired collection is left to catch up from and drop.
+        """
+        return self._get(self.retired_name) is not None
+
+    def prepare_shadow(self, signature: EmbeddingSignature) -> None:
+        """
+        Creates the shadow collection with the configuration of the live one, keeping a shadow of the
+        same signature left by an interrupted migration so its vectors are not computed again.
+        Args:
+            signature (EmbeddingSignature): The signature of the new vectors.
+        """
+        shadow = self._get(self.shadow_name)
+        if shadow is not None:
+            if EmbeddingSignature.from_metadata(shadow.metadata) == signature:
+                logging.info("Resuming the migration of collection %s to %s (%d documents done)", self.name, signature, shadow.count())
+                return
+            self.client.delete_collection(self.shadow_name)
+
+        live = self.client.get_collection(self.name)
+        configuration = {key: value for key, value in (live.configuration or {}).items() if key in ("hnsw", "spann") and value}
+        self.client.create_collection(
+            self.shadow_name,
+            metadata={**(live.metadata or {}), **signature.to_metadata()},
+            configuration=configuration or None,
+        )
+
+    def iter_id_pages(self, source: str, batch_size: int) -> Iterator[list[str]]:
+        """
+        Reads the ids of a collection page by page.
+        Args:
+            source (str): "live" or "retired".
+            batch_size (int): The number of ids per page.
+        Yields:
+            list[str]: The ids of each page.
+        """
+        collection = self.client.get_collection(self.name if source == "live" else self.retired_name)
+        offset = 0
+        while True:
+            ids = collection.get(include=[], limit=batch_size, offset=offset)["ids"]
+            if not ids:
+                return
+            yield ids
+            offset += len(ids)
+
+    def missing(self, source: str, ids: list[str]) -> tuple[list[str], list[str], list[dict[str, Any]]]:
+        """
+        Loads the documents of the source collection that the target does not have yet, or has an
+        older version of, by the time they were saved. The target of the live collection is the shadow,
+        and the target of the retired collection is the live one.
+        Args:
+            source (str): "live" or "retired".
+            ids (list[str]): The ids to check.
+        Returns:
+            tuple[list[str], list[str], list[dict[str, Any]]]: The ids, documents and metadatas to copy.
+        """
+        source_collection = self.client.get_collection(self.name if source == "live" else self.retired_name)
+        target_collection = self.client.get_collection(self.shadow_name if source == "live" else self.name)
+
+        sources = source_collection.get(ids=ids, include=["metadatas"])
+        targets = target_collection.get(ids=ids, include=["metadatas"])
+        copied = {document_id: saved_at(metadata) for document_id, metadata in zip(targets["ids"], targets["metadatas"])}
+        stale_ids = [
+            document_id for document_id, metadata in zip(sources["ids"], sources["metadatas"])
+            if document_id not in copied or saved_at(metadata) > copied[document_id]
+        ]
+        if not stale_ids:
+            return [], [], []
+
+        page = source_collection.get(ids=stale_ids, include=["documents", "metadatas"])
+        return page["ids"], page["documents"], page["metadatas"]
+
+    def write(self, source: str, ids: list[str], embeddings: Any, documents: list[str], metadatas: list[dict[str, Any]]) -> None:
+        """Writes copied documents with their new vectors to the target of the source collection."""
+        target_collection = self.client.get_collection(self.shadow_name if source == "live" else self.name)
+        target_collection.upsert(ids=ids, embeddings=embeddings, documents=documents, metadatas=metadatas)
+
+    def swap(self) -> None:
+        """Retires the live collection and renames the shadow to the live name."""
+        if self.has_retired():
+            self.client.delete_collection(self.retired_name)
+
+        self.client.get_collection(self.name).modify(name=self.retired_name)
+        self.client.get_collection(self.shadow_name).modify(name=self.name)
+
+    def drop_retired(self) -> None:
+        """Drops the retired collection, once no request can be using it."""
+        if self.has_retired():
+            self.client.delete_collection(self.retired_name)
@@ -0,0 +1,677 @@
+import asyncio
+import json
+import logging
+import os
+import re
+import threading
+from typing import Iterator, Optional
+import faiss
+import numpy as np
+from langchain_core.documents import Document
+
+from abstractions.articles_repo import ArticlesRepo
+from abstractions.content_store import ContentStore
+from application.services.batch_embedder import BatchEmbedder
+from application.utils.content_fingerprint import fingerprint_content
+from application.utils.metrics import VECTOR_STORE_SECONDS, timed
+from application.utils.rank_fusion import reciprocal_rank_fusion
+from application.utils.semantic_text import build_semantic_text
+from domain.article_enriched import ArticleEnriched
+from domain.article_filters import ArticleFilters, normalize_topic
+from domain.article_query import ArticleQuery
+from repositories.bm25_index import Bm25Index
+from repositories.sqlite_connection import connect_sqlite
+
+INDEX_FILE = "index.faiss"
+CHECKPOINT_PATTERN = re.compile(r"^index-(\d+)\.faiss$")
+METADATA_FILE = "metadata.sqlite3"
+INDEX_TYPES = ("flat", "hnsw", "ivf")
+
+def fingerprint_to_id(fingerprint: str) -> int:
+    """
+    Maps a hex content fingerprint to a positive int64 FAISS id.
+    Args:
+        fingerprint (str): The hex content fingerprint.
+    Returns:
+        int: The FAISS id (the first 60 bits of the fingerprint).
+    """
+    return int(fingerprint[:15], 16)
+
+class FaissArticlesRepo(ArticlesRepo):
+    """
+    Repository for storing and querying articles using a FAISS index persisted on disk.
+    Document text, metadata and vectors live in a SQLite file shared by all worker processes: a save
+    writes only its own rows, in one transaction, and appends their vectors to a log. Each process
+    keeps the FAISS index in memory and replays the log entries it has not seen yet before searching,
+    so no process drops another's vectors. The index is checkpointed to a file named after the last
+    log entry it holds once the entries since the previous checkpoint reach a quarter of the index
+    (and at least checkpoint_entries), so startup loads the checkpoint and replays only the rest,
+    and saves do not rewrite the whole index. The index type is selected by corpus size:
+    - 'flat': exact search, best for small corpora.
+    - 'hnsw': graph-based approximate search for large corpora.
+    - 'ivf': starts as flat and is rebuilt as a trained IVF index once it reaches ivf_threshold vectors.
+    Scores are squared L2 distances, the same as the default Chroma collection.
+    With a BM25 lexical index, queries fuse the BM25 and vector rankings with reciprocal rank
+    fusion instead, and scores are fused scores (higher is better).
+    Filters are evaluated by SQLite over indexed political_bias and topic columns, and the
+    matching ids restrict the FAISS search itself through an id selector.
+    With a content store, the full article content is kept there instead of in the document
+    metadata, so searches only load and decode the small fields; content is read on demand by id.
+    """
+    def __init__(
+        self,
+        persist_directory: str,
+        embedder: BatchEmbedder,
+        index_type: str = "flat",
+        ivf_threshold: int = 50_000,
+        nprobe: int = 16,
+        k: int = 4,
+        lexical_index: Optional[Bm25Index] = None,
+        candidates: int = 20,
+        rrf_k: int = 60,
+        content_store: Optional[ContentStore] = None,
+        checkpoint_entries: int = 10_000,
+    ) -> None:
+        if index_type not in INDEX_TYPES:
+            raise ValueError(f"Unknown FAISS index type: {index_type}")
+
+        self.persist_directory = persist_directory
+        self.embedder = embedder
+        self.index_type = index_type
+        self.ivf_threshold = ivf_threshold
+        self.nprobe = nprobe
+        self.k = k
+        self.lexical_index = lexical_index
+        self.candidates = candidates
+        self.rrf_k = rrf_k
+        self.content_store = content_store
+        self.checkpoint_entries = checkpoint_entries
+
+        os.makedirs(persist_directory, exist_ok=True)
+
+        self._write_lock = asyncio.Lock()
+        self._index_lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self._connection = connect_sqlite(os.path.join(persist_directory, METADATA_FILE))
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS documents (
+                id INTEGER PRIMARY KEY,
+                fingerprint TEXT NOT NULL UNIQUE,
+                page_content TEXT NOT NULL,
+                metadata TEXT NOT NULL,
+                political_bias TEXT
+            )
+            """
+        )
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS document_topics (
+                topic TEXT NOT NULL,
+                id INTEGER NOT NULL,
+                PRIMARY KEY (topic, id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS document_topics_id ON document_topics (id);
+            """
+        )
+        self._migrate_filter_columns()
+        self._connection.execute("CREATE INDEX IF NOT EXISTS documents_political_bias ON documents (political_bias)")
+        # AUTOINCREMENT so the sequence of a replaced vector is never reused and replays miss nothing
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS vectors (
+                sequence INTEGER PRIMARY KEY AUTOINCREMENT,
+                id INTEGER NOT NULL UNIQUE,
+                vector BLOB NOT NULL
+            )
+            """
+        )
+
+        self._index, self._sequence = self._load_checkpoint()
+        self._indexed: set[int] = set()
+        if self._index is not None:
+            self._indexed.update(faiss.vector_to_array(self._index.id_map).tolist())
+        with self._index_lock:
+            self._replay()
+
+    def _migrate_filter_columns(self) -> None:
+        """Adds the filter columns to a metadata store created before filtering, filling them from the metadata."""
+        columns = {row[1] for row in self._connection.execute("PRAGMA table_info(documents)")}
+        if "political_bias" in columns:
+            return
+
+        rows = self._connection.execute("SELECT id, metadata FROM documents").fetchall()
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            self._connection.execute("ALTER TABLE documents ADD COLUMN political_bias TEXT")
+            for row_id, metadata in rows:
+                metadata = json.loads(metadata)
+                self._connection.execute("UPDATE documents SET political_bias = ? WHERE id = ?", (metadata.get("political_bias"), row_id))
+                self._connection.executemany(
+                    "INSERT OR IGNORE INTO document_topics VALUES (?, ?)",
+                    [(topic, row_id) for topic in self._topics(metadata)],
+                )
+            self._connection.execute("COMMIT")
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+
+        logging.info("Added filter columns to %d stored articles", len(rows))
+
+    @staticmethod
+    def _topics(metadata: dict) -> set[str]:
+        """
+        Normalizes the comma-separated topics of document metadata for filtering.
+        Args:
+            metadata (dict): The document metadata.
+        Returns:
+            set[str]: The normalized topics.
+        """
+        return {normalize_topic(topic) for topic in (metadata.get("topics") or "").split(",") if topic.strip()}
+
+    def _checkpoint_path(self, sequence: int) -> str:
+        return os.path.join(self.persist_directory, f"index-{sequence}.faiss")
+
+    def _checkpoints(self) -> list[int]:
+        """Returns the log sequences of the index checkpoints on disk."""
+        return [int(match.group(1)) for match in map(CHECKPOINT_PATTERN.match, os.listdir(self.persist_directory)) if match]
+
+    def _load_checkpoint(self) -> tuple[Optional[faiss.Index], int]:
+        """
+        Loads the latest index checkpoint. An index persisted before the vector log existed holds the
+        vectors saved until then and becomes the checkpoint of the empty log.
+        Returns:
+            tuple[Optional[faiss.Index], int]: The index, or None if nothing was checkpointed yet, and the
+                sequence of the last log entry it holds.
+        """
+        legacy_path = os.path.join(self.persist_directory, INDEX_FILE)
+        if os.path.exists(legacy_path) and not self._checkpoints():
+            try:
+                os.replace(legacy_path, self._checkpoint_path(0))
+            except FileNotFoundError:
+                pass  # Moved by another worker
+
+        for sequence in sorted(self._checkpoints(), reverse=True):
+            try:
+                index = faiss.read_index(self._checkpoint_path(sequence))
+            except RuntimeError:
+                continue  # Replaced by a newer checkpoint of another worker in the meantime
+            logging.info("Loaded FAISS index with %d vectors up to log entry %d", index.ntotal, sequence)
+            return index, sequence
+
+        return None, 0
+
+    def _replay(self, batch_size: int = 10_000) -> None:
+        """
+        Adds the vectors logged since the last replay, by this or another process, to the index.
+        Vectors of already indexed articles are replaced when the index supports removal.
+        Must be called under the index lock.
+        Args:
+            batch_size (int): The number of log entries read at a time.
+        """
+        while True:
+            with self._db_lock:
+                rows = self._connection.execute(
+                    "SELECT sequence, id, vector FROM vectors WHERE sequence > ? ORDER BY sequence LIMIT ?",
+                    (self._sequence, batch_size),
+                ).fetchall()
+            if not rows:
+                return
+
+            ids = np.array([row[1] for row in rows], dtype=np.int64)
+            vectors = np.frombuffer(b"".join(row[2] for row in rows), dtype=np.float32).reshape(len(rows), -1)
+
+            if self._index is None:
+                self._index = self._create_index(vectors.shape[1])
+
+            new_rows = np.array([i not in self._indexed for i in ids.tolist()], dtype=bool)
+            if not new_rows.all():
+                try:
+                    self._index.remove_ids(ids[~new_rows])
+                    new_rows[:] = True
+                except RuntimeError:
+                    logging.debug("Index does not support removal, keeping vectors of %d existing articles", int((~new_rows).sum()))
+
+            if new_rows.any():
+                self._index.add_with_ids(vectors[new_rows], ids[new_rows])
+
+            self._indexed.update(ids.tolist())
+            self._sequence = rows[-1][0]
+            self._maybe_convert_to_ivf()
+
+    def _refresh(self) -> None:
+        """Replays the vectors logged by other processes."""
+        with self._index_lock:
+            self._replay()
+
+    def _create_index(self, dimension: int) -> faiss.Index:
+        """
+        Creates an empty index of the configured type.
+        Args:
+            dimension (int): The embedding dimension.
+        Returns:
+            faiss.Index: The new index.
+        """
+        if self.index_type == "hnsw":
+            return faiss.index_factory(dimension, "IDMap2,HNSW32")
+        return faiss.index_factory(dimension, "IDMap2,Flat")
+
+    def _maybe_convert_to_ivf(self) -> None:
+        """
+        Rebuilds a flat index as a trained IVF index once it holds ivf_threshold vectors.
+        Must be called under the index lock.
+        """
+        if self.index_type != "ivf" or self._index.ntotal < self.ivf_threshold:
+            return
+
+        inner = faiss.downcast_index(self._index.index)
+        if not isinstance(inner, faiss.IndexFlat):
+            return
+
+        vectors = inner.reconstruct_n(0, self._index.ntotal)
+        ids = faiss.vector_to_array(self._index.id_map)
+        nlist = max(1, int(4 * np.sqrt(len(ids))))
+
+        ivf = faiss.index_factory(self._index.d, f"IDMap2,IVF{nlist},Flat")
+        ivf.train(vectors)
+        ivf.add_with_ids(vectors, ids)
+        self._index = ivf
+
+        logging.info("Converted FAISS index to IVF with %d lists", nlist)
+
+    def _search_parameters(self) -> None:
+        """Applies the IVF nprobe setting to the current index, if it is an IVF index."""
+        inner = faiss.downcast_index(self._index.index)
+        if isinstance(inner, faiss.IndexIVF):
+            inner.nprobe = self.nprobe
+
+    async def save_async(self, articles: list[ArticleQuery]) -> None:
+        """
+        Upserts a list of articles into the index and metadata store.
+        Articles already stored (same content fingerprint) get their metadata replaced;
+        their vector is replaced too when the index supports removal.
+        Args:
+            articles (list[ArticleQuery]): List of articles to save.
+        """
+        documents = self._articles_to_documents(articles)
+        if not documents:
+            return
+
+        async with self._write_lock:
+            if self.content_store is not None:
+                contents = {fingerprint_content(article.content): article.content for article in articles}
+                await asyncio.to_thread(self.content_store.put_many, contents)
+
+            async for start, vectors in self.embedder.iter_batches_async([document.page_content for document in documents]):
+                batch = documents[start:start + len(vectors)]
+                await asyncio.to_thread(self._upsert_batch, batch, np.asarray(vectors, dtype=np.float32))
+
+            await asyncio.to_thread(self._checkpoint)
+
+            if self.lexical_index is not None:
+                await asyncio.to_thread(self._index_lexically, documents)
+
+    def _index_lexically(self, documents: list[Document]) -> None:
+        """
+        Adds the documents to the lexical index.
+        Args:
+            documents (list[Document]): The saved documents.
+        """
+        self.lexical_index.add((document.id, document.page_content) for document in documents)
+
+    def _upsert_batch(self, documents: list[Document], vectors: np.ndarray) -> None:
+        """
+        Writes a batch of documents with precomputed vectors to the metadata store and vector log,
+        then adds them to the index.
+        Args:
+            documents (list[Document]): The documents of the batch.
+            vectors (np.ndarray): Their float32 embeddings.
+        """
+        with timed(VECTOR_STORE_SECONDS, stage="vector_store_write", store="faiss", operation="write"):
+            rows = [fingerprint_to_id(document.id) for document in documents]
+
+            with self._db_lock:
+                self._connection.execute("BEGIN IMMEDIATE")
+                try:
+                    self._connection.executemany(
+                        "INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?, ?)",
+                        [
+                            (i, document.id, document.page_content, json.dumps(document.metadata), document.metadata.get("political_bias"))
+                            for i, document in zip(rows, documents)
+                        ],
+                    )
+                    self._connection.execute(f"DELETE FROM document_topics WHERE id IN ({','.join('?' * len(rows))})", rows)
+                    self._connection.executemany(
+                        "INSERT OR IGNORE INTO document_topics VALUES (?, ?)",
+                        [(topic, i) for i, document in zip(rows, documents) for topic in self._topics(document.metadata)],
+                    )
+                    self._connection.execute(f"DELETE FROM vectors WHERE id IN ({','.join('?' * len(rows))})", rows)
+                    self._connection.executemany(
+                        "INSERT INTO vectors (id, vector) VALUES (?, ?)",
+                        [(i, vector.tobytes()) for i, vector in zip(rows, vectors)],
+                    )
+                    self._connection.execute("COMMIT")
+                except BaseException:
+                    self._connection.execute("ROLLBACK")
+                    raise
+
+            with self._index_lock:
+                self._replay()
+
+    def _checkpoint(self, force: bool = False) -> None:
+        """
+        Writes the index to a checkpoint named after the last log entry it holds, once enough entries
+        were logged since the latest checkpoint, and removes the older checkpoints.
+        Args:
+            force (bool): Whether to write it whenever entries were logged since the latest checkpoint.
+        """
+        with self._index_lock:
+            if self._index is None:
+                return
+
+            sequence = self._sequence
+            pending = sequence - max(self._checkpoints(), default=0)
+            if pending <= 0 or (not force and pending < max(self.checkpoint_entries, self._index.ntotal // 4)):
+                return
+
+            # Written from a copy, so searches do not wait for the disk
+            index = faiss.clone_index(self._index)
+
+        path = self._checkpoint_path(sequence)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        faiss.write_index(index, temporary_path)
+        os.replace(temporary_path, path)
+
+        for older in self._checkpoints():
+            if older < sequence:
+                try:
+                    os.remove(self._checkpoint_path(older))
+                except FileNotFoundError:
+                    pass  # Removed by another worker
+
+        logging.info("Checkpointed FAISS index with %d vectors up to log entry %d", index.ntotal, sequence)
+
+    async def query_async(
+        self, query: str, k: Optional[int] = None, offset: int = 0, filters: Optional[ArticleFilters] = None
+    ) -> list[tuple[Document, float]]:
+        """
+        Queries the index for documents similar to the given query.
+        With a lexical index, the vector and BM25 candidates are fused with reciprocal rank fusion.
+        With filters, the ids matching them are selected in SQLite and only those are searched.
+        Args:
+            query (str): The search query to find similar articles.
+            k (Optional[int]): The number of results to return; the repository default if omitted.
+            offset (int): The number of best results to skip, for pagination.
+            filters (Optional[ArticleFilters]): Metadata filters the documents must match.
+        Returns:
+            list[tuple[Document, float]]: List of tuples containing Document and squared L2 distance (or fused score).
+        """
+        await asyncio.to_thread(self._refresh)
+        if self._index is None or self._index.ntotal == 0:
+            return []
+
+        k = self.k if k is None else k
+        allowed = None
+        if filters is not None and not filters.is_empty():
+            allowed = await asyncio.to_thread(self._filter_ids, filters)
+            if not allowed:
+                return []
+
+        vector = np.asarray(await self.embedder.embed_query_async(query), dtype=np.float32)
+
+        if self.lexical_index is None:
+            results = await asyncio.to_thread(self._search, vector, offset + k, allowed)
+            return results[offset:]
+
+        candidates = max(self.candidates, offset + k)
+        dense, lexical = await asyncio.gather(
+            asyncio.to_thread(self._search, vector, candidates, allowed),
+            asyncio.to_thread(self.lexical_index.search, query, candidates),
+        )
+        lexical_ids = [
+            document_id for document_id, _ in lexical if allowed is None or fingerprint_to_id(document_id) in allowed
+        ]
+        fused = reciprocal_rank_fusion([[document.id for document, _ in dense], lexical_ids], self.rrf_k)[offset:offset + k]
+
+        documents = {document.id: document for document, _ in dense}
+        missing = [document_id for document_id, _ in fused if document_id not in documents]
+        documents.update(await asyncio.to_thread(self._load_documents, "fingerprint", missing))
+
+        return [(documents[document_id], score) for document_id, score in fused if document_id in documents]
+
+    def _filter_ids(self, filters: ArticleFilters) -> set[int]:
+        """
+        Selects the ids of the documents matching the filters.
+        Args:
+            filters (ArticleFilters): The filters.
+        Returns:
+            set[int]: The matching ids.
+        """
+        clauses, parameters = [], []
+        if filters.political_bias:
+            clauses.append(f"political_bias IN ({','.join('?' * len(filters.political_bias))})")
+            parameters.extend(filters.political_bias)
+        if filters.topics:
+            clauses.append(f"id IN (SELECT id FROM document_topics WHERE topic IN ({','.join('?' * len(filters.topics))}))")
+            parameters.extend(filters.topics)
+
+        with self._db_lock:
+            rows = self._connection.execute(f"SELECT id FROM documents WHERE {' AND '.join(clauses)}", parameters)
+            return {row[0] for row in rows}
+
+    def _search(self, vector: np.ndarray, k: int, allowed: Optional[set[int]] = None) -> list[tuple[Document, float]]:
+        """
+        Searches the index and loads the metadata of the nearest documents.
+        Args:
+            vector (np.ndarray): The query embedding.
+            k (int): The number of neighbours to return.
+            allowed (Optional[set[int]]): The only ids that may be returned; any if omitted.
+        Returns:
+            list[tuple[Document, float]]: The nearest documents with their distances.
+        """
+        with timed(VECTOR_STORE_SECONDS, stage="vector_store_query", store="faiss", operation="query"):
+            with self._index_lock:
+                self._search_parameters()
+                params = None if allowed is None else self._selector_parameters(allowed)
+                distances, ids = self._index.search(vector.reshape(1, -1), k, params=params)
+            hits = [(int(i), float(d)) for i, d in zip(ids[0], distances[0]) if i != -1]
+
+            documents = self._load_documents("id", [i for i, _ in hits])
+
+            return [(documents[i], distance) for i, distance in hits if i in documents]
+
+    def _selector_parameters(self, allowed: set[int]) -> faiss.SearchParameters:
+        """
+        Builds search parameters restricting the search to the allowed ids, matching the index type.
+        Must be called under the index lock.
+        Args:
+            allowed (set[int]): The ids that may be returned.
+        Returns:
+            faiss.SearchParameters: The search parameters.
+        """
+        selector = faiss.IDSelectorBatch(np.fromiter(allowed, dtype=np.int64, count=len(allowed)))
+        inner = faiss.downcast_index(self._index.index)
+
+        if isinstance(inner, faiss.IndexIVF):
+            return faiss.SearchParametersIVF(sel=selector, nprobe=self.nprobe)
+        if isinstance(inner, faiss.IndexHNSW):
+            return faiss.SearchParametersHNSW(sel=selector)
+        return faiss.SearchParameters(sel=selector)
+
+    async def get_by_fingerprints_async(self, fingerprints: list[str]) -> dict[str, ArticleEnriched]:
+        """
+        Loads already stored articles by their content fingerprints.
+        Args:
+            fingerprints (list[str]): Content fingerprints of the articles to look up.
+        Returns:
+            dict[str, ArticleEnriched]: Stored articles keyed by fingerprint; unknown fingerprints are omitted.
+        """
+        if not fingerprints:
+            return {}
+
+        documents = await asyncio.to_thread(self._load_documents, "fingerprint", fingerprints)
+        contents = await self._load_contents(list(documents))
+
+        return {document.id: self._document_to_article(document, contents.get(document.id)) for document in documents.values()}
+
+    async def get_contents_async(self, ids: list[str]) -> dict[str, str]:
+        """
+        Loads the full content of articles by id.
+        Args:
+            ids (list[str]): The article ids (content fingerprints).
+        Returns:
+            dict[str, str]: The contents keyed by id; unknown ids are omitted.
+        """
+        contents = await self._load_contents(ids)
+        missing = [article_id for article_id in ids if article_id not in contents]
+        if missing:
+            documents = await asyncio.to_thread(self._load_documents, "fingerprint", missing)
+            contents.update({
+                article_id: document.metadata["content"] for article_id, document in documents.items() if "content" in document.metadata
+            })
+
+        return contents
+
+    async def _load_contents(self, ids: list[str]) -> dict[str, str]:
+        """
+        Loads contents from the content store, if there is one.
+        Args:
+            ids (list[str]): The article ids.
+        Returns:
+            dict[str, str]: The stored contents keyed by id.
+        """
+        if self.content_store is None or not ids:
+            return {}
+        return await asyncio.to_thread(self.content_store.get_many, ids)
+
+    def move_contents_to_store(self, batch_size: int = 1000) -> int:
+        """
+        Moves the content of documents stored before the content store was used out of their metadata.
+        Args:
+            batch_size (int): The number of documents moved at a time.
+        Returns:
+            int: The number of documents moved.
+        """
+        if self.content_store is None:
+            return 0
+
+        moved = 0
+        while True:
+            with self._db_lock:
+                rows = self._connection.execute(
+                    "SELECT id, fingerprint, metadata FROM documents WHERE json_extract(metadata, '$.content') IS NOT NULL LIMIT ?",
+                    (batch_size,),
+                ).fetchall()
+            if not rows:
+                break
+
+            metadatas = [(row_id, fingerprint, json.loads(metadata)) for row_id, fingerprint, metadata in rows]
+            self.content_store.put_many({fingerprint: metadata.pop("content") for _, fingerprint, metadata in metadatas})
+            with self._db_lock:
+                self._connection.executemany(
+                    "UPDATE documents SET metadata = ? WHERE id = ?",
+                    [(json.dumps(metadata), row_id) for row_id, _, metadata in metadatas],
+                )
+            moved += len(rows)
+
+        if moved:
+            logging.info("Moved the content of %d stored articles to the content store", moved)
+        return moved
+
+    def _load_documents(self, column: str, keys: list) -> dict:
+        """
+        Loads documents from the metadata store by id or fingerprint.
+        Args:
+            column (str): Either 'id' or 'fingerprint'.
+            keys (list): The values to look up.
+        Returns:
+            dict: Documents keyed by the looked-up column.
+        """
+        if not keys:
+            return {}
+
+        with self._db_lock:
+            rows = self._connection.execute(
+                f"SELECT id, fingerprint, page_content, metadata FROM documents WHERE {column} IN ({','.join('?' * len(keys))})",
+                keys,
+            ).fetchall()
+
+        documents = {}
+        for row_id, fingerprint, page_content, metadata in rows:
+            document = Document(id=fingerprint, page_content=page_content, metadata=json.loads(metadata))
+            documents[row_id if column == "id" else fingerprint] = document
+        return documents
+
+    def iter_page_contents(self, batch_size: int = 1000) -> Iterator[list[tuple[str, str]]]:
+        """
+        Reads the stored documents page by page, to (re)build the lexical index.
+        Args:
+            batch_size (int): The number of documents per page.
+        Returns:
+            Iterator[list[tuple[str, str]]]: Pages of document fingerprints and texts.
+        """
+        last_id = -1
+        while True:
+            with self._db_lock:
+                rows = self._connection.execute(
+                    "SELECT id, fingerprint, page_content FROM documents WHERE id > ? ORDER BY id LIMIT ?", (last_id, batch_size)
+                ).fetchall()
+            if not rows:
+                return
+
+            yield [(fingerprint, page_content) for _, fingerprint, page_content in rows]
+            last_id = rows[-1][0]
+
+    def _articles_to_documents(self, articles: list[ArticleQuery]) -> list[Document]:
+        """
+        Converts a list of articles to Documents keyed by content fingerprint,
+        using the same semantic text and metadata as the Chroma repository.
+        Args:
+            articles (list[ArticleQuery]): List of articles to convert.
+        Returns:
+            list[Document]: List of Document objects.
+        """
+        documents = {}
+        for article in articles:
+            fingerprint = fingerprint_content(article.content)
+            metadata = {
+                "headline": article.headline,
+                "summary": article.summary,
+                "topics": ','.join(article.topics or []),
+                "political_bias": article.political_bias,
+            }
+            if self.content_store is None:
+                metadata["content"] = article.content
+
+            documents[fingerprint] = Document(
+                id=fingerprint,
+                page_content=build_semantic_text(article),
+                metadata=metadata,
+            )
+        return list(documents.values())
+
+    def _document_to_article(self, document: Document, content: Optional[str] = None) -> ArticleEnriched:
+        """
+        Converts a stored Document back to an ArticleEnriched object.
+        Args:
+            document (Document): The stored document.
+            content (Optional[str]): The content from the content store; read from the metadata if omitted.
+        Returns:
+            ArticleEnriched: The stored article.
+        """
+        metadata = document.metadata or {}
+        topics = metadata.get("topics")
+
+        return ArticleEnriched(
+            headline=metadata.get("headline"),
+            content=content if content is not None else metadata.get("content", ""),
+            summary=metadata.get("summary", ""),
+            topics=[t.strip() for t in topics.split(",") if t.strip()] if topics else None,
+            political_bias=metadata.get("political_bias"),
+        )
+
+    def close(self) -> None:
+        """Checkpoints the vectors logged since the latest checkpoint and closes the metadata store connection."""
+        self._checkpoint(force=True)
+        with self._db_lock:
+            self._connection.close()
@@ -0,0 +1,45 @@
+import json
+import os
+from typing import Any, Optional
+
+class JsonIngestCheckpoint():
+    """
+    Progress of a bulk ingestion persisted as a small JSON file. Writes go to a temporary file
+    that replaces the checkpoint atomically, so an interrupted ingestion never leaves a torn one.
+    """
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def load(self) -> Optional[dict[str, Any]]:
+        """
+        Returns:
+            Optional[dict[str, Any]]: The saved state, or None if there is no checkpoint yet.
+        """
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return None
+
+    def save(self, state: dict[str, Any]) -> None:
+        """
+        Replaces the saved state.
+        Args:
+            state (dict[str, Any]): The JSON serializable state.
+        """
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+
+        temporary_path = f"{self.path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump(state, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, self.path)
+
+    def clear(self) -> None:
+        """Removes the checkpoint, e.g. to ingest a dump again from the start."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
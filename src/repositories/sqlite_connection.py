@@ -0,0 +1,21 @@
+import os
+import sqlite3
+
+def connect_sqlite(path: str) -> sqlite3.Connection:
+    """
+    Opens a SQLite database shared by the threads of this process and by the other worker processes,
+    creating its directory if needed. The connection is in autocommit mode, so writes spanning several
+    statements open their own transactions, and uses WAL, so readers do not block the writer.
+    Callers serialize their use of the connection with their own lock.
+    Args:
+        path (str): The database file.
+    Returns:
+        sqlite3.Connection: The connection.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    connection = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+    connection.execute("PRAGMA journal_mode=WAL")
+    return connection
@@ -0,0 +1,81 @@
+import threading
+import zstandard
+
+from abstractions.content_store import ContentStore
+from repositories.sqlite_connection import connect_sqlite
+
+class SqliteContentStore(ContentStore):
+    """
+    Article content store keeping each content as a zstd-compressed blob in SQLite, keyed by article id.
+    The vector store then only holds the small fields it searches and returns, and the full
+    text is read (and decompressed) only for the articles whose content is actually requested.
+    """
+    def __init__(self, path: str, level: int = 3) -> None:
+        self.level = level
+
+        self._lock = threading.Lock()
+
+        self._connection = connect_sqlite(path)
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS contents (
+                id TEXT PRIMARY KEY,
+                content BLOB NOT NULL,
+                size INTEGER NOT NULL
+            ) WITHOUT ROWID
+            """
+        )
+
+    def put_many(self, contents: dict[str, str]) -> None:
+        """
+        Stores the contents, replacing the previous content of known ids.
+        Args:
+            contents (dict[str, str]): The contents keyed by article id.
+        """
+        if not contents:
+            return
+
+        compressor = zstandard.ZstdCompressor(level=self.level)
+        rows = []
+        for article_id, content in contents.items():
+            data = content.encode("utf-8")
+            rows.append((article_id, compressor.compress(data), len(data)))
+
+        with self._lock:
+            self._connection.executemany("INSERT OR REPLACE INTO contents VALUES (?, ?, ?)", rows)
+
+    def get_many(self, ids: list[str]) -> dict[str, str]:
+        """
+        Loads the contents of the given ids.
+        Args:
+            ids (list[str]): The article ids.
+        Returns:
+            dict[str, str]: The contents keyed by article id; unknown ids are omitted.
+        """
+        if not ids:
+            return {}
+
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT id, content FROM contents WHERE id IN ({','.join('?' * len(ids))})", ids
+            ).fetchall()
+
+        decompressor = zstandard.ZstdDecompressor()
+        return {article_id: decompressor.decompress(blob).decode("utf-8") for article_id, blob in rows}
+
+    def stats(self) -> dict[str, int]:
+        """
+        Returns the size of the store.
+        Returns:
+            dict[str, int]: The number of stored contents and their raw and compressed sizes in bytes.
+        """
+        with self._lock:
+            count, raw_bytes, compressed_bytes = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(LENGTH(content)), 0) FROM contents"
+            ).fetchone()
+        return {"contents": count, "raw_bytes": raw_bytes, "compressed_bytes": compressed_bytes}
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        with self._lock:
+            self._connection.close()
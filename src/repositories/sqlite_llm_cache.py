@@ -0,0 +1,182 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+from typing import Any, Optional
+from langchain_core.caches import BaseCache, RETURN_VAL_TYPE
+from langchain_core.load import dumps, loads
+
+from repositories.sqlite_connection import connect_sqlite
+
+class SqliteLLMCache(BaseCache):
+    """
+    Persistent LLM response cache stored in SQLite.
+    Entries are keyed by a hash of the prompt and the LLM string (which includes the model,
+    deployment and temperature), expire after the TTL and are evicted least recently used
+    first once max_entries is exceeded. Expired entries are purged at most every purge_interval_seconds,
+    and the least recently used tenth is evicted at once, so most writes evict nothing.
+    """
+    def __init__(self, path: str, ttl_seconds: float, max_entries: int, purge_interval_seconds: float = 60) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.purge_interval_seconds = purge_interval_seconds
+
+        self._counters = {"hits": 0, "misses": 0}
+        self._lock = threading.Lock()
+        self._purged_at = 0.0
+
+        self._connection = connect_sqlite(path)
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                key TEXT PRIMARY KEY,
+                generations TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS llm_cache_accessed_at ON llm_cache (accessed_at)")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS llm_cache_created_at ON llm_cache (created_at)")
+        self._create_entry_count()
+
+    def _create_entry_count(self) -> None:
+        """
+        Keeps the number of entries in a one-row table, updated by triggers in the same transaction
+        as every insert and delete, so writes do not count the whole cache.
+        A cache created before the count existed is counted once.
+        """
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache_count (id INTEGER PRIMARY KEY CHECK (id = 0), entries INTEGER NOT NULL)"
+            )
+            self._connection.execute("INSERT OR IGNORE INTO llm_cache_count VALUES (0, (SELECT COUNT(*) FROM llm_cache))")
+            for name, event, change in (("insert", "INSERT", "+ 1"), ("delete", "DELETE", "- 1")):
+                self._connection.execute(
+                    f"CREATE TRIGGER IF NOT EXISTS llm_cache_count_{name} AFTER {event} ON llm_cache "
+                    f"BEGIN UPDATE llm_cache_count SET entries = entries {change}; END"
+                )
+            self._connection.execute("COMMIT")
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+
+    @staticmethod
+    def _key(prompt: str, llm_string: str) -> str:
+        return hashlib.sha256(f"{llm_string}\x00{prompt}".encode("utf-8")).hexdigest()
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        """
+        Looks up the cached generations for the prompt and LLM configuration.
+        Args:
+            prompt (str): The serialized prompt.
+            llm_string (str): The serialized LLM configuration.
+        Returns:
+            Optional[RETURN_VAL_TYPE]: The cached generations, or None on a miss.
+        """
+        key = self._key(prompt, llm_string)
+        now = time.time()
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT generations FROM llm_cache WHERE key = ? AND created_at >= ?", (key, now - self.ttl_seconds)
+            ).fetchone()
+
+            if row is None:
+                self._counters["misses"] += 1
+                return None
+
+            self._connection.execute("UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            self._counters["hits"] += 1
+
+        return [loads(generation) for generation in json.loads(row[0])]
+
+    def contains(self, prompt: str, llm_string: str) -> bool:
+        """
+        Checks for a live entry without counting a lookup or refreshing its access time.
+        Args:
+            prompt (str): The serialized prompt.
+            llm_string (str): The serialized LLM configuration.
+        Returns:
+            bool: True if lookup would return cached generations.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT 1 FROM llm_cache WHERE key = ? AND created_at >= ?",
+                (self._key(prompt, llm_string), time.time() - self.ttl_seconds),
+            ).fetchone()
+
+        return row is not None
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        """
+        Stores the generations for the prompt and LLM configuration, evicting old entries if needed.
+        Args:
+            prompt (str): The serialized prompt.
+            llm_string (str): The serialized LLM configuration.
+            return_val (RETURN_VAL_TYPE): The generations to cache.
+        """
+        try:
+            generations = json.dumps([dumps(generation) for generation in return_val])
+        except (TypeError, ValueError) as exc:
+            logging.debug("Skipping LLM cache update for non-serializable generation: %s", exc)
+            return
+
+        now = time.time()
+
+        with self._lock:
+            # An upsert rather than INSERT OR REPLACE, whose implicit delete would not fire the count trigger
+            self._connection.execute(
+                "INSERT INTO llm_cache VALUES (?, ?, ?, ?) ON CONFLICT (key) DO UPDATE SET "
+                "generations = excluded.generations, created_at = excluded.created_at, accessed_at = excluded.accessed_at",
+                (self._key(prompt, llm_string), generations, now, now),
+            )
+            self._evict(now)
+
+    def clear(self, **kwargs: Any) -> None:
+        """Removes all cached generations."""
+        with self._lock:
+            self._connection.execute("DELETE FROM llm_cache")
+
+    def stats(self) -> dict[str, float]:
+        """
+        Returns the hit/miss counters of this process together with the cache size.
+        Returns:
+            dict[str, float]: Hits, misses, hit rate and number of entries.
+        """
+        with self._lock:
+            (entries,) = self._connection.execute("SELECT entries FROM llm_cache_count").fetchone()
+            lookups = self._counters["hits"] + self._counters["misses"]
+
+            return {
+                **self._counters,
+                "hit_rate": self._counters["hits"] / lookups if lookups else 0.0,
+                "entries": entries,
+            }
+
+    def close(self) -> None:
+        """Closes the underlying SQLite connection."""
+        with self._lock:
+            self._connection.close()
+
+    def _evict(self, now: float) -> None:
+        """
+        Removes expired entries, if they were not purged recently, then the least recently used ones
+        down to nine tenths of max_entries once max_entries is exceeded. Must be called under the lock.
+        """
+        if now - self._purged_at >= self.purge_interval_seconds:
+            self._connection.execute("DELETE FROM llm_cache WHERE created_at < ?", (now - self.ttl_seconds,))
+            self._purged_at = now
+
+        (entries,) = self._connection.execute("SELECT entries FROM llm_cache_count").fetchone()
+        if entries <= self.max_entries:
+            return
+
+        excess = entries - (self.max_entries - self.max_entries // 10)
+        self._connection.execute(
+            "DELETE FROM llm_cache WHERE key IN (SELECT key FROM llm_cache ORDER BY accessed_at LIMIT ?)", (excess,)
+        )
+
+        logging.debug("Evicted %d entries from LLM cache", excess)
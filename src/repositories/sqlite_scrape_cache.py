@@ -0,0 +1,200 @@
+import hashlib
+import logging
+import threading
+import time
+from typing import Optional
+
+from abstractions.scrape_cache import ScrapeCache
+from application.models.cached_scrape import CachedScrape
+from application.utils.url_normalizer import normalize_url
+from repositories.sqlite_connection import connect_sqlite
+
+class SqliteScrapeCache(ScrapeCache):
+    """
+    Disk-backed scrape cache stored in SQLite and keyed by a hash of the normalized URL.
+    Entries younger than the TTL are served without any request; older ones are revalidated
+    with their ETag / Last-Modified validators. The cache is bounded in size and evicts the
+    least recently used entries first, down to nine tenths of max_bytes at once. Expired entries
+    are purged at most every purge_interval_seconds.
+    """
+    def __init__(self, path: str, ttl_seconds: float, max_bytes: int, purge_interval_seconds: float = 60) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.purge_interval_seconds = purge_interval_seconds
+
+        self._counters = {"hits": 0, "stale": 0, "revalidated": 0, "misses": 0}
+        self._lock = threading.Lock()
+        self._purged_at = 0.0
+
+        self._connection = connect_sqlite(path)
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS scrape_cache (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                headline TEXT NOT NULL,
+                content TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+            """
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS scrape_cache_accessed_at ON scrape_cache (accessed_at)")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS scrape_cache_fetched_at ON scrape_cache (fetched_at)")
+        self._create_size_total()
+
+    def _create_size_total(self) -> None:
+        """
+        Keeps the total size of the entries in a one-row table, updated by triggers in the same
+        transaction as every insert, update and delete, so eviction does not sum the whole cache.
+        A cache created before the total existed is summed once.
+        """
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS scrape_cache_size (id INTEGER PRIMARY KEY CHECK (id = 0), total INTEGER NOT NULL)"
+            )
+            self._connection.execute(
+                "INSERT OR IGNORE INTO scrape_cache_size VALUES (0, (SELECT COALESCE(SUM(size), 0) FROM scrape_cache))"
+            )
+            for name, event, change in (
+                ("insert", "INSERT", "new.size"),
+                ("update", "UPDATE OF size", "new.size - old.size"),
+                ("delete", "DELETE", "-old.size"),
+            ):
+                self._connection.execute(
+                    f"CREATE TRIGGER IF NOT EXISTS scrape_cache_size_{name} AFTER {event} ON scrape_cache "
+                    f"BEGIN UPDATE scrape_cache_size SET total = total + {change}; END"
+                )
+            self._connection.execute("COMMIT")
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.sha256(normalize_url(url).encode("utf-8")).hexdigest()
+
+    def get(self, url: str) -> Optional[CachedScrape]:
+        """
+        Returns the cached article for the URL, marking it as recently used.
+        Args:
+            url (str): The article URL.
+        Returns:
+            Optional[CachedScrape]: The cached article, or None if the URL is not cached.
+        """
+        key = self._key(url)
+        now = time.time()
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT headline, content, etag, last_modified, fetched_at FROM scrape_cache WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self._counters["misses"] += 1
+                return None
+
+            self._connection.execute("UPDATE scrape_cache SET accessed_at = ? WHERE key = ?", (now, key))
+
+            headline, content, etag, last_modified, fetched_at = row
+            is_fresh = now - fetched_at < self.ttl_seconds
+            self._counters["hits" if is_fresh else "stale"] += 1
+
+        return CachedScrape(
+            headline=headline,
+            content=content,
+            etag=etag,
+            last_modified=last_modified,
+            is_fresh=is_fresh,
+        )
+
+    def put(self, url: str, article: dict[str, str], etag: Optional[str], last_modified: Optional[str]) -> None:
+        """
+        Stores the extracted article and its validators, evicting old entries if needed.
+        Args:
+            url (str): The article URL.
+            article (dict[str, str]): The extracted article with 'headline' and 'content' keys.
+            etag (Optional[str]): The ETag response header.
+            last_modified (Optional[str]): The Last-Modified response header.
+        """
+        now = time.time()
+        size = len(article["headline"].encode("utf-8")) + len(article["content"].encode("utf-8"))
+
+        with self._lock:
+            # An upsert rather than INSERT OR REPLACE, whose implicit delete would not fire the size trigger
+            self._connection.execute(
+                """
+                INSERT INTO scrape_cache VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (key) DO UPDATE SET
+                    url = excluded.url, headline = excluded.headline, content = excluded.content, etag = excluded.etag,
+                    last_modified = excluded.last_modified, fetched_at = excluded.fetched_at,
+                    accessed_at = excluded.accessed_at, size = excluded.size
+                """,
+                (self._key(url), url, article["headline"], article["content"], etag, last_modified, now, now, size),
+            )
+            self._evict(now)
+
+    def touch(self, url: str) -> None:
+        """
+        Marks the cached article as fresh again after a successful revalidation (304 Not Modified).
+        Args:
+            url (str): The article URL.
+        """
+        now = time.time()
+
+        with self._lock:
+            self._connection.execute(
+                "UPDATE scrape_cache SET fetched_at = ?, accessed_at = ? WHERE key = ?", (now, now, self._key(url))
+            )
+            self._counters["revalidated"] += 1
+
+    def stats(self) -> dict[str, int]:
+        """
+        Returns the hit/miss counters of this process together with the cache size.
+        Returns:
+            dict[str, int]: Counters for hits, stale entries, revalidations, misses, entries and bytes.
+        """
+        with self._lock:
+            entries, size = self._connection.execute(
+                "SELECT (SELECT COUNT(*) FROM scrape_cache), total FROM scrape_cache_size"
+            ).fetchone()
+
+            return {**self._counters, "entries": entries, "size_bytes": size}
+
+    def close(self) -> None:
+        """Closes the underlying SQLite connection."""
+        with self._lock:
+            self._connection.close()
+
+    def _evict(self, now: float) -> None:
+        """
+        Removes expired entries that cannot be revalidated, if they were not purged recently, then the
+        least recently used entries down to nine tenths of max_bytes once the cache exceeds max_bytes.
+        Must be called under the lock.
+        """
+        if now - self._purged_at >= self.purge_interval_seconds:
+            self._connection.execute(
+                "DELETE FROM scrape_cache WHERE fetched_at < ? AND etag IS NULL AND last_modified IS NULL",
+                (now - self.ttl_seconds,),
+            )
+            self._purged_at = now
+
+        (total,) = self._connection.execute("SELECT total FROM scrape_cache_size").fetchone()
+        if total <= self.max_bytes:
+            return
+
+        target = self.max_bytes - self.max_bytes // 10
+        evicted = []
+        for key, size in self._connection.execute("SELECT key, size FROM scrape_cache ORDER BY accessed_at"):
+            if total <= target:
+                break
+            evicted.append((key,))
+            total -= size
+
+        self._connection.executemany("DELETE FROM scrape_cache WHERE key = ?", evicted)
+
+        logging.debug("Evicted %d entries from scrape cache", len(evicted))
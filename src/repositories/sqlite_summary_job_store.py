@@ -0,0 +1,287 @@
+import logging
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Optional
+
+from abstractions.summary_job_store import SummaryJobStore
+from application.models.article_summary_result_dto import ArticleSummaryResultDTO
+from application.models.summary_job_dto import SummaryJobDTO
+from repositories.sqlite_connection import connect_sqlite
+
+class SqliteSummaryJobStore(SummaryJobStore):
+    """
+    Persistent queue of summary jobs stored in SQLite. Each submitted URL is a queue item
+    that a worker claims with a lease, renewed while it works on the item; items whose lease
+    expired (because the worker or the whole process died) are claimed again, so jobs survive
+    restarts, until they were claimed max_attempts times and are recorded as failed, so a URL
+    that keeps killing its worker does not hold up the queue forever. Claiming is a single
+    UPDATE ... RETURNING statement, which keeps it atomic across worker processes. Leases are
+    held by worker id, and only the worker still holding an unexpired lease may renew it or
+    record the result, so a worker that lost its lease cannot overwrite the one that took over.
+    Finished jobs are pruned after the retention period.
+    """
+    def __init__(self, path: str, lease_seconds: float, retention_seconds: float, max_attempts: int = 3) -> None:
+        self.lease_seconds = lease_seconds
+        self.retention_seconds = retention_seconds
+        self.max_attempts = max_attempts
+
+        self._lock = threading.Lock()
+
+        self._connection = connect_sqlite(path)
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS summary_jobs (
+                id TEXT PRIMARY KEY,
+                total INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS summary_job_items (
+                job_id TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                url TEXT NOT NULL,
+                status TEXT NOT NULL,
+                claimed_at REAL,
+                result TEXT,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                worker_id TEXT,
+                PRIMARY KEY (job_id, position)
+            )
+            """
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS summary_job_items_status ON summary_job_items (status, claimed_at)")
+        self._add_columns()
+
+    def _add_columns(self) -> None:
+        """Adds the attempt counter and the lease holder to queues created before they existed."""
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            columns = {row[1] for row in self._connection.execute("PRAGMA table_info(summary_job_items)")}
+            if "attempts" not in columns:
+                self._connection.execute("ALTER TABLE summary_job_items ADD COLUMN attempts INTEGER NOT NULL DEFAULT 0")
+            if "worker_id" not in columns:
+                self._connection.execute("ALTER TABLE summary_job_items ADD COLUMN worker_id TEXT")
+            self._connection.execute("COMMIT")
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+
+    def create(self, urls: list[str]) -> SummaryJobDTO:
+        """
+        Enqueues a new job for the URLs and prunes expired finished jobs.
+        Args:
+            urls (list[str]): The URLs to summarize.
+        Returns:
+            SummaryJobDTO: The pending job.
+        """
+        job_id = uuid.uuid4().hex
+        now = time.time()
+
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                self._connection.execute("INSERT INTO summary_jobs VALUES (?, ?, ?, ?)", (job_id, len(urls), now, now))
+                self._connection.executemany(
+                    "INSERT INTO summary_job_items (job_id, position, url, status) VALUES (?, ?, ?, 'pending')",
+                    [(job_id, position, url) for position, url in enumerate(urls)],
+                )
+                self._prune(now)
+                self._connection.execute("COMMIT")
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+
+        return SummaryJobDTO(
+            id=job_id,
+            status="completed" if not urls else "pending",
+            total=len(urls),
+            created_at=self._to_datetime(now),
+            updated_at=self._to_datetime(now),
+        )
+
+    def claim(self, limit: int, worker_id: str) -> list[tuple[str, int, str]]:
+        """
+        Leases up to limit pending URLs (or URLs whose lease expired), oldest jobs first.
+        Expired URLs already claimed max_attempts times are recorded as failed instead.
+        Args:
+            limit (int): The maximum number of URLs to claim.
+            worker_id (str): The id of the worker taking the leases.
+        Returns:
+            list[tuple[str, int, str]]: The job id, position and URL of each claimed item.
+        """
+        now = time.time()
+
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                self._abandon_exhausted(now)
+                claimed = self._connection.execute(
+                    """
+                    UPDATE summary_job_items SET status = 'running', claimed_at = :now, attempts = attempts + 1, worker_id = :worker_id
+                    WHERE rowid IN (
+                        SELECT items.rowid FROM summary_job_items AS items
+                        JOIN summary_jobs AS jobs ON jobs.id = items.job_id
+                        WHERE items.status = 'pending' OR (items.status = 'running' AND items.claimed_at < :expired)
+                        ORDER BY jobs.created_at, items.position
+                        LIMIT :limit
+                    )
+                    RETURNING job_id, position, url
+                    """,
+                    {"now": now, "expired": now - self.lease_seconds, "limit": limit, "worker_id": worker_id},
+                ).fetchall()
+                self._connection.execute("COMMIT")
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+
+        return claimed
+
+    def renew(self, items: list[tuple[str, int, str]], worker_id: str) -> None:
+        """
+        Extends the lease of claimed URLs that are still being processed by the worker.
+        Args:
+            items (list[tuple[str, int, str]]): The job id, position and URL of each claimed item.
+            worker_id (str): The id of the worker holding the leases.
+        """
+        now = time.time()
+
+        with self._lock:
+            self._connection.executemany(
+                """
+                UPDATE summary_job_items SET claimed_at = ?
+                WHERE job_id = ? AND position = ? AND status = 'running' AND worker_id = ? AND claimed_at >= ?
+                """,
+                [(now, job_id, position, worker_id, now - self.lease_seconds) for job_id, position, _ in items],
+            )
+
+    def complete(self, job_id: str, results: list[tuple[int, ArticleSummaryResultDTO]], worker_id: str) -> int:
+        """
+        Records the results of claimed URLs of a job, skipping the URLs whose lease the worker lost.
+        Args:
+            job_id (str): The job id.
+            results (list[tuple[int, ArticleSummaryResultDTO]]): The position and result of each finished URL.
+            worker_id (str): The id of the worker holding the leases.
+        Returns:
+            int: The number of results recorded.
+        """
+        now = time.time()
+
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                recorded = self._connection.executemany(
+                    """
+                    UPDATE summary_job_items SET status = ?, result = ?
+                    WHERE job_id = ? AND position = ? AND status = 'running' AND worker_id = ? AND claimed_at >= ?
+                    """,
+                    [
+                        (result.status, result.model_dump_json(), job_id, position, worker_id, now - self.lease_seconds)
+                        for position, result in results
+                    ],
+                ).rowcount
+                if recorded:
+                    self._connection.execute("UPDATE summary_jobs SET updated_at = ? WHERE id = ?", (now, job_id))
+                self._connection.execute("COMMIT")
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+
+        if recorded < len(results):
+            logging.warning("Dropped %d results of summary job %s whose lease expired", len(results) - recorded, job_id)
+
+        return recorded
+
+    def get(self, job_id: str) -> Optional[SummaryJobDTO]:
+        """
+        Loads a job with the results of its finished URLs.
+        Args:
+            job_id (str): The job id.
+        Returns:
+            Optional[SummaryJobDTO]: The job, or None if it does not exist.
+        """
+        with self._lock:
+            job = self._connection.execute(
+                "SELECT total, created_at, updated_at FROM summary_jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+            if job is None:
+                return None
+
+            counts = dict(self._connection.execute(
+                "SELECT status, COUNT(*) FROM summary_job_items WHERE job_id = ? GROUP BY status", (job_id,)
+            ).fetchall())
+            rows = self._connection.execute(
+                "SELECT result FROM summary_job_items WHERE job_id = ? AND result IS NOT NULL ORDER BY position", (job_id,)
+            ).fetchall()
+
+        total, created_at, updated_at = job
+        succeeded, failed = counts.get("ok", 0), counts.get("error", 0)
+
+        if succeeded + failed == total:
+            status = "completed"
+        elif succeeded + failed or counts.get("running"):
+            status = "running"
+        else:
+            status = "pending"
+
+        return SummaryJobDTO(
+            id=job_id,
+            status=status,
+            total=total,
+            succeeded=succeeded,
+            failed=failed,
+            created_at=self._to_datetime(created_at),
+            updated_at=self._to_datetime(updated_at),
+            results=[ArticleSummaryResultDTO.model_validate_json(row[0]) for row in rows],
+        )
+
+    def close(self) -> None:
+        """Closes the underlying SQLite connection."""
+        with self._lock:
+            self._connection.close()
+
+    def _abandon_exhausted(self, now: float) -> None:
+        """
+        Records the URLs whose lease expired on their last attempt as failed.
+        Must be called under the lock, inside a transaction.
+        """
+        rows = self._connection.execute(
+            "SELECT job_id, position, url FROM summary_job_items WHERE status = 'running' AND claimed_at < ? AND attempts >= ?",
+            (now - self.lease_seconds, self.max_attempts),
+        ).fetchall()
+        if not rows:
+            return
+
+        logging.warning("Giving up on %d queued URLs not finished after %d attempts", len(rows), self.max_attempts)
+
+        error = f"Gave up after {self.max_attempts} attempts that did not finish."
+        self._connection.executemany(
+            "UPDATE summary_job_items SET status = 'error', result = ? WHERE job_id = ? AND position = ?",
+            [(ArticleSummaryResultDTO(url=url, status="error", error=error).model_dump_json(), job_id, position) for job_id, position, url in rows],
+        )
+        self._connection.executemany(
+            "UPDATE summary_jobs SET updated_at = ? WHERE id = ?", [(now, job_id) for job_id in {row[0] for row in rows}]
+        )
+
+    def _prune(self, now: float) -> None:
+        """
+        Removes jobs that finished more than the retention period ago.
+        Must be called under the lock, inside a transaction.
+        """
+        expired = """
+            SELECT id FROM summary_jobs WHERE updated_at < ? AND NOT EXISTS (
+                SELECT 1 FROM summary_job_items WHERE job_id = summary_jobs.id AND status IN ('pending', 'running')
+            )
+        """
+        cutoff = (now - self.retention_seconds,)
+        self._connection.execute(f"DELETE FROM summary_job_items WHERE job_id IN ({expired})", cutoff)
+        self._connection.execute(f"DELETE FROM summary_jobs WHERE id IN ({expired})", cutoff)
+
+    @staticmethod
+    def _to_datetime(timestamp: float) -> datetime:
+        return datetime.fromtimestamp(timestamp, tz=timezone.utc)
@@ -0,0 +1,45 @@
+import fcntl
+import os
+from typing import Optional
+
+from application.exceptions.store_locked_error import StoreLockedError
+
+class StoreDirectoryLock():
+    """
+    Advisory lock file in an article store directory.
+    The API server workers hold it shared, so they can run side by side, while the bulk ingestion
+    CLI holds it exclusively, so an ingestion of a whole dump never competes with a live server for
+    the write locks of the store databases, the embedding model and the LLM rate limits.
+    Other lock files in the directory serialize other work, such as the embedding migration, which
+    exactly one API server worker runs. The operating system releases the lock when the process exits.
+    """
+    def __init__(self, directory: str, file_name: str = ".lock") -> None:
+        self.directory = directory
+        self.path = os.path.join(directory, file_name)
+        self._file: Optional[int] = None
+
+    def acquire(self, exclusive: bool = False) -> None:
+        """
+        Takes the lock without waiting.
+        Args:
+            exclusive (bool): Whether to take it exclusively, as the bulk ingestion does.
+        Raises:
+            StoreLockedError: If another process holds the lock in a conflicting mode.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        descriptor = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+
+        try:
+            fcntl.flock(descriptor, (fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH) | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(descriptor)
+            raise StoreLockedError(self.directory, exclusive) from None
+
+        self._file = descriptor
+
+    def release(self) -> None:
+        """Releases the lock, if held."""
+        if self._file is not None:
+            fcntl.flock(self._file, fcntl.LOCK_UN)
+            os.close(self._file)
+            self._file = None
@@ -0,0 +1,265 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+
+from abstractions.resources import AppResources
+from application.exceptions.service_not_ready_error import ServiceNotReadyError
+from abstractions.dependencies import (
+    get_resources, get_embeddings, get_article_store, get_chroma, get_embedder, get_llm, get_articles_provider, get_articles_repo,
+)
+from repositories.chroma_articles_repo import ChromaArticlesRepo
+from repositories.bm25_index import Bm25Index
+
+
+def make_resources(**kwargs) -> AppResources:
+    embeddings = MagicMock()
+    chroma = MagicMock()
+    chroma._collection.get.return_value = {"ids": [], "metadatas": []}
+    llm = MagicMock()
+    llm.root_async_client.close = AsyncMock()
+    articles_provider = MagicMock()
+    articles_provider.close_async = AsyncMock()
+    return AppResources(embeddings, chroma, llm, articles_provider, **kwargs)
+
+
+@pytest.fixture
+def resources():
+    return make_resources()
+
+
+def test_build_creates_each_resource_once():
+    # Arrange
+    with patch("langchain_huggingface.HuggingFaceEmbeddings") as embeddings_cls, \
+         patch("langchain_chroma.Chroma") as chroma_cls, \
+         patch("chromadb.PersistentClient"), \
+         patch("langchain_openai.AzureChatOpenAI") as llm_cls, \
+         patch("application.services.web_scraping_articles_provider.WebScrapingArticlesProvider") as provider_cls, \
+         patch("abstractions.resources.SqliteScrapeCache"), \
+         patch("repositories.sqlite_llm_cache.SqliteLLMCache"), \
+         patch("repositories.sqlite_content_store.SqliteContentStore"), \
+         patch("abstractions.resources.SqliteSummaryJobStore"), \
+         patch("abstractions.resources.StoreDirectoryLock") as lock_cls, \
+         patch("application.utils.tokenizer.Tokenizer"), \
+         patch("abstractions.resources.ProcessPoolExecutor"):
+        # Act
+        resources = AppResources.build()
+
+    # Assert
+    embeddings_cls.assert_called_once()
+    chroma_cls.assert_called_once()
+    llm_cls.assert_called_once()
+    provider_cls.assert_called_once()
+    assert chroma_cls.call_args.kwargs["embedding_function"] == resources.embeddings
+    lock_cls.return_value.acquire.assert_called_once_with(exclusive=False)
+
+
+def test_build_releases_the_store_lock_when_it_fails(monkeypatch, tmp_path):
+    # Arrange
+    from config.settings import settings
+    from repositories.store_directory_lock import StoreDirectoryLock
+    monkeypatch.setattr(settings, "CHROMA_PERSIST_DIRECTORY", str(tmp_path))
+    monkeypatch.setattr(settings, "FAISS_PERSIST_DIRECTORY", str(tmp_path))
+
+    with patch.object(AppResources, "_build_embeddings", side_effect=OSError("model not found")):
+        # Act
+        with pytest.raises(OSError):
+            AppResources.build(exclusive_store=True)
+
+    # Assert
+    lock = StoreDirectoryLock(str(tmp_path))
+    lock.acquire(exclusive=True)
+    lock.release()
+
+
+def test_dependencies_return_shared_resources(resources):
+    # Arrange
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(resources=resources)))
+
+    # Act
+    shared = get_resources(request)
+
+    # Assert
+    assert get_embeddings(shared) is resources.embeddings
+    store = get_article_store(shared)
+    assert get_chroma(store) is resources.chroma
+    assert get_embedder(store) is resources.embedder
+    assert get_articles_repo(store) is resources.store.articles_repo
+    assert get_llm(shared) is resources.llm
+    assert get_articles_provider(shared) is resources.articles_provider
+
+
+def test_get_resources_raises_until_resources_are_loaded():
+    # Arrange
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(resources=None)))
+
+    # Act & Assert
+    with pytest.raises(ServiceNotReadyError):
+        get_resources(request)
+
+
+def test_store_uses_the_faiss_repo_when_there_is_one():
+    # Arrange
+    faiss_articles_repo = MagicMock()
+
+    # Act
+    chroma_resources = make_resources()
+    faiss_resources = make_resources(faiss_articles_repo=faiss_articles_repo)
+
+    # Assert
+    assert isinstance(chroma_resources.store.articles_repo, ChromaArticlesRepo)
+    assert faiss_resources.store.articles_repo is faiss_articles_repo
+
+
+@pytest.mark.asyncio
+async def test_warm_up_async_embeds_query(resources):
+    # Act
+    await resources.warm_up_async()
+
+    # Assert
+    resources.embeddings.embed_query.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_async_builds_missing_lexical_index():
+    # Arrange
+    resources = make_resources(faiss_articles_repo=MagicMock(), lexical_index=Bm25Index())
+    resources.faiss_articles_repo.iter_page_contents.return_value = iter([
+        [("a", "Headline: Floods in Valencia")],
+        [("b", "Headline: Nvidia shares rally")],
+    ])
+
+    # Act
+    await resources.warm_up_async()
+
+    # Assert
+    assert len(resources.lexical_index) == 2
+    assert resources.lexical_index.search("nvidia", k=1)[0][0] == "b"
+
+
+@pytest.mark.asyncio
+async def test_close_async_releases_clients(resources):
+    # Act
+    await resources.close_async()
+
+    # Assert
+    resources.articles_provider.close_async.assert_awaited_once()
+    resources.llm.root_async_client.close.assert_awaited_once()
+    resources.chroma._client.clear_system_cache.assert_called_once()
+
+
+@pytest.fixture
+def migrator(tmp_path):
+    import chromadb
+    from repositories.chroma_collection_migrator import ChromaCollectionMigrator
+
+    client = chromadb.PersistentClient(path=str(tmp_path / "chroma"))
+    client.create_collection("articles").upsert(ids=["a"], embeddings=[[1.0, 0.0]], documents=["Headline: A"])
+    return ChromaCollectionMigrator(client, "articles")
+
+
+def test_open_collection_stamps_legacy_collections_of_the_configured_dimension(migrator):
+    # Arrange
+    embeddings = MagicMock()
+    embeddings.embed_query.return_value = [0.5, 0.5]
+
+    # Act
+    live_embeddings = AppResources._open_collection(migrator, embeddings)
+
+    # Assert
+    assert live_embeddings is embeddings
+    assert migrator.signature() == AppResources._configured_signature()
+
+
+def test_open_collection_marks_legacy_collections_of_another_dimension_unknown(migrator):
+    # Arrange
+    embeddings = MagicMock()
+    embeddings.embed_query.return_value = [0.5, 0.5, 0.5]
+
+    # Act
+    live_embeddings = AppResources._open_collection(migrator, embeddings)
+
+    # Assert
+    assert live_embeddings is embeddings
+    assert migrator.signature().model == "unknown"
+
+
+def test_open_collection_loads_the_stored_model_to_serve_queries_until_migrated(migrator):
+    # Arrange
+    from domain.embedding_signature import EmbeddingSignature
+    migrator.stamp(EmbeddingSignature(model="previous-model"))
+
+    with patch("langchain_huggingface.HuggingFaceEmbeddings") as embeddings_cls:
+        # Act
+        live_embeddings = AppResources._open_collection(migrator, MagicMock())
+
+    # Assert
+    embeddings_cls.assert_called_once_with(model_name="previous-model")
+    assert live_embeddings is embeddings_cls.return_value
+
+
+def test_swap_to_migrated_collection_replaces_the_whole_store_then_calls_back():
+    # Arrange
+    old_embedder = MagicMock()
+    resources = make_resources(embedder=old_embedder)
+    old_store = resources.store
+    old_chroma = resources.chroma
+    callback = MagicMock()
+    resources.on_swap.append(callback)
+
+    with patch("langchain_chroma.Chroma") as chroma_cls:
+        # Act
+        resources._swap_to_migrated_collection()
+
+    # Assert
+    assert chroma_cls.call_args.kwargs["client"] is old_chroma._client
+    assert chroma_cls.call_args.kwargs["embedding_function"] is resources.embeddings
+    assert resources.chroma is chroma_cls.return_value
+    assert resources.embedder.embeddings is resources.embeddings
+    assert resources.embedder.executor is old_embedder.executor
+    assert resources.store.articles_repo.vector_store is resources.chroma
+    assert resources.store.articles_repo.embedder is resources.embedder
+    assert old_store.chroma is old_chroma and old_store.embedder is old_embedder
+    callback.assert_called_once()
+
+
+@pytest.mark.parametrize("agreement, uses_onnx", [(0.999, True), (0.9, False)])
+def test_build_embeddings_uses_onnx_only_within_the_cosine_tolerance(monkeypatch, agreement, uses_onnx):
+    # Arrange
+    from config.settings import settings
+    monkeypatch.setattr(settings, "EMBEDDING_BACKEND", "onnx")
+    monkeypatch.setattr(settings, "EMBEDDING_ONNX_MIN_COSINE", 0.99)
+
+    with patch("application.services.onnx_embeddings.OnnxEmbeddings") as onnx_cls, \
+         patch("application.services.onnx_embeddings.embedding_agreement", return_value=agreement), \
+         patch("langchain_huggingface.HuggingFaceEmbeddings") as reference_cls:
+        # Act
+        embeddings = AppResources._build_embeddings("model")
+
+    # Assert
+    assert embeddings is (onnx_cls.return_value if uses_onnx else reference_cls.return_value)
+
+
+def test_build_embeddings_falls_back_to_pytorch_when_the_onnx_model_fails_to_load(monkeypatch):
+    # Arrange
+    from config.settings import settings
+    monkeypatch.setattr(settings, "EMBEDDING_BACKEND", "onnx")
+
+    with patch("application.services.onnx_embeddings.OnnxEmbeddings", side_effect=FileNotFoundError("onnx/model.onnx")), \
+         patch("langchain_huggingface.HuggingFaceEmbeddings") as reference_cls:
+        # Act
+        embeddings = AppResources._build_embeddings("model")
+
+    # Assert
+    assert embeddings is reference_cls.return_value
+
+
+def test_cursor_secret_is_created_once_and_shared(tmp_path):
+    # Act
+    first = AppResources._load_cursor_secret(str(tmp_path))
+    second = AppResources._load_cursor_secret(str(tmp_path))
+
+    # Assert
+    assert len(first) == 32
+    assert second == first
+    assert (tmp_path / ".cursor_secret").stat().st_mode & 0o777 == 0o600
+    assert [path.name for path in tmp_path.iterdir()] == [".cursor_secret"]
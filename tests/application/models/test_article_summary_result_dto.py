@@ -0,0 +1,50 @@
+import httpx
+from openai import ContentFilterFinishReasonError
+from tenacity import RetryError, Future
+
+from application.models.article_summary_result_dto import ArticleSummaryResultDTO
+from application.exceptions.no_content_error import NoContentError
+from domain.article_enriched import ArticleEnriched
+
+
+def test_from_article_builds_ok_result():
+    # Arrange
+    article = ArticleEnriched(headline="Title", content="Content", summary="Summary", topics=["world"])
+
+    # Act
+    result = ArticleSummaryResultDTO.from_article("https://example.com/a", article)
+
+    # Assert
+    assert result.status == "ok"
+    assert result.article.summary == "Summary"
+    assert result.error is None
+
+
+def test_from_error_describes_http_errors():
+    # Arrange
+    request = httpx.Request("GET", "https://example.com/missing")
+    exc = httpx.HTTPStatusError("Not Found", request=request, response=httpx.Response(404, request=request))
+
+    # Act
+    result = ArticleSummaryResultDTO.from_error("https://example.com/missing", exc)
+
+    # Assert
+    assert result.status == "error"
+    assert result.article is None
+    assert result.error == "HTTP error occurred: 404 - Not Found"
+
+
+def test_from_error_describes_no_content_and_content_filter_errors():
+    # Arrange
+    attempt = Future(attempt_number=1)
+    attempt.set_exception(ContentFilterFinishReasonError())
+
+    # Act
+    no_content = ArticleSummaryResultDTO.from_error("https://example.com/a", NoContentError("https://example.com/a"))
+    blocked = ArticleSummaryResultDTO.from_error("https://example.com/b", RetryError(attempt))
+    unexpected = ArticleSummaryResultDTO.from_error("https://example.com/c", RuntimeError("secret details"))
+
+    # Assert
+    assert no_content.error == str(NoContentError("https://example.com/a"))
+    assert blocked.error == "The content was blocked due to violating safety filters."
+    assert unexpected.error == "An unexpected error occurred."
@@ -0,0 +1,60 @@
+import pytest
+
+from application.services.article_extractors import (
+    BeautifulSoupExtractor, SelectolaxExtractor, build_article_extractor
+)
+
+ARTICLE_HTML = """
+<html>
+<head><title> Test Title </title></head>
+<body>
+<nav><p>Menu</p></nav>
+<article>
+    <h1>Heading</h1>
+    <p>First paragraph.</p>
+    <p>Second paragraph.</p>
+</article>
+</body>
+</html>
+"""
+
+NO_TITLE_HTML = "<html><body><h1>Only Heading</h1><p>One.</p><p>Two.</p></body></html>"
+
+BACKENDS = ["html.parser", "lxml", "selectolax"]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_extract_reads_title_and_article_body(backend):
+    # Arrange
+    extractor = build_article_extractor(backend)
+
+    # Act
+    result = extractor.extract(ARTICLE_HTML)
+
+    # Assert
+    assert result == {"headline": "Test Title", "content": "Heading\nFirst paragraph.\nSecond paragraph."}
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_extract_falls_back_to_h1_and_paragraphs(backend):
+    # Arrange
+    extractor = build_article_extractor(backend)
+
+    # Act
+    result = extractor.extract(NO_TITLE_HTML)
+
+    # Assert
+    assert result == {"headline": "Only Heading", "content": "One.\nTwo."}
+
+
+def test_build_article_extractor_returns_expected_types():
+    # Act & Assert
+    assert isinstance(build_article_extractor("html.parser"), BeautifulSoupExtractor)
+    assert build_article_extractor("lxml").parser == "lxml"
+    assert isinstance(build_article_extractor("selectolax"), SelectolaxExtractor)
+
+
+def test_build_article_extractor_rejects_unknown_backend():
+    # Act & Assert
+    with pytest.raises(ValueError):
+        build_article_extractor("regex")
@@ -1,11 +1,45 @@
+import json
 import pytest
+from typing import Any, Optional
 from unittest.mock import AsyncMock, MagicMock
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.runnables import RunnablePassthrough
 
 from application.services.azure_ai_summarizer import AzureAISummarizer
 from application.exceptions.token_limit_exceeded_error import TokenLimitExceededError
+from application.utils.metrics import SUMMARY_CHUNKS, SUMMARY_NODE_SECONDS
+from application.utils.request_context import request_context
+from application.utils.tokenizer import Tokenizer, TokenizerTextSplitter
+from config.prompts import build_summary_prompt, build_chunk_summary_prompt
 from domain.article_enriched import ArticleEnriched
 
 
+class FakeSummaryChatModel(BaseChatModel):
+    """Fake chat model that answers chunk prompts with a fixed-size summary and final prompts with a JSON article."""
+    summary_tokens: int = 100
+    chunk_calls: int = 0
+    final_calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-summary"
+
+    def _generate(self, messages: list[BaseMessage], stop: Optional[list[str]] = None, run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        if "chunks of news article" in messages[0].content:
+            self.chunk_calls += 1
+            content = "s" * self.summary_tokens
+        else:
+            self.final_calls += 1
+            content = json.dumps({"summary": "Summary", "topics": ["news"], "political_bias": "None"})
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=content))])
+
+    def with_structured_output(self, schema, **kwargs):
+        return self | PydanticOutputParser(pydantic_object=schema)
+
+
 @pytest.fixture
 def mock_llm():
     llm = MagicMock()
@@ -81,7 +115,7 @@ async def test_summarize_async_multiple_chunks(summarizer):
 
 
 @pytest.mark.asyncio
-async def test_summarize_async_handles_token_limit_exceeded(summarizer):
+async def test_summarize_async_returns_token_limit_exceeded(summarizer):
     # Arrange
     summarizer.text_splitter.split_text = MagicMock(return_value=["chunk1", "chunk2"])
 
@@ -95,10 +129,11 @@ async def test_summarize_async_handles_token_limit_exceeded(summarizer):
 
     articles = [{"headline": "Retry Me", "content": "chunk1\n\nchunk2"}]
 
-    # Act & Assert
-    with pytest.raises(TokenLimitExceededError):
-        await summarizer.summarize_async(articles)
+    # Act
+    result = await summarizer.summarize_async(articles)
 
+    # Assert
+    assert isinstance(result[0], TokenLimitExceededError)
     assert mock_summary_chain.ainvoke.call_count == 1 
 
 
@@ -128,3 +163,119 @@ async def test_summarize_async_multiple_articles(summarizer):
     assert len(result) == 2
     assert result[0].headline == "H1"
     assert result[1].headline == "H2"
+
+
+@pytest.fixture
+def byte_tokenizer(byte_encoding):
+    return Tokenizer("unused", encoding=byte_encoding)
+
+def build_collapsing_summarizer(llm, tokenizer, collapse_token_limit=250, short_article_tokens=50, max_collapse_depth=5):
+    return AzureAISummarizer(
+        llm=llm,
+        summary_prompt=build_summary_prompt(),
+        chunk_summary_prompt=build_chunk_summary_prompt(),
+        token_text_splitter=TokenizerTextSplitter(tokenizer, chunk_size=100, chunk_overlap=0),
+        token_limit_validator=RunnablePassthrough(),
+        tokenizer=tokenizer,
+        collapse_token_limit=collapse_token_limit,
+        short_article_tokens=short_article_tokens,
+        max_collapse_depth=max_collapse_depth,
+    )
+
+
+@pytest.mark.asyncio
+async def test_graph_collapses_chunk_summaries_level_by_level(byte_tokenizer):
+    # Arrange
+    llm = FakeSummaryChatModel()
+    summarizer = build_collapsing_summarizer(llm, byte_tokenizer)
+    content = "a" * 1600  # 16 chunks of 100 tokens, each summarized into 100 tokens
+
+    # Act
+    state = await summarizer.graph.ainvoke({"headline": "Long", "content": content})
+
+    # Assert
+    assert len(state["chunks"]) == 16
+    assert state["collapse_depth"] == 3  # 16 -> 8 -> 4 -> 2 summaries
+    assert len(state["chunk_summaries"]) == 2
+    assert llm.chunk_calls == 16 + 8 + 4 + 2
+    assert llm.final_calls == 1
+    assert state["article_enriched"].content == content
+
+
+@pytest.mark.asyncio
+async def test_graph_does_not_collapse_summaries_that_fit(byte_tokenizer):
+    # Arrange
+    llm = FakeSummaryChatModel()
+    summarizer = build_collapsing_summarizer(llm, byte_tokenizer, collapse_token_limit=10_000)
+
+    # Act
+    state = await summarizer.graph.ainvoke({"headline": "Long", "content": "a" * 1600})
+
+    # Assert
+    assert state["collapse_depth"] == 0
+    assert llm.chunk_calls == 16
+    assert llm.final_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_graph_stops_collapsing_at_max_depth(byte_tokenizer):
+    # Arrange
+    llm = FakeSummaryChatModel()
+    summarizer = build_collapsing_summarizer(llm, byte_tokenizer, collapse_token_limit=10, max_collapse_depth=1)
+
+    # Act
+    state = await summarizer.graph.ainvoke({"headline": "Long", "content": "a" * 1600})
+
+    # Assert
+    assert state["collapse_depth"] == 1
+    assert llm.chunk_calls == 16 + 8
+    assert llm.final_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_graph_short_circuits_tiny_articles(byte_tokenizer):
+    # Arrange
+    llm = FakeSummaryChatModel()
+    summarizer = build_collapsing_summarizer(llm, byte_tokenizer)
+
+    # Act
+    result = await summarizer.summarize_async([{"headline": "Brief", "content": "A short news brief."}])
+
+    # Assert
+    assert result[0].content == "A short news brief."
+    assert llm.chunk_calls == 0
+    assert llm.final_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_graph_does_not_count_tokens_of_long_articles(byte_tokenizer):
+    # Arrange
+    llm = FakeSummaryChatModel()
+    summarizer = build_collapsing_summarizer(llm, byte_tokenizer, collapse_token_limit=10_000)
+    byte_tokenizer.count = MagicMock(wraps=byte_tokenizer.count)
+
+    # Act
+    state = await summarizer.graph.ainvoke({"headline": "Long", "content": "a" * 1600})
+
+    # Assert
+    byte_tokenizer.count.assert_not_called()
+    assert len(state["chunks"]) == 16
+
+
+@pytest.mark.asyncio
+async def test_graph_records_node_timings_and_chunk_count(summarizer):
+    # Arrange
+    summarizer.text_splitter.split_text = MagicMock(return_value=["chunk1", "chunk2", "chunk3"])
+    summarizer.chunk_chain = MagicMock(abatch=AsyncMock(return_value=["summary1", "summary2", "summary3"]))
+    summarizer.summary_chain = MagicMock(ainvoke=AsyncMock(return_value=MagicMock(spec=ArticleEnriched)))
+    chunk_observations = SUMMARY_CHUNKS.count()
+    final_observations = SUMMARY_NODE_SECONDS.count(node="summarize_final")
+
+    # Act
+    with request_context("request-1") as timings:
+        await summarizer.summarize_async([{"headline": "Title", "content": "chunk1\n\nchunk2\n\nchunk3"}])
+
+    # Assert
+    assert SUMMARY_CHUNKS.count() == chunk_observations + 1
+    assert SUMMARY_NODE_SECONDS.count(node="summarize_final") == final_observations + 1
+    assert {"summary_split", "summary_summarize_chunks", "summary_summarize_final"} <= set(timings)
@@ -0,0 +1,70 @@
+import threading
+import numpy as np
+import pytest
+from unittest.mock import MagicMock
+
+from application.services.batch_embedder import BatchEmbedder
+
+
+@pytest.fixture
+def embeddings():
+    embeddings = MagicMock()
+    embeddings.embed_documents.side_effect = lambda texts: [[3.0, 4.0] for _ in texts]
+    return embeddings
+
+
+@pytest.mark.asyncio
+async def test_iter_batches_async_embeds_in_fixed_size_batches(embeddings):
+    # Arrange
+    embedder = BatchEmbedder(embeddings, batch_size=2)
+    texts = ["a", "b", "c", "d", "e"]
+
+    # Act
+    batches = [(start, vectors) async for start, vectors in embedder.iter_batches_async(texts)]
+
+    # Assert
+    assert [start for start, _ in batches] == [0, 2, 4]
+    assert [len(vectors) for _, vectors in batches] == [2, 2, 1]
+    assert [call.args[0] for call in embeddings.embed_documents.call_args_list] == [["a", "b"], ["c", "d"], ["e"]]
+
+
+@pytest.mark.asyncio
+async def test_embed_batch_async_runs_off_the_event_loop(embeddings):
+    # Arrange
+    threads = []
+    embeddings.embed_documents.side_effect = lambda texts: threads.append(threading.current_thread()) or [[1.0]]
+    embedder = BatchEmbedder(embeddings)
+
+    # Act
+    await embedder.embed_batch_async(["a"])
+
+    # Assert
+    assert threads[0] is not threading.main_thread()
+
+
+@pytest.mark.asyncio
+async def test_embed_batch_async_returns_normalized_float32_array(embeddings):
+    # Arrange
+    embedder = BatchEmbedder(embeddings, normalize=True)
+
+    # Act
+    vectors = await embedder.embed_batch_async(["a", "b"])
+
+    # Assert
+    assert vectors.dtype == np.float32
+    np.testing.assert_allclose(vectors, [[0.6, 0.8], [0.6, 0.8]], rtol=1e-6)
+
+
+@pytest.mark.asyncio
+async def test_embed_query_async_normalizes_like_documents(embeddings):
+    # Arrange
+    embeddings.embed_query.return_value = [3.0, 4.0]
+    embedder = BatchEmbedder(embeddings, normalize=True)
+
+    # Act
+    vector = await embedder.embed_query_async("query")
+
+    # Assert
+    assert vector.dtype == np.float32
+    np.testing.assert_allclose(vector, [0.6, 0.8], rtol=1e-6)
+    assert await BatchEmbedder(embeddings).embed_query_async("query") == [3.0, 4.0]
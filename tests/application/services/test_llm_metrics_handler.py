@@ -0,0 +1,43 @@
+from uuid import uuid4
+from langchain_core.outputs import LLMResult
+
+from application.services.llm_metrics_handler import LlmMetricsHandler
+from application.utils.metrics import LLM_REQUEST_SECONDS, LLM_TOKENS_TOTAL
+
+
+def test_counts_tokens_and_latency_of_service_calls():
+    # Arrange
+    handler = LlmMetricsHandler()
+    run_id = uuid4()
+    prompt_tokens = LLM_TOKENS_TOTAL.value(kind="prompt")
+    completion_tokens = LLM_TOKENS_TOTAL.value(kind="completion")
+    calls = LLM_REQUEST_SECONDS.count(outcome="ok")
+
+    # Act
+    handler.on_chat_model_start({}, [], run_id=run_id)
+    handler.on_llm_end(
+        LLMResult(generations=[], llm_output={"token_usage": {"prompt_tokens": 120, "completion_tokens": 30}}), run_id=run_id
+    )
+
+    # Assert
+    assert LLM_TOKENS_TOTAL.value(kind="prompt") == prompt_tokens + 120
+    assert LLM_TOKENS_TOTAL.value(kind="completion") == completion_tokens + 30
+    assert LLM_REQUEST_SECONDS.count(outcome="ok") == calls + 1
+
+
+def test_cached_and_failed_calls_are_counted_by_outcome():
+    # Arrange
+    handler = LlmMetricsHandler()
+    cached_run, failed_run = uuid4(), uuid4()
+    cached = LLM_REQUEST_SECONDS.count(outcome="cached")
+    failed = LLM_REQUEST_SECONDS.count(outcome="error")
+
+    # Act
+    handler.on_chat_model_start({}, [], run_id=cached_run)
+    handler.on_llm_end(LLMResult(generations=[]), run_id=cached_run)
+    handler.on_chat_model_start({}, [], run_id=failed_run)
+    handler.on_llm_error(RuntimeError("boom"), run_id=failed_run)
+
+    # Assert
+    assert LLM_REQUEST_SECONDS.count(outcome="cached") == cached + 1
+    assert LLM_REQUEST_SECONDS.count(outcome="error") == failed + 1
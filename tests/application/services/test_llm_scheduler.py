@@ -0,0 +1,262 @@
+import asyncio
+import time
+import httpx
+import pytest
+from unittest.mock import AsyncMock
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.output_parsers import StrOutputParser
+from openai import APIConnectionError, InternalServerError, RateLimitError
+
+from application.services.llm_scheduler import LlmScheduler, LlmPriority, ScheduledRunnable, retry_after_seconds
+from repositories.sqlite_llm_cache import SqliteLLMCache
+
+
+def rate_limit_error(headers: dict[str, str]) -> RateLimitError:
+    request = httpx.Request("POST", "https://example.openai.azure.com/chat/completions")
+    return RateLimitError("Too Many Requests", response=httpx.Response(429, headers=headers, request=request), body=None)
+
+
+def server_error() -> InternalServerError:
+    request = httpx.Request("POST", "https://example.openai.azure.com/chat/completions")
+    return InternalServerError("Bad Gateway", response=httpx.Response(502, request=request), body=None)
+
+
+def make_scheduler(**kwargs) -> LlmScheduler:
+    options = {"requests_per_minute": 60_000, "tokens_per_minute": 10_000_000, "max_concurrency": 4}
+    return LlmScheduler(**{**options, **kwargs})
+
+
+@pytest.mark.asyncio
+async def test_interactive_calls_are_served_before_queued_chunk_summaries():
+    # Arrange
+    scheduler = make_scheduler(max_concurrency=1)
+    await scheduler.acquire(10, LlmPriority.CHUNK_SUMMARY)
+    order = []
+
+    async def call(name, priority):
+        await scheduler.acquire(10, priority)
+        order.append(name)
+        await scheduler.release()
+
+    chunk = asyncio.create_task(call("chunk", LlmPriority.CHUNK_SUMMARY))
+    await asyncio.sleep(0.01)
+    interactive = asyncio.create_task(call("interactive", LlmPriority.INTERACTIVE))
+    await asyncio.sleep(0.01)
+
+    # Act
+    await scheduler.release()
+    await asyncio.gather(chunk, interactive)
+
+    # Assert
+    assert order == ["interactive", "chunk"]
+
+
+@pytest.mark.asyncio
+async def test_token_budget_delays_calls_until_refilled():
+    # Arrange
+    scheduler = make_scheduler(tokens_per_minute=6_000)  # 100 tokens/s, 1000 token burst
+    await scheduler.acquire(1_000, LlmPriority.SUMMARY)
+    await scheduler.release()
+
+    # Act
+    start = time.perf_counter()
+    await scheduler.acquire(20, LlmPriority.SUMMARY)
+    elapsed = time.perf_counter() - start
+
+    # Assert
+    assert elapsed >= 0.15
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_halved_on_rate_limit_and_grows_back_on_success():
+    # Arrange
+    scheduler = make_scheduler(max_concurrency=8)
+
+    # Act
+    await scheduler.acquire(1, LlmPriority.SUMMARY)
+    await scheduler.release(retry_after=0.05, rate_limited=True)
+    reduced = scheduler.concurrency_limit
+    for _ in range(8):
+        await scheduler.acquire(1, LlmPriority.SUMMARY)
+        await scheduler.release()
+
+    # Assert
+    assert reduced == 4
+    assert 5 <= scheduler.concurrency_limit <= 8
+    assert scheduler.stats()["rate_limited"] == 1
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_pauses_calls_for_retry_after():
+    # Arrange
+    scheduler = make_scheduler()
+    await scheduler.acquire(1, LlmPriority.SUMMARY)
+    await scheduler.release(retry_after=0.2, rate_limited=True)
+
+    # Act
+    start = time.perf_counter()
+    await scheduler.acquire(1, LlmPriority.INTERACTIVE)
+    elapsed = time.perf_counter() - start
+
+    # Assert
+    assert elapsed >= 0.15
+
+
+@pytest.mark.asyncio
+async def test_scheduled_runnable_retries_rate_limited_calls():
+    # Arrange
+    scheduler = make_scheduler()
+    runnable = AsyncMock()
+    runnable.ainvoke = AsyncMock(side_effect=[rate_limit_error({"retry-after-ms": "10"}), "result"])
+    scheduled = ScheduledRunnable(runnable, scheduler, token_counter=lambda _: 100, priority=LlmPriority.INTERACTIVE)
+
+    # Act
+    result = await scheduled.ainvoke("prompt")
+
+    # Assert
+    assert result == "result"
+    assert runnable.ainvoke.await_count == 2
+    assert scheduler.in_flight == 0
+    assert scheduler.rate_limited == 1
+
+
+@pytest.mark.asyncio
+async def test_scheduled_runnable_gives_up_after_max_retries():
+    # Arrange
+    scheduler = make_scheduler()
+    runnable = AsyncMock()
+    runnable.ainvoke = AsyncMock(side_effect=rate_limit_error({"retry-after-ms": "1"}))
+    scheduled = ScheduledRunnable(runnable, scheduler, lambda _: 1, LlmPriority.SUMMARY, max_rate_limit_retries=2)
+
+    # Act & Assert
+    with pytest.raises(RateLimitError):
+        await scheduled.ainvoke("prompt")
+
+    assert runnable.ainvoke.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_scheduled_runnable_retries_transient_errors_with_backoff_outside_the_slot():
+    # Arrange
+    scheduler = make_scheduler()
+    in_flight_during_backoff = []
+    request = httpx.Request("POST", "https://example.openai.azure.com/chat/completions")
+    runnable = AsyncMock()
+    runnable.ainvoke = AsyncMock(side_effect=[APIConnectionError(request=request), server_error(), "result"])
+    scheduled = ScheduledRunnable(runnable, scheduler, lambda _: 1, LlmPriority.SUMMARY, backoff_seconds=0.01)
+    sleep = asyncio.sleep
+
+    async def recording_sleep(delay):
+        in_flight_during_backoff.append((delay, scheduler.in_flight))
+        await sleep(0)
+
+    # Act
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr("application.services.llm_scheduler.asyncio.sleep", recording_sleep)
+        result = await scheduled.ainvoke("prompt")
+
+    # Assert
+    assert result == "result"
+    assert in_flight_during_backoff == [(0.01, 0), (0.02, 0)]
+    assert scheduler.rate_limited == 0
+
+
+@pytest.mark.asyncio
+async def test_scheduled_runnable_gives_up_after_max_transient_retries():
+    # Arrange
+    scheduler = make_scheduler()
+    runnable = AsyncMock()
+    runnable.ainvoke = AsyncMock(side_effect=server_error())
+    scheduled = ScheduledRunnable(
+        runnable, scheduler, lambda _: 1, LlmPriority.SUMMARY, max_transient_retries=1, backoff_seconds=0
+    )
+
+    # Act & Assert
+    with pytest.raises(InternalServerError):
+        await scheduled.ainvoke("prompt")
+
+    assert runnable.ainvoke.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_scheduled_runnable_answers_cache_hits_without_a_slot(tmp_path):
+    # Arrange
+    cache = SqliteLLMCache(path=str(tmp_path / "llm_cache.sqlite3"), ttl_seconds=60, max_entries=100)
+    llm = FakeListChatModel(responses=["first", "second"], cache=cache)
+    scheduler = make_scheduler()
+    scheduled = ScheduledRunnable(llm, scheduler, lambda _: 1, LlmPriority.SUMMARY)
+    await scheduled.ainvoke("prompt")
+    scheduler.acquire = AsyncMock(side_effect=AssertionError("cache hit was scheduled"))
+
+    # Act
+    result = await scheduled.ainvoke("prompt")
+
+    # Assert
+    assert result.content == "first"
+    assert cache.stats()["hits"] == 1
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_scheduled_runnable_answers_cache_hits_of_bound_models_without_a_slot(tmp_path):
+    # Arrange
+    cache = SqliteLLMCache(path=str(tmp_path / "llm_cache.sqlite3"), ttl_seconds=60, max_entries=100)
+    llm = FakeListChatModel(responses=["first", "second"], cache=cache)
+    scheduler = make_scheduler()
+    scheduled = ScheduledRunnable(llm.bind(stop=["END"]) | StrOutputParser(), scheduler, lambda _: 1, LlmPriority.SUMMARY)
+    await scheduled.ainvoke("prompt")
+    scheduler.acquire = AsyncMock(side_effect=AssertionError("cache hit was scheduled"))
+
+    # Act
+    result = await scheduled.ainvoke("prompt")
+
+    # Assert
+    assert result == "first"
+    assert cache.stats()["hits"] == 1
+    cache.close()
+
+
+def test_scheduled_runnable_invokes_synchronously_without_a_running_loop():
+    # Arrange
+    scheduler = make_scheduler()
+    scheduled = ScheduledRunnable(FakeListChatModel(responses=["first", "second"]), scheduler, lambda _: 1, LlmPriority.SUMMARY)
+
+    # Act
+    results = [scheduled.invoke("prompt"), scheduled.invoke("prompt")]
+
+    # Assert
+    assert [result.content for result in results] == ["first", "second"]
+    assert scheduler.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_scheduled_runnable_invokes_synchronously_through_the_scheduler_loop():
+    # Arrange
+    scheduler = make_scheduler()
+    scheduled = ScheduledRunnable(FakeListChatModel(responses=["first", "second"]), scheduler, lambda _: 1, LlmPriority.SUMMARY)
+    await scheduled.ainvoke("prompt")
+
+    # Act
+    result = await asyncio.to_thread(scheduled.invoke, "prompt")
+
+    # Assert
+    assert result.content == "second"
+    assert scheduler.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_scheduled_runnable_refuses_sync_invoke_on_the_scheduler_loop():
+    # Arrange
+    scheduled = ScheduledRunnable(FakeListChatModel(responses=["first"]), make_scheduler(), lambda _: 1, LlmPriority.SUMMARY)
+    await scheduled.ainvoke("prompt")
+
+    # Act & Assert
+    with pytest.raises(RuntimeError):
+        scheduled.invoke("prompt")
+
+
+def test_retry_after_seconds_reads_headers():
+    # Act & Assert
+    assert retry_after_seconds(rate_limit_error({"retry-after-ms": "1500"})) == 1.5
+    assert retry_after_seconds(rate_limit_error({"retry-after": "3"})) == 3
+    assert retry_after_seconds(rate_limit_error({})) is None
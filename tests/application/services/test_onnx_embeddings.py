@@ -0,0 +1,116 @@
+import json
+
+import numpy as np
+import pytest
+from tokenizers import Tokenizer
+from tokenizers.models import WordLevel
+from tokenizers.normalizers import Lowercase
+from tokenizers.pre_tokenizers import Whitespace
+
+from application.services.onnx_embeddings import OnnxEmbeddings, embedding_agreement
+
+VOCAB = {"[PAD]": 0, "[UNK]": 1, "floods": 2, "markets": 3, "rally": 4, "court": 5}
+TABLE = np.array([[0, 0, 0], [1, 1, 1], [1, 0, 0], [0, 2, 0], [0, 0, 3], [2, 2, 0]], dtype=np.float32)
+
+
+def varint(value: int) -> bytes:
+    out = bytearray()
+    while True:
+        byte, value = value & 0x7F, value >> 7
+        out.append(byte | (0x80 if value else 0))
+        if not value:
+            return bytes(out)
+
+
+def field(number: int, value) -> bytes:
+    if isinstance(value, int):
+        return varint(number << 3) + varint(value)
+    if isinstance(value, str):
+        value = value.encode()
+    return varint(number << 3 | 2) + varint(len(value)) + value
+
+
+def tensor_type(elem_type: int, dims: list) -> bytes:
+    shape = b"".join(field(1, field(1, dim) if isinstance(dim, int) else field(2, dim)) for dim in dims)
+    return field(1, field(1, elem_type) + field(2, shape))
+
+
+def write_gather_model(path) -> None:
+    """Writes an ONNX model looking up token embeddings in TABLE (a Gather node), encoded by hand."""
+    table = field(1, TABLE.shape[0]) + field(1, TABLE.shape[1]) + field(2, 1) + field(8, "table") + field(9, TABLE.tobytes())
+    node = field(1, "table") + field(1, "input_ids") + field(2, "last_hidden_state") + field(3, "lookup") + field(4, "Gather")
+    graph = (
+        field(1, node) + field(2, "test") + field(5, table)
+        + field(11, field(1, "input_ids") + field(2, tensor_type(7, ["batch", "sequence"])))
+        + field(12, field(1, "last_hidden_state") + field(2, tensor_type(1, ["batch", "sequence", 3])))
+    )
+    path.write_bytes(field(1, 8) + field(7, graph) + field(8, field(1, "") + field(2, 13)))
+
+
+@pytest.fixture
+def model_directory(tmp_path):
+    (tmp_path / "onnx").mkdir()
+    write_gather_model(tmp_path / "onnx" / "model.onnx")
+
+    tokenizer = Tokenizer(WordLevel(VOCAB, unk_token="[UNK]"))
+    tokenizer.normalizer = Lowercase()
+    tokenizer.pre_tokenizer = Whitespace()
+    tokenizer.save(str(tmp_path / "tokenizer.json"))
+
+    (tmp_path / "1_Pooling").mkdir()
+    (tmp_path / "1_Pooling" / "config.json").write_text(json.dumps({"pooling_mode_mean_tokens": True}))
+    (tmp_path / "modules.json").write_text(json.dumps([{"type": "sentence_transformers.models.Normalize"}]))
+    (tmp_path / "sentence_bert_config.json").write_text(json.dumps({"max_seq_length": 4}))
+    return str(tmp_path)
+
+
+def expected(*token_ids) -> list[float]:
+    vector = TABLE[list(token_ids)].mean(axis=0)
+    return (vector / np.linalg.norm(vector)).tolist()
+
+
+def test_embed_documents_mean_pools_tokens_without_padding_in_input_order(model_directory):
+    # Arrange
+    embeddings = OnnxEmbeddings(model_directory, intra_op_threads=1, batch_size=2)
+
+    # Act
+    vectors = embeddings.embed_documents(["Floods markets rally", "court", "floods"])
+
+    # Assert
+    np.testing.assert_allclose(vectors, [expected(2, 3, 4), expected(5), expected(2)], rtol=1e-6)
+
+
+def test_embed_query_truncates_to_the_max_sequence_length(model_directory):
+    # Arrange
+    embeddings = OnnxEmbeddings(model_directory)
+
+    # Act
+    vector = embeddings.embed_query("floods markets rally court floods floods")
+
+    # Assert
+    np.testing.assert_allclose(vector, expected(2, 3, 4, 5), rtol=1e-6)
+
+
+def test_embed_query_uses_the_cls_token_with_cls_pooling(model_directory, tmp_path):
+    # Arrange
+    (tmp_path / "1_Pooling" / "config.json").write_text(json.dumps({"pooling_mode_cls_token": True}))
+    embeddings = OnnxEmbeddings(model_directory)
+
+    # Act
+    vector = embeddings.embed_query("markets floods")
+
+    # Assert
+    np.testing.assert_allclose(vector, expected(3), rtol=1e-6)
+
+
+def test_embedding_agreement_returns_the_lowest_cosine_similarity(model_directory):
+    # Arrange
+    embeddings = OnnxEmbeddings(model_directory)
+
+    class Flipped():
+        def embed_documents(self, texts):
+            return [[-value for value in vector] if text == "court" else vector for text, vector in zip(texts, embeddings.embed_documents(texts))]
+
+    # Act & Assert
+    assert embedding_agreement(embeddings, embeddings, ["floods", "court"]) == pytest.approx(1.0)
+    assert embedding_agreement(embeddings, Flipped(), ["floods", "court"]) == pytest.approx(-1.0)
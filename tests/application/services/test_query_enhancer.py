@@ -2,6 +2,7 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from application.services.query_enhancer import QueryEnhancer
+from application.services.llm_scheduler import LlmScheduler, LlmPriority, ScheduledRunnable
 from application.exceptions.token_limit_exceeded_error import TokenLimitExceededError
 
 
@@ -93,3 +94,54 @@ async def test_enhance_async_does_not_retry_on_token_limit_exceeded(enhancer, mo
             await enhancer.enhance_async("token bomb")
 
     assert chain.ainvoke.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_enhance_async_returns_semantic_cache_hit_without_llm(mock_llm, mock_prompt, mock_token_limit_validator):
+    # Arrange
+    semantic_cache = MagicMock()
+    semantic_cache.lookup_async = AsyncMock(return_value=("cached enhanced query", None))
+    enhancer = QueryEnhancer(mock_llm, mock_prompt, mock_token_limit_validator, semantic_cache)
+
+    with patch("config.settings.settings.USE_DETERMINISTIC_QUERY", False):
+        # Act
+        result = await enhancer.enhance_async("similar query")
+
+    # Assert
+    assert result == "cached enhanced query"
+    mock_prompt.__or__.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_enhance_async_stores_rewrite_on_semantic_cache_miss(mock_llm, mock_prompt, mock_token_limit_validator):
+    # Arrange
+    semantic_cache = MagicMock()
+    semantic_cache.lookup_async = AsyncMock(return_value=(None, "vector"))
+    enhancer = QueryEnhancer(mock_llm, mock_prompt, mock_token_limit_validator, semantic_cache)
+
+    chain = MagicMock()
+    chain.ainvoke = AsyncMock(return_value="enhanced query")
+    mock_prompt.__or__.return_value = mock_token_limit_validator
+    mock_token_limit_validator.__or__.return_value = mock_llm
+    mock_llm.__or__.return_value = chain
+
+    with patch("config.settings.settings.USE_DETERMINISTIC_QUERY", False):
+        # Act
+        result = await enhancer.enhance_async("new query")
+
+    # Assert
+    assert result == "enhanced query"
+    semantic_cache.store.assert_called_once_with("new query", "vector", "enhanced query")
+
+
+def test_enhancer_schedules_llm_calls_as_interactive(mock_llm, mock_prompt, mock_token_limit_validator):
+    # Arrange
+    scheduler = LlmScheduler(requests_per_minute=600, tokens_per_minute=100_000, max_concurrency=4)
+
+    # Act
+    enhancer = QueryEnhancer(mock_llm, mock_prompt, mock_token_limit_validator, scheduler=scheduler)
+
+    # Assert
+    assert isinstance(enhancer.llm, ScheduledRunnable)
+    assert enhancer.llm.priority == LlmPriority.INTERACTIVE
+    assert enhancer.llm.runnable is mock_llm
@@ -0,0 +1,155 @@
+import asyncio
+import chromadb
+import pytest
+from unittest.mock import MagicMock
+
+from application.services.batch_embedder import BatchEmbedder
+from application.services.reembedding_job import ReembeddingJob
+from domain.embedding_signature import EmbeddingSignature
+from repositories.chroma_collection_migrator import ChromaCollectionMigrator
+from repositories.store_directory_lock import StoreDirectoryLock
+
+NEW = EmbeddingSignature(model="new-model")
+
+
+class FakeEmbeddings():
+    def __init__(self) -> None:
+        self.embedded: list[str] = []
+
+    def embed_documents(self, texts):
+        self.embedded.extend(texts)
+        return [[float(len(text)), 1.0, 0.0] for text in texts]
+
+
+@pytest.fixture
+def client(tmp_path):
+    client = chromadb.PersistentClient(path=str(tmp_path / "chroma"))
+    live = client.create_collection("articles", metadata={"embedding_model": "old-model", "embedding_version": 1})
+    live.upsert(
+        ids=[f"id{i}" for i in range(5)],
+        embeddings=[[float(i), 0.0] for i in range(5)],
+        documents=[f"Headline: {i}" for i in range(5)],
+        metadatas=[{"headline": str(i)} for i in range(5)],
+    )
+    return client
+
+
+@pytest.fixture
+def embeddings():
+    return FakeEmbeddings()
+
+
+def build_job(client, embeddings, on_swap=None, migrate=True, lock=None):
+    migrator = ChromaCollectionMigrator(client, "articles")
+    return ReembeddingJob(
+        migrator, BatchEmbedder(embeddings), NEW, on_swap or MagicMock(), migrate=migrate, batch_size=2, pause_seconds=0,
+        retire_grace_seconds=0, lock=lock, poll_seconds=0.01,
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_async_reembeds_the_stored_documents_and_swaps_them_in(client, embeddings):
+    # Arrange
+    on_swap = MagicMock()
+    job = build_job(client, embeddings, on_swap)
+
+    # Act
+    await job.run_async()
+
+    # Assert
+    live = client.get_collection("articles")
+    stored = live.get(include=["documents", "metadatas", "embeddings"])
+    assert EmbeddingSignature.from_metadata(live.metadata) == NEW
+    assert sorted(stored["ids"]) == [f"id{i}" for i in range(5)]
+    assert {metadata["headline"] for metadata in stored["metadatas"]} == {str(i) for i in range(5)}
+    assert all(len(vector) == 3 for vector in stored["embeddings"])
+    assert sorted(embeddings.embedded) == [f"Headline: {i}" for i in range(5)]
+    on_swap.assert_called_once()
+    assert [collection.name for collection in client.list_collections()] == ["articles"]
+
+
+@pytest.mark.asyncio
+async def test_run_async_resumes_without_reembedding_copied_documents(client, embeddings):
+    # Arrange
+    migrator = ChromaCollectionMigrator(client, "articles")
+    migrator.prepare_shadow(NEW)
+    migrator.write("live", ["id0", "id1"], [[1.0, 1.0, 0.0]] * 2, ["Headline: 0", "Headline: 1"], [{"headline": "0"}, {"headline": "1"}])
+    job = build_job(client, embeddings)
+
+    # Act
+    await job.run_async()
+
+    # Assert
+    assert sorted(embeddings.embedded) == ["Headline: 2", "Headline: 3", "Headline: 4"]
+    assert client.get_collection("articles").count() == 5
+
+
+@pytest.mark.asyncio
+async def test_run_async_copies_articles_saved_to_the_retired_collection_during_the_swap(client, embeddings):
+    # Arrange
+    job = build_job(client, embeddings)
+
+    def save_during_swap():
+        client.get_collection("articles__retired").upsert(
+            ids=["late"], embeddings=[[9.0, 0.0]], documents=["Headline: late"], metadatas=[{"headline": "late"}]
+        )
+
+    job.on_swap = save_during_swap
+
+    # Act
+    await job.run_async()
+
+    # Assert
+    assert client.get_collection("articles").get(ids=["late"])["documents"] == ["Headline: late"]
+    assert [collection.name for collection in client.list_collections()] == ["articles"]
+
+
+@pytest.mark.asyncio
+async def test_run_async_logs_failures_instead_of_raising(embeddings):
+    # Arrange
+    migrator = MagicMock()
+    migrator.prepare_shadow.side_effect = RuntimeError("store down")
+    job = ReembeddingJob(migrator, BatchEmbedder(embeddings), NEW, MagicMock())
+
+    # Act
+    await job.run_async()
+
+    # Assert
+    job.on_swap.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_run_async_follows_the_swap_of_the_worker_holding_the_lock(client, embeddings, tmp_path):
+    # Arrange
+    migrating = StoreDirectoryLock(str(tmp_path), ".migration.lock")
+    migrating.acquire(exclusive=True)
+    on_swap = MagicMock()
+    job = build_job(client, embeddings, on_swap, lock=StoreDirectoryLock(str(tmp_path), ".migration.lock"))
+
+    # Act
+    following = asyncio.create_task(job.run_async())
+    await asyncio.sleep(0.05)
+    swapped_early = on_swap.called
+    ChromaCollectionMigrator(client, "articles").stamp(NEW)
+    await asyncio.wait_for(following, timeout=5)
+
+    # Assert
+    assert not swapped_early
+    on_swap.assert_called_once()
+    assert embeddings.embedded == []
+    migrating.release()
+
+
+@pytest.mark.asyncio
+async def test_run_async_migrates_under_the_lock_and_releases_it(client, embeddings, tmp_path):
+    # Arrange
+    job = build_job(client, embeddings, lock=StoreDirectoryLock(str(tmp_path), ".migration.lock"))
+
+    # Act
+    await job.run_async()
+
+    # Assert
+    assert EmbeddingSignature.from_metadata(client.get_collection("articles").metadata) == NEW
+    other = StoreDirectoryLock(str(tmp_path), ".migration.lock")
+    other.acquire(exclusive=True)
+    other.release()
@@ -0,0 +1,67 @@
+import pytest
+from unittest.mock import MagicMock
+
+from application.services.semantic_query_cache import SemanticQueryCache
+
+VECTORS = {
+    "ukraine war": [1.0, 0.0, 0.0],
+    "war in ukraine": [0.98, 0.2, 0.0],
+    "stock market": [0.0, 1.0, 0.0],
+    "elections": [0.0, 0.0, 1.0],
+}
+
+
+@pytest.fixture
+def embeddings():
+    embeddings = MagicMock()
+    embeddings.embed_query.side_effect = lambda query: VECTORS[query]
+    return embeddings
+
+
+@pytest.mark.asyncio
+async def test_lookup_async_returns_rewrite_for_similar_query(embeddings):
+    # Arrange
+    cache = SemanticQueryCache(embeddings, threshold=0.9, max_entries=10)
+    _, vector = await cache.lookup_async("ukraine war")
+    cache.store("ukraine war", vector, "Russia Ukraine war frontline")
+
+    # Act
+    result, _ = await cache.lookup_async("war in ukraine")
+
+    # Assert
+    assert result == "Russia Ukraine war frontline"
+    assert cache.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_lookup_async_misses_for_dissimilar_query(embeddings):
+    # Arrange
+    cache = SemanticQueryCache(embeddings, threshold=0.9, max_entries=10)
+    _, vector = await cache.lookup_async("ukraine war")
+    cache.store("ukraine war", vector, "Russia Ukraine war frontline")
+
+    # Act
+    result, _ = await cache.lookup_async("stock market")
+
+    # Assert
+    assert result is None
+    assert cache.stats()["misses"] == 2
+
+
+@pytest.mark.asyncio
+async def test_store_evicts_least_recently_used_entry(embeddings):
+    # Arrange
+    cache = SemanticQueryCache(embeddings, threshold=0.9, max_entries=2)
+    for query in ("ukraine war", "stock market"):
+        _, vector = await cache.lookup_async(query)
+        cache.store(query, vector, f"enhanced {query}")
+    await cache.lookup_async("ukraine war")
+
+    # Act
+    _, vector = await cache.lookup_async("elections")
+    cache.store("elections", vector, "enhanced elections")
+
+    # Assert
+    assert (await cache.lookup_async("stock market"))[0] is None
+    assert (await cache.lookup_async("ukraine war"))[0] == "enhanced ukraine war"
+    assert cache.stats()["entries"] == 2
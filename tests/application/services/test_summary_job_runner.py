@@ -0,0 +1,119 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from application.services.summary_job_runner import SummaryJobRunner
+from application.models.article_summary_result_dto import ArticleSummaryResultDTO
+from domain.article_enriched import ArticleEnriched
+from repositories.sqlite_summary_job_store import SqliteSummaryJobStore
+
+
+def ok_result(url: str) -> ArticleSummaryResultDTO:
+    return ArticleSummaryResultDTO.from_article(url, ArticleEnriched(headline="Title", content="Content", summary="Summary"))
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SqliteSummaryJobStore(str(tmp_path / "jobs.sqlite3"), lease_seconds=60, retention_seconds=3600)
+    yield store
+    store.close()
+
+
+async def wait_for_completion(store, job_id: str) -> None:
+    for _ in range(200):
+        if store.get(job_id).status == "completed":
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("job did not complete")
+
+
+@pytest.mark.asyncio
+async def test_runner_processes_submitted_job_in_batches(store):
+    # Arrange
+    use_case = AsyncMock(side_effect=lambda urls: [ok_result(url) for url in urls])
+    runner = SummaryJobRunner(store, use_case, workers=2, batch_size=2, poll_seconds=10)
+    runner.start()
+    urls = [f"https://example.com/{i}" for i in range(5)]
+
+    # Act
+    job = store.create(urls)
+    runner.notify()
+    await wait_for_completion(store, job.id)
+    await runner.stop_async()
+
+    # Assert
+    finished = store.get(job.id)
+    assert finished.succeeded == 5
+    assert [result.url for result in finished.results] == urls
+    assert max(len(call.args[0]) for call in use_case.await_args_list) == 2
+
+
+@pytest.mark.asyncio
+async def test_runner_records_errors_when_a_batch_fails(store):
+    # Arrange
+    use_case = AsyncMock(side_effect=RuntimeError("vector store down"))
+    runner = SummaryJobRunner(store, use_case, workers=1, batch_size=10, poll_seconds=10)
+    runner.start()
+
+    # Act
+    job = store.create(["https://example.com/a", "https://example.com/b"])
+    runner.notify()
+    await wait_for_completion(store, job.id)
+    await runner.stop_async()
+
+    # Assert
+    finished = store.get(job.id)
+    assert finished.failed == 2
+    assert finished.results[0].error == "An unexpected error occurred."
+
+
+@pytest.mark.asyncio
+async def test_runner_picks_up_queued_urls_by_polling():
+    # Arrange
+    store = MagicMock()
+    store.claim = MagicMock(side_effect=[[], [("job", 0, "https://example.com/a")], []] + [[]] * 100)
+    use_case = AsyncMock(return_value=[ok_result("https://example.com/a")])
+    runner = SummaryJobRunner(store, use_case, workers=1, batch_size=10, poll_seconds=0.01)
+
+    # Act
+    runner.start()
+    await asyncio.sleep(0.1)
+    await runner.stop_async()
+
+    # Assert
+    use_case.assert_awaited_once_with(["https://example.com/a"])
+    store.complete.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_runner_renews_leases_while_a_batch_runs():
+    # Arrange
+    items = [("job", 0, "https://example.com/a")]
+    store = MagicMock()
+    store.claim = MagicMock(side_effect=[items] + [[]] * 100)
+
+    async def slow_use_case(urls):
+        # Runs until the leases were renewed twice
+        while store.renew.call_count < 2:
+            await asyncio.sleep(0.01)
+        return [ok_result(url) for url in urls]
+
+    runner = SummaryJobRunner(store, AsyncMock(side_effect=slow_use_case), workers=1, poll_seconds=10, lease_renewal_seconds=0.01)
+
+    # Act
+    runner.start()
+    for _ in range(100):
+        if store.complete.called:
+            break
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.01)
+    renewals = store.renew.call_count
+    await asyncio.sleep(0.05)
+    await runner.stop_async()
+
+    # Assert
+    worker_id = store.claim.call_args.args[1]
+    store.complete.assert_called_once_with("job", [(0, ok_result("https://example.com/a"))], worker_id)
+    store.renew.assert_called_with(items, worker_id)
+    assert renewals >= 2
+    assert store.renew.call_count == renewals
@@ -1,7 +1,10 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 import pytest
 from unittest.mock import AsyncMock, MagicMock, PropertyMock
 from application.services.web_scraping_articles_provider import WebScrapingArticlesProvider, is_valid_article
 from application.exceptions.no_content_error import NoContentError
+from application.models.cached_scrape import CachedScrape
 
 
 VALID_HTML = """
@@ -49,7 +52,7 @@ async def test_get_async_returns_valid_articles(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_get_async_raises_no_content_error(monkeypatch):
+async def test_get_async_returns_no_content_error(monkeypatch):
     # Arrange
     provider = WebScrapingArticlesProvider()
     url = "http://example.com/invalid"
@@ -68,11 +71,12 @@ async def test_get_async_raises_no_content_error(monkeypatch):
     
     monkeypatch.setattr("httpx.AsyncClient", MagicMock(return_value=async_client_mock))
     
-    # Act & Assert
-    with pytest.raises(NoContentError) as exc:
-        await provider.get_async([url])
+    # Act
+    result = await provider.get_async([url])
     
-    assert url in str(exc.value)
+    # Assert
+    assert isinstance(result[0], NoContentError)
+    assert url in str(result[0])
 
 
 def test_is_valid_article_true():
@@ -105,4 +109,156 @@ def test_is_valid_article_false_sentence_count():
     result = not is_valid_article(text)
 
     # Assert
-    assert result
\ No newline at end of file
+    assert result
+
+@pytest.mark.asyncio
+async def test_get_async_reuses_single_client(monkeypatch):
+    # Arrange
+    provider = WebScrapingArticlesProvider()
+    urls = [f"http://example.com/{i}" for i in range(5)]
+
+    mock_response = MagicMock()
+    type(mock_response).text = PropertyMock(return_value=VALID_HTML)
+    mock_response.raise_for_status = MagicMock()
+
+    async_client_mock = MagicMock()
+    async_client_mock.get = AsyncMock(return_value=mock_response)
+    async_client_mock.aclose = AsyncMock()
+    client_factory = MagicMock(return_value=async_client_mock)
+
+    monkeypatch.setattr("httpx.AsyncClient", client_factory)
+
+    # Act
+    result = await provider.get_async(urls)
+    await provider.close_async()
+
+    # Assert
+    assert len(result) == 5
+    client_factory.assert_called_once()
+    assert async_client_mock.get.await_count == 5
+    async_client_mock.aclose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_async_limits_concurrency_per_host(monkeypatch):
+    # Arrange
+    provider = WebScrapingArticlesProvider(max_connections_per_host=2, max_concurrency=10)
+    urls = [f"http://example.com/{i}" for i in range(6)] + [f"http://other.com/{i}" for i in range(2)]
+
+    in_flight: dict[str, int] = {}
+    peak: dict[str, int] = {}
+
+    mock_response = MagicMock()
+    type(mock_response).text = PropertyMock(return_value=VALID_HTML)
+    mock_response.raise_for_status = MagicMock()
+
+    async def mock_get(url, *args, **kwargs):
+        host = url.split("/")[2]
+        in_flight[host] = in_flight.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), in_flight[host])
+        await asyncio.sleep(0.01)
+        in_flight[host] -= 1
+        return mock_response
+
+    async_client_mock = MagicMock()
+    async_client_mock.get = AsyncMock(side_effect=mock_get)
+
+    monkeypatch.setattr("httpx.AsyncClient", MagicMock(return_value=async_client_mock))
+
+    # Act
+    result = await provider.get_async(urls)
+
+    # Assert
+    assert len(result) == 8
+    assert peak["example.com"] == 2
+    assert peak["other.com"] == 2
+    assert provider._host_limits == {}
+
+
+@pytest.mark.asyncio
+async def test_get_async_extracts_in_parse_executor(monkeypatch):
+    # Arrange
+    executor = ThreadPoolExecutor(max_workers=1)
+    extractor = MagicMock()
+    extractor.extract.return_value = {"headline": "Test Title", "content": "This sentence. " * 6 + "word " * 100}
+    provider = WebScrapingArticlesProvider(extractor=extractor, parse_executor=executor)
+
+    mock_response = MagicMock()
+    type(mock_response).text = PropertyMock(return_value=VALID_HTML)
+    mock_response.raise_for_status = MagicMock()
+
+    async_client_mock = MagicMock()
+    async_client_mock.get = AsyncMock(return_value=mock_response)
+
+    monkeypatch.setattr("httpx.AsyncClient", MagicMock(return_value=async_client_mock))
+
+    # Act
+    result = await provider.get_async(["http://example.com"])
+    executor.shutdown()
+
+    # Assert
+    assert result[0]["headline"] == "Test Title"
+    extractor.extract.assert_called_once_with(VALID_HTML)
+
+
+@pytest.mark.asyncio
+async def test_get_async_serves_fresh_cached_article_without_request(monkeypatch):
+    # Arrange
+    scrape_cache = MagicMock()
+    scrape_cache.get.return_value = CachedScrape(headline="Cached", content="Cached content", is_fresh=True)
+    provider = WebScrapingArticlesProvider(scrape_cache=scrape_cache)
+
+    client_factory = MagicMock()
+    monkeypatch.setattr("httpx.AsyncClient", client_factory)
+
+    # Act
+    result = await provider.get_async(["http://example.com"])
+
+    # Assert
+    assert result == [{"headline": "Cached", "content": "Cached content"}]
+    client_factory.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_async_revalidates_stale_article_and_skips_parsing_on_304(monkeypatch):
+    # Arrange
+    scrape_cache = MagicMock()
+    scrape_cache.get.return_value = CachedScrape(headline="Cached", content="Cached content", etag='"v1"')
+    extractor = MagicMock()
+    provider = WebScrapingArticlesProvider(scrape_cache=scrape_cache, extractor=extractor)
+
+    mock_response = MagicMock(status_code=304)
+
+    async_client_mock = MagicMock()
+    async_client_mock.get = AsyncMock(return_value=mock_response)
+    monkeypatch.setattr("httpx.AsyncClient", MagicMock(return_value=async_client_mock))
+
+    # Act
+    result = await provider.get_async(["http://example.com"])
+
+    # Assert
+    assert result == [{"headline": "Cached", "content": "Cached content"}]
+    async_client_mock.get.assert_awaited_once_with("http://example.com", headers={"If-None-Match": '"v1"'})
+    mock_response.raise_for_status.assert_not_called()
+    extractor.extract.assert_not_called()
+    scrape_cache.touch.assert_called_once_with("http://example.com")
+
+
+@pytest.mark.asyncio
+async def test_get_async_stores_scraped_article_with_validators(monkeypatch):
+    # Arrange
+    scrape_cache = MagicMock()
+    scrape_cache.get.return_value = None
+    provider = WebScrapingArticlesProvider(scrape_cache=scrape_cache)
+
+    mock_response = MagicMock(status_code=200, text=VALID_HTML, headers={"ETag": '"v2"'})
+
+    async_client_mock = MagicMock()
+    async_client_mock.get = AsyncMock(return_value=mock_response)
+    monkeypatch.setattr("httpx.AsyncClient", MagicMock(return_value=async_client_mock))
+
+    # Act
+    result = await provider.get_async(["http://example.com"])
+
+    # Assert
+    scrape_cache.put.assert_called_once_with("http://example.com", result[0], '"v2"', None)
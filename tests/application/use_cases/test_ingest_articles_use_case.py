@@ -0,0 +1,157 @@
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from application.models.ingest_batch_result_dto import IngestBatchResultDTO
+from application.use_cases.ingest_articles_use_case import IngestArticlesUseCase
+from application.utils.content_fingerprint import fingerprint_content
+from domain.article_enriched import ArticleEnriched
+from domain.article_query import ArticleQuery
+
+
+@pytest.fixture
+def mock_repo():
+    repo = MagicMock()
+    repo.save_async = AsyncMock()
+    repo.get_by_fingerprints_async = AsyncMock(return_value={})
+    return repo
+
+
+@pytest.fixture
+def mock_summarizer():
+    summarizer = MagicMock()
+
+    async def summarize_async(articles):
+        return [
+            ValueError("too long") if article["headline"] == "fails" else
+            ArticleEnriched(headline=article["headline"], content=article["content"], summary=f"Summary of {article['headline']}", topics=["World"])
+            for article in articles
+        ]
+
+    summarizer.summarize_async = AsyncMock(side_effect=summarize_async)
+    return summarizer
+
+
+def saved_articles(mock_repo):
+    return [article for call in mock_repo.save_async.await_args_list for article in call.args[0]]
+
+
+@pytest.mark.asyncio
+async def test_call_summarizes_and_saves_new_articles(mock_repo, mock_summarizer):
+    # Arrange
+    use_case = IngestArticlesUseCase(mock_repo, mock_summarizer)
+
+    # Act
+    result = await use_case([{"headline": "a", "content": "Content a"}, {"headline": "b", "content": "Content b"}])
+
+    # Assert
+    assert result == IngestBatchResultDTO(ingested=2)
+    assert [article.summary for article in saved_articles(mock_repo)] == ["Summary of a", "Summary of b"]
+
+
+@pytest.mark.asyncio
+async def test_call_skips_stored_and_repeated_contents_and_counts_failures(mock_repo, mock_summarizer):
+    # Arrange
+    stored = ArticleEnriched(headline="stored", content="Stored content", summary="Old")
+    mock_repo.get_by_fingerprints_async.return_value = {fingerprint_content("Stored content"): stored}
+    use_case = IngestArticlesUseCase(mock_repo, mock_summarizer)
+
+    # Act
+    result = await use_case([
+        {"headline": "stored", "content": "Stored content"},
+        {"headline": "a", "content": "Content a"},
+        {"headline": "a again", "content": "Content a"},
+        {"headline": "empty", "content": " "},
+        {},
+        {"headline": "fails", "content": "Content f"},
+    ])
+
+    # Assert
+    assert result == IngestBatchResultDTO(ingested=1, skipped=2, failed=3)
+    assert [article.headline for article in saved_articles(mock_repo)] == ["a"]
+    assert [article["headline"] for article in mock_summarizer.summarize_async.await_args.args[0]] == ["a", "fails"]
+
+
+@pytest.mark.asyncio
+async def test_call_without_summarization_saves_records_as_is(mock_repo, mock_summarizer):
+    # Arrange
+    use_case = IngestArticlesUseCase(mock_repo, mock_summarizer, summarize=False)
+
+    # Act
+    result = await use_case([
+        {"headline": "a", "content": "Content a"},
+        {"headline": "b", "content": "Content b", "summary": "Given", "topics": ["Economy"], "political_bias": "None"},
+    ])
+
+    # Assert
+    assert result == IngestBatchResultDTO(ingested=2)
+    mock_summarizer.summarize_async.assert_not_awaited()
+    assert saved_articles(mock_repo) == [
+        ArticleQuery(headline="a", content="Content a", summary=""),
+        ArticleQuery(headline="b", content="Content b", summary="Given", topics=["Economy"], political_bias="None"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stream_reports_batches_in_input_order_with_bounded_parallelism(mock_repo, mock_summarizer):
+    # Arrange
+    in_flight, peak = 0, 0
+
+    async def save_async(articles):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # The first batch is the slowest, so later batches finish before it
+        await asyncio.sleep(0.05 if articles[0].headline == "0" else 0.01)
+        in_flight -= 1
+
+    mock_repo.save_async.side_effect = save_async
+    use_case = IngestArticlesUseCase(mock_repo, mock_summarizer, summarize=False, parallel=2)
+    batches = [[{"headline": str(i), "content": f"Content {i}-{j}"} for j in range(3)] for i in range(4)]
+
+    # Act
+    reports = [(position, result) async for position, result in use_case.stream(batches, start=10)]
+
+    # Assert
+    assert [position for position, _ in reports] == [13, 16, 19, 22]
+    assert all(result == IngestBatchResultDTO(ingested=3) for _, result in reports)
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_raises_when_a_batch_fails_to_save(mock_repo, mock_summarizer):
+    # Arrange
+    mock_repo.save_async.side_effect = [None, RuntimeError("store down")]
+    use_case = IngestArticlesUseCase(mock_repo, mock_summarizer, summarize=False, parallel=1)
+    batches = [[{"content": "Content 1"}], [{"content": "Content 2"}], [{"content": "Content 3"}]]
+
+    # Act
+    positions = []
+    with pytest.raises(RuntimeError):
+        async for position, _ in use_case.stream(batches):
+            positions.append(position)
+
+    # Assert
+    assert positions == [1]
+
+
+@pytest.mark.asyncio
+async def test_stream_ingests_an_article_in_concurrent_batches_once(mock_repo, mock_summarizer):
+    # Arrange
+    async def save_async(articles):
+        await asyncio.sleep(0.01)
+
+    mock_repo.save_async.side_effect = save_async
+    use_case = IngestArticlesUseCase(mock_repo, mock_summarizer, summarize=False, parallel=2)
+    batches = [
+        [{"headline": "shared", "content": "Shared content"}, {"headline": "a", "content": "Content a"}],
+        [{"headline": "shared again", "content": "Shared content"}, {"headline": "b", "content": "Content b"}],
+    ]
+
+    # Act
+    reports = [result async for _, result in use_case.stream(batches)]
+
+    # Assert
+    assert reports == [IngestBatchResultDTO(ingested=2), IngestBatchResultDTO(ingested=1, skipped=1)]
+    assert sorted(article.headline for article in saved_articles(mock_repo)) == ["a", "b", "shared"]
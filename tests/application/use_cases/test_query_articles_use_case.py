@@ -4,16 +4,21 @@ from types import SimpleNamespace
 
 from application.use_cases.query_articles_use_case import QueryArticleUseCase
 from application.models.related_article_dto import RelatedArticleDTO
+from application.exceptions.invalid_cursor_error import InvalidCursorError
+from domain.article_filters import ArticleFilters
+from application.utils.query_cursor import cursor_key, encode_cursor
+
+SECRET = b"test-secret"
 
 @pytest.mark.asyncio
 async def test_query_article_use_case_returns_expected_results():
     # Arrange
     fake_query = "climate change"
     enhanced_query = "climate change impact"
-    fake_results = [(SimpleNamespace(**{"metadata": {"headline": "Article 1",  "content":"content", "summary": "test"}}), 0.9),
-                    (SimpleNamespace(**{"metadata": {"headline": "Article 2",  "content":"content", "summary": "test"}}), 0.8)]
-    expected_dtos = [RelatedArticleDTO(headline="Article 1", content="content", summary="test", score=0.9),
-                     RelatedArticleDTO(headline="Article 2", content="content", summary="test", score=0.8)]
+    fake_results = [(SimpleNamespace(**{"id": "1", "metadata": {"headline": "Article 1",  "content":"content", "summary": "test"}}), 0.9),
+                    (SimpleNamespace(**{"id": "2", "metadata": {"headline": "Article 2",  "content":"content", "summary": "test"}}), 0.8)]
+    expected_dtos = [RelatedArticleDTO(headline="Article 1", summary="test", topics=None, political_bias=None, score=0.9),
+                     RelatedArticleDTO(headline="Article 2", summary="test", topics=None, political_bias=None, score=0.8)]
     
     mock_repo = MagicMock()
     mock_repo.query_async = AsyncMock(return_value=fake_results)
@@ -22,13 +27,15 @@ async def test_query_article_use_case_returns_expected_results():
     mock_enhancer.enhance_async = AsyncMock(return_value=enhanced_query)
 
     # Act
-    use_case = QueryArticleUseCase(repo=mock_repo, query_enhancer=mock_enhancer)
-    result = await use_case(fake_query)
+    use_case = QueryArticleUseCase(repo=mock_repo, query_enhancer=mock_enhancer, cursor_secret=SECRET)
+    result = await use_case(fake_query, k=2)
 
     # Assert
     mock_enhancer.enhance_async.assert_awaited_once_with(fake_query)
-    mock_repo.query_async.assert_awaited_once_with(enhanced_query)
-    assert result == expected_dtos
+    mock_repo.query_async.assert_awaited_once_with(enhanced_query, k=2, offset=0, filters=ArticleFilters())
+    assert result.items == expected_dtos
+    assert "content" not in result.items[0].model_fields_set
+    assert result.next_cursor is not None
 
 @pytest.mark.asyncio
 async def test_empty_query_returns_no_results():
@@ -41,39 +48,37 @@ async def test_empty_query_returns_no_results():
     mock_enhancer = MagicMock()
     mock_enhancer.enhance_async = AsyncMock(return_value=enhanced_query)
 
-    use_case = QueryArticleUseCase(repo=mock_repo, query_enhancer=mock_enhancer)
+    use_case = QueryArticleUseCase(repo=mock_repo, query_enhancer=mock_enhancer, cursor_secret=SECRET)
 
     # Act
     result = await use_case(query)
 
     # Assert
-    assert result == []
+    assert result.items == []
+    assert result.next_cursor is None
     mock_enhancer.enhance_async.assert_awaited_once_with(query)
-    mock_repo.query_async.assert_awaited_once_with(enhanced_query)
+    mock_repo.query_async.assert_awaited_once_with(enhanced_query, k=4, offset=0, filters=ArticleFilters())
     
 @pytest.mark.asyncio
 async def test_enhancer_returns_same_query():
     # Arrange
     query = "machine learning"
     mock_repo = MagicMock()
-    mock_repo.query_async = AsyncMock(return_value=[({"title": "ML Paper"}, 0.95)])
+    mock_repo.query_async = AsyncMock(return_value=[(SimpleNamespace(id="1", metadata={"headline": "ML Paper"}), 0.95)])
 
     mock_enhancer = MagicMock()
     mock_enhancer.enhance_async = AsyncMock(return_value=query)
 
-    dto_mock = MagicMock(spec=RelatedArticleDTO)
-    RelatedArticleDTO.from_document = MagicMock(return_value=dto_mock)
-
-    use_case = QueryArticleUseCase(repo=mock_repo, query_enhancer=mock_enhancer)
+    use_case = QueryArticleUseCase(repo=mock_repo, query_enhancer=mock_enhancer, cursor_secret=SECRET)
 
     # Act
-    result = await use_case(query)
+    result = await use_case(query, fields=["headline", "score"])
 
     # Assert
-    assert result == [dto_mock]
+    assert result.items == [RelatedArticleDTO(headline="ML Paper", score=0.95)]
+    assert result.items[0].model_fields_set == {"headline", "score"}
     mock_enhancer.enhance_async.assert_awaited_once_with(query)
-    mock_repo.query_async.assert_awaited_once_with(query)
-    RelatedArticleDTO.from_document.assert_called_once()
+    mock_repo.query_async.assert_awaited_once_with(query, k=4, offset=0, filters=ArticleFilters())
     
 @pytest.mark.asyncio
 async def test_repo_returns_empty_list():
@@ -87,15 +92,16 @@ async def test_repo_returns_empty_list():
     mock_enhancer = MagicMock()
     mock_enhancer.enhance_async = AsyncMock(return_value=enhanced_query)
 
-    use_case = QueryArticleUseCase(repo=mock_repo, query_enhancer=mock_enhancer)
+    use_case = QueryArticleUseCase(repo=mock_repo, query_enhancer=mock_enhancer, cursor_secret=SECRET)
     
     # Act
     result = await use_case(query)
 
     # Assert
-    assert result == []
+    assert result.items == []
+    assert result.next_cursor is None
     mock_enhancer.enhance_async.assert_awaited_once_with(query)
-    mock_repo.query_async.assert_awaited_once_with(enhanced_query)
+    mock_repo.query_async.assert_awaited_once_with(enhanced_query, k=4, offset=0, filters=ArticleFilters())
     
 @pytest.mark.asyncio
 async def test_enhancer_raises_exception():
@@ -106,7 +112,7 @@ async def test_enhancer_raises_exception():
     mock_enhancer = MagicMock()
     mock_enhancer.enhance_async = AsyncMock(side_effect=Exception("Enhancer error"))
 
-    use_case = QueryArticleUseCase(repo=mock_repo, query_enhancer=mock_enhancer)
+    use_case = QueryArticleUseCase(repo=mock_repo, query_enhancer=mock_enhancer, cursor_secret=SECRET)
 
     # Act & Assert
     with pytest.raises(Exception, match="Enhancer error"):
@@ -128,10 +134,123 @@ async def test_repo_raises_exception():
     mock_repo.query_async = AsyncMock(side_effect=Exception("Repo error"))
 
     # Act & Assert
-    use_case = QueryArticleUseCase(repo=mock_repo, query_enhancer=mock_enhancer)
+    use_case = QueryArticleUseCase(repo=mock_repo, query_enhancer=mock_enhancer, cursor_secret=SECRET)
 
     with pytest.raises(Exception, match="Repo error"):
         await use_case(query)
 
     mock_enhancer.enhance_async.assert_awaited_once_with(query)
-    mock_repo.query_async.assert_awaited_once_with(enhanced_query)
+    mock_repo.query_async.assert_awaited_once_with(enhanced_query, k=4, offset=0, filters=ArticleFilters())
+
+@pytest.mark.asyncio
+async def test_next_page_reuses_enhanced_query_from_cursor():
+    # Arrange
+    query = "floods"
+    filters = ArticleFilters(political_bias=["Left"], topics=["Climate"])
+    document = SimpleNamespace(id="1", metadata={"headline": "Floods in Valencia"})
+
+    mock_repo = MagicMock()
+    mock_repo.query_async = AsyncMock(side_effect=[[(document, 0.9), (document, 0.8)], [(document, 0.7)]])
+    mock_enhancer = MagicMock()
+    mock_enhancer.enhance_async = AsyncMock(return_value="floods spain")
+
+    use_case = QueryArticleUseCase(repo=mock_repo, query_enhancer=mock_enhancer, cursor_secret=SECRET)
+
+    # Act
+    first_page = await use_case(query, k=2, filters=filters)
+    second_page = await use_case(query, k=2, cursor=first_page.next_cursor, filters=filters)
+
+    # Assert
+    mock_enhancer.enhance_async.assert_awaited_once_with(query)
+    mock_repo.query_async.assert_awaited_with("floods spain", k=2, offset=2, filters=filters)
+    assert len(second_page.items) == 1
+    assert second_page.next_cursor is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "eyJxIjoieCJ9"])
+async def test_malformed_cursor_raises_invalid_cursor_error(cursor):
+    # Arrange
+    use_case = QueryArticleUseCase(repo=MagicMock(), query_enhancer=MagicMock(), cursor_secret=SECRET)
+
+    # Act & Assert
+    with pytest.raises(InvalidCursorError):
+        await use_case("floods", cursor=cursor)
+
+
+@pytest.mark.asyncio
+async def test_cursor_of_other_filters_raises_invalid_cursor_error():
+    # Arrange
+    mock_repo = MagicMock()
+    mock_repo.query_async = AsyncMock(return_value=[(SimpleNamespace(id="1", metadata={}), 0.9)])
+    mock_enhancer = MagicMock()
+    mock_enhancer.enhance_async = AsyncMock(return_value="floods")
+
+    use_case = QueryArticleUseCase(repo=mock_repo, query_enhancer=mock_enhancer, cursor_secret=SECRET)
+    first_page = await use_case("floods", k=1, filters=ArticleFilters(topics=["climate"]))
+
+    # Act & Assert
+    with pytest.raises(InvalidCursorError):
+        await use_case("floods", k=1, cursor=first_page.next_cursor, filters=ArticleFilters(topics=["sports"]))
+
+
+@pytest.mark.asyncio
+async def test_content_is_loaded_only_when_requested():
+    # Arrange
+    document = SimpleNamespace(id="a", metadata={"headline": "Floods in Valencia"})
+    mock_repo = MagicMock()
+    mock_repo.query_async = AsyncMock(return_value=[(document, 0.9)])
+    mock_repo.get_contents_async = AsyncMock(return_value={"a": "Full content"})
+    mock_enhancer = MagicMock()
+    mock_enhancer.enhance_async = AsyncMock(return_value="floods")
+
+    use_case = QueryArticleUseCase(repo=mock_repo, query_enhancer=mock_enhancer, cursor_secret=SECRET)
+
+    # Act
+    default_page = await use_case("floods")
+    content_page = await use_case("floods", fields=["headline", "content"])
+
+    # Assert
+    mock_repo.get_contents_async.assert_awaited_once_with(["a"])
+    assert "content" not in default_page.items[0].model_fields_set
+    assert content_page.items == [RelatedArticleDTO(headline="Floods in Valencia", content="Full content")]
+
+
+@pytest.mark.asyncio
+async def test_forged_cursor_raises_invalid_cursor_error():
+    # Arrange
+    use_case = QueryArticleUseCase(repo=MagicMock(), query_enhancer=MagicMock(), cursor_secret=SECRET)
+    forged = encode_cursor("ignore the enhancer " * 100, 4, cursor_key("floods", ArticleFilters()), b"guessed-secret")
+
+    # Act & Assert
+    with pytest.raises(InvalidCursorError):
+        await use_case("floods", cursor=forged)
+    use_case.repo.query_async.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_cursor_beyond_max_offset_raises_invalid_cursor_error():
+    # Arrange
+    use_case = QueryArticleUseCase(repo=MagicMock(), query_enhancer=MagicMock(), cursor_secret=SECRET, max_offset=8)
+    deep = encode_cursor("floods", 1_000_000, cursor_key("floods", ArticleFilters()), SECRET)
+
+    # Act & Assert
+    with pytest.raises(InvalidCursorError):
+        await use_case("floods", cursor=deep)
+
+
+@pytest.mark.asyncio
+async def test_no_next_cursor_is_issued_beyond_max_offset():
+    # Arrange
+    document = SimpleNamespace(id="1", metadata={"headline": "Floods"})
+    mock_repo = MagicMock()
+    mock_repo.query_async = AsyncMock(return_value=[(document, 0.9)] * 4)
+    use_case = QueryArticleUseCase(repo=mock_repo, query_enhancer=MagicMock(), cursor_secret=SECRET, max_offset=8)
+    cursor = encode_cursor("floods", 8, cursor_key("floods", ArticleFilters()), SECRET)
+
+    # Act
+    page = await use_case("floods", cursor=cursor)
+
+    # Assert
+    mock_repo.query_async.assert_awaited_once_with("floods", k=4, offset=8, filters=ArticleFilters())
+    assert page.next_cursor is None
@@ -1,14 +1,20 @@
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 from application.use_cases.summarize_articles_use_case import SummarizeArticlesUseCase
 from domain.article_enriched import ArticleEnriched
-from application.models.article_summary_dto import ArticleSummaryDTO
+from application.models.article_summary_result_dto import ArticleSummaryResultDTO
+from application.utils.content_fingerprint import fingerprint_content
+from application.exceptions.no_content_error import NoContentError
+from application.exceptions.url_validation_error import UrlValidationError
+from application.exceptions.token_limit_exceeded_error import TokenLimitExceededError
 
 
 @pytest.fixture
 def mock_repo():
     repo = MagicMock()
     repo.save_async = AsyncMock()
+    repo.get_by_fingerprints_async = AsyncMock(return_value={})
     return repo
 
 
@@ -35,45 +41,251 @@ def use_case(mock_repo, mock_summarizer, mock_articles_provider):
     )
 
 
+def scrape_pages(pages):
+    async def get_async(urls):
+        return [pages[url] for url in urls]
+    return get_async
+
+
+def summarize_with(summaries):
+    async def summarize_async(articles):
+        return [summaries[article["headline"]] for article in articles]
+    return summarize_async
+
+
+def saved_articles(mock_repo):
+    return [article for call in mock_repo.save_async.await_args_list for article in call.args[0]]
+
+
 @pytest.mark.asyncio
 async def test_use_case_executes_full_pipeline(use_case, mock_articles_provider, mock_summarizer, mock_repo):
     # Arrange
     urls = ["https://example.com/article1", "https://example.com/article2"]
-
-    scrapped = [("Title1", "Content1"), ("Title2", "Content2")]
-    mock_articles_provider.get_async.return_value = scrapped
+    scrapped = [{"headline": "Title1", "content": "Content1"}, {"headline": "Title2", "content": "Content2"}]
+    mock_articles_provider.get_async.side_effect = scrape_pages(dict(zip(urls, scrapped)))
 
     enriched = [
         ArticleEnriched(headline="Title1", content="Content1", summary="Summary1"),
         ArticleEnriched(headline="Title2", content="Content2", summary="Summary2")
     ]
-    mock_summarizer.summarize_async.return_value = enriched
+    mock_summarizer.summarize_async.side_effect = summarize_with({article.headline: article for article in enriched})
 
     # Act
     result = await use_case(urls)
 
     # Assert
-    mock_articles_provider.get_async.assert_awaited_once_with(urls)
-    mock_summarizer.summarize_async.assert_awaited_once_with(scrapped)
-    mock_repo.save_async.assert_awaited_once_with(enriched)
+    assert sorted(call.args[0][0] for call in mock_articles_provider.get_async.await_args_list) == urls
+    assert [call.args[0] for call in mock_summarizer.summarize_async.await_args_list] in ([[scrapped[0]], [scrapped[1]]], [[scrapped[1]], [scrapped[0]]])
+    assert sorted(saved_articles(mock_repo), key=lambda article: article.headline) == enriched
 
-    assert all(isinstance(dto, ArticleSummaryDTO) for dto in result)
-    assert result[0].headline == "Title1"
-    assert result[0].summary == "Summary1"
+    assert all(isinstance(dto, ArticleSummaryResultDTO) for dto in result)
+    assert [dto.url for dto in result] == urls
+    assert result[0].article.headline == "Title1"
+    assert result[0].article.summary == "Summary1"
 
 
 @pytest.mark.asyncio
 async def test_use_case_handles_empty_url_list(use_case, mock_articles_provider, mock_summarizer, mock_repo):
-    # Arrange
-    mock_articles_provider.get_async.return_value = []
-    mock_summarizer.summarize_async.return_value = []
-
     # Act
     result = await use_case([])
 
     # Assert
-    mock_articles_provider.get_async.assert_awaited_once_with([])
-    mock_summarizer.summarize_async.assert_awaited_once_with([])
-    mock_repo.save_async.assert_awaited_once_with([])
+    mock_articles_provider.get_async.assert_not_awaited()
+    mock_summarizer.summarize_async.assert_not_awaited()
+    mock_repo.save_async.assert_not_awaited()
 
     assert result == []
+
+
+@pytest.mark.asyncio
+async def test_use_case_skips_summarizer_for_known_articles(use_case, mock_articles_provider, mock_summarizer, mock_repo):
+    # Arrange
+    urls = ["https://example.com/known", "https://example.com/new"]
+    known = {"headline": "Known", "content": "Known content"}
+    new = {"headline": "New", "content": "New content"}
+    mock_articles_provider.get_async.side_effect = scrape_pages(dict(zip(urls, [known, new])))
+
+    stored = ArticleEnriched(headline="Known", content="Known content", summary="Stored summary")
+    mock_repo.get_by_fingerprints_async.side_effect = lambda fingerprints: {
+        fingerprint: stored for fingerprint in fingerprints if fingerprint == fingerprint_content("Known content")
+    }
+
+    enriched = ArticleEnriched(headline="New", content="New content", summary="New summary")
+    mock_summarizer.summarize_async.side_effect = summarize_with({"New": enriched})
+
+    # Act
+    result = await use_case(urls)
+
+    # Assert
+    mock_summarizer.summarize_async.assert_awaited_once_with([new])
+    mock_repo.save_async.assert_awaited_once_with([enriched])
+    assert [dto.article.summary for dto in result] == ["Stored summary", "New summary"]
+
+
+@pytest.mark.asyncio
+async def test_use_case_summarizes_duplicate_content_once(use_case, mock_articles_provider, mock_summarizer, mock_repo):
+    # Arrange
+    urls = ["https://example.com/a", "https://mirror.example.com/a"]
+    mock_articles_provider.get_async.side_effect = scrape_pages({
+        urls[0]: {"headline": "Same", "content": "Same   content"},
+        urls[1]: {"headline": "Same", "content": "same content"},
+    })
+
+    enriched = ArticleEnriched(headline="Same", content="Same content", summary="Summary")
+    mock_summarizer.summarize_async.side_effect = summarize_with({"Same": enriched})
+
+    # Act
+    result = await use_case(urls)
+
+    # Assert
+    mock_summarizer.summarize_async.assert_awaited_once()
+    mock_repo.get_by_fingerprints_async.assert_awaited_once_with([fingerprint_content("same content")])
+    mock_repo.save_async.assert_awaited_once_with([enriched])
+    assert [dto.article.summary for dto in result] == ["Summary", "Summary"]
+
+
+@pytest.mark.asyncio
+async def test_use_case_reports_failures_per_url_and_saves_successes(use_case, mock_articles_provider, mock_summarizer, mock_repo):
+    # Arrange
+    urls = ["https://example.com/empty", "https://example.com/good", "https://example.com/too-long"]
+    good = {"headline": "Good", "content": "Good content"}
+    too_long = {"headline": "Long", "content": "Long content"}
+    mock_articles_provider.get_async.side_effect = scrape_pages(dict(zip(urls, [NoContentError(urls[0]), good, too_long])))
+
+    enriched = ArticleEnriched(headline="Good", content="Good content", summary="Summary")
+    mock_summarizer.summarize_async.side_effect = summarize_with(
+        {"Good": enriched, "Long": TokenLimitExceededError("too long", max_tokens=10)}
+    )
+
+    # Act
+    result = await use_case(urls)
+
+    # Assert
+    assert mock_summarizer.summarize_async.await_count == 2
+    mock_repo.save_async.assert_awaited_once_with([enriched])
+    assert [dto.status for dto in result] == ["error", "ok", "error"]
+    assert urls[0] in result[0].error
+    assert result[1].article.summary == "Summary"
+    assert result[2].article is None
+
+
+@pytest.mark.asyncio
+async def test_use_case_summarizes_early_articles_while_slow_ones_are_scraped(use_case, mock_articles_provider, mock_summarizer, mock_repo):
+    # Arrange
+    urls = ["https://example.com/slow", "https://example.com/fast"]
+    fast_saved = asyncio.Event()
+
+    async def get_async(urls):
+        if urls == ["https://example.com/slow"]:
+            await asyncio.wait_for(fast_saved.wait(), 5)
+            return [{"headline": "Slow", "content": "Slow content"}]
+        return [{"headline": "Fast", "content": "Fast content"}]
+
+    async def save_async(articles):
+        if any(article.headline == "Fast" for article in articles):
+            fast_saved.set()
+
+    async def summarize_async(articles):
+        return [ArticleEnriched(headline=article["headline"], content=article["content"], summary="Summary") for article in articles]
+
+    mock_articles_provider.get_async.side_effect = get_async
+    mock_summarizer.summarize_async.side_effect = summarize_async
+    mock_repo.save_async.side_effect = save_async
+
+    # Act
+    result = await use_case(urls)
+
+    # Assert
+    assert [dto.status for dto in result] == ["ok", "ok"]
+    assert [call.args[0][0].headline for call in mock_repo.save_async.await_args_list] == ["Fast", "Slow"]
+
+
+@pytest.mark.asyncio
+async def test_use_case_reports_save_failures_per_url(use_case, mock_articles_provider, mock_summarizer, mock_repo):
+    # Arrange
+    urls = ["https://example.com/a"]
+    mock_articles_provider.get_async.side_effect = scrape_pages({urls[0]: {"headline": "A", "content": "A content"}})
+    mock_summarizer.summarize_async.side_effect = summarize_with({"A": ArticleEnriched(headline="A", content="A content", summary="S")})
+    mock_repo.save_async.side_effect = RuntimeError("store unavailable")
+
+    # Act
+    result = await use_case(urls)
+
+    # Assert
+    assert result[0].status == "error"
+    assert result[0].article is None
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_each_article_as_soon_as_it_is_done(use_case, mock_articles_provider, mock_summarizer, mock_repo):
+    # Arrange
+    slow_released = asyncio.Event()
+
+    async def get_async(urls):
+        if urls == ["https://example.com/slow"]:
+            await slow_released.wait()
+            return [{"headline": "Slow", "content": "Slow content"}]
+        return [{"headline": "Fast", "content": "Fast content"}]
+
+    async def summarize_async(articles):
+        return [ArticleEnriched(headline=articles[0]["headline"], content=articles[0]["content"], summary="Summary")]
+
+    mock_articles_provider.get_async.side_effect = get_async
+    mock_summarizer.summarize_async.side_effect = summarize_async
+
+    # Act
+    stream = use_case.stream(["https://example.com/slow", "https://example.com/fast"])
+    first = await anext(stream)
+    saves_before_slow = mock_repo.save_async.await_count
+    slow_released.set()
+    rest = [result async for result in stream]
+
+    # Assert
+    assert first.url == "https://example.com/fast"
+    assert first.article.headline == "Fast"
+    assert saves_before_slow == 1
+    assert [result.url for result in rest] == ["https://example.com/slow"]
+    assert mock_repo.save_async.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_reports_failed_urls_without_aborting_others(use_case, mock_articles_provider, mock_summarizer, mock_repo):
+    # Arrange
+    async def get_async(urls):
+        if urls == ["https://example.com/empty"]:
+            return [NoContentError(urls[0])]
+        return [{"headline": "Good", "content": "Good content"}]
+
+    mock_articles_provider.get_async.side_effect = get_async
+    mock_summarizer.summarize_async.return_value = [ArticleEnriched(headline="Good", content="Good content", summary="Summary")]
+
+    # Act
+    results = [result async for result in use_case.stream(["https://example.com/empty", "https://example.com/good"])]
+
+    # Assert
+    by_url = {result.url: result for result in results}
+    assert by_url["https://example.com/good"].status == "ok"
+    assert by_url["https://example.com/empty"].status == "error"
+    assert "https://example.com/empty" in by_url["https://example.com/empty"].error
+    mock_repo.save_async.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_stream_summarizes_duplicate_content_once(use_case, mock_articles_provider, mock_summarizer, mock_repo):
+    # Arrange
+    mock_articles_provider.get_async.return_value = [{"headline": "Same", "content": "Same content"}]
+    mock_summarizer.summarize_async.return_value = [ArticleEnriched(headline="Same", content="Same content", summary="Summary")]
+
+    # Act
+    results = [result async for result in use_case.stream(["https://example.com/a", "https://mirror.example.com/a"])]
+
+    # Assert
+    assert [result.status for result in results] == ["ok", "ok"]
+    mock_summarizer.summarize_async.assert_awaited_once()
+    mock_repo.save_async.assert_awaited_once()
+
+
+def test_stream_validates_urls_before_streaming(use_case):
+    # Act & Assert
+    with pytest.raises(UrlValidationError):
+        use_case.stream(["not a url"])
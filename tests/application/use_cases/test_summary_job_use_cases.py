@@ -0,0 +1,56 @@
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+from application.use_cases.submit_summary_job_use_case import SubmitSummaryJobUseCase
+from application.use_cases.get_summary_job_use_case import GetSummaryJobUseCase
+from application.models.summary_job_dto import SummaryJobDTO
+from application.exceptions.job_not_found_error import JobNotFoundError
+from application.exceptions.url_validation_error import UrlValidationError
+
+
+def make_job() -> SummaryJobDTO:
+    now = datetime.now(timezone.utc)
+    return SummaryJobDTO(id="job", status="pending", total=1, created_at=now, updated_at=now)
+
+
+@pytest.mark.asyncio
+async def test_submit_persists_job_and_wakes_workers():
+    # Arrange
+    store = MagicMock()
+    store.create.return_value = make_job()
+    runner = MagicMock()
+    use_case = SubmitSummaryJobUseCase(store, runner)
+
+    # Act
+    job = await use_case(["https://example.com/a"])
+
+    # Assert
+    store.create.assert_called_once_with(["https://example.com/a"])
+    runner.notify.assert_called_once()
+    assert job.id == "job"
+
+
+@pytest.mark.asyncio
+async def test_submit_rejects_invalid_urls():
+    # Arrange
+    store = MagicMock()
+    use_case = SubmitSummaryJobUseCase(store, MagicMock())
+
+    # Act & Assert
+    with pytest.raises(UrlValidationError):
+        await use_case(["not a url"])
+
+    store.create.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_raises_for_unknown_job():
+    # Arrange
+    store = MagicMock()
+    store.get.return_value = None
+    use_case = GetSummaryJobUseCase(store)
+
+    # Act & Assert
+    with pytest.raises(JobNotFoundError):
+        await use_case("missing")
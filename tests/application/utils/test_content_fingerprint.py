@@ -0,0 +1,15 @@
+from application.utils.content_fingerprint import fingerprint_content
+
+
+def test_fingerprint_content_ignores_case_and_whitespace():
+    # Act
+    first = fingerprint_content("Breaking  News:\nMarkets fall.")
+    second = fingerprint_content("breaking news: markets fall.  ")
+
+    # Assert
+    assert first == second
+
+
+def test_fingerprint_content_differs_for_different_content():
+    # Act & Assert
+    assert fingerprint_content("Markets fall.") != fingerprint_content("Markets rise.")
@@ -0,0 +1,79 @@
+import pytest
+
+from application.utils.metrics import MetricsRegistry, timed
+from application.utils.request_context import request_context
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+def test_histogram_renders_cumulative_buckets_sum_and_count(registry):
+    # Arrange
+    histogram = registry.histogram("fetch_seconds", "Fetch time.", ("outcome",), buckets=(0.1, 1))
+
+    # Act
+    for value in (0.05, 0.5, 2):
+        histogram.observe(value, outcome="ok")
+
+    # Assert
+    assert registry.render().splitlines() == [
+        "# HELP fetch_seconds Fetch time.",
+        "# TYPE fetch_seconds histogram",
+        'fetch_seconds_bucket{outcome="ok",le="0.1"} 1',
+        'fetch_seconds_bucket{outcome="ok",le="1"} 2',
+        'fetch_seconds_bucket{outcome="ok",le="+Inf"} 3',
+        'fetch_seconds_sum{outcome="ok"} 2.55',
+        'fetch_seconds_count{outcome="ok"} 3',
+    ]
+
+
+def test_counter_keeps_one_series_per_label_values(registry):
+    # Arrange
+    counter = registry.counter("tokens_total", "Tokens.", ("kind",))
+
+    # Act
+    counter.inc(10, kind="prompt")
+    counter.inc(5, kind="prompt")
+    counter.inc(3, kind="completion")
+
+    # Assert
+    assert counter.value(kind="prompt") == 15
+    assert 'tokens_total{kind="completion"} 3' in registry.render()
+
+
+def test_metric_rejects_unknown_labels(registry):
+    # Arrange
+    counter = registry.counter("retries_total", "Retries.", ("reason",))
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        counter.inc(route="/metrics")
+
+
+def test_registry_returns_already_registered_metric(registry):
+    # Act
+    first = registry.counter("documents_total", "Documents.")
+    second = registry.counter("documents_total", "Documents.")
+
+    # Assert
+    assert first is second
+
+
+def test_timed_observes_and_adds_stage_to_current_request(registry):
+    # Arrange
+    histogram = registry.histogram("parse_seconds", "Parse time.")
+
+    # Act
+    with request_context("request-1") as timings:
+        with timed(histogram, stage="parse"):
+            pass
+        with timed(histogram, stage="parse"):
+            pass
+    with timed(histogram, stage="parse"):
+        pass
+
+    # Assert
+    assert histogram.count() == 3
+    assert list(timings) == ["parse"]
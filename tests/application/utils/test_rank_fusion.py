@@ -0,0 +1,21 @@
+import pytest
+
+from application.utils.rank_fusion import reciprocal_rank_fusion
+
+
+def test_reciprocal_rank_fusion_favours_ids_ranked_by_both_lists():
+    # Arrange
+    dense = ["a", "b", "c"]
+    lexical = ["c", "d"]
+
+    # Act
+    fused = reciprocal_rank_fusion([dense, lexical], k=60)
+
+    # Assert
+    assert [item for item, _ in fused] == ["c", "a", "b", "d"]  # b and d tie, first seen wins
+    assert fused[0][1] == pytest.approx(1 / 63 + 1 / 61)
+
+
+def test_reciprocal_rank_fusion_of_empty_lists_is_empty():
+    # Act & Assert
+    assert reciprocal_rank_fusion([[], []]) == []
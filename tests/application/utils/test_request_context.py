@@ -0,0 +1,86 @@
+import asyncio
+import contextvars
+import logging
+import threading
+import pytest
+
+from application.utils.request_context import (
+    RequestIdLogFilter, format_stage_timings, new_request_id, record_stage, request_context, request_id_var
+)
+
+
+def test_new_request_id_keeps_well_formed_ids_and_replaces_others():
+    # Act
+    kept = new_request_id("abc-123")
+    replaced = new_request_id("bad id\n")
+    generated = new_request_id()
+
+    # Assert
+    assert kept == "abc-123"
+    assert replaced != "bad id\n" and len(replaced) == 32
+    assert generated != replaced
+
+
+@pytest.mark.asyncio
+async def test_request_context_is_inherited_by_tasks_and_threads():
+    # Arrange
+    async def stage():
+        record_stage("fetch", 0.25)
+        await asyncio.to_thread(record_stage, "parse", 0.5)
+
+    # Act
+    with request_context("request-1") as timings:
+        await asyncio.gather(stage(), stage())
+        request_id = request_id_var.get()
+
+    # Assert
+    assert request_id == "request-1"
+    assert timings == {"fetch": 0.5, "parse": 1.0}
+    assert request_id_var.get() is None
+
+
+def test_record_stage_from_concurrent_threads_loses_no_updates():
+    # Arrange
+    def stage():
+        for _ in range(1000):
+            record_stage("parse", 1.0)
+
+    # Act
+    with request_context("request-1") as timings:
+        threads = [threading.Thread(target=contextvars.copy_context().run, args=(stage,)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    # Assert
+    assert timings == {"parse": 8000.0}
+
+
+def test_record_stage_outside_a_request_is_ignored():
+    # Act & Assert
+    record_stage("fetch", 1.0)
+
+
+def test_format_stage_timings_lists_slowest_stage_first():
+    # Act
+    formatted = format_stage_timings({"parse": 0.01, "llm": 1.5})
+
+    # Assert
+    assert formatted == "llm=1500.0ms parse=10.0ms"
+
+
+def test_log_filter_adds_request_id():
+    # Arrange
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "message", None, None)
+    log_filter = RequestIdLogFilter()
+
+    # Act
+    log_filter.filter(record)
+    outside = record.request_id
+    with request_context("request-1"):
+        log_filter.filter(record)
+
+    # Assert
+    assert outside == "-"
+    assert record.request_id == "request-1"
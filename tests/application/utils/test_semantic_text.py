@@ -0,0 +1,18 @@
+from application.utils.semantic_text import build_semantic_text
+from domain.article_query import ArticleQuery
+
+
+def test_build_semantic_text_uses_summary_and_topics():
+    # Arrange
+    article = ArticleQuery(headline="Floods", content="Long content", summary="Rain fell.", topics=["Climate", "Spain"])
+
+    # Act & Assert
+    assert build_semantic_text(article) == "Headline: Floods\nSummary: Rain fell.\nTopics: Climate, Spain"
+
+
+def test_build_semantic_text_uses_content_without_summary():
+    # Arrange
+    article = ArticleQuery(headline="Floods", content="Long content", summary="")
+
+    # Act & Assert
+    assert build_semantic_text(article) == "Headline: Floods\nContent: Long content"
@@ -0,0 +1,121 @@
+import asyncio
+import pytest
+
+from application.utils.stage_pipeline import Finished, PipelineStage, StagePipeline
+
+
+async def collect(pipeline, items):
+    return [outcome async for outcome in pipeline.run(items)]
+
+
+@pytest.mark.asyncio
+async def test_items_flow_through_every_stage():
+    # Arrange
+    async def double(items):
+        return [item * 2 for item in items]
+
+    async def increment(items):
+        return [item + 1 for item in items]
+
+    pipeline = StagePipeline([PipelineStage("double", double, workers=2), PipelineStage("increment", increment)])
+
+    # Act
+    outcomes = await collect(pipeline, [1, 2, 3])
+
+    # Assert
+    assert sorted(outcomes) == [(0, 3), (1, 5), (2, 7)]
+
+
+@pytest.mark.asyncio
+async def test_errors_and_finished_items_skip_the_remaining_stages():
+    # Arrange
+    seen = []
+
+    async def first(items):
+        return [ValueError(item) if item == "bad" else Finished("early") if item == "done" else item for item in items]
+
+    async def second(items):
+        seen.extend(items)
+        return items
+
+    pipeline = StagePipeline([PipelineStage("first", first), PipelineStage("second", second)])
+
+    # Act
+    outcomes = dict(await collect(pipeline, ["bad", "done", "ok"]))
+
+    # Assert
+    assert isinstance(outcomes[0], ValueError)
+    assert outcomes[1] == "early"
+    assert outcomes[2] == "ok"
+    assert seen == ["ok"]
+
+
+@pytest.mark.asyncio
+async def test_handler_exception_fails_its_whole_batch():
+    # Arrange
+    async def failing(items):
+        raise RuntimeError("down")
+
+    pipeline = StagePipeline([PipelineStage("failing", failing, batch_size=4)])
+
+    # Act
+    outcomes = await collect(pipeline, [1, 2])
+
+    # Assert
+    assert all(isinstance(outcome, RuntimeError) for _, outcome in outcomes)
+
+
+@pytest.mark.asyncio
+async def test_stage_batches_only_what_is_already_queued():
+    # Arrange
+    batches = []
+    released = asyncio.Event()
+
+    async def slow(items):
+        if items == [0]:
+            await released.wait()
+        return items
+
+    async def batch(items):
+        batches.append(items)
+        released.set()
+        return items
+
+    pipeline = StagePipeline([PipelineStage("slow", slow, workers=4), PipelineStage("batch", batch, batch_size=8)])
+
+    # Act
+    outcomes = await collect(pipeline, [0, 1, 2, 3])
+
+    # Assert
+    assert len(outcomes) == 4
+    assert batches[-1] == [0]
+    assert sorted(item for items in batches for item in items) == [0, 1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_full_queue_holds_back_upstream_stage():
+    # Arrange
+    started = []
+    gate = asyncio.Event()
+
+    async def produce(items):
+        started.extend(items)
+        return items
+
+    async def blocked(items):
+        await gate.wait()
+        return items
+
+    pipeline = StagePipeline([PipelineStage("produce", produce), PipelineStage("blocked", blocked)], queue_size=1)
+    outcomes = pipeline.run(list(range(10)))
+    first = asyncio.ensure_future(anext(outcomes))
+
+    # Act
+    await asyncio.sleep(0.05)
+    started_while_blocked = len(started)
+    gate.set()
+    await first
+    await outcomes.aclose()
+
+    # Assert
+    assert started_while_blocked < 10
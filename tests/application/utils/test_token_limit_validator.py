@@ -11,6 +11,8 @@ from langchain_core.messages import AIMessage, HumanMessage
 def mock_encoding():
     encoding = MagicMock()
     encoding.encode.side_effect = lambda s: s.split() 
+    encoding.encode_ordinary.side_effect = lambda s: s.split()
+    encoding.encode_ordinary_batch.side_effect = lambda texts: [s.split() for s in texts]
     return encoding
 
 
@@ -0,0 +1,100 @@
+import pytest
+from unittest.mock import MagicMock
+from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.prompts.chat import ChatPromptValue
+
+from application.utils.tokenizer import Tokenizer, TokenizerTextSplitter
+from application.utils.token_limit_validator import TokenLimitValidator
+
+
+@pytest.fixture
+def encoding(byte_encoding):
+    return MagicMock(wraps=byte_encoding)
+
+
+@pytest.fixture
+def tokenizer(encoding):
+    return Tokenizer("unused", cache_size=8, encoding=encoding)
+
+
+def test_split_text_produces_overlapping_token_windows(tokenizer):
+    # Arrange
+    text = "abcdefghij" * 3
+
+    # Act
+    chunks = tokenizer.split_text(text, chunk_size=12, chunk_overlap=2)
+
+    # Assert
+    assert chunks == [text[0:12], text[10:22], text[20:30]]
+
+
+def test_split_text_encodes_once_and_remembers_chunk_counts(tokenizer, encoding):
+    # Arrange
+    text = "word " * 50
+
+    # Act
+    chunks = TokenizerTextSplitter(tokenizer, chunk_size=100, chunk_overlap=10).split_text(text)
+    counts = tokenizer.count_batch(chunks)
+
+    # Assert
+    assert encoding.encode_ordinary.call_count == 1
+    encoding.encode_ordinary_batch.assert_not_called()
+    assert counts == [100, 100, 70]
+
+
+def test_split_text_returns_no_chunks_for_empty_text(tokenizer):
+    # Act & Assert
+    assert tokenizer.split_text("", chunk_size=10, chunk_overlap=2) == []
+
+
+def test_count_caches_repeated_texts(tokenizer, encoding):
+    # Act
+    first = tokenizer.count("You are a precise assistant.")
+    second = tokenizer.count("You are a precise assistant.")
+
+    # Assert
+    assert first == second == len("You are a precise assistant.")
+    assert encoding.encode_ordinary.call_count == 1
+
+
+def test_count_batch_encodes_misses_in_one_batch(tokenizer, encoding):
+    # Arrange
+    tokenizer.count("cached")
+
+    # Act
+    counts = tokenizer.count_batch(["cached", "one", "three"])
+
+    # Assert
+    assert counts == [6, 3, 5]
+    encoding.encode_ordinary_batch.assert_called_once_with(["one", "three"])
+
+
+def test_cache_evicts_least_recently_used_texts(tokenizer, encoding):
+    # Arrange
+    tokenizer.count("first")
+    tokenizer.count_batch([f"text {i}" for i in range(8)])
+
+    # Act
+    tokenizer.count("first")
+
+    # Assert
+    assert encoding.encode_ordinary.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_validator_abatch_encodes_prompts_together(tokenizer, encoding):
+    # Arrange
+    validator = TokenLimitValidator(max_tokens=1000, model_name="unused", tokenizer=tokenizer)
+    prompts = [
+        ChatPromptValue(messages=[SystemMessage(content="System prompt"), HumanMessage(content=f"Chunk {i}")])
+        for i in range(3)
+    ]
+
+    # Act
+    result = await validator.abatch(prompts)
+
+    # Assert
+    assert result == prompts
+    encoding.encode_ordinary_batch.assert_called_once()
+    encoding.encode_ordinary.assert_not_called()
+    assert len(encoding.encode_ordinary_batch.call_args[0][0]) == 4
@@ -0,0 +1,25 @@
+from application.utils.url_normalizer import normalize_url
+
+
+def test_normalize_url_lowercases_host_and_drops_fragment_and_default_port():
+    # Act
+    result = normalize_url("HTTPS://News.Example.com:443/World/Story#comments")
+
+    # Assert
+    assert result == "https://news.example.com/World/Story"
+
+
+def test_normalize_url_removes_tracking_params_and_sorts_query():
+    # Act
+    result = normalize_url("https://example.com/a?b=2&utm_source=tw&a=1&fbclid=xyz")
+
+    # Assert
+    assert result == "https://example.com/a?a=1&b=2"
+
+
+def test_normalize_url_keeps_custom_port():
+    # Act
+    result = normalize_url("http://localhost:8080")
+
+    # Assert
+    assert result == "http://localhost:8080/"
@@ -0,0 +1,11 @@
+import pytest
+import tiktoken
+
+# The pre-tokenization pattern of cl100k_base
+PATTERN = r"""'s|'t|'re|'ve|'m|'ll|'d| ?\p{L}+| ?\p{N}+| ?[^\s\p{L}\p{N}]+|\s+(?!\S)|\s+"""
+
+
+@pytest.fixture
+def byte_encoding() -> tiktoken.Encoding:
+    # One token per byte, so token counts equal text lengths (no BPE download needed)
+    return tiktoken.Encoding(name="bytes", pat_str=PATTERN, mergeable_ranks={bytes([i]): i for i in range(256)}, special_tokens={})
@@ -0,0 +1,94 @@
+import json
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from application.models.ingest_batch_result_dto import IngestBatchResultDTO
+from application.use_cases.ingest_articles_use_case import IngestArticlesUseCase
+from entrypoints.cli.ingest import format_duration, ingest_async
+from repositories.article_dump_reader import ArticleDumpReader
+from repositories.json_ingest_checkpoint import JsonIngestCheckpoint
+
+
+@pytest.fixture
+def mock_repo():
+    repo = MagicMock()
+    repo.save_async = AsyncMock()
+    repo.get_by_fingerprints_async = AsyncMock(return_value={})
+    return repo
+
+
+@pytest.fixture
+def dump(tmp_path):
+    path = tmp_path / "articles.jsonl"
+    path.write_text("\n".join(json.dumps({"headline": f"Headline {i}", "content": f"Content {i}"}) for i in range(10)))
+    return str(path)
+
+
+def saved_headlines(mock_repo):
+    return [article.headline for call in mock_repo.save_async.await_args_list for article in call.args[0]]
+
+
+@pytest.mark.asyncio
+async def test_ingest_async_ingests_the_dump_and_marks_the_checkpoint_completed(mock_repo, dump, tmp_path):
+    # Arrange
+    use_case = IngestArticlesUseCase(mock_repo, MagicMock(), summarize=False, parallel=2)
+    checkpoint = JsonIngestCheckpoint(str(tmp_path / "checkpoint.json"))
+
+    # Act
+    totals = await ingest_async(use_case, ArticleDumpReader(dump), checkpoint, batch_size=4)
+
+    # Assert
+    assert totals == IngestBatchResultDTO(ingested=10)
+    assert saved_headlines(mock_repo) == [f"Headline {i}" for i in range(10)]
+    assert checkpoint.load()["position"] == 10
+    assert checkpoint.load()["completed"] is True
+
+
+@pytest.mark.asyncio
+async def test_ingest_async_resumes_after_the_checkpointed_position(mock_repo, dump, tmp_path):
+    # Arrange
+    reader = ArticleDumpReader(dump)
+    checkpoint = JsonIngestCheckpoint(str(tmp_path / "checkpoint.json"))
+    checkpoint.save({"dump": reader.describe(), "position": 6, "completed": False, "ingested": 5, "skipped": 0, "failed": 1})
+    use_case = IngestArticlesUseCase(mock_repo, MagicMock(), summarize=False)
+
+    # Act
+    totals = await ingest_async(use_case, reader, checkpoint, batch_size=4)
+
+    # Assert
+    assert saved_headlines(mock_repo) == [f"Headline {i}" for i in range(6, 10)]
+    assert totals == IngestBatchResultDTO(ingested=9, failed=1)
+
+
+@pytest.mark.asyncio
+async def test_ingest_async_does_nothing_when_the_dump_was_already_ingested(mock_repo, dump, tmp_path):
+    # Arrange
+    reader = ArticleDumpReader(dump)
+    checkpoint = JsonIngestCheckpoint(str(tmp_path / "checkpoint.json"))
+    checkpoint.save({"dump": reader.describe(), "position": 10, "completed": True, "ingested": 10, "skipped": 0, "failed": 0})
+    use_case = IngestArticlesUseCase(mock_repo, MagicMock(), summarize=False)
+
+    # Act
+    totals = await ingest_async(use_case, reader, checkpoint, batch_size=4)
+
+    # Assert
+    assert totals == IngestBatchResultDTO(ingested=10)
+    mock_repo.save_async.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_ingest_async_refuses_a_checkpoint_of_another_dump(mock_repo, dump, tmp_path):
+    # Arrange
+    checkpoint = JsonIngestCheckpoint(str(tmp_path / "checkpoint.json"))
+    checkpoint.save({"dump": {"path": "/other.jsonl", "size": 1}, "position": 4, "completed": False})
+    use_case = IngestArticlesUseCase(mock_repo, MagicMock(), summarize=False)
+
+    # Act & Assert
+    with pytest.raises(SystemExit):
+        await ingest_async(use_case, ArticleDumpReader(dump), checkpoint, batch_size=4)
+
+
+def test_format_duration():
+    # Act & Assert
+    assert format_duration(3725.4) == "1:02:05"
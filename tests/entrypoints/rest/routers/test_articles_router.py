@@ -0,0 +1,65 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from fastapi.testclient import TestClient
+
+from entrypoints.rest.main import app
+from abstractions.dependencies import get_query_articles_user_case
+from application.use_cases.query_articles_use_case import QueryArticleUseCase
+from domain.article_filters import ArticleFilters
+
+
+@pytest.fixture
+def repo():
+    document = SimpleNamespace(id="1", metadata={
+        "headline": "Floods in Valencia", "summary": "Rain", "content": "Long content", "topics": "Climate", "political_bias": "None",
+    })
+    repo = MagicMock()
+    repo.query_async = AsyncMock(return_value=[(document, 0.5)])
+    return repo
+
+
+@pytest.fixture
+def client(repo):
+    enhancer = MagicMock()
+    enhancer.enhance_async = AsyncMock(side_effect=lambda query: query)
+    app.dependency_overrides[get_query_articles_user_case] = lambda: QueryArticleUseCase(repo, enhancer, b"test-secret")
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def test_query_returns_projected_page_and_pushes_filters_down(client, repo):
+    # Act
+    response = client.get(
+        "/articles/query",
+        params={"query": "floods", "k": 1, "fields": ["headline", "score"], "political_bias": ["None", "Left"], "topics": ["Climate"]},
+    )
+
+    # Assert
+    assert response.status_code == 200
+    body = response.json()
+    assert body["items"] == [{"headline": "Floods in Valencia", "score": 0.5}]
+    assert body["next_cursor"]
+    repo.query_async.assert_awaited_once_with(
+        "floods", k=1, offset=0, filters=ArticleFilters(political_bias=["None", "Left"], topics=["climate"])
+    )
+
+
+def test_query_omits_content_by_default(client):
+    # Act
+    response = client.get("/articles/query", params={"query": "floods"})
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json() == {
+        "items": [{"headline": "Floods in Valencia", "summary": "Rain", "topics": ["Climate"], "political_bias": "None", "score": 0.5}],
+        "next_cursor": None,
+    }
+
+
+def test_query_rejects_invalid_cursor(client):
+    # Act
+    response = client.get("/articles/query", params={"query": "floods", "cursor": "bogus"})
+
+    # Assert
+    assert response.status_code == 400
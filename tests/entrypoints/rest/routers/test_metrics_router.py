@@ -0,0 +1,59 @@
+import logging
+from types import SimpleNamespace
+from fastapi.testclient import TestClient
+
+from entrypoints.rest.main import app
+from abstractions.dependencies import get_summarize_articles_user_case
+from application.utils.metrics import HTTP_REQUEST_SECONDS
+from application.utils.request_context import record_stage
+
+
+def test_metrics_exposes_prometheus_text_format():
+    # Arrange
+    client = TestClient(app)
+    client.get("/metrics")
+
+    # Act
+    response = client.get("/metrics")
+
+    # Assert
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE http_request_duration_seconds histogram" in response.text
+    assert 'http_request_duration_seconds_count{method="GET",route="/metrics",status="200"}' in response.text
+
+
+def test_responses_carry_request_id_and_server_timing():
+    # Arrange
+    client = TestClient(app)
+    unmatched = HTTP_REQUEST_SECONDS.count(method="GET", route="unmatched", status="404")
+
+    # Act
+    supplied = client.get("/metrics", headers={"X-Request-ID": "trace-42"})
+    generated = client.get("/does/not/exist")
+
+    # Assert
+    assert supplied.headers["X-Request-ID"] == "trace-42"
+    assert supplied.headers["Server-Timing"].startswith("total;dur=")
+    assert len(generated.headers["X-Request-ID"]) == 32
+    assert HTTP_REQUEST_SECONDS.count(method="GET", route="unmatched", status="404") == unmatched + 1
+
+
+def test_streamed_responses_log_the_stages_run_while_the_body_is_sent(caplog):
+    # Arrange
+    async def stream(urls):
+        for url in urls:
+            record_stage("llm", 0.25)
+            yield SimpleNamespace(model_dump_json=lambda: '{"url": "%s"}' % url)
+
+    app.dependency_overrides[get_summarize_articles_user_case] = lambda: SimpleNamespace(stream=stream)
+    client = TestClient(app)
+
+    # Act
+    with caplog.at_level(logging.INFO):
+        response = client.post("/articles/summary/stream", json=["http://a.com/1", "http://b.com/2"])
+    app.dependency_overrides.clear()
+
+    # Assert
+    assert response.text.count("\n") == 2
+    assert any("POST /articles/summary/stream took" in message and "llm=500.0ms" in message for message in caplog.messages)
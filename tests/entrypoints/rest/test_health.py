@@ -0,0 +1,93 @@
+import threading
+import time
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi.testclient import TestClient
+
+from entrypoints.rest.main import app
+
+
+@pytest.fixture
+def resources():
+    resources = MagicMock()
+    resources.warm_up_async = AsyncMock()
+    resources.close_async = AsyncMock()
+    return resources
+
+
+def wait_until_ready(client: TestClient, timeout: float = 5) -> int:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        response = client.get("/health/ready")
+        if response.json()["status"] != "starting":
+            return response.status_code
+        time.sleep(0.01)
+    return 503
+
+
+def test_fast_start_accepts_requests_while_resources_load(resources):
+    # Arrange
+    loaded = threading.Event()
+
+    def build():
+        loaded.wait(5)
+        return resources
+
+    with patch("entrypoints.rest.main.settings") as settings, \
+         patch("entrypoints.rest.main.AppResources.build", side_effect=build), \
+         patch("entrypoints.rest.main.build_summarize_articles_use_case"), \
+         patch("entrypoints.rest.main.SummaryJobRunner") as runner_cls:
+        settings.FAST_START = True
+        runner_cls.return_value.stop_async = AsyncMock()
+
+        # Act
+        with TestClient(app) as client:
+            starting = client.get("/health/ready")
+            query = client.get("/articles/query", params={"query": "elections"})
+            loaded.set()
+            ready_status = wait_until_ready(client)
+
+    # Assert
+    assert starting.status_code == 503
+    assert starting.json() == {"status": "starting"}
+    assert query.status_code == 503
+    assert query.headers["Retry-After"] == "5"
+    assert ready_status == 200
+    resources.warm_up_async.assert_awaited_once()
+    runner_cls.return_value.start.assert_called_once()
+    runner_cls.return_value.stop_async.assert_awaited_once()
+    resources.close_async.assert_awaited_once()
+
+
+def test_fast_start_reports_failed_startup():
+    # Arrange
+    with patch("entrypoints.rest.main.settings") as settings, \
+         patch("entrypoints.rest.main.AppResources.build", side_effect=RuntimeError("model not found")):
+        settings.FAST_START = True
+
+        # Act
+        with TestClient(app) as client:
+            wait_until_ready(client)
+            response = client.get("/health/ready")
+
+    # Assert
+    assert response.status_code == 503
+    assert response.json() == {"status": "failed"}
+
+
+def test_default_start_is_ready_before_accepting_requests(resources):
+    # Arrange
+    with patch("entrypoints.rest.main.settings") as settings, \
+         patch("entrypoints.rest.main.AppResources.build", return_value=resources), \
+         patch("entrypoints.rest.main.build_summarize_articles_use_case"), \
+         patch("entrypoints.rest.main.SummaryJobRunner") as runner_cls:
+        settings.FAST_START = False
+        runner_cls.return_value.stop_async = AsyncMock()
+
+        # Act
+        with TestClient(app) as client:
+            response = client.get("/health/ready")
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json() == {"status": "ready"}
@@ -0,0 +1,47 @@
+import os
+import subprocess
+import sys
+
+SRC_DIRECTORY = os.path.join(os.path.dirname(__file__), "..", "..", "..", "src")
+
+# Cumulative `python -X importtime` budget of the REST entrypoint, FastAPI included.
+# Loading the models and clients (see AppResources.build) takes several times longer.
+IMPORT_TIME_BUDGET_MS = 1500
+
+HEAVY_MODULES = (
+    "langchain", "langchain_core", "langgraph", "langsmith", "langchain_chroma", "chromadb",
+    "langchain_huggingface", "transformers", "torch", "langchain_openai", "openai", "tiktoken", "faiss",
+)
+
+
+def import_entrypoint() -> tuple[int, set[str]]:
+    """Imports the entrypoint in a fresh interpreter, returning its cumulative import time (us) and loaded modules."""
+    code = "import sys, entrypoints.rest.main; print(' '.join(sys.modules))"
+    env = {**os.environ, "PYTHONPATH": os.path.abspath(SRC_DIRECTORY)}
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, env=env, check=True
+    )
+
+    cumulative = 0
+    for line in process.stderr.splitlines():
+        fields = line.split("|")
+        if line.startswith("import time:") and len(fields) == 3 and fields[2].strip() == "entrypoints.rest.main":
+            cumulative = int(fields[1])
+
+    return cumulative, set(process.stdout.split())
+
+
+def test_entrypoint_does_not_import_heavy_modules():
+    # Act
+    _, modules = import_entrypoint()
+
+    # Assert
+    assert sorted(modules.intersection(HEAVY_MODULES)) == []
+
+
+def test_entrypoint_import_time_is_within_budget():
+    # Act
+    cumulative_us = min(import_entrypoint()[0] for _ in range(3))
+
+    # Assert
+    assert 0 < cumulative_us / 1000 <= IMPORT_TIME_BUDGET_MS
@@ -0,0 +1,82 @@
+import gzip
+import json
+
+import pytest
+
+from repositories.article_dump_reader import ArticleDumpReader
+
+RECORDS = [{"headline": f"Headline {i}", "content": f"Content {i}"} for i in range(5)]
+
+
+def write_jsonl(path, lines):
+    path.write_text("\n".join(lines) + "\n")
+    return str(path)
+
+
+@pytest.fixture
+def dump(tmp_path):
+    return write_jsonl(tmp_path / "articles.jsonl", [json.dumps(record) for record in RECORDS])
+
+
+def test_iter_batches_reads_jsonl_in_batches(dump):
+    # Act
+    batches = list(ArticleDumpReader(dump).iter_batches(batch_size=2))
+
+    # Assert
+    assert batches == [RECORDS[0:2], RECORDS[2:4], RECORDS[4:5]]
+
+
+def test_iter_batches_skips_already_ingested_records(dump):
+    # Act
+    batches = list(ArticleDumpReader(dump).iter_batches(batch_size=2, skip=3))
+
+    # Assert
+    assert batches == [RECORDS[3:5]]
+
+
+def test_iter_batches_yields_malformed_lines_as_empty_records_and_ignores_blank_lines(tmp_path):
+    # Arrange
+    dump = write_jsonl(tmp_path / "articles.jsonl", [json.dumps(RECORDS[0]), "", "{not json", "[1, 2]", json.dumps(RECORDS[1])])
+
+    # Act
+    records = [record for batch in ArticleDumpReader(dump).iter_batches(batch_size=10) for record in batch]
+
+    # Assert
+    assert records == [RECORDS[0], {}, {}, RECORDS[1]]
+    assert ArticleDumpReader(dump).count() == 4
+
+
+def test_reader_reads_gzip_compressed_jsonl(tmp_path):
+    # Arrange
+    path = tmp_path / "articles.jsonl.gz"
+    with gzip.open(path, "wt") as file:
+        file.write("\n".join(json.dumps(record) for record in RECORDS))
+
+    # Act
+    reader = ArticleDumpReader(str(path))
+
+    # Assert
+    assert reader.count() == 5
+    assert [record for batch in reader.iter_batches(batch_size=3) for record in batch] == RECORDS
+
+
+def test_reader_rejects_unsupported_format(dump):
+    # Act & Assert
+    with pytest.raises(ValueError):
+        ArticleDumpReader(dump, format="csv")
+
+
+def test_iter_batches_reads_parquet_row_groups_and_skips_records(tmp_path):
+    # Arrange
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = str(tmp_path / "articles.parquet")
+    pq.write_table(pa.Table.from_pylist(RECORDS), path, row_group_size=2)
+    reader = ArticleDumpReader(path)
+
+    # Act
+    batches = list(reader.iter_batches(batch_size=2, skip=3))
+
+    # Assert
+    assert reader.count() == 5
+    assert batches == [RECORDS[3:5]]
@@ -0,0 +1,119 @@
+import pytest
+
+from repositories.bm25_index import Bm25Index, tokenize_terms
+
+DOCUMENTS = [
+    ("a", "Headline: Central bank holds rates\nSummary: The central bank kept interest rates unchanged."),
+    ("b", "Headline: Nvidia shares rally\nSummary: NVDA rose after earnings beat expectations."),
+    ("c", "Headline: Floods in Valencia\nSummary: Heavy rain flooded Valencia and nearby towns."),
+]
+
+
+def test_tokenize_terms_lowercases_and_drops_stop_words():
+    # Act
+    terms = tokenize_terms("The Fed and the ECB, in 2024")
+
+    # Assert
+    assert terms == ["fed", "ecb", "2024"]
+
+
+def test_search_ranks_exact_entity_first():
+    # Arrange
+    index = Bm25Index()
+    index.add(DOCUMENTS)
+
+    # Act
+    results = index.search("valencia floods", k=3)
+
+    # Assert
+    assert [document_id for document_id, _ in results] == ["c"]
+    assert results[0][1] > 0
+
+
+def test_search_returns_at_most_k_best_documents():
+    # Arrange
+    index = Bm25Index()
+    index.add(DOCUMENTS)
+
+    # Act
+    results = index.search("summary headline nvda", k=1)
+
+    # Assert
+    assert [document_id for document_id, _ in results] == ["b"]
+
+
+def test_search_without_matching_terms_returns_empty_list():
+    # Arrange
+    index = Bm25Index()
+    index.add(DOCUMENTS)
+
+    # Act & Assert
+    assert index.search("the and of", k=3) == []
+    assert index.search("tokyo", k=3) == []
+
+
+def test_add_replaces_previous_version_of_document():
+    # Arrange
+    index = Bm25Index()
+    index.add(DOCUMENTS)
+
+    # Act
+    index.add([("c", "Headline: Wildfires in Athens")])
+
+    # Assert
+    assert len(index) == 3
+    assert index.search("valencia", k=3) == []
+    assert [document_id for document_id, _ in index.search("athens", k=3)] == ["c"]
+
+
+def test_reopened_index_replays_the_log(tmp_path):
+    # Arrange
+    path = str(tmp_path / "bm25_index.sqlite3")
+    index = Bm25Index(path)
+    index.add(DOCUMENTS)
+    index.add([("a", "Headline: Central bank cuts rates")])
+    expected = index.search("central bank nvda", k=3)
+    index.close()
+
+    # Act
+    reopened = Bm25Index(path)
+
+    # Assert
+    assert len(reopened) == 3
+    assert reopened.search("central bank nvda", k=3) == pytest.approx(expected)
+    assert reopened.search("unchanged", k=3) == []
+    reopened.close()
+
+
+def test_indexes_sharing_a_log_see_each_others_documents(tmp_path):
+    # Arrange
+    path = str(tmp_path / "bm25_index.sqlite3")
+    first, second = Bm25Index(path), Bm25Index(path)
+
+    # Act
+    first.add(DOCUMENTS[:2])
+    second.add(DOCUMENTS[2:])
+    first.add([("c", "Headline: Wildfires in Athens")])
+
+    # Assert
+    assert len(first) == len(second) == 3
+    assert [document_id for document_id, _ in second.search("athens", k=3)] == ["c"]
+    assert second.search("valencia", k=3) == []
+    assert [document_id for document_id, _ in first.search("nvidia", k=3)] == ["b"]
+    first.close()
+    second.close()
+
+
+def test_compaction_drops_replaced_documents():
+    # Arrange
+    index = Bm25Index()
+    index.add(DOCUMENTS)
+
+    # Act
+    for version in range(5):
+        index.add([("b", f"Headline: Nvidia update {version}")])
+
+    # Assert
+    assert len(index._ids) < 3 + 5
+    assert [document_id for document_id, _ in index.search("update 4", k=3)] == ["b"]
+    assert [document_id for document_id, _ in index.search("valencia", k=3)] == ["c"]
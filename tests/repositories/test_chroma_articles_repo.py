@@ -1,8 +1,14 @@
+import uuid
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 from domain.article_query import ArticleQuery
 from langchain_core.documents import Document
-from repositories.chroma_articles_repo import ChromaArticlesRepo
+from repositories.chroma_articles_repo import ChromaArticlesRepo, build_where
+from domain.article_filters import ArticleFilters
+from application.utils.content_fingerprint import fingerprint_content
+from application.services.batch_embedder import BatchEmbedder
+from repositories.bm25_index import Bm25Index
+from repositories.sqlite_content_store import SqliteContentStore
 
 @pytest.fixture
 def sample_articles():
@@ -12,14 +18,14 @@ def sample_articles():
             summary="Summary A",
             content="Full article content A.",
             topics=["politics", "world"],
-            political_bias="center"
+            political_bias="None"
         ),
         ArticleQuery(
             headline="Title B",
             summary="Summary B",
             content="Full article content B.",
             topics=["tech"],
-            political_bias="left"
+            political_bias="Left"
         ),
     ]
 
@@ -55,7 +61,7 @@ def test_articles_to_documents_creates_expected_documents(sample_articles):
     assert isinstance(documents[0], Document)
     assert "Headline: Title A" in documents[0].page_content
     assert documents[0].metadata["topics"] == "politics,world"
-    assert documents[1].metadata["political_bias"] == "left"
+    assert documents[1].metadata["political_bias"] == "Left"
 
 
 @pytest.mark.asyncio
@@ -71,5 +77,250 @@ async def test_query_async_returns_similarity_results():
     results = await repo.query_async("test query")
 
     # Assert
-    mock_chroma.asimilarity_search_with_score.assert_awaited_once_with("test query")
+    mock_chroma.asimilarity_search_with_score.assert_awaited_once_with("test query", k=4, filter=None)
     assert results == [(fake_document, 0.9)]
+
+
+@pytest.mark.asyncio
+async def test_query_async_fuses_vector_and_lexical_results():
+    # Arrange
+    mock_chroma = AsyncMock()
+    dense_a = Document(id="a", page_content="Headline: Rates", metadata={})
+    dense_b = Document(id="b", page_content="Headline: Markets", metadata={})
+    lexical_c = Document(id="c", page_content="Headline: Floods in Valencia", metadata={})
+    mock_chroma.asimilarity_search_with_score.return_value = [(dense_a, 0.2), (dense_b, 0.3)]
+    mock_chroma.aget_by_ids.return_value = [lexical_c]
+
+    lexical_index = Bm25Index()
+    lexical_index.add([("a", dense_a.page_content), ("b", dense_b.page_content), ("c", lexical_c.page_content)])
+    repo = ChromaArticlesRepo(vector_store=mock_chroma, lexical_index=lexical_index, k=2, candidates=10)
+
+    # Act
+    results = await repo.query_async("valencia")
+
+    # Assert
+    mock_chroma.asimilarity_search_with_score.assert_awaited_once_with("valencia", k=10, filter=None)
+    mock_chroma.aget_by_ids.assert_awaited_once_with(["c"])
+    assert [document.id for document, _ in results] == ["a", "c"]
+    assert results[0][1] == pytest.approx(1 / 61)
+
+
+@pytest.mark.asyncio
+async def test_save_async_indexes_articles_lexically(sample_articles, tmp_path):
+    # Arrange
+    lexical_index = Bm25Index(str(tmp_path / "bm25_index.sqlite3"))
+    repo = ChromaArticlesRepo(vector_store=AsyncMock(), lexical_index=lexical_index)
+
+    # Act
+    await repo.save_async(sample_articles)
+
+    # Assert
+    assert len(Bm25Index(lexical_index.path)) == 2
+    assert [document_id for document_id, _ in lexical_index.search("tech", k=2)] == [fingerprint_content("Full article content B.")]
+
+
+@pytest.mark.asyncio
+async def test_save_async_upserts_with_content_fingerprint_ids(sample_articles):
+    # Arrange
+    mock_chroma = AsyncMock()
+    repo = ChromaArticlesRepo(vector_store=mock_chroma)
+
+    # Act
+    await repo.save_async(sample_articles)
+
+    # Assert
+    ids = mock_chroma.aadd_documents.call_args.kwargs["ids"]
+    assert ids == [fingerprint_content("Full article content A."), fingerprint_content("Full article content B.")]
+
+
+@pytest.mark.asyncio
+async def test_save_async_skips_empty_batch():
+    # Arrange
+    mock_chroma = AsyncMock()
+    repo = ChromaArticlesRepo(vector_store=mock_chroma)
+
+    # Act
+    await repo.save_async([])
+
+    # Assert
+    mock_chroma.aadd_documents.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_by_fingerprints_async_returns_stored_articles():
+    # Arrange
+    mock_chroma = AsyncMock()
+    stored = Document(
+        id="abc",
+        page_content="Headline: Title A",
+        metadata={"headline": "Title A", "summary": "Summary A", "content": "Content A", "topics": "politics,world"},
+    )
+    mock_chroma.aget_by_ids.return_value = [stored]
+    repo = ChromaArticlesRepo(vector_store=mock_chroma)
+
+    # Act
+    result = await repo.get_by_fingerprints_async(["abc", "missing"])
+
+    # Assert
+    mock_chroma.aget_by_ids.assert_awaited_once_with(["abc", "missing"])
+    assert list(result) == ["abc"]
+    assert result["abc"].summary == "Summary A"
+    assert result["abc"].topics == ["politics", "world"]
+
+
+@pytest.mark.asyncio
+async def test_save_async_streams_batches_into_collection(sample_articles):
+    # Arrange
+    mock_chroma = MagicMock()
+    embeddings = MagicMock()
+    embeddings.embed_documents.side_effect = lambda texts: [[0.1, 0.2] for _ in texts]
+    repo = ChromaArticlesRepo(vector_store=mock_chroma, embedder=BatchEmbedder(embeddings, batch_size=1))
+
+    # Act
+    await repo.save_async(sample_articles)
+
+    # Assert
+    upserts = mock_chroma._collection.upsert.call_args_list
+    assert len(upserts) == 2
+    assert upserts[0].kwargs["ids"] == [fingerprint_content("Full article content A.")]
+    assert upserts[1].kwargs["embeddings"] == [[0.1, 0.2]]
+    mock_chroma.aadd_documents.assert_not_called()
+
+
+def test_build_where_combines_filters():
+    # Act
+    where = build_where(ArticleFilters(political_bias=["Left", "Lean Left"], topics=["Tech", "world"]))
+
+    # Assert
+    assert where == {"$and": [
+        {"political_bias": {"$in": ["Left", "Lean Left"]}},
+        {"$or": [{"topic:tech": True}, {"topic:world": True}]},
+    ]}
+    assert build_where(ArticleFilters()) is None
+
+
+@pytest.fixture
+def chroma_store():
+    import chromadb
+    from langchain_chroma import Chroma
+    from langchain_core.embeddings import DeterministicFakeEmbedding
+
+    client = chromadb.EphemeralClient()
+    store = Chroma(collection_name=f"articles_{uuid.uuid4().hex[:8]}", client=client, embedding_function=DeterministicFakeEmbedding(size=8))
+    yield store
+    store.delete_collection()
+
+
+@pytest.mark.asyncio
+async def test_query_async_filters_in_chroma(sample_articles, chroma_store):
+    # Arrange
+    repo = ChromaArticlesRepo(vector_store=chroma_store)
+    await repo.save_async(sample_articles)
+
+    # Act
+    by_topic = await repo.query_async("news", k=4, filters=ArticleFilters(topics=["World"]))
+    by_bias = await repo.query_async("news", k=4, filters=ArticleFilters(political_bias=["Left"], topics=["tech"]))
+    no_match = await repo.query_async("news", k=4, filters=ArticleFilters(political_bias=["Left"], topics=["world"]))
+
+    # Assert
+    assert [document.metadata["headline"] for document, _ in by_topic] == ["Title A"]
+    assert [document.metadata["headline"] for document, _ in by_bias] == ["Title B"]
+    assert no_match == []
+
+
+@pytest.mark.asyncio
+async def test_query_async_normalizes_queries_like_stored_vectors(sample_articles, chroma_store):
+    # Arrange
+    repo = ChromaArticlesRepo(vector_store=chroma_store, embedder=BatchEmbedder(chroma_store.embeddings, normalize=True))
+    await repo.save_async(sample_articles)
+
+    # Act
+    results = await repo.query_async("news", k=2)
+
+    # Assert: squared L2 distances between unit vectors are at most 4
+    assert len(results) == 2
+    assert all(score <= 4 for _, score in results)
+
+
+@pytest.mark.asyncio
+async def test_query_async_pages_with_offset(sample_articles, chroma_store):
+    # Arrange
+    repo = ChromaArticlesRepo(vector_store=chroma_store)
+    await repo.save_async(sample_articles)
+
+    # Act
+    first_page = await repo.query_async("news", k=1)
+    second_page = await repo.query_async("news", k=1, offset=1)
+
+    # Assert
+    assert len(first_page) == len(second_page) == 1
+    assert first_page[0][0].id != second_page[0][0].id
+
+
+@pytest.mark.asyncio
+async def test_hybrid_query_async_filters_lexical_candidates(sample_articles, chroma_store):
+    # Arrange
+    lexical_index = Bm25Index()
+    repo = ChromaArticlesRepo(vector_store=chroma_store, lexical_index=lexical_index, candidates=10)
+    await repo.save_async(sample_articles)
+
+    # Act
+    results = await repo.query_async("tech", k=4, filters=ArticleFilters(political_bias=["None"]))
+
+    # Assert
+    assert [document.metadata["headline"] for document, _ in results] == ["Title A"]
+
+
+def test_backfill_topic_flags_makes_old_documents_filterable(chroma_store):
+    # Arrange
+    chroma_store._collection.add(
+        ids=["old"], embeddings=[[0.1] * 8], documents=["Headline: Old"], metadatas=[{"headline": "Old", "topics": "Energy, Markets"}]
+    )
+    repo = ChromaArticlesRepo(vector_store=chroma_store)
+
+    # Act
+    updated = repo.backfill_topic_flags()
+
+    # Assert
+    assert updated == 1
+    assert repo.backfill_topic_flags() == 0
+    assert chroma_store._collection.get(where={"topic:markets": True})["ids"] == ["old"]
+
+
+@pytest.mark.asyncio
+async def test_content_store_keeps_content_out_of_chroma_metadata(sample_articles, chroma_store, tmp_path):
+    # Arrange
+    content_store = SqliteContentStore(str(tmp_path / "contents.sqlite3"))
+    repo = ChromaArticlesRepo(vector_store=chroma_store, content_store=content_store)
+    fingerprint = fingerprint_content("Full article content A.")
+
+    # Act
+    await repo.save_async(sample_articles)
+    results = await repo.query_async("news", k=2)
+    contents = await repo.get_contents_async([fingerprint])
+    stored = await repo.get_by_fingerprints_async([fingerprint])
+
+    # Assert
+    assert all("content" not in document.metadata for document, _ in results)
+    assert contents == {fingerprint: "Full article content A."}
+    assert stored[fingerprint].content == "Full article content A."
+    content_store.close()
+
+
+@pytest.mark.asyncio
+async def test_move_contents_to_store_migrates_legacy_documents(sample_articles, chroma_store, tmp_path):
+    # Arrange
+    await ChromaArticlesRepo(vector_store=chroma_store).save_async(sample_articles)
+    content_store = SqliteContentStore(str(tmp_path / "contents.sqlite3"))
+    repo = ChromaArticlesRepo(vector_store=chroma_store, content_store=content_store)
+    fingerprint = fingerprint_content("Full article content B.")
+
+    # Act
+    moved = repo.move_contents_to_store()
+
+    # Assert
+    assert moved == 2
+    assert repo.move_contents_to_store() == 0
+    assert all("content" not in metadata for metadata in chroma_store._collection.get(include=["metadatas"])["metadatas"])
+    assert await repo.get_contents_async([fingerprint]) == {fingerprint: "Full article content B."}
+    content_store.close()
@@ -0,0 +1,118 @@
+import chromadb
+import pytest
+
+from domain.embedding_signature import EmbeddingSignature
+from repositories.chroma_collection_migrator import ChromaCollectionMigrator
+
+OLD = EmbeddingSignature(model="old-model")
+NEW = EmbeddingSignature(model="new-model", version=2)
+
+
+@pytest.fixture
+def client(tmp_path):
+    return chromadb.PersistentClient(path=str(tmp_path / "chroma"))
+
+
+@pytest.fixture
+def migrator(client):
+    live = client.create_collection("articles", metadata={"hnsw:space": "cosine"})
+    live.upsert(ids=["a", "b"], embeddings=[[1.0, 0.0], [0.0, 1.0]], documents=["Headline: A", "Headline: B"], metadatas=[{"x": 1}, {"x": 2}])
+    return ChromaCollectionMigrator(client, "articles")
+
+
+def test_stamp_records_the_signature_and_keeps_the_distance(migrator, client):
+    # Act
+    migrator.stamp(OLD)
+
+    # Assert
+    assert migrator.signature() == OLD
+    assert client.get_collection("articles").configuration["hnsw"]["space"] == "cosine"
+    assert migrator.stored_dimension() == 2
+
+
+def test_signature_records_whether_vectors_are_normalized(migrator, client):
+    # Arrange
+    normalized = EmbeddingSignature(model="old-model", normalized=True)
+
+    # Act
+    migrator.stamp(normalized)
+
+    # Assert
+    assert migrator.signature() == normalized
+    assert migrator.signature() != OLD
+    assert EmbeddingSignature.from_metadata({"embedding_model": "old-model", "embedding_version": 1}) == OLD
+
+
+def test_missing_loads_the_live_documents_not_in_the_shadow(migrator):
+    # Arrange
+    migrator.prepare_shadow(NEW)
+    migrator.write("live", ["a"], [[1.0, 0.0, 0.0]], ["Headline: A"], [{"x": 1}])
+
+    # Act
+    ids, documents, metadatas = migrator.missing("live", ["a", "b"])
+
+    # Assert
+    assert (ids, documents, metadatas) == (["b"], ["Headline: B"], [{"x": 2}])
+
+
+def test_missing_loads_documents_saved_again_after_they_were_copied(migrator, client):
+    # Arrange
+    client.get_collection("articles").update(ids=["a", "b"], metadatas=[{"x": 1, "saved_at": 1.0}, {"x": 2, "saved_at": 1.0}])
+    migrator.prepare_shadow(NEW)
+    migrator.write("live", ["a", "b"], [[1.0, 0.0, 0.0]] * 2, ["Headline: A", "Headline: B"], [{"x": 1, "saved_at": 1.0}, {"x": 2, "saved_at": 1.0}])
+    client.get_collection("articles").update(ids=["b"], embeddings=[[0.0, 2.0]], documents=["Headline: B2"], metadatas=[{"x": 3, "saved_at": 2.0}])
+
+    # Act
+    ids, documents, metadatas = migrator.missing("live", ["a", "b"])
+
+    # Assert
+    assert (ids, documents, metadatas) == (["b"], ["Headline: B2"], [{"x": 3, "saved_at": 2.0}])
+
+
+def test_prepare_shadow_keeps_a_shadow_of_the_same_signature_only(migrator, client):
+    # Arrange
+    migrator.prepare_shadow(NEW)
+    migrator.write("live", ["a"], [[1.0, 0.0, 0.0]], ["Headline: A"], [{"x": 1}])
+
+    # Act
+    migrator.prepare_shadow(NEW)
+    kept = client.get_collection("articles__shadow").count()
+    migrator.prepare_shadow(EmbeddingSignature(model="other-model"))
+
+    # Assert
+    assert kept == 1
+    assert client.get_collection("articles__shadow").count() == 0
+
+
+def test_swap_renames_the_shadow_to_the_live_name_and_retires_the_live_collection(migrator, client):
+    # Arrange
+    migrator.stamp(OLD)
+    migrator.prepare_shadow(NEW)
+    migrator.write("live", ["a", "b"], [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]], ["Headline: A", "Headline: B"], [{"x": 1}, {"x": 2}])
+    old_handle = client.get_collection("articles")
+
+    # Act
+    migrator.swap()
+
+    # Assert
+    assert migrator.signature() == NEW
+    assert migrator.stored_dimension() == 3
+    assert migrator.has_retired()
+    assert old_handle.query(query_embeddings=[[1.0, 0.0]], n_results=1)["ids"] == [["a"]]
+    assert list(migrator.iter_id_pages("retired", batch_size=1)) == [["a"], ["b"]]
+
+    migrator.drop_retired()
+    assert not migrator.has_retired()
+
+
+def test_recover_completes_a_swap_interrupted_between_the_renames(migrator, client):
+    # Arrange
+    migrator.prepare_shadow(NEW)
+    client.get_collection("articles").modify(name="articles__retired")
+
+    # Act
+    migrator.recover()
+
+    # Assert
+    assert migrator.signature() == NEW
+    assert [collection.name for collection in client.list_collections()].count("articles__shadow") == 0
@@ -0,0 +1,360 @@
+import json
+import sqlite3
+import faiss
+import pytest
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from domain.article_query import ArticleQuery
+from repositories.faiss_articles_repo import FaissArticlesRepo, fingerprint_to_id
+from application.services.batch_embedder import BatchEmbedder
+from application.utils.content_fingerprint import fingerprint_content
+from repositories.bm25_index import Bm25Index
+from domain.article_filters import ArticleFilters
+from repositories.sqlite_content_store import SqliteContentStore
+
+
+def make_articles(count: int) -> list[ArticleQuery]:
+    return [
+        ArticleQuery(
+            headline=f"Title {i}",
+            summary=f"Summary {i}",
+            content=f"Full article content {i}.",
+            topics=["politics", "world"],
+            political_bias="None",
+        )
+        for i in range(count)
+    ]
+
+
+def make_tagged_articles() -> list[ArticleQuery]:
+    return [
+        ArticleQuery(headline="Rates", summary="Rates rise", content="Rates.", topics=["Economy"], political_bias="Left"),
+        ArticleQuery(headline="Floods", summary="Floods hit", content="Floods.", topics=["Climate", "World"], political_bias="Right"),
+        ArticleQuery(headline="Chips", summary="Chips boom", content="Chips.", topics=["Tech", "Economy"], political_bias="Right"),
+    ]
+
+
+def make_repo(path, **kwargs) -> FaissArticlesRepo:
+    embedder = BatchEmbedder(DeterministicFakeEmbedding(size=16), batch_size=8)
+    return FaissArticlesRepo(str(path), embedder, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_save_and_query_returns_documents_with_distances(tmp_path):
+    # Arrange
+    repo = make_repo(tmp_path)
+    articles = make_articles(3)
+    await repo.save_async(articles)
+
+    # Act
+    results = await repo.query_async("Headline: Title 1\nSummary: Summary 1\nTopics: politics, world")
+
+    # Assert
+    assert len(results) == 3
+    document, distance = results[0]
+    assert isinstance(document, Document)
+    assert document.metadata["headline"] == "Title 1"
+    assert distance == pytest.approx(0.0, abs=1e-4)
+
+
+@pytest.mark.asyncio
+async def test_query_async_on_empty_repo_returns_empty_list(tmp_path):
+    # Arrange
+    repo = make_repo(tmp_path)
+
+    # Act
+    results = await repo.query_async("anything")
+
+    # Assert
+    assert results == []
+
+
+@pytest.mark.asyncio
+async def test_get_by_fingerprints_async_returns_stored_articles(tmp_path):
+    # Arrange
+    repo = make_repo(tmp_path)
+    articles = make_articles(2)
+    await repo.save_async(articles)
+    fingerprint = fingerprint_content(articles[0].content)
+
+    # Act
+    stored = await repo.get_by_fingerprints_async([fingerprint, "f" * 64])
+
+    # Assert
+    assert list(stored) == [fingerprint]
+    assert stored[fingerprint].headline == "Title 0"
+    assert stored[fingerprint].topics == ["politics", "world"]
+
+
+@pytest.mark.asyncio
+async def test_save_async_upserts_without_duplicates(tmp_path):
+    # Arrange
+    repo = make_repo(tmp_path)
+    articles = make_articles(2)
+    await repo.save_async(articles)
+    articles[0].headline = "Updated title"
+
+    # Act
+    await repo.save_async(articles + [articles[0]])
+
+    # Assert
+    assert repo._index.ntotal == 2
+    stored = await repo.get_by_fingerprints_async([fingerprint_content(articles[0].content)])
+    assert next(iter(stored.values())).headline == "Updated title"
+
+
+@pytest.mark.asyncio
+async def test_index_is_persisted_and_reloaded(tmp_path):
+    # Arrange
+    repo = make_repo(tmp_path)
+    await repo.save_async(make_articles(4))
+    repo.close()
+
+    # Act
+    reloaded = make_repo(tmp_path)
+    results = await reloaded.query_async("Headline: Title 2\nSummary: Summary 2\nTopics: politics, world")
+
+    # Assert
+    assert reloaded._index.ntotal == 4
+    assert results[0][0].metadata["headline"] == "Title 2"
+
+
+@pytest.mark.asyncio
+async def test_repos_sharing_a_directory_see_each_others_vectors(tmp_path):
+    # Arrange
+    first, second = make_repo(tmp_path), make_repo(tmp_path)
+    articles = make_articles(4)
+
+    # Act
+    await first.save_async(articles[:2])
+    await second.save_async(articles[2:])
+    results = await first.query_async("Headline: Title 3\nSummary: Summary 3\nTopics: politics, world")
+    first.close()
+    second.close()
+    reloaded = make_repo(tmp_path)
+
+    # Assert
+    assert results[0][0].metadata["headline"] == "Title 3"
+    assert first._index.ntotal == 4
+    assert reloaded._index.ntotal == 4
+
+
+@pytest.mark.asyncio
+async def test_index_is_checkpointed_only_once_enough_entries_are_logged(tmp_path):
+    # Arrange
+    repo = make_repo(tmp_path, checkpoint_entries=5)
+
+    # Act
+    await repo.save_async(make_articles(3))
+    before = repo._checkpoints()
+    await repo.save_async(make_articles(6))
+
+    # Assert
+    assert before == []
+    assert repo._checkpoints() == [repo._sequence]
+
+
+@pytest.mark.asyncio
+async def test_legacy_index_file_becomes_the_first_checkpoint(tmp_path):
+    # Arrange
+    repo = make_repo(tmp_path)
+    await repo.save_async(make_articles(2))
+    repo.close()
+    legacy = faiss.read_index(str(tmp_path / f"index-{repo._sequence}.faiss"))
+    (tmp_path / f"index-{repo._sequence}.faiss").unlink()
+    faiss.write_index(legacy, str(tmp_path / "index.faiss"))
+    connection = sqlite3.connect(tmp_path / "metadata.sqlite3")
+    connection.execute("DELETE FROM vectors")
+    connection.commit()
+    connection.close()
+
+    # Act
+    reloaded = make_repo(tmp_path)
+    await reloaded.save_async(make_articles(3))
+
+    # Assert
+    assert not (tmp_path / "index.faiss").exists()
+    assert reloaded._index.ntotal == 3
+
+
+@pytest.mark.asyncio
+async def test_ivf_index_is_built_once_threshold_is_reached(tmp_path):
+    # Arrange
+    repo = make_repo(tmp_path, index_type="ivf", ivf_threshold=40, nprobe=64)
+
+    # Act
+    await repo.save_async(make_articles(39))
+    flat_index = repo._index
+    await repo.save_async(make_articles(50))
+    results = await repo.query_async("Headline: Title 7\nSummary: Summary 7\nTopics: politics, world")
+
+    # Assert
+    assert repo._index is not flat_index
+    assert repo._index.ntotal == 50
+    assert results[0][0].metadata["headline"] == "Title 7"
+
+
+@pytest.mark.asyncio
+async def test_hnsw_index_keeps_existing_vectors_on_upsert(tmp_path):
+    # Arrange
+    repo = make_repo(tmp_path, index_type="hnsw")
+    articles = make_articles(3)
+    await repo.save_async(articles)
+
+    # Act
+    await repo.save_async(articles)
+    results = await repo.query_async("Headline: Title 0\nSummary: Summary 0\nTopics: politics, world")
+
+    # Assert
+    assert repo._index.ntotal == 3
+    assert results[0][0].metadata["headline"] == "Title 0"
+
+
+@pytest.mark.asyncio
+async def test_hybrid_query_ranks_exact_entity_match_first(tmp_path):
+    # Arrange
+    lexical_index = Bm25Index(str(tmp_path / "bm25_index.sqlite3"))
+    repo = make_repo(tmp_path, lexical_index=lexical_index, k=2)
+    articles = make_articles(6)
+    articles[4].headline = "Floods in Valencia"
+    await repo.save_async(articles)
+
+    # Act
+    results = await repo.query_async("valencia")
+
+    # Assert
+    assert len(results) == 2
+    assert results[0][0].metadata["headline"] == "Floods in Valencia"
+    assert len(Bm25Index(lexical_index.path)) == 6
+
+
+@pytest.mark.asyncio
+async def test_iter_page_contents_reads_all_documents(tmp_path):
+    # Arrange
+    repo = make_repo(tmp_path)
+    articles = make_articles(5)
+    await repo.save_async(articles)
+
+    # Act
+    pages = list(repo.iter_page_contents(batch_size=2))
+
+    # Assert
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert {fingerprint for page in pages for fingerprint, _ in page} == {fingerprint_content(a.content) for a in articles}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("index_type, ivf_threshold", [("flat", 50_000), ("hnsw", 50_000), ("ivf", 40)])
+async def test_query_async_searches_only_filtered_ids(tmp_path, index_type, ivf_threshold):
+    # Arrange
+    repo = make_repo(tmp_path, index_type=index_type, ivf_threshold=ivf_threshold, nprobe=64)
+    await repo.save_async(make_articles(40) + make_tagged_articles())
+
+    # Act
+    economy = await repo.query_async("markets", k=4, filters=ArticleFilters(topics=["economy"]))
+    right_economy = await repo.query_async("markets", k=4, filters=ArticleFilters(political_bias=["Right"], topics=["Economy"]))
+    none = await repo.query_async("markets", k=4, filters=ArticleFilters(political_bias=["Lean Left"]))
+
+    # Assert
+    assert sorted(document.metadata["headline"] for document, _ in economy) == ["Chips", "Rates"]
+    assert [document.metadata["headline"] for document, _ in right_economy] == ["Chips"]
+    assert none == []
+
+
+@pytest.mark.asyncio
+async def test_query_async_pages_with_offset(tmp_path):
+    # Arrange
+    repo = make_repo(tmp_path, lexical_index=Bm25Index(), candidates=2)
+    await repo.save_async(make_tagged_articles())
+
+    # Act
+    pages = [await repo.query_async("floods", k=1, offset=offset) for offset in range(4)]
+
+    # Assert
+    headlines = [document.metadata["headline"] for page in pages for document, _ in page]
+    assert headlines[0] == "Floods"
+    assert sorted(headlines) == ["Chips", "Floods", "Rates"]
+    assert pages[3] == []
+
+
+@pytest.mark.asyncio
+async def test_hybrid_query_async_filters_lexical_candidates(tmp_path):
+    # Arrange
+    repo = make_repo(tmp_path, lexical_index=Bm25Index())
+    await repo.save_async(make_tagged_articles())
+
+    # Act
+    results = await repo.query_async("floods", k=4, filters=ArticleFilters(political_bias=["Left"]))
+
+    # Assert
+    assert [document.metadata["headline"] for document, _ in results] == ["Rates"]
+
+
+def test_filter_columns_are_migrated_from_metadata(tmp_path):
+    # Arrange
+    connection = sqlite3.connect(tmp_path / "metadata.sqlite3")
+    connection.execute("CREATE TABLE documents (id INTEGER PRIMARY KEY, fingerprint TEXT NOT NULL UNIQUE, page_content TEXT NOT NULL, metadata TEXT NOT NULL)")
+    connection.execute("INSERT INTO documents VALUES (1, 'a', 'text', ?)", (json.dumps({"political_bias": "Left", "topics": "Tech, World"}),))
+    connection.commit()
+    connection.close()
+
+    # Act
+    repo = make_repo(tmp_path)
+
+    # Assert
+    assert repo._filter_ids(ArticleFilters(political_bias=["Left"], topics=["world"])) == {1}
+    assert repo._filter_ids(ArticleFilters(topics=["sports"])) == set()
+
+
+@pytest.mark.asyncio
+async def test_content_store_keeps_content_out_of_metadata(tmp_path):
+    # Arrange
+    content_store = SqliteContentStore(str(tmp_path / "contents.sqlite3"))
+    repo = make_repo(tmp_path, content_store=content_store)
+    articles = make_articles(2)
+    fingerprint = fingerprint_content(articles[1].content)
+
+    # Act
+    await repo.save_async(articles)
+    results = await repo.query_async("Title 1")
+    stored = await repo.get_by_fingerprints_async([fingerprint])
+
+    # Assert
+    assert all("content" not in document.metadata for document, _ in results)
+    assert await repo.get_contents_async([fingerprint]) == {fingerprint: "Full article content 1."}
+    assert stored[fingerprint].content == "Full article content 1."
+    content_store.close()
+
+
+@pytest.mark.asyncio
+async def test_move_contents_to_store_migrates_legacy_documents(tmp_path):
+    # Arrange
+    await make_repo(tmp_path).save_async(make_articles(3))
+    content_store = SqliteContentStore(str(tmp_path / "contents.sqlite3"))
+    repo = make_repo(tmp_path, content_store=content_store)
+    fingerprint = fingerprint_content("Full article content 2.")
+
+    # Act
+    moved = repo.move_contents_to_store(batch_size=2)
+
+    # Assert
+    assert moved == 3
+    assert repo.move_contents_to_store() == 0
+    assert "content" not in repo._load_documents("fingerprint", [fingerprint])[fingerprint].metadata
+    assert await repo.get_contents_async([fingerprint]) == {fingerprint: "Full article content 2."}
+    content_store.close()
+
+
+def test_unknown_index_type_raises(tmp_path):
+    # Act & Assert
+    with pytest.raises(ValueError):
+        make_repo(tmp_path, index_type="lsh")
+
+
+def test_fingerprint_to_id_is_positive_int64():
+    # Act
+    faiss_id = fingerprint_to_id("f" * 64)
+
+    # Assert
+    assert 0 < faiss_id < 2 ** 63
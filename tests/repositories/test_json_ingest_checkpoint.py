@@ -0,0 +1,32 @@
+from repositories.json_ingest_checkpoint import JsonIngestCheckpoint
+
+
+def test_load_returns_none_without_checkpoint(tmp_path):
+    # Act & Assert
+    assert JsonIngestCheckpoint(str(tmp_path / "checkpoint.json")).load() is None
+
+
+def test_save_replaces_the_checkpoint_atomically(tmp_path):
+    # Arrange
+    checkpoint = JsonIngestCheckpoint(str(tmp_path / "nested" / "checkpoint.json"))
+    checkpoint.save({"position": 32})
+
+    # Act
+    checkpoint.save({"position": 64})
+
+    # Assert
+    assert checkpoint.load() == {"position": 64}
+    assert [path.name for path in (tmp_path / "nested").iterdir()] == ["checkpoint.json"]
+
+
+def test_clear_removes_the_checkpoint(tmp_path):
+    # Arrange
+    checkpoint = JsonIngestCheckpoint(str(tmp_path / "checkpoint.json"))
+    checkpoint.save({"position": 32})
+
+    # Act
+    checkpoint.clear()
+    checkpoint.clear()
+
+    # Assert
+    assert checkpoint.load() is None
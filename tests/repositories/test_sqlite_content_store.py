@@ -0,0 +1,60 @@
+import pytest
+
+from repositories.sqlite_content_store import SqliteContentStore
+
+CONTENT = "Floods hit Valencia after record rainfall. " * 50
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SqliteContentStore(path=str(tmp_path / "contents.sqlite3"))
+    yield store
+    store.close()
+
+
+def test_put_many_then_get_many_round_trips_contents(store):
+    # Arrange
+    store.put_many({"a": CONTENT, "b": "Ünïcödé content"})
+
+    # Act
+    contents = store.get_many(["a", "b", "missing"])
+
+    # Assert
+    assert contents == {"a": CONTENT, "b": "Ünïcödé content"}
+
+
+def test_put_many_replaces_existing_content(store):
+    # Arrange
+    store.put_many({"a": "old"})
+
+    # Act
+    store.put_many({"a": "new"})
+
+    # Assert
+    assert store.get_many(["a"]) == {"a": "new"}
+    assert store.stats()["contents"] == 1
+
+
+def test_stats_reports_compressed_size(store):
+    # Act
+    store.put_many({"a": CONTENT})
+    stats = store.stats()
+
+    # Assert
+    assert stats["raw_bytes"] == len(CONTENT.encode("utf-8"))
+    assert stats["compressed_bytes"] < stats["raw_bytes"] // 10
+
+
+def test_contents_are_persisted(tmp_path):
+    # Arrange
+    path = str(tmp_path / "contents.sqlite3")
+    store = SqliteContentStore(path)
+    store.put_many({"a": CONTENT})
+    store.close()
+
+    # Act
+    reopened = SqliteContentStore(path)
+
+    # Assert
+    assert reopened.get_many(["a"]) == {"a": CONTENT}
+    reopened.close()
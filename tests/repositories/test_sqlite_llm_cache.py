@@ -0,0 +1,182 @@
+import itertools
+import json
+import time
+import pytest
+from typing import Any, Optional
+from unittest.mock import MagicMock, patch
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult, Generation
+from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.runnables import RunnablePassthrough
+
+from application.services.azure_ai_summarizer import AzureAISummarizer
+from config.prompts import build_summary_prompt, build_chunk_summary_prompt
+from repositories.sqlite_llm_cache import SqliteLLMCache
+
+
+class CountingFakeChatModel(BaseChatModel):
+    """Fake chat model that answers every prompt with a JSON article and counts its calls."""
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "counting-fake"
+
+    def _generate(self, messages: list[BaseMessage], stop: Optional[list[str]] = None, run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        self.calls += 1
+        content = json.dumps({"summary": "Summary", "topics": ["news"], "political_bias": "None"})
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=content))])
+
+    def with_structured_output(self, schema, **kwargs):
+        return self | PydanticOutputParser(pydantic_object=schema)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = SqliteLLMCache(path=str(tmp_path / "llm_cache.sqlite3"), ttl_seconds=60, max_entries=100)
+    yield cache
+    cache.close()
+
+
+def test_lookup_returns_none_on_miss(cache):
+    # Act
+    result = cache.lookup("prompt", "llm")
+
+    # Assert
+    assert result is None
+    assert cache.stats()["misses"] == 1
+
+
+def test_update_then_lookup_returns_generations_for_same_llm_string(cache):
+    # Arrange
+    cache.update("prompt", "llm-temperature-0.3", [Generation(text="cached")])
+
+    # Act
+    hit = cache.lookup("prompt", "llm-temperature-0.3")
+    other_model = cache.lookup("prompt", "llm-temperature-0.9")
+
+    # Assert
+    assert hit == [Generation(text="cached")]
+    assert other_model is None
+    assert cache.stats()["hit_rate"] == 0.5
+
+
+def test_contains_does_not_count_a_lookup(cache):
+    # Arrange
+    cache.update("prompt", "llm", [Generation(text="cached")])
+
+    # Act
+    present = cache.contains("prompt", "llm")
+    absent = cache.contains("other", "llm")
+
+    # Assert
+    assert present and not absent
+    assert cache.stats()["hits"] == cache.stats()["misses"] == 0
+
+
+def test_lookup_ignores_expired_entries(cache):
+    # Arrange
+    with patch("repositories.sqlite_llm_cache.time.time", return_value=0):
+        cache.update("prompt", "llm", [Generation(text="old")])
+
+    # Act
+    result = cache.lookup("prompt", "llm")
+
+    # Assert
+    assert result is None
+
+
+def test_update_evicts_least_recently_used_entries(tmp_path):
+    # Arrange
+    cache = SqliteLLMCache(path=str(tmp_path / "llm_cache.sqlite3"), ttl_seconds=60, max_entries=2)
+    now = time.time()
+    with patch("repositories.sqlite_llm_cache.time.time", side_effect=itertools.chain([now - 4, now - 3, now - 2], itertools.repeat(now - 1))):
+        cache.update("first", "llm", [Generation(text="1")])
+        cache.update("second", "llm", [Generation(text="2")])
+        cache.lookup("first", "llm")
+        cache.update("third", "llm", [Generation(text="3")])
+
+    # Act & Assert
+    assert cache.lookup("second", "llm") is None
+    assert cache.lookup("first", "llm") is not None
+    assert cache.stats()["entries"] == 2
+    cache.close()
+
+
+def test_cache_is_shared_between_instances(tmp_path):
+    # Arrange
+    path = str(tmp_path / "llm_cache.sqlite3")
+    writer = SqliteLLMCache(path=path, ttl_seconds=60, max_entries=100)
+    reader = SqliteLLMCache(path=path, ttl_seconds=60, max_entries=100)
+
+    # Act
+    writer.update("prompt", "llm", [Generation(text="shared")])
+
+    # Assert
+    assert reader.lookup("prompt", "llm") == [Generation(text="shared")]
+    writer.close()
+    reader.close()
+
+
+@pytest.mark.asyncio
+async def test_second_identical_summarize_makes_no_model_calls(cache):
+    # Arrange
+    llm = CountingFakeChatModel(cache=cache)
+    splitter = MagicMock()
+    splitter.split_text.return_value = ["chunk one", "chunk two"]
+    summarizer = AzureAISummarizer(
+        llm=llm,
+        summary_prompt=build_summary_prompt(),
+        chunk_summary_prompt=build_chunk_summary_prompt(),
+        token_text_splitter=splitter,
+        token_limit_validator=RunnablePassthrough(),
+    )
+    articles = [{"headline": "Headline", "content": "chunk one chunk two"}]
+
+    # Act
+    first = await summarizer.summarize_async(articles)
+    calls_after_first = llm.calls
+    second = await summarizer.summarize_async(articles)
+
+    # Assert
+    assert calls_after_first == 3
+    assert llm.calls == calls_after_first
+    assert second[0].summary == first[0].summary == "Summary"
+
+
+def test_entry_count_follows_replacements_and_batched_evictions(tmp_path):
+    # Arrange
+    path = str(tmp_path / "llm_cache.sqlite3")
+    cache = SqliteLLMCache(path=path, ttl_seconds=60, max_entries=10)
+
+    # Act
+    for i in range(11):
+        cache.update(f"prompt {i}", "llm", [Generation(text=str(i))])
+    cache.update("prompt 10", "llm", [Generation(text="again")])
+    cache.close()
+    reopened = SqliteLLMCache(path=path, ttl_seconds=60, max_entries=10)
+
+    # Assert
+    (counted,) = reopened._connection.execute("SELECT COUNT(*) FROM llm_cache").fetchone()
+    assert reopened.stats()["entries"] == counted == 9
+    assert reopened.lookup("prompt 0", "llm") is None
+    assert reopened.lookup("prompt 10", "llm") == [Generation(text="again")]
+    reopened.close()
+
+
+def test_expired_entries_are_purged_by_an_index_scan_at_most_once_per_interval(tmp_path):
+    # Arrange
+    cache = SqliteLLMCache(path=str(tmp_path / "llm_cache.sqlite3"), ttl_seconds=60, max_entries=100, purge_interval_seconds=300)
+    with patch("repositories.sqlite_llm_cache.time.time", side_effect=itertools.chain([0, 100], itertools.repeat(200))):
+        cache.update("old", "llm", [Generation(text="old")])
+        cache.update("newer", "llm", [Generation(text="newer")])
+
+        # Act
+        cache.update("newest", "llm", [Generation(text="newest")])
+
+    # Assert
+    assert cache.stats()["entries"] == 3
+    plan = cache._connection.execute("EXPLAIN QUERY PLAN DELETE FROM llm_cache WHERE created_at < 0").fetchall()
+    assert "llm_cache_created_at" in str(plan)
+    cache.close()
@@ -0,0 +1,105 @@
+import pytest
+from unittest.mock import patch
+
+from repositories.sqlite_scrape_cache import SqliteScrapeCache
+
+ARTICLE = {"headline": "Title", "content": "Content " * 10}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = SqliteScrapeCache(path=str(tmp_path / "cache.sqlite3"), ttl_seconds=60, max_bytes=10_000)
+    yield cache
+    cache.close()
+
+
+def test_get_returns_none_and_counts_miss(cache):
+    # Act
+    result = cache.get("https://example.com/a")
+
+    # Assert
+    assert result is None
+    assert cache.stats()["misses"] == 1
+
+
+def test_put_then_get_returns_fresh_entry_for_equivalent_url(cache):
+    # Arrange
+    cache.put("https://Example.com/a?utm_source=x#top", ARTICLE, etag='"v1"', last_modified=None)
+
+    # Act
+    result = cache.get("https://example.com/a")
+
+    # Assert
+    assert result.is_fresh
+    assert result.to_article() == ARTICLE
+    assert result.conditional_headers() == {"If-None-Match": '"v1"'}
+    assert cache.stats()["hits"] == 1
+
+
+def test_get_returns_stale_entry_after_ttl_and_touch_refreshes_it(cache):
+    # Arrange
+    with patch("repositories.sqlite_scrape_cache.time.time", return_value=0):
+        cache.put("https://example.com/a", ARTICLE, etag=None, last_modified="Mon, 01 Jan 2024 00:00:00 GMT")
+
+    # Act
+    stale = cache.get("https://example.com/a")
+    cache.touch("https://example.com/a")
+    refreshed = cache.get("https://example.com/a")
+
+    # Assert
+    assert not stale.is_fresh
+    assert refreshed.is_fresh
+    stats = cache.stats()
+    assert (stats["stale"], stats["revalidated"], stats["hits"]) == (1, 1, 1)
+
+
+def test_put_evicts_least_recently_used_entries_over_size_limit(tmp_path):
+    # Arrange
+    cache = SqliteScrapeCache(path=str(tmp_path / "cache.sqlite3"), ttl_seconds=60, max_bytes=250)
+    article = {"headline": "T", "content": "x" * 99}
+    with patch("repositories.sqlite_scrape_cache.time.time", side_effect=[1, 2, 3, 4]):
+        cache.put("https://example.com/1", article, etag='"1"', last_modified=None)
+        cache.put("https://example.com/2", article, etag='"2"', last_modified=None)
+        cache.get("https://example.com/1")
+
+    # Act
+    cache.put("https://example.com/3", article, etag='"3"', last_modified=None)
+
+    # Assert
+    assert cache.get("https://example.com/2") is None
+    assert cache.get("https://example.com/1") is not None
+    assert cache.stats()["entries"] == 2
+    cache.close()
+
+
+def test_put_evicts_expired_entries_without_validators(cache):
+    # Arrange
+    with patch("repositories.sqlite_scrape_cache.time.time", return_value=0):
+        cache.put("https://example.com/old", ARTICLE, etag=None, last_modified=None)
+
+    # Act
+    cache.put("https://example.com/new", ARTICLE, etag=None, last_modified=None)
+
+    # Assert
+    assert cache.stats()["entries"] == 1
+
+
+def test_size_total_follows_puts_replacements_and_evictions(tmp_path):
+    # Arrange
+    path = str(tmp_path / "cache.sqlite3")
+    cache = SqliteScrapeCache(path=path, ttl_seconds=60, max_bytes=250)
+
+    # Act
+    cache.put("https://example.com/1", {"headline": "T", "content": "x" * 99}, etag='"1"', last_modified=None)
+    cache.put("https://example.com/1", {"headline": "T", "content": "x" * 49}, etag='"1"', last_modified=None)
+    cache.put("https://example.com/2", {"headline": "T", "content": "x" * 199}, etag='"2"', last_modified=None)
+    cache.put("https://example.com/3", {"headline": "T", "content": "x" * 99}, etag='"3"', last_modified=None)
+    cache.close()
+    reopened = SqliteScrapeCache(path=path, ttl_seconds=60, max_bytes=250)
+
+    # Assert
+    stats = reopened.stats()
+    assert (stats["entries"], stats["size_bytes"]) == (1, 100)
+    (summed,) = reopened._connection.execute("SELECT SUM(size) FROM scrape_cache").fetchone()
+    assert summed == 100
+    reopened.close()
@@ -0,0 +1,179 @@
+import time
+import pytest
+
+from repositories.sqlite_summary_job_store import SqliteSummaryJobStore
+from application.models.article_summary_result_dto import ArticleSummaryResultDTO
+from application.exceptions.no_content_error import NoContentError
+from domain.article_enriched import ArticleEnriched
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SqliteSummaryJobStore(str(tmp_path / "jobs.sqlite3"), lease_seconds=60, retention_seconds=3600)
+    yield store
+    store.close()
+
+
+def ok_result(url: str) -> ArticleSummaryResultDTO:
+    return ArticleSummaryResultDTO.from_article(url, ArticleEnriched(headline="Title", content="Content", summary="Summary"))
+
+
+def test_create_returns_pending_job(store):
+    # Act
+    job = store.create(["https://example.com/a", "https://example.com/b"])
+
+    # Assert
+    assert job.status == "pending"
+    assert job.total == 2
+    assert store.get(job.id).status == "pending"
+
+
+def test_claim_leases_each_url_once_in_submission_order(store):
+    # Arrange
+    first = store.create(["https://example.com/a", "https://example.com/b"])
+    second = store.create(["https://example.com/c"])
+
+    # Act
+    claimed = store.claim(2, "worker")
+    rest = store.claim(10, "worker")
+    nothing = store.claim(10, "worker")
+
+    # Assert
+    assert claimed == [(first.id, 0, "https://example.com/a"), (first.id, 1, "https://example.com/b")]
+    assert rest == [(second.id, 0, "https://example.com/c")]
+    assert nothing == []
+    assert store.get(first.id).status == "running"
+
+
+def test_complete_records_results_and_progress(store):
+    # Arrange
+    job = store.create(["https://example.com/a", "https://example.com/b"])
+    store.claim(10, "worker")
+
+    # Act
+    store.complete(job.id, [(1, ArticleSummaryResultDTO.from_error("https://example.com/b", NoContentError("https://example.com/b")))], "worker")
+    partial = store.get(job.id)
+    store.complete(job.id, [(0, ok_result("https://example.com/a"))], "worker")
+    finished = store.get(job.id)
+
+    # Assert
+    assert (partial.status, partial.succeeded, partial.failed) == ("running", 0, 1)
+    assert finished.status == "completed"
+    assert [result.url for result in finished.results] == ["https://example.com/a", "https://example.com/b"]
+    assert finished.results[0].article.summary == "Summary"
+
+
+def test_expired_leases_are_claimed_again_after_restart(tmp_path):
+    # Arrange
+    path = str(tmp_path / "jobs.sqlite3")
+    store = SqliteSummaryJobStore(path, lease_seconds=0.01, retention_seconds=3600)
+    job = store.create(["https://example.com/a"])
+    store.claim(10, "worker")
+    store.close()
+    time.sleep(0.02)
+
+    # Act
+    restarted = SqliteSummaryJobStore(path, lease_seconds=0.01, retention_seconds=3600)
+    claimed = restarted.claim(10, "worker")
+
+    # Assert
+    assert claimed == [(job.id, 0, "https://example.com/a")]
+    restarted.close()
+
+
+def test_finished_jobs_are_pruned_after_retention(tmp_path):
+    # Arrange
+    store = SqliteSummaryJobStore(str(tmp_path / "jobs.sqlite3"), lease_seconds=60, retention_seconds=0)
+    finished = store.create(["https://example.com/a"])
+    store.claim(10, "worker")
+    store.complete(finished.id, [(0, ok_result("https://example.com/a"))], "worker")
+    unfinished = store.create(["https://example.com/b"])
+
+    # Act
+    store.create(["https://example.com/c"])
+
+    # Assert
+    assert store.get(finished.id) is None
+    assert store.get(unfinished.id) is not None
+    store.close()
+
+
+def test_get_returns_none_for_unknown_job(store):
+    # Act & Assert
+    assert store.get("missing") is None
+
+
+def test_urls_are_failed_after_max_attempts(tmp_path):
+    # Arrange
+    store = SqliteSummaryJobStore(str(tmp_path / "jobs.sqlite3"), lease_seconds=0.01, retention_seconds=3600, max_attempts=2)
+    job = store.create(["https://example.com/a"])
+
+    # Act
+    first = store.claim(10, "worker")
+    time.sleep(0.02)
+    second = store.claim(10, "worker")
+    time.sleep(0.02)
+    last = store.claim(10, "worker")
+
+    # Assert
+    assert first == second == [(job.id, 0, "https://example.com/a")]
+    assert last == []
+    finished = store.get(job.id)
+    assert (finished.status, finished.failed) == ("completed", 1)
+    assert "2 attempts" in finished.results[0].error
+    store.close()
+
+
+def test_renewed_leases_are_not_claimed_again(tmp_path):
+    # Arrange
+    store = SqliteSummaryJobStore(str(tmp_path / "jobs.sqlite3"), lease_seconds=0.05, retention_seconds=3600)
+    store.create(["https://example.com/a"])
+    items = store.claim(10, "worker")
+    time.sleep(0.03)
+
+    # Act
+    store.renew(items, "worker")
+    time.sleep(0.03)
+    claimed = store.claim(10, "worker")
+
+    # Assert
+    assert claimed == []
+    store.close()
+
+
+def test_results_of_a_lost_lease_are_dropped(tmp_path):
+    # Arrange
+    store = SqliteSummaryJobStore(str(tmp_path / "jobs.sqlite3"), lease_seconds=0.2, retention_seconds=3600)
+    job = store.create(["https://example.com/a"])
+    store.claim(10, "slow")
+    time.sleep(0.25)
+    store.claim(10, "fast")
+    store.renew([(job.id, 0, "https://example.com/a")], "slow")
+
+    # Act
+    lost = store.complete(job.id, [(0, ArticleSummaryResultDTO.from_error("https://example.com/a", NoContentError("https://example.com/a")))], "slow")
+    recorded = store.complete(job.id, [(0, ok_result("https://example.com/a"))], "fast")
+
+    # Assert
+    assert (lost, recorded) == (0, 1)
+    finished = store.get(job.id)
+    assert (finished.succeeded, finished.failed) == (1, 0)
+    store.close()
+
+
+def test_queue_without_attempts_column_is_migrated(tmp_path):
+    # Arrange
+    import sqlite3
+    path = str(tmp_path / "jobs.sqlite3")
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE summary_job_items (job_id TEXT NOT NULL, position INTEGER NOT NULL, url TEXT NOT NULL, status TEXT NOT NULL, claimed_at REAL, result TEXT, PRIMARY KEY (job_id, position))")
+    connection.commit()
+    connection.close()
+
+    # Act
+    store = SqliteSummaryJobStore(path, lease_seconds=60, retention_seconds=3600)
+    job = store.create(["https://example.com/a"])
+
+    # Assert
+    assert store.claim(10, "worker") == [(job.id, 0, "https://example.com/a")]
+    store.close()
@@ -0,0 +1,32 @@
+import pytest
+
+from application.exceptions.store_locked_error import StoreLockedError
+from repositories.store_directory_lock import StoreDirectoryLock
+
+
+def test_shared_locks_coexist_but_exclude_an_exclusive_one(tmp_path):
+    # Arrange
+    first, second, ingestion = (StoreDirectoryLock(str(tmp_path / "store")) for _ in range(3))
+    first.acquire()
+    second.acquire()
+
+    # Act & Assert
+    with pytest.raises(StoreLockedError):
+        ingestion.acquire(exclusive=True)
+
+    first.release()
+    second.release()
+    ingestion.acquire(exclusive=True)
+    ingestion.release()
+
+
+def test_exclusive_lock_excludes_a_shared_one(tmp_path):
+    # Arrange
+    ingestion, server = StoreDirectoryLock(str(tmp_path)), StoreDirectoryLock(str(tmp_path))
+    ingestion.acquire(exclusive=True)
+
+    # Act & Assert
+    with pytest.raises(StoreLockedError, match="bulk ingestion"):
+        server.acquire()
+
+    ingestion.release()